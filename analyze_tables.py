@@ -5,14 +5,104 @@
 Находит дублирование, избыточность и предлагает оптимизацию
 """
 
+import argparse
 import json
+import re
 import sys
-from collections import defaultdict
+from collections import Counter
+
+from backup_store import list_snapshots, read_snapshot
+from safe_output import write_json_atomic
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
+# Типы значений столбцов: проверяются по порядку, первый совпавший побеждает
+VALUE_TYPES = [
+    ('url', re.compile(r'^(https?:)?//|^www\.', re.I)),
+    ('path', re.compile(r'\.(jpe?g|png|webp|gif|svg|avif|mp4|pdf)$', re.I)),
+    ('html', re.compile(r'<[a-z][^>]*>', re.I)),
+    ('date', re.compile(r'^\d{4}-\d{2}-\d{2}|^\d{1,2}[./]\d{1,2}([./]\d{2,4})?$'
+                        r'|\d{1,2}\s+(января|февраля|марта|апреля|мая|июня|июля|августа'
+                        r'|сентября|октября|ноября|декабря)', re.I)),
+    ('price', re.compile(r'\d[\d\s]*\s*(р\b|р\.|руб|₽)', re.I)),
+    ('number', re.compile(r'^-?\d+([.,]\d+)?$')),
+]
+
+SHEET_DATA_FILE = 'sheet_data.json'
+
+# Группы вкладок, из которых собирается form.json
+FORM_CATEGORIES = ['sports_categories', 'events']
+HEAVIEST_LIMIT = 12
+
+# Сколько повторяющихся значений показывать в отчете
+TOP_DUPLICATES = 3
+PREVIEW_LENGTH = 60
+
+
+def value_type(value):
+    for name, pattern in VALUE_TYPES:
+        if pattern.search(value):
+            return name
+    return 'text'
+
+
+def to_columns(headers, rows):
+    """
+    Вкладка по столбцам: один проход по строкам, дальше расчеты идут
+    по целым столбцам
+
+    Короткие строки дополняются пустыми значениями, лишние ячейки отбрасываются
+    """
+    width = len(headers)
+    padded = [(list(row) + [''] * (width - len(row)))[:width] for row in rows]
+    return list(zip(*padded)) if padded else [()] * width
+
+
+def _column_counts(column):
+    """
+    (заполнено, {значение: количество}, байт UTF-8, максимальная длина)
+
+    Ячейки считаются один раз (Counter), остальное - по различным значениям
+    с весом: в таблице много повторов, а пустых ячеек больше, чем заполненных
+    """
+    cells = Counter(column)
+    size = sum(len(value.encode('utf-8')) * count for value, count in cells.items())
+    longest = max(map(len, cells), default=0)
+    counts = {value: count for value, count in sorted(cells.items()) if value.strip()}
+    return sum(counts.values()), counts, size, longest
+
+
+def profile_column(header, column):
+    """Заполненность, повторы, мощность, тип значений и размер столбца"""
+    filled, counts, size, longest = _column_counts(column)
+    rows = len(column)
+
+    # Тип определяется по различным значениям, а не по каждой ячейке
+    types = Counter()
+    for value, count in counts.items():
+        types[value_type(value)] += count
+
+    duplicates = sorted(((count, value) for value, count in counts.items() if count > 1), reverse=True)
+
+    return {
+        'name': header,
+        'filled': filled,
+        'fill_rate': round(filled / rows, 3) if rows else 0.0,
+        'distinct': len(counts),
+        'duplicates': len(duplicates),
+        'top_duplicates': [
+            {'value': value[:PREVIEW_LENGTH], 'count': count}
+            for count, value in duplicates[:TOP_DUPLICATES]
+        ],
+        'type': types.most_common(1)[0][0] if types else 'empty',
+        'types': dict(types.most_common()),
+        'bytes': size,
+        'max_length': longest
+    }
+
+
 def analyze_sheet_structure(sheet_name, data):
     """Анализирует структуру одной вкладки"""
 
@@ -22,39 +112,22 @@ def analyze_sheet_structure(sheet_name, data):
     headers = data[0]
     rows = data[1:] if len(data) > 1 else []
 
-    # Статистика
-    stats = {
+    profile = [profile_column(header, column) for header, column in zip(headers, to_columns(headers, rows))]
+    header_counts = Counter(headers)
+
+    return {
         'name': sheet_name,
         'columns': len(headers),
         'rows': len(rows),
         'headers': headers,
-        'empty_columns': [],
-        'duplicate_columns': [],
-        'data_types': {},
+        'empty_columns': [column['name'] for column in profile if not column['filled']],
+        'duplicate_columns': [header for header, count in header_counts.items() if count > 1],
+        'data_types': {column['name']: column['type'] for column in profile},
+        'bytes': sum(column['bytes'] for column in profile),
+        'profile': profile,
         'sample_data': rows[:3] if rows else []
     }
 
-    # Проверяем пустые столбцы
-    for col_idx, header in enumerate(headers):
-        is_empty = True
-        for row in rows:
-            if col_idx < len(row) and row[col_idx].strip():
-                is_empty = False
-                break
-        if is_empty:
-            stats['empty_columns'].append(header)
-
-    # Проверяем дублирующиеся заголовки
-    header_counts = defaultdict(int)
-    for header in headers:
-        header_counts[header] += 1
-
-    for header, count in header_counts.items():
-        if count > 1:
-            stats['duplicate_columns'].append(header)
-
-    return stats
-
 
 def categorize_sheets(all_data):
     """Группирует вкладки по типам"""
@@ -87,7 +160,56 @@ def categorize_sheets(all_data):
     return categories
 
 
-def main():
+def load_versions(files, history=False):
+    """
+    Версии таблицы для анализа: [(источник, данные)], последняя - текущая
+
+    history: добавить в начало снимки sheet_data.json из хранилища бэкапов
+    """
+    versions = []
+
+    if history:
+        for entry in list_snapshots(SHEET_DATA_FILE):
+            data = json.loads(read_snapshot(entry['hash']).decode('utf-8'))
+            versions.append((f"{entry['file']} @ {entry['hash'][:12]} ({entry['created']})", data))
+
+    for file_name in files:
+        with open(file_name, 'r', encoding='utf-8') as f:
+            versions.append((file_name, json.load(f)))
+
+    return versions
+
+
+def heaviest_columns(stats_by_name, sheet_names, limit=HEAVIEST_LIMIT):
+    """Столбцы вкладок form.json, занимающие больше всего байт"""
+    total = sum(stats_by_name[name]['bytes'] for name in sheet_names if name in stats_by_name)
+    sizes = Counter()
+    filled = Counter()
+
+    for name in sheet_names:
+        for column in stats_by_name.get(name, {}).get('profile', []):
+            sizes[column['name']] += column['bytes']
+            filled[column['name']] += column['filled']
+
+    return [
+        {'name': name, 'bytes': size, 'share': round(size / total, 3) if total else 0.0, 'filled': filled[name]}
+        for name, size in sizes.most_common(limit)
+    ]
+
+
+def summarize_version(source, data):
+    """Краткая сводка версии таблицы для истории"""
+    stats = [s for s in (analyze_sheet_structure(name, rows) for name, rows in data.items()) if s]
+    return {
+        'source': source,
+        'sheets': len(stats),
+        'rows': sum(s['rows'] for s in stats),
+        'bytes': sum(s['bytes'] for s in stats),
+        'sheet_bytes': {s['name']: s['bytes'] for s in stats}
+    }
+
+
+def main(files=None, history=False):
     """Главная функция анализа"""
 
     print("="*80)
@@ -95,9 +217,9 @@ def main():
     print("="*80)
     print()
 
-    # Читаем данные
-    with open('sheet_data.json', 'r', encoding='utf-8') as f:
-        all_data = json.load(f)
+    # Читаем данные: анализируется последняя версия, остальные - в истории
+    versions = load_versions(files or [SHEET_DATA_FILE], history)
+    all_data = versions[-1][1]
 
     print(f"✓ Загружено вкладок: {len(all_data)}")
     print()
@@ -149,6 +271,8 @@ def main():
         if stats:
             all_stats.append(stats)
 
+    stats_by_name = {stats['name']: stats for stats in all_stats}
+
     # Анализируем спортивные категории
     print("⚽ СПОРТИВНЫЕ КАТЕГОРИИ:")
     print()
@@ -197,7 +321,7 @@ def main():
 
         print(f"\n{category_name.upper()}:")
         for sheet_name in sheet_names:
-            stats = next((s for s in all_stats if s['name'] == sheet_name), None)
+            stats = stats_by_name.get(sheet_name)
             if stats:
                 print(f"\n  📄 {sheet_name}")
                 print(f"     Столбцы: {len(stats['headers'])}")
@@ -213,21 +337,60 @@ def main():
                         preview = [str(cell)[:30] for cell in row[:3]]
                         print(f"       {i}. {' | '.join(preview)}...")
 
+    # Размер столбцов вкладок, из которых собирается form.json
+    form_sheets = [name for category in FORM_CATEGORIES for name in categories[category]]
+    heaviest = heaviest_columns(stats_by_name, form_sheets)
+
+    print()
+    print("="*80)
+    print("⚖️  САМЫЕ ТЯЖЕЛЫЕ СТОЛБЦЫ (вкладки form.json):")
+    print("="*80)
+    print()
+    for column in heaviest:
+        print(f"  {column['name']:25s} {column['bytes'] / 1024:8.1f} KB  {column['share']:6.1%}  "
+              f"заполнено: {column['filled']}")
+
+    # Повторы и типы значений по всем вкладкам
+    print()
+    print("🔁 Повторяющиеся значения:")
+    for stats in all_stats:
+        for column in stats['profile']:
+            if column['duplicates'] and column['type'] not in ('number', 'empty') and column['max_length'] > 20:
+                top = column['top_duplicates'][0]
+                print(f"  {stats['name']} / {column['name']}: {column['duplicates']} повторов "
+                      f"(тип {column['type']}), чаще всего x{top['count']}: {top['value'][:40]}")
+
+    # История версий таблицы
+    summaries = [summarize_version(source, data) for source, data in versions]
+    if len(summaries) > 1:
+        print()
+        print("🕓 История версий:")
+        for summary in summaries:
+            print(f"  {summary['source']}: {summary['sheets']} вкладок, {summary['rows']} строк, "
+                  f"{summary['bytes'] / 1024:.1f} KB")
+
     print()
     print("="*80)
     print("✅ АНАЛИЗ ЗАВЕРШЕН")
     print("="*80)
 
     # Сохраняем результаты
-    with open('table_analysis.json', 'w', encoding='utf-8') as f:
-        json.dump({
-            'categories': categories,
-            'stats': all_stats
-        }, f, ensure_ascii=False, indent=2)
+    write_json_atomic('table_analysis.json', {
+        'categories': categories,
+        'stats': all_stats,
+        'heaviest_columns': heaviest,
+        'history': summaries
+    })
 
     print()
     print("💾 Детальный анализ сохранен в: table_analysis.json")
 
 
 if __name__ == '__main__':
-    main()
+    parser = argparse.ArgumentParser(description='Анализ структуры и содержимого вкладок Google Таблицы')
+    parser.add_argument('files', nargs='*', help=f'JSON-выгрузки таблицы (по умолчанию {SHEET_DATA_FILE})')
+    parser.add_argument('--history', action='store_true',
+                        help=f'добавить снимки {SHEET_DATA_FILE} из хранилища бэкапов')
+    args = parser.parse_args()
+
+    main(args.files, args.history)
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Сброс кеша статических файлов по хешу содержимого
+
+Все локальные CSS/JS, подключенные в index.html, получают версию ?v=<хеш>
+вместо времени запуска. Версия меняется только если изменился сам файл,
+поэтому посетители не скачивают заново неизмененные three.min.js и main.js.
+
+HTML-фрагменты модальных окон, которые загружаются через fetch('...html')
+или loadPartial('...html') из этих скриптов, тоже получают версию по хешу.
+Исключение - расписания schedule-*.html: update-schedule.py пересоздает их
+во время работы сайта, поэтому версия в скрипте быстро устарела бы.
+
+index.html разбирается один раз, все ссылки заменяются за один проход.
+Итоговые версии сохраняются в asset-manifest.json.
+
+Запуск: python asset_manifest.py
+"""
+
+import hashlib
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from safe_output import write_json_atomic, write_text_atomic
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+INDEX_FILE = 'index.html'
+MANIFEST_FILE = 'asset-manifest.json'
+ASSET_EXTENSIONS = ('.css', '.js')
+HASH_LENGTH = 10
+BUNDLE_PREFIX = 'bundle-'
+
+# fetch('sportModal.html'), loadPartial('sportModal.html?v=...')
+PARTIAL_PATTERN = re.compile(r"""((?:fetch|loadPartial)\(\s*(['"`]))([\w./-]+\.html)(?:\?v=[0-9a-f]+)?(\2)""")
+
+# Фрагменты, которые пересоздаются во время работы сайта (update-schedule.py,
+# sync_watcher.py): без версии и без встраивания в index.html
+RUNTIME_PARTIALS = re.compile(r'^schedule-[\w-]+\.html$')
+
+
+def file_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:HASH_LENGTH]
+
+
+def split_ref(value):
+    """'./main.js?v=8' -> ('./main.js', 'main.js')"""
+    url = value.split('#', 1)[0].split('?', 1)[0]
+    file_name = url[2:] if url.startswith('./') else url
+    return url, file_name
+
+
+def is_local_asset(value):
+    if re.match(r'^(?:[a-z]+:)?//', value) or value.startswith(('/', 'data:')):
+        return False
+    file_name = split_ref(value)[1]
+    # Бандлы bundle_assets.py уже содержат хеш в имени файла
+    if file_name.startswith(BUNDLE_PREFIX):
+        return False
+    return file_name.endswith(ASSET_EXTENSIONS)
+
+
+class AssetRefCollector(HTMLParser):
+    """Собирает ссылки src/href на локальные CSS/JS вместе с позицией тега"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.refs = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in ('src', 'href') and value and is_local_asset(value):
+                self.refs.append({
+                    'pos': self.getpos(),
+                    'tag': self.get_starttag_text(),
+                    'element': tag,
+                    'attrs': dict(attrs),
+                    'attr': name,
+                    'value': value
+                })
+
+
+def collect_refs(html):
+    """
+    Ссылки на локальные CSS/JS в документе
+
+    Для каждой ссылки: start/end - смещения тега в строке html,
+    element и attrs - имя тега и его атрибуты
+    """
+    collector = AssetRefCollector()
+    collector.feed(html)
+    collector.close()
+
+    # getpos() считает строки только по \n (не по \r, \x0b, U+2028...)
+    line_starts = [0]
+    for line in html.split('\n'):
+        line_starts.append(line_starts[-1] + len(line) + 1)
+
+    for ref in collector.refs:
+        line, column = ref['pos']
+        ref['start'] = line_starts[line - 1] + column
+        ref['end'] = ref['start'] + len(ref['tag'])
+
+    return collector.refs
+
+
+def version_partials(script_path, root):
+    """
+    Проставляет версии HTML-фрагментам в fetch/loadPartial('...html') внутри скрипта
+
+    Возвращает True, если файл изменен
+    """
+    source = script_path.read_text(encoding='utf-8')
+
+    def replace(match):
+        partial = root / match.group(3)
+        if RUNTIME_PARTIALS.match(match.group(3)):
+            return f"{match.group(1)}{match.group(3)}{match.group(4)}"
+        if not partial.exists():
+            return match.group(0)
+        return f"{match.group(1)}{match.group(3)}?v={file_hash(partial)}{match.group(4)}"
+
+    updated = PARTIAL_PATTERN.sub(replace, source)
+    if updated == source:
+        return False
+
+    write_text_atomic(script_path, updated)
+    return True
+
+
+def rewrite_refs(html, refs, versions):
+    """Замена всех ссылок за один проход по документу"""
+    parts = []
+    cursor = 0
+
+    for ref in refs:
+        url, file_name = split_ref(ref['value'])
+        if file_name not in versions:
+            continue
+
+        start, end = ref['start'], ref['end']
+
+        new_value = f"{url}?v={versions[file_name]}"
+        attr_pattern = re.compile(rf"""(\b{ref['attr']}\s*=\s*["']?){re.escape(ref['value'])}""")
+        new_tag = attr_pattern.sub(lambda m: m.group(1) + new_value, ref['tag'], count=1)
+
+        parts.append(html[cursor:start])
+        parts.append(new_tag)
+        cursor = end
+
+    parts.append(html[cursor:])
+    return ''.join(parts)
+
+
+def build_manifest(index_file=INDEX_FILE, manifest_file=MANIFEST_FILE):
+    """
+    Обновляет версии ссылок в index.html
+
+    Возвращает словарь: versions {файл: хеш}, changed - файлы с новой версией,
+    missing - ссылки на несуществующие файлы
+    """
+    index_path = Path(index_file)
+    root = index_path.parent
+    html = index_path.read_text(encoding='utf-8')
+    refs = collect_refs(html)
+
+    missing = []
+    scripts_updated = []
+
+    # Сначала версии фрагментов внутри скриптов: это меняет хеш самих скриптов
+    for ref in refs:
+        file_name = split_ref(ref['value'])[1]
+        path = root / file_name
+        if file_name.endswith('.js') and path.exists() and version_partials(path, root):
+            scripts_updated.append(file_name)
+
+    versions = {}
+    for ref in refs:
+        file_name = split_ref(ref['value'])[1]
+        path = root / file_name
+        if path.exists():
+            versions[file_name] = file_hash(path)
+        elif file_name not in missing:
+            missing.append(file_name)
+
+    changed = sorted({
+        split_ref(ref['value'])[1] for ref in refs
+        if split_ref(ref['value'])[1] in versions
+        and not ref['value'].endswith(f"?v={versions[split_ref(ref['value'])[1]]}")
+    })
+
+    updated = rewrite_refs(html, refs, versions)
+    if updated != html:
+        write_text_atomic(index_path, updated)
+
+    write_json_atomic(root / manifest_file, dict(sorted(versions.items())))
+
+    return {
+        'versions': versions,
+        'changed': changed,
+        'scripts_updated': scripts_updated,
+        'missing': missing
+    }
+
+
+def main():
+    result = build_manifest()
+
+    print(f"Файлов в index.html: {len(result['versions'])}")
+    for file_name in result['scripts_updated']:
+        print(f"  обновлены версии HTML-фрагментов в {file_name}")
+    for file_name in result['changed']:
+        print(f"  новая версия: {file_name}?v={result['versions'][file_name]}")
+    for file_name in result['missing']:
+        print(f"  [WARNING] файл не найден: {file_name}")
+
+    if result['changed']:
+        print("Reload the page with Ctrl+F5 (hard reload)")
+    else:
+        print("Все версии актуальны, кеш посетителей не сбрасывается")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Хранилище бэкапов с адресацией по содержимому
+
+Вместо копий form.json.backup.YYYYMMDD_HHMMSS в корне сайта снимки хранятся
+в папке .backups/ сжатыми (gzip) и по хешу содержимого:
+- одинаковые снимки не дублируются;
+- старые снимки удаляются по правилам хранения (последние N, по дням, по неделям);
+- любой снимок можно восстановить.
+
+Использование:
+    python backup_store.py list [файл]
+    python backup_store.py restore <файл> [хеш или номер из list]
+    python backup_store.py prune
+    python backup_store.py import-legacy     # перенести старые *.backup.* файлы
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from safe_output import write_json_atomic, write_text_atomic
+from static_variants import republish
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+BACKUP_DIR = '.backups'
+
+# Правила хранения по умолчанию
+KEEP_LAST = 20
+KEEP_DAILY = 14
+KEEP_WEEKLY = 8
+
+# Старые бэкапы: form.json.backup.20251119_153000
+LEGACY_PATTERN = re.compile(r'^(?P<name>.+)\.backup\.(?P<stamp>\d{8}_\d{6})$')
+
+
+def _index_path(store):
+    return Path(store) / 'index.json'
+
+
+def _object_path(store, digest):
+    return Path(store) / 'objects' / digest[:2] / f'{digest}.gz'
+
+
+def load_index(store=BACKUP_DIR):
+    try:
+        with open(_index_path(store), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'snapshots': []}
+
+
+def save_index(index, store=BACKUP_DIR):
+    Path(store).mkdir(parents=True, exist_ok=True)
+    write_json_atomic(_index_path(store), index)
+
+
+def _record(store, name, data, created=None):
+    """Сохраняет содержимое под именем файла name, если оно отличается от последнего снимка"""
+    digest = hashlib.sha256(data).hexdigest()
+    index = load_index(store)
+
+    history = [s for s in index['snapshots'] if s['file'] == name]
+    if history and history[-1]['hash'] == digest:
+        return None
+
+    # Объект мог остаться от более раннего снимка с тем же содержимым
+    object_path = _object_path(store, digest)
+    if not object_path.exists():
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = object_path.with_suffix('.tmp')
+        with gzip.open(tmp_path, 'wb') as f:
+            f.write(data)
+        tmp_path.replace(object_path)
+
+    entry = {
+        'file': name,
+        'hash': digest,
+        'size': len(data),
+        'created': (created or datetime.now()).isoformat(timespec='seconds')
+    }
+    index['snapshots'].append(entry)
+    index['snapshots'].sort(key=lambda s: s['created'])
+    save_index(index, store)
+
+    return entry
+
+
+def snapshot(path, store=BACKUP_DIR):
+    """
+    Сохраняет снимок файла
+
+    Возвращает запись о снимке или None, если файла нет
+    или он не изменился с последнего снимка.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    return _record(store, path.name, path.read_bytes())
+
+
+def backup_file(path, store=BACKUP_DIR):
+    """Бэкап перед перезаписью файла с выводом в консоль (для скриптов синхронизации)"""
+    entry = snapshot(path, store)
+    if entry:
+        print(f"💾 Создан бэкап: {entry['file']} @ {entry['hash'][:12]} ({store}/)")
+        prune(store)
+    return entry
+
+
+def list_snapshots(file_name=None, store=BACKUP_DIR):
+    """Снимки (новые в конце), при необходимости только для одного файла"""
+    snapshots = load_index(store)['snapshots']
+    if file_name:
+        snapshots = [s for s in snapshots if s['file'] == Path(file_name).name]
+    return snapshots
+
+
+def read_snapshot(digest, store=BACKUP_DIR):
+    with gzip.open(_object_path(store, digest), 'rb') as f:
+        return f.read()
+
+
+def restore(path, ref=None, store=BACKUP_DIR):
+    """
+    Восстанавливает файл из снимка
+
+    ref: начало хеша или номер снимка из list (1 - самый новый); по умолчанию - последний
+    Текущая версия файла перед восстановлением тоже сохраняется в хранилище.
+    Сжатые версии и части по категориям (form.min.json, form-shards/)
+    пересоздаются, иначе сайт продолжит отдавать старые данные.
+    """
+    path = Path(path)
+    history = list_snapshots(path.name, store)
+    if not history:
+        raise LookupError(f"Нет снимков для {path.name}")
+
+    if ref is None:
+        entry = history[-1]
+    elif ref.isdigit() and int(ref) < 1:
+        # history[-0] - самый старый снимок, а не последний
+        raise LookupError(f"Неверный номер снимка '{ref}': нумерация начинается с 1 (самый новый)")
+    elif ref.isdigit() and int(ref) <= len(history):
+        entry = history[-int(ref)]
+    else:
+        matches = [s for s in history if s['hash'].startswith(ref)]
+        if not matches:
+            raise LookupError(f"Снимок '{ref}' не найден")
+        entry = matches[-1]
+
+    snapshot(path, store)
+    write_text_atomic(path, read_snapshot(entry['hash'], store).decode('utf-8'))
+    republish(path)
+
+    return entry
+
+
+def select_retained(snapshots, now=None, keep_last=KEEP_LAST, keep_daily=KEEP_DAILY, keep_weekly=KEEP_WEEKLY):
+    """
+    Выбор снимков одного файла, которые нужно оставить
+
+    Оставляются: последние keep_last снимков, самый новый снимок за каждый
+    из последних keep_daily дней и за каждую из последних keep_weekly недель.
+    """
+    now = now or datetime.now()
+    ordered = sorted(snapshots, key=lambda s: s['created'], reverse=True)
+    keep = {id(s) for s in ordered[:keep_last]}
+
+    seen_days = set()
+    seen_weeks = set()
+
+    for s in ordered:
+        created = datetime.fromisoformat(s['created'])
+
+        day = created.date()
+        if now - created <= timedelta(days=keep_daily) and day not in seen_days:
+            seen_days.add(day)
+            keep.add(id(s))
+
+        week = created.isocalendar()[:2]
+        if now - created <= timedelta(weeks=keep_weekly) and week not in seen_weeks:
+            seen_weeks.add(week)
+            keep.add(id(s))
+
+    return [s for s in snapshots if id(s) in keep]
+
+
+def prune(store=BACKUP_DIR, now=None, **policy):
+    """Удаляет снимки по правилам хранения и объекты, на которые больше нет ссылок"""
+    index = load_index(store)
+
+    by_file = {}
+    for s in index['snapshots']:
+        by_file.setdefault(s['file'], []).append(s)
+
+    retained = []
+    for snapshots in by_file.values():
+        retained.extend(select_retained(snapshots, now=now, **policy))
+    retained.sort(key=lambda s: s['created'])
+
+    removed = len(index['snapshots']) - len(retained)
+    index['snapshots'] = retained
+    save_index(index, store)
+
+    referenced = {s['hash'] for s in retained}
+    freed = 0
+    objects_dir = Path(store) / 'objects'
+    if objects_dir.exists():
+        for object_path in objects_dir.glob('*/*.gz'):
+            if object_path.name[:-3] not in referenced:
+                freed += object_path.stat().st_size
+                object_path.unlink()
+
+    return {'removed': removed, 'kept': len(retained), 'freed_bytes': freed}
+
+
+def import_legacy(directory='.', store=BACKUP_DIR):
+    """Переносит старые файлы *.backup.YYYYMMDD_HHMMSS в хранилище и удаляет их"""
+    candidates = []
+
+    for path in Path(directory).iterdir():
+        match = LEGACY_PATTERN.match(path.name)
+        if match and path.is_file():
+            created = datetime.strptime(match.group('stamp'), '%Y%m%d_%H%M%S')
+            candidates.append((created, match.group('name'), path))
+
+    imported = 0
+    for created, name, path in sorted(candidates):
+        if _record(store, name, path.read_bytes(), created):
+            imported += 1
+        path.unlink()
+
+    return {'files': len(candidates), 'imported': imported}
+
+
+def main(argv):
+    command = argv[1] if len(argv) > 1 else 'list'
+
+    if command == 'list':
+        snapshots = list_snapshots(argv[2] if len(argv) > 2 else None)
+        if not snapshots:
+            print("Снимков нет")
+        for number, s in enumerate(reversed(snapshots), 1):
+            print(f"  {number:3}. {s['created']}  {s['file']:20s} {s['hash'][:12]}  {s['size'] / 1024:.1f} KB")
+        return True
+
+    if command == 'restore':
+        if len(argv) < 3:
+            print("Использование: python backup_store.py restore <файл> [хеш или номер]")
+            return False
+        entry = restore(argv[2], argv[3] if len(argv) > 3 else None)
+        print(f"✓ {argv[2]} восстановлен из снимка {entry['hash'][:12]} от {entry['created']}")
+        return True
+
+    if command == 'prune':
+        stats = prune()
+        print(f"✓ Удалено снимков: {stats['removed']}, осталось: {stats['kept']}, "
+              f"освобождено: {stats['freed_bytes'] / 1024:.1f} KB")
+        return True
+
+    if command == 'import-legacy':
+        stats = import_legacy()
+        print(f"✓ Старых бэкапов: {stats['files']}, перенесено уникальных снимков: {stats['imported']}")
+        return True
+
+    print(f"Неизвестная команда: {command}")
+    print(__doc__)
+    return False
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(0 if main(sys.argv) else 1)
+    except LookupError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
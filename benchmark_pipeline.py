@@ -0,0 +1,410 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Замеры производительности конвейера данных сайта на синтетических таблицах
+
+Данные строятся из sheet_data.json и slides.json, увеличенных в 1, 10 и 100 раз.
+Работает полностью офлайн: вместо Google Sheets используется FakeTransport,
+все файлы пишутся во временную папку.
+
+Для каждого этапа (загрузка, дерево, сериализация, запись...) сохраняется
+лучшее время из нескольких повторов и пиковая память (tracemalloc).
+Результаты пишутся в .benchmarks/<дата>-<коммит>.json для сравнения между коммитами.
+
+Использование:
+    python benchmark_pipeline.py                      # масштабы 1, 10, 100
+    python benchmark_pipeline.py --scales 1 10 --repeat 5
+    python benchmark_pipeline.py --compare .benchmarks/старый.json
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from form_shards import publish_shards
+from sheet_cache import build_category_tree
+from sheet_fetch import FakeTransport, fetch_sheets
+from sheet_tree import link_tree, rows_to_dicts
+from static_variants import minify_json, publish_json
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+SHEET_DATA_FILE = 'sheet_data.json'
+SLIDES_FILE = 'slides.json'
+RESULTS_DIR = '.benchmarks'
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_REPEAT = 3
+
+# Вкладки, которые не являются категориями form.json
+SKIP_SHEETS = ['СЛАЙДЫ', 'СОБЫТИЯ', 'АКЦИИ', 'НОВОСТИ']
+
+
+class FakeWorksheet:
+    """Вкладка для функций sync_selective, которые принимают worksheet"""
+
+    def __init__(self, title, rows):
+        self.title = title
+        self.rows = rows
+
+    def get_all_values(self):
+        return [list(row) for row in self.rows]
+
+
+# ---------------------------------------------------------------------------
+# Синтетические данные
+# ---------------------------------------------------------------------------
+
+def scale_tree_sheet(rows, factor):
+    """
+    Повторяет строки вкладки factor раз
+
+    В каждой копии к ID, значению корня и первому сегменту путей "Родитель"
+    добавляется суффикс -xN, поэтому копии образуют отдельные деревья.
+    """
+    if not rows or 'ID' not in rows[0] or 'Родитель' not in rows[0]:
+        return [list(row) for row in rows]
+
+    headers = rows[0]
+    id_col = headers.index('ID')
+    parent_col = headers.index('Родитель')
+    value_col = headers.index('Значение') if 'Значение' in headers else None
+
+    result = [list(headers)]
+
+    for copy in range(factor):
+        suffix = f"-x{copy}" if copy else ''
+
+        for row in rows[1:]:
+            row = list(row) + [''] * (len(headers) - len(row))
+
+            if suffix:
+                row[id_col] = f"{row[id_col]}{suffix}" if row[id_col] else ''
+                parent = row[parent_col]
+                if parent:
+                    head, _, tail = parent.partition('/')
+                    row[parent_col] = f"{head}{suffix}/{tail}" if tail else f"{head}{suffix}"
+                elif value_col is not None:
+                    row[value_col] = f"{row[value_col]}{suffix}"
+
+            result.append(row)
+
+    return result
+
+
+def make_synthetic_data(sheet_data, slides, factor):
+    """Таблица и слайды, увеличенные в factor раз"""
+    sheets = {title: scale_tree_sheet(rows, factor) for title, rows in sheet_data.items()}
+    return sheets, [dict(slide) for _ in range(factor) for slide in slides]
+
+
+def category_titles(sheets):
+    return [title for title in sheets if not any(skip in title for skip in SKIP_SHEETS)]
+
+
+def write_csv_export(sheets, directory):
+    """CSV-файлы категорий в формате export_to_sheets (для import_from_csv)"""
+    directory.mkdir(parents=True, exist_ok=True)
+
+    for title in category_titles(sheets):
+        with open(directory / f"{title}.csv", 'w', encoding='utf-8-sig', newline='') as f:
+            csv.writer(f, delimiter='\t').writerows(sheets[title])
+
+
+# ---------------------------------------------------------------------------
+# Этапы
+# ---------------------------------------------------------------------------
+
+def stage_parse(ctx):
+    titles = category_titles(ctx['sheets'])
+    fetched = fetch_sheets(FakeTransport(ctx['sheets']), titles)
+    return [row for title in titles for row in rows_to_dicts(fetched['values'][title])]
+
+
+def stage_tree(ctx):
+    return link_tree(ctx['rows'])
+
+
+def stage_tree_categories(ctx):
+    """Сборка по вкладкам без кеша"""
+    return build_category_tree(ctx['category_sheets'])
+
+
+def stage_tree_incremental(ctx):
+    """Первая сборка через кеш отпечатков (как в sync_from_google_sheets.py)"""
+    output_file = ctx['workdir'] / 'form.json'
+    return build_category_tree(ctx['category_sheets'], output_file)
+
+
+def stage_tree_cached(ctx):
+    """Повторная сборка без изменений в таблице - все вкладки из кеша"""
+    return stage_tree_incremental(ctx)
+
+
+def stage_update_events(ctx):
+    from sync_selective import update_events
+
+    worksheet = FakeWorksheet('14_СОБЫТИЯ', ctx['sheets'].get('14_СОБЫТИЯ', []))
+    return update_events(worksheet, ctx['result'])
+
+
+def stage_serialise(ctx):
+    pretty = json.dumps(ctx['result'], ensure_ascii=False, indent=2)
+    return len(pretty) + len(minify_json(ctx['result']))
+
+
+def stage_write(ctx):
+    output_file = ctx['workdir'] / 'form.json'
+    publish_json(output_file, ctx['result'])
+    publish_shards(output_file, ctx['result'])
+
+
+def stage_slides(ctx):
+    """Отрисовка всех слайдов с пустым кешем"""
+    from slides_generator import render_slides
+
+    return render_slides(ctx['slides'], cache_file=ctx['workdir'] / 'slides_html.cache.json')
+
+
+def stage_slides_cached(ctx):
+    """Повторная генерация без изменений в слайдах - весь HTML из кеша"""
+    return stage_slides(ctx)
+
+
+def stage_flatten(ctx):
+    from export_to_sheets_v2 import flatten_item
+
+    return [row for item in ctx['result']['main'] for row in flatten_item(item)]
+
+
+def stage_import_csv(ctx):
+    from import_from_sheets import import_from_csv
+
+    # import_from_csv делает бэкап в .backups/ текущей папки - работаем во временной
+    cwd = os.getcwd()
+    os.chdir(ctx['workdir'])
+    try:
+        import_from_csv(str(ctx['csv_dir']), 'form.json')
+    finally:
+        os.chdir(cwd)
+
+
+# (название, функция, нужна ли чистая рабочая папка перед каждым запуском)
+STAGES = [
+    ('parse', stage_parse, False),
+    ('tree', stage_tree, False),
+    ('tree_categories', stage_tree_categories, False),
+    ('tree_incremental', stage_tree_incremental, True),
+    ('tree_cached', stage_tree_cached, False),
+    ('update_events', stage_update_events, False),
+    ('serialise', stage_serialise, False),
+    ('write', stage_write, True),
+    ('slides', stage_slides, True),
+    ('slides_cached', stage_slides_cached, False),
+    ('flatten', stage_flatten, False),
+    ('import_csv', stage_import_csv, True),
+]
+
+
+# ---------------------------------------------------------------------------
+# Запуск
+# ---------------------------------------------------------------------------
+
+def _fresh_dir(root, name):
+    return Path(tempfile.mkdtemp(prefix=f'{name}-', dir=root))
+
+
+def measure(func, ctx, repeat, fresh, root, name):
+    """
+    Лучшее время из repeat запусков и пиковая память отдельного запуска
+
+    Пиковая память измеряется отдельно: tracemalloc замедляет выполнение
+    """
+    def run(traced):
+        if fresh or 'workdir' not in ctx:
+            ctx['workdir'] = _fresh_dir(root, name)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            if traced:
+                tracemalloc.start()
+                try:
+                    func(ctx)
+                    return tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+
+            started = time.perf_counter()
+            func(ctx)
+            return time.perf_counter() - started
+
+    runs = [run(traced=False) for _ in range(repeat)]
+    peak = run(traced=True)
+
+    return {
+        'seconds': min(runs),
+        'runs': runs,
+        'peak_kb': round(peak / 1024, 1)
+    }
+
+
+def prepare_context(sheet_data, slides, factor, root):
+    """Входные данные всех этапов (подготовка не входит в замеры)"""
+    sheets, scaled_slides = make_synthetic_data(sheet_data, slides, factor)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        ctx = {'sheets': sheets, 'slides': scaled_slides}
+        ctx['category_sheets'] = [
+            (title, sheets[title]) for title in category_titles(sheets) if len(sheets[title]) > 1
+        ]
+        ctx['rows'] = stage_parse(ctx)
+        ctx['result'] = {'main': stage_tree(ctx)['tree']}
+
+    ctx['csv_dir'] = Path(root) / 'csv'
+    write_csv_export(sheets, ctx['csv_dir'])
+
+    return ctx
+
+
+def run_scale(sheet_data, slides, factor, repeat, stages):
+    with tempfile.TemporaryDirectory(prefix=f'bench-x{factor}-') as root:
+        ctx = prepare_context(sheet_data, slides, factor, root)
+
+        result = {
+            'rows': len(ctx['rows']),
+            'slides': len(ctx['slides']),
+            'form_json_kb': round(len(minify_json(ctx['result'])) / 1024, 1),
+            'stages': {}
+        }
+
+        for name, func, fresh in STAGES:
+            if stages and name not in stages:
+                continue
+
+            # Для этапов с кешем кеш должен уже существовать
+            warm_up = {'tree_cached': stage_tree_incremental, 'slides_cached': stage_slides}
+            if name in warm_up:
+                ctx['workdir'] = _fresh_dir(root, name)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    warm_up[name](ctx)
+
+            try:
+                result['stages'][name] = measure(func, ctx, repeat, fresh, root, name)
+            except ImportError as e:
+                # Модули с зависимостями (gspread, bs4) могут быть не установлены
+                result['stages'][name] = {'skipped': str(e)}
+
+            ctx.pop('workdir', None)
+
+        return result
+
+
+def git_commit():
+    try:
+        output = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        )
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_benchmarks(scales=None, repeat=DEFAULT_REPEAT, stages=None):
+    with open(SHEET_DATA_FILE, 'r', encoding='utf-8') as f:
+        sheet_data = json.load(f)
+    with open(SLIDES_FILE, 'r', encoding='utf-8') as f:
+        slides = json.load(f)
+
+    report = {
+        'commit': git_commit(),
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'repeat': repeat,
+        'scales': {}
+    }
+
+    for factor in scales or DEFAULT_SCALES:
+        print(f"\n📏 Масштаб x{factor}")
+        report['scales'][str(factor)] = run_scale(sheet_data, slides, factor, repeat, stages)
+        print_scale(report['scales'][str(factor)])
+
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Вывод и сравнение
+# ---------------------------------------------------------------------------
+
+def print_scale(scale):
+    print(f"   строк: {scale['rows']}, слайдов: {scale['slides']}, form.json: {scale['form_json_kb']} KB")
+
+    for name, stats in scale['stages'].items():
+        if 'skipped' in stats:
+            print(f"   {name:18s} пропущено ({stats['skipped']})")
+        else:
+            print(f"   {name:18s} {stats['seconds'] * 1000:10.2f} ms   пик {stats['peak_kb']:10.1f} KB")
+
+
+def compare(old_report, new_report):
+    """Печатает изменение времени и памяти по сравнению со старым отчетом"""
+    print(f"\n📊 Сравнение {old_report.get('commit')} -> {new_report.get('commit')}")
+
+    for factor, scale in new_report['scales'].items():
+        old_scale = old_report.get('scales', {}).get(factor)
+        if not old_scale:
+            continue
+
+        print(f"\n   x{factor}")
+        for name, stats in scale['stages'].items():
+            old_stats = old_scale['stages'].get(name)
+            if not old_stats or 'seconds' not in old_stats or 'seconds' not in stats:
+                continue
+
+            time_ratio = stats['seconds'] / old_stats['seconds'] if old_stats['seconds'] else 0
+            memory_ratio = stats['peak_kb'] / old_stats['peak_kb'] if old_stats['peak_kb'] else 0
+            marker = '⚠️ ' if time_ratio > 1.2 else '   '
+            print(f"   {marker}{name:18s} время x{time_ratio:.2f}   память x{memory_ratio:.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Замеры конвейера данных на синтетических таблицах')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES,
+                        help='во сколько раз увеличить sheet_data.json (по умолчанию 1 10 100)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='повторов каждого этапа, берется лучшее время')
+    parser.add_argument('--stages', nargs='+', choices=[name for name, _, _ in STAGES],
+                        help='запустить только указанные этапы')
+    parser.add_argument('--output', help='файл результатов (по умолчанию .benchmarks/<дата>-<коммит>.json)')
+    parser.add_argument('--compare', help='сравнить с сохраненным отчетом')
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.scales, args.repeat, args.stages)
+
+    output = Path(args.output) if args.output else (
+        Path(RESULTS_DIR) / f"{datetime.now():%Y%m%d_%H%M%S}-{report['commit']}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 Результаты: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            compare(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9492 @@
+parcelRequire=(function(modules,cache,entry,globalName){
+var previousRequire=typeof parcelRequire==='function'&&parcelRequire;
+var nodeRequire=typeof require==='function'&&require;
+function newRequire(name,jumped){
+if(!cache[name]){
+if(!modules[name]){
+var currentRequire=typeof parcelRequire==='function'&&parcelRequire;
+if(!jumped&&currentRequire){
+return currentRequire(name,true);
+}
+if(previousRequire){
+return previousRequire(name,true);
+}
+if(nodeRequire&&typeof name==='string'){
+return nodeRequire(name);
+}
+var err=new Error('Cannot find module \'' + name + '\'');
+err.code='MODULE_NOT_FOUND';
+throw err;
+}
+localRequire.resolve=resolve;
+localRequire.cache={};
+var module=cache[name]=new newRequire.Module(name);
+modules[name][0].call(module.exports,localRequire,module,module.exports,this);
+}
+return cache[name].exports;
+function localRequire(x){
+return newRequire(localRequire.resolve(x));
+}
+function resolve(x){
+return modules[name][1][x]||x;
+}
+}
+function Module(moduleName){
+this.id=moduleName;
+this.bundle=newRequire;
+this.exports={};
+}
+newRequire.isParcelRequire=true;
+newRequire.Module=Module;
+newRequire.modules=modules;
+newRequire.cache=cache;
+newRequire.parent=previousRequire;
+newRequire.register=function(id,exports){
+modules[id]=[function(require,module){
+module.exports=exports;
+},{}];
+};
+var error;
+for(var i=0;i<entry.length;i++){
+try{
+newRequire(entry[i]);
+}catch(e){
+if(!error){
+error=e;
+}
+}
+}
+if(entry.length){
+var mainExports=newRequire(entry[entry.length - 1]);
+if(typeof exports==="object"&&typeof module!=="undefined"){
+module.exports=mainExports;
+}else if(typeof define==="function"&&define.amd){
+define(function(){
+return mainExports;
+});
+}else if(globalName){
+this[globalName]=mainExports;
+}
+}
+parcelRequire=newRequire;
+if(error){
+throw error;
+}
+return newRequire;
+})({
+"BQvw":[function(require,module,exports){
+var define;
+var global=arguments[3];
+(function(global,factory){
+if(typeof define=='function'&&define.amd){
+define(factory);
+}else if(typeof module=='object'&&module.exports){
+module.exports=factory();
+}else{
+global.EvEmitter=factory();
+}
+}(typeof window!='undefined'?window:this,function(){
+"use strict";
+function EvEmitter(){}
+var proto=EvEmitter.prototype;
+proto.on=function(eventName,listener){
+if(!eventName||!listener){
+return;
+}
+var events=this._events=this._events||{};
+var listeners=events[eventName]=events[eventName]||[];
+if(listeners.indexOf(listener)==-1){
+listeners.push(listener);
+}
+return this;
+};
+proto.once=function(eventName,listener){
+if(!eventName||!listener){
+return;
+}
+this.on(eventName,listener);
+var onceEvents=this._onceEvents=this._onceEvents||{};
+var onceListeners=onceEvents[eventName]=onceEvents[eventName]||{};
+onceListeners[listener]=true;
+return this;
+};
+proto.off=function(eventName,listener){
+var listeners=this._events&&this._events[eventName];
+if(!listeners||!listeners.length){
+return;
+}
+var index=listeners.indexOf(listener);
+if(index!=-1){
+listeners.splice(index,1);
+}
+return this;
+};
+proto.emitEvent=function(eventName,args){
+var listeners=this._events&&this._events[eventName];
+if(!listeners||!listeners.length){
+return;
+}
+listeners=listeners.slice(0);
+args=args||[];
+var onceListeners=this._onceEvents&&this._onceEvents[eventName];
+for(var i=0;i<listeners.length;i++){
+var listener=listeners[i]
+var isOnce=onceListeners&&onceListeners[listener];
+if(isOnce){
+this.off(eventName,listener);
+delete onceListeners[listener];
+}
+listener.apply(this,args);
+}
+return this;
+};
+proto.allOff=function(){
+delete this._events;
+delete this._onceEvents;
+};
+return EvEmitter;
+}));
+},{}],
+"lc7f":[function(require,module,exports){
+var define;
+(function(window,factory){
+'use strict';
+if(typeof define=='function'&&define.amd){
+define([
+'ev-emitter/ev-emitter'
+],function(EvEmitter){
+return factory(window,EvEmitter);
+});
+}else if(typeof module=='object'&&module.exports){
+module.exports=factory(
+window,
+require('ev-emitter')
+);
+}else{
+window.imagesLoaded=factory(
+window,
+window.EvEmitter
+);
+}
+})(typeof window!=='undefined'?window:this,
+function factory(window,EvEmitter){
+'use strict';
+var $=window.jQuery;
+var console=window.console;
+function extend(a,b){
+for(var prop in b){
+a[prop]=b[prop];
+}
+return a;
+}
+var arraySlice=Array.prototype.slice;
+function makeArray(obj){
+if(Array.isArray(obj)){
+return obj;
+}
+var isArrayLike=typeof obj=='object'&&typeof obj.length=='number';
+if(isArrayLike){
+return arraySlice.call(obj);
+}
+return[obj];
+}
+function ImagesLoaded(elem,options,onAlways){
+if(!(this instanceof ImagesLoaded)){
+return new ImagesLoaded(elem,options,onAlways);
+}
+var queryElem=elem;
+if(typeof elem=='string'){
+queryElem=document.querySelectorAll(elem);
+}
+if(!queryElem){
+console.error('Bad element for imagesLoaded ' +(queryElem||elem));
+return;
+}
+this.elements=makeArray(queryElem);
+this.options=extend({},this.options);
+if(typeof options=='function'){
+onAlways=options;
+}else{
+extend(this.options,options);
+}
+if(onAlways){
+this.on('always',onAlways);
+}
+this.getImages();
+if($){
+this.jqDeferred=new $.Deferred();
+}
+setTimeout(this.check.bind(this));
+}
+ImagesLoaded.prototype=Object.create(EvEmitter.prototype);
+ImagesLoaded.prototype.options={};
+ImagesLoaded.prototype.getImages=function(){
+this.images=[];
+this.elements.forEach(this.addElementImages,this);
+};
+ImagesLoaded.prototype.addElementImages=function(elem){
+if(elem.nodeName=='IMG'){
+this.addImage(elem);
+}
+if(this.options.background===true){
+this.addElementBackgroundImages(elem);
+}
+var nodeType=elem.nodeType;
+if(!nodeType||!elementNodeTypes[nodeType]){
+return;
+}
+var childImgs=elem.querySelectorAll('img');
+for(var i=0;i<childImgs.length;i++){
+var img=childImgs[i];
+this.addImage(img);
+}
+if(typeof this.options.background=='string'){
+var children=elem.querySelectorAll(this.options.background);
+for(i=0;i<children.length;i++){
+var child=children[i];
+this.addElementBackgroundImages(child);
+}
+}
+};
+var elementNodeTypes={
+1:true,
+9:true,
+11:true
+};
+ImagesLoaded.prototype.addElementBackgroundImages=function(elem){
+var style=getComputedStyle(elem);
+if(!style){
+return;
+}
+var reURL=/url\((['"])?(.*?)\1\)/gi;
+var matches=reURL.exec(style.backgroundImage);
+while(matches!==null){
+var url=matches&&matches[2];
+if(url){
+this.addBackground(url,elem);
+}
+matches=reURL.exec(style.backgroundImage);
+}
+};
+ImagesLoaded.prototype.addImage=function(img){
+var loadingImage=new LoadingImage(img);
+this.images.push(loadingImage);
+};
+ImagesLoaded.prototype.addBackground=function(url,elem){
+var background=new Background(url,elem);
+this.images.push(background);
+};
+ImagesLoaded.prototype.check=function(){
+var _this=this;
+this.progressedCount=0;
+this.hasAnyBroken=false;
+if(!this.images.length){
+this.complete();
+return;
+}
+function onProgress(image,elem,message){
+setTimeout(function(){
+_this.progress(image,elem,message);
+});
+}
+this.images.forEach(function(loadingImage){
+loadingImage.once('progress',onProgress);
+loadingImage.check();
+});
+};
+ImagesLoaded.prototype.progress=function(image,elem,message){
+this.progressedCount++;
+this.hasAnyBroken=this.hasAnyBroken||!image.isLoaded;
+this.emitEvent('progress',[this,image,elem]);
+if(this.jqDeferred&&this.jqDeferred.notify){
+this.jqDeferred.notify(this,image);
+}
+if(this.progressedCount==this.images.length){
+this.complete();
+}
+if(this.options.debug&&console){
+console.log('progress: ' + message,image,elem);
+}
+};
+ImagesLoaded.prototype.complete=function(){
+var eventName=this.hasAnyBroken?'fail':'done';
+this.isComplete=true;
+this.emitEvent(eventName,[this]);
+this.emitEvent('always',[this]);
+if(this.jqDeferred){
+var jqMethod=this.hasAnyBroken?'reject':'resolve';
+this.jqDeferred[jqMethod](this);
+}
+};
+function LoadingImage(img){
+this.img=img;
+}
+LoadingImage.prototype=Object.create(EvEmitter.prototype);
+LoadingImage.prototype.check=function(){
+var isComplete=this.getIsImageComplete();
+if(isComplete){
+this.confirm(this.img.naturalWidth!==0,'naturalWidth');
+return;
+}
+this.proxyImage=new Image();
+this.proxyImage.addEventListener('load',this);
+this.proxyImage.addEventListener('error',this);
+this.img.addEventListener('load',this);
+this.img.addEventListener('error',this);
+this.proxyImage.src=this.img.src;
+};
+LoadingImage.prototype.getIsImageComplete=function(){
+return this.img.complete&&this.img.naturalWidth;
+};
+LoadingImage.prototype.confirm=function(isLoaded,message){
+this.isLoaded=isLoaded;
+this.emitEvent('progress',[this,this.img,message]);
+};
+LoadingImage.prototype.handleEvent=function(event){
+var method='on' + event.type;
+if(this[method]){
+this[method](event);
+}
+};
+LoadingImage.prototype.onload=function(){
+this.confirm(true,'onload');
+this.unbindEvents();
+};
+LoadingImage.prototype.onerror=function(){
+this.confirm(false,'onerror');
+this.unbindEvents();
+};
+LoadingImage.prototype.unbindEvents=function(){
+this.proxyImage.removeEventListener('load',this);
+this.proxyImage.removeEventListener('error',this);
+this.img.removeEventListener('load',this);
+this.img.removeEventListener('error',this);
+};
+function Background(url,element){
+this.url=url;
+this.element=element;
+this.img=new Image();
+}
+Background.prototype=Object.create(LoadingImage.prototype);
+Background.prototype.check=function(){
+this.img.addEventListener('load',this);
+this.img.addEventListener('error',this);
+this.img.src=this.url;
+var isComplete=this.getIsImageComplete();
+if(isComplete){
+this.confirm(this.img.naturalWidth!==0,'naturalWidth');
+this.unbindEvents();
+}
+};
+Background.prototype.unbindEvents=function(){
+this.img.removeEventListener('load',this);
+this.img.removeEventListener('error',this);
+};
+Background.prototype.confirm=function(isLoaded,message){
+this.isLoaded=isLoaded;
+this.emitEvent('progress',[this,this.element,message]);
+};
+ImagesLoaded.makeJQueryPlugin=function(jQuery){
+jQuery=jQuery||window.jQuery;
+if(!jQuery){
+return;
+}
+$=jQuery;
+$.fn.imagesLoaded=function(options,callback){
+var instance=new ImagesLoaded(this,options,callback);
+return instance.jqDeferred.promise($(this));
+};
+};
+ImagesLoaded.makeJQueryPlugin();
+return ImagesLoaded;
+});
+},{
+"ev-emitter":"BQvw"
+}],
+"MgTz":[function(require,module,exports){
+"use strict";
+Object.defineProperty(exports,"__esModule",{
+value:true
+});
+exports.preloadImages=void 0;
+var imagesLoaded=require('imagesloaded');
+var preloadImages=exports.preloadImages=function preloadImages(){
+var selector=arguments.length>0&&arguments[0]!==undefined?arguments[0]:'img';
+return new Promise(function(resolve){
+imagesLoaded(document.querySelectorAll(selector),{
+background:true
+},resolve);
+});
+};
+},{
+"imagesloaded":"lc7f"
+}],
+"qr24":[function(require,module,exports){
+"use strict";
+Object.defineProperty(exports,"__esModule",{
+value:true
+});
+exports.Navigation=void 0;
+function _typeof(o){
+"@babel/helpers - typeof";
+return _typeof="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(o){
+return typeof o;
+}:function(o){
+return o&&"function"==typeof Symbol&&o.constructor===Symbol&&o!==Symbol.prototype?"symbol":typeof o;
+},_typeof(o);
+}
+function _classCallCheck(a,n){
+if(!(a instanceof n))throw new TypeError("Cannot call a class as a function");
+}
+function _defineProperties(e,r){
+for(var t=0;t<r.length;t++){
+var o=r[t];
+o.enumerable=o.enumerable||!1,o.configurable=!0,"value" in o&&(o.writable=!0),Object.defineProperty(e,_toPropertyKey(o.key),o);
+}
+}
+function _createClass(e,r,t){
+return r&&_defineProperties(e.prototype,r),t&&_defineProperties(e,t),Object.defineProperty(e,"prototype",{
+writable:!1
+}),e;
+}
+function _toPropertyKey(t){
+var i=_toPrimitive(t,"string");
+return "symbol"==_typeof(i)?i:i + "";
+}
+function _toPrimitive(t,r){
+if("object"!=_typeof(t)||!t)return t;
+var e=t[Symbol.toPrimitive];
+if(void 0!==e){
+var i=e.call(t,r||"default");
+if("object"!=_typeof(i))return i;
+throw new TypeError("@@toPrimitive must return a primitive value.");
+}
+return("string"===r?String:Number)(t);
+}
+var Navigation=exports.Navigation= function(){
+function Navigation(el){
+_classCallCheck(this,Navigation);
+this.DOM={
+el:el
+};
+this.DOM.ctrls={
+next:this.DOM.el.querySelector('.slides-nav__button--next'),
+prev:this.DOM.el.querySelector('.slides-nav__button--prev')
+};
+this.DOM.current=this.DOM.el.querySelector('.slides-nav__index-current');
+this.DOM.total=this.DOM.el.querySelector('.slides-nav__index-total');
+}
+return _createClass(Navigation,[{
+key:"updateCurrent",
+value:function updateCurrent(position){
+this.DOM.current.innerHTML=position<10?"0".concat(position + 1):position;
+}
+}]);
+}();
+},{}],
+"Drnq":[function(require,module,exports){
+"use strict";
+Object.defineProperty(exports,"__esModule",{
+value:true
+});
+exports.Slide=void 0;
+function _typeof(o){
+"@babel/helpers - typeof";
+return _typeof="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(o){
+return typeof o;
+}:function(o){
+return o&&"function"==typeof Symbol&&o.constructor===Symbol&&o!==Symbol.prototype?"symbol":typeof o;
+},_typeof(o);
+}
+function _defineProperties(e,r){
+for(var t=0;t<r.length;t++){
+var o=r[t];
+o.enumerable=o.enumerable||!1,o.configurable=!0,"value" in o&&(o.writable=!0),Object.defineProperty(e,_toPropertyKey(o.key),o);
+}
+}
+function _createClass(e,r,t){
+return r&&_defineProperties(e.prototype,r),t&&_defineProperties(e,t),Object.defineProperty(e,"prototype",{
+writable:!1
+}),e;
+}
+function _toPropertyKey(t){
+var i=_toPrimitive(t,"string");
+return "symbol"==_typeof(i)?i:i + "";
+}
+function _toPrimitive(t,r){
+if("object"!=_typeof(t)||!t)return t;
+var e=t[Symbol.toPrimitive];
+if(void 0!==e){
+var i=e.call(t,r||"default");
+if("object"!=_typeof(i))return i;
+throw new TypeError("@@toPrimitive must return a primitive value.");
+}
+return("string"===r?String:Number)(t);
+}
+function _classCallCheck(a,n){
+if(!(a instanceof n))throw new TypeError("Cannot call a class as a function");
+}
+var Slide=exports.Slide= _createClass(function Slide(el){
+_classCallCheck(this,Slide);
+this.DOM={
+el:el
+};
+this.DOM.imgWrap=this.DOM.el.querySelector('.slide__img-wrap');
+this.DOM.img=this.DOM.imgWrap.querySelector('.slide__img');
+this.DOM.headline=this.DOM.el.querySelector('.slides__caption-headline');
+this.DOM.text=this.DOM.headline.querySelectorAll('.text-row > span');
+this.DOM.link=this.DOM.el.querySelector('.slides__caption-link');
+this.textSplits=[];
+var _this=this;
+this.DOM.text.forEach(function(textEl){
+var existingSplits=textEl.querySelectorAll('.split-line');
+existingSplits.forEach(function(splitEl){
+var parent=splitEl.parentNode;
+while(splitEl.firstChild){
+parent.insertBefore(splitEl.firstChild,splitEl);
+}
+parent.removeChild(splitEl);
+});
+textEl.style.overflow='hidden';
+var split=new window.SplitText(textEl,{
+type:"lines",
+linesClass:"split-line"
+});
+_this.textSplits.push(split);
+});
+this.textLines=[];
+this.textSplits.forEach(function(s){
+_this.textLines=_this.textLines.concat(Array.from(s.lines));
+});
+var existingLinkSplits=this.DOM.link.querySelectorAll('.split-line');
+existingLinkSplits.forEach(function(splitEl){
+var parent=splitEl.parentNode;
+while(splitEl.firstChild){
+parent.insertBefore(splitEl.firstChild,splitEl);
+}
+parent.removeChild(splitEl);
+});
+this.DOM.link.style.overflow='hidden';
+this.linkSplit=new window.SplitText(this.DOM.link,{
+type:"lines",
+linesClass:"split-line"
+});
+if(typeof window!=='undefined'&&window.gsap){
+window.gsap.set(this.textLines,{yPercent:100,opacity:0});
+window.gsap.set(this.linkSplit.lines,{yPercent:100,opacity:0});
+}
+});
+},{}],
+"dr5l":[function(require,module,exports){
+'use strict';
+var R=typeof Reflect==='object'?Reflect:null;
+var ReflectApply=R&&typeof R.apply==='function'?R.apply:function ReflectApply(target,receiver,args){
+return Function.prototype.apply.call(target,receiver,args);
+};
+var ReflectOwnKeys;
+if(R&&typeof R.ownKeys==='function'){
+ReflectOwnKeys=R.ownKeys;
+}else if(Object.getOwnPropertySymbols){
+ReflectOwnKeys=function ReflectOwnKeys(target){
+return Object.getOwnPropertyNames(target).concat(Object.getOwnPropertySymbols(target));
+};
+}else{
+ReflectOwnKeys=function ReflectOwnKeys(target){
+return Object.getOwnPropertyNames(target);
+};
+}
+function ProcessEmitWarning(warning){
+if(console&&console.warn)console.warn(warning);
+}
+var NumberIsNaN=Number.isNaN||function NumberIsNaN(value){
+return value!==value;
+};
+function EventEmitter(){
+EventEmitter.init.call(this);
+}
+module.exports=EventEmitter;
+module.exports.once=once;
+EventEmitter.EventEmitter=EventEmitter;
+EventEmitter.prototype._events=undefined;
+EventEmitter.prototype._eventsCount=0;
+EventEmitter.prototype._maxListeners=undefined;
+var defaultMaxListeners=10;
+function checkListener(listener){
+if(typeof listener!=='function'){
+throw new TypeError('The "listener" argument must be of type Function. Received type ' + typeof listener);
+}
+}
+Object.defineProperty(EventEmitter,'defaultMaxListeners',{
+enumerable:true,
+get:function(){
+return defaultMaxListeners;
+},
+set:function(arg){
+if(typeof arg!=='number'||arg<0||NumberIsNaN(arg)){
+throw new RangeError('The value of "defaultMaxListeners" is out of range. It must be a non-negative number. Received ' + arg + '.');
+}
+defaultMaxListeners=arg;
+}
+});
+EventEmitter.init=function(){
+if(this._events===undefined||this._events===Object.getPrototypeOf(this)._events){
+this._events=Object.create(null);
+this._eventsCount=0;
+}
+this._maxListeners=this._maxListeners||undefined;
+};
+EventEmitter.prototype.setMaxListeners=function setMaxListeners(n){
+if(typeof n!=='number'||n<0||NumberIsNaN(n)){
+throw new RangeError('The value of "n" is out of range. It must be a non-negative number. Received ' + n + '.');
+}
+this._maxListeners=n;
+return this;
+};
+function _getMaxListeners(that){
+if(that._maxListeners===undefined)return EventEmitter.defaultMaxListeners;
+return that._maxListeners;
+}
+EventEmitter.prototype.getMaxListeners=function getMaxListeners(){
+return _getMaxListeners(this);
+};
+EventEmitter.prototype.emit=function emit(type){
+var args=[];
+for(var i=1;i<arguments.length;i++)args.push(arguments[i]);
+var doError=type==='error';
+var events=this._events;
+if(events!==undefined)doError=doError&&events.error===undefined;
+else if(!doError)return false;
+if(doError){
+var er;
+if(args.length>0)er=args[0];
+if(er instanceof Error){
+throw er;
+}
+var err=new Error('Unhandled error.' +(er?' (' + er.message + ')':''));
+err.context=er;
+throw err;
+}
+var handler=events[type];
+if(handler===undefined)return false;
+if(typeof handler==='function'){
+ReflectApply(handler,this,args);
+}else{
+var len=handler.length;
+var listeners=arrayClone(handler,len);
+for(var i=0;i<len;++i)ReflectApply(listeners[i],this,args);
+}
+return true;
+};
+function _addListener(target,type,listener,prepend){
+var m;
+var events;
+var existing;
+checkListener(listener);
+events=target._events;
+if(events===undefined){
+events=target._events=Object.create(null);
+target._eventsCount=0;
+}else{
+if(events.newListener!==undefined){
+target.emit('newListener',type,listener.listener?listener.listener:listener);
+events=target._events;
+}
+existing=events[type];
+}
+if(existing===undefined){
+existing=events[type]=listener;
+++target._eventsCount;
+}else{
+if(typeof existing==='function'){
+existing=events[type]=prepend?[listener,existing]:[existing,listener];
+}else if(prepend){
+existing.unshift(listener);
+}else{
+existing.push(listener);
+}
+m=_getMaxListeners(target);
+if(m>0&&existing.length>m&&!existing.warned){
+existing.warned=true;
+var w=new Error('Possible EventEmitter memory leak detected. ' + existing.length + ' ' + String(type)+ ' listeners ' + 'added. Use emitter.setMaxListeners() to ' + 'increase limit');
+w.name='MaxListenersExceededWarning';
+w.emitter=target;
+w.type=type;
+w.count=existing.length;
+ProcessEmitWarning(w);
+}
+}
+return target;
+}
+EventEmitter.prototype.addListener=function addListener(type,listener){
+return _addListener(this,type,listener,false);
+};
+EventEmitter.prototype.on=EventEmitter.prototype.addListener;
+EventEmitter.prototype.prependListener=function prependListener(type,listener){
+return _addListener(this,type,listener,true);
+};
+function onceWrapper(){
+if(!this.fired){
+this.target.removeListener(this.type,this.wrapFn);
+this.fired=true;
+if(arguments.length===0)return this.listener.call(this.target);
+return this.listener.apply(this.target,arguments);
+}
+}
+function _onceWrap(target,type,listener){
+var state={
+fired:false,
+wrapFn:undefined,
+target:target,
+type:type,
+listener:listener
+};
+var wrapped=onceWrapper.bind(state);
+wrapped.listener=listener;
+state.wrapFn=wrapped;
+return wrapped;
+}
+EventEmitter.prototype.once=function once(type,listener){
+checkListener(listener);
+this.on(type,_onceWrap(this,type,listener));
+return this;
+};
+EventEmitter.prototype.prependOnceListener=function prependOnceListener(type,listener){
+checkListener(listener);
+this.prependListener(type,_onceWrap(this,type,listener));
+return this;
+};
+EventEmitter.prototype.removeListener=function removeListener(type,listener){
+var list,events,position,i,originalListener;
+checkListener(listener);
+events=this._events;
+if(events===undefined)return this;
+list=events[type];
+if(list===undefined)return this;
+if(list===listener||list.listener===listener){
+if(--this._eventsCount===0)this._events=Object.create(null);
+else{
+delete events[type];
+if(events.removeListener)this.emit('removeListener',type,list.listener||listener);
+}
+}else if(typeof list!=='function'){
+position=-1;
+for(i=list.length - 1;i>=0;i--){
+if(list[i]===listener||list[i].listener===listener){
+originalListener=list[i].listener;
+position=i;
+break;
+}
+}
+if(position<0)return this;
+if(position===0)list.shift();
+else{
+spliceOne(list,position);
+}
+if(list.length===1)events[type]=list[0];
+if(events.removeListener!==undefined)this.emit('removeListener',type,originalListener||listener);
+}
+return this;
+};
+EventEmitter.prototype.off=EventEmitter.prototype.removeListener;
+EventEmitter.prototype.removeAllListeners=function removeAllListeners(type){
+var listeners,events,i;
+events=this._events;
+if(events===undefined)return this;
+if(events.removeListener===undefined){
+if(arguments.length===0){
+this._events=Object.create(null);
+this._eventsCount=0;
+}else if(events[type]!==undefined){
+if(--this._eventsCount===0)this._events=Object.create(null);
+else delete events[type];
+}
+return this;
+}
+if(arguments.length===0){
+var keys=Object.keys(events);
+var key;
+for(i=0;i<keys.length;++i){
+key=keys[i];
+if(key==='removeListener')continue;
+this.removeAllListeners(key);
+}
+this.removeAllListeners('removeListener');
+this._events=Object.create(null);
+this._eventsCount=0;
+return this;
+}
+listeners=events[type];
+if(typeof listeners==='function'){
+this.removeListener(type,listeners);
+}else if(listeners!==undefined){
+for(i=listeners.length - 1;i>=0;i--){
+this.removeListener(type,listeners[i]);
+}
+}
+return this;
+};
+function _listeners(target,type,unwrap){
+var events=target._events;
+if(events===undefined)return[];
+var evlistener=events[type];
+if(evlistener===undefined)return[];
+if(typeof evlistener==='function')return unwrap?[evlistener.listener||evlistener]:[evlistener];
+return unwrap?unwrapListeners(evlistener):arrayClone(evlistener,evlistener.length);
+}
+EventEmitter.prototype.listeners=function listeners(type){
+return _listeners(this,type,true);
+};
+EventEmitter.prototype.rawListeners=function rawListeners(type){
+return _listeners(this,type,false);
+};
+EventEmitter.listenerCount=function(emitter,type){
+if(typeof emitter.listenerCount==='function'){
+return emitter.listenerCount(type);
+}else{
+return listenerCount.call(emitter,type);
+}
+};
+EventEmitter.prototype.listenerCount=listenerCount;
+function listenerCount(type){
+var events=this._events;
+if(events!==undefined){
+var evlistener=events[type];
+if(typeof evlistener==='function'){
+return 1;
+}else if(evlistener!==undefined){
+return evlistener.length;
+}
+}
+return 0;
+}
+EventEmitter.prototype.eventNames=function eventNames(){
+return this._eventsCount>0?ReflectOwnKeys(this._events):[];
+};
+function arrayClone(arr,n){
+var copy=new Array(n);
+for(var i=0;i<n;++i)copy[i]=arr[i];
+return copy;
+}
+function spliceOne(list,index){
+for(;index + 1<list.length;index++)list[index]=list[index + 1];
+list.pop();
+}
+function unwrapListeners(arr){
+var ret=new Array(arr.length);
+for(var i=0;i<ret.length;++i){
+ret[i]=arr[i].listener||arr[i];
+}
+return ret;
+}
+function once(emitter,name){
+return new Promise(function(resolve,reject){
+function errorListener(err){
+emitter.removeListener(name,resolver);
+reject(err);
+}
+function resolver(){
+if(typeof emitter.removeListener==='function'){
+emitter.removeListener('error',errorListener);
+}
+resolve([].slice.call(arguments));
+};
+eventTargetAgnosticAddListener(emitter,name,resolver,{
+once:true
+});
+if(name!=='error'){
+addErrorHandlerIfEventEmitter(emitter,errorListener,{
+once:true
+});
+}
+});
+}
+function addErrorHandlerIfEventEmitter(emitter,handler,flags){
+if(typeof emitter.on==='function'){
+eventTargetAgnosticAddListener(emitter,'error',handler,flags);
+}
+}
+function eventTargetAgnosticAddListener(emitter,name,listener,flags){
+if(typeof emitter.on==='function'){
+if(flags.once){
+emitter.once(name,listener);
+}else{
+emitter.on(name,listener);
+}
+}else if(typeof emitter.addEventListener==='function'){
+emitter.addEventListener(name,function wrapListener(arg){
+if(flags.once){
+emitter.removeEventListener(name,wrapListener);
+}
+listener(arg);
+});
+}else{
+throw new TypeError('The "emitter" argument must be of type EventEmitter. Received type ' + typeof emitter);
+}
+}
+},{}],
+"TNS6":[function(require,module,exports){
+"use strict";
+Object.defineProperty(exports,"__esModule",{
+value:true
+});
+exports.wrapYoyo=exports.wrap=exports.unitize=exports.toArray=exports.splitColor=exports.snap=exports.shuffle=exports.selector=exports.random=exports.pipe=exports.normalize=exports.mapRange=exports.interpolate=exports.gsap=exports.getUnit=exports.distribute=exports.default=exports.clamp=exports._ticker=exports._sortPropTweensByPriority=exports._setDefaults=exports._roundModifier=exports._round=exports._replaceRandom=exports._renderComplexString=exports._removeLinkedListItem=exports._relExp=exports._plugins=exports._parseRelative=exports._numWithUnitExp=exports._numExp=exports._missingPlugin=exports._isUndefined=exports._isString=exports._getSetter=exports._getProperty=exports._getCache=exports._forEachName=exports._config=exports._colorStringFilter=exports._colorExp=exports._checkPlugin=exports.TweenMax=exports.TweenLite=exports.Tween=exports.TimelineMax=exports.TimelineLite=exports.Timeline=exports.Strong=exports.SteppedEase=exports.Sine=exports.Quint=exports.Quart=exports.Quad=exports.PropTween=exports.Power4=exports.Power3=exports.Power2=exports.Power1=exports.Power0=exports.Linear=exports.GSCache=exports.Expo=exports.Elastic=exports.Cubic=exports.Circ=exports.Bounce=exports.Back=exports.Animation=void 0;
+function _assertThisInitialized(self){
+if(self===void 0){
+throw new ReferenceError("this hasn't been initialised - super() hasn't been called");
+}
+return self;
+}
+function _inheritsLoose(subClass,superClass){
+subClass.prototype=Object.create(superClass.prototype);
+subClass.prototype.constructor=subClass;
+subClass.__proto__=superClass;
+}
+var _config=exports._config={
+autoSleep:120,
+force3D:"auto",
+nullTargetWarn:1,
+units:{
+lineHeight:""
+}
+},
+_defaults={
+duration:.5,
+overwrite:false,
+delay:0
+},
+_suppressOverwrites,
+_reverting,
+_context,
+_bigNum=1e8,
+_tinyNum=1 / _bigNum,
+_2PI=Math.PI*2,
+_HALF_PI=_2PI / 4,
+_gsID=0,
+_sqrt=Math.sqrt,
+_cos=Math.cos,
+_sin=Math.sin,
+_isString=exports._isString=function _isString(value){
+return typeof value==="string";
+},
+_isFunction=function _isFunction(value){
+return typeof value==="function";
+},
+_isNumber=function _isNumber(value){
+return typeof value==="number";
+},
+_isUndefined=exports._isUndefined=function _isUndefined(value){
+return typeof value==="undefined";
+},
+_isObject=function _isObject(value){
+return typeof value==="object";
+},
+_isNotFalse=function _isNotFalse(value){
+return value!==false;
+},
+_windowExists=function _windowExists(){
+return typeof window!=="undefined";
+},
+_isFuncOrString=function _isFuncOrString(value){
+return _isFunction(value)||_isString(value);
+},
+_isTypedArray=typeof ArrayBuffer==="function"&&ArrayBuffer.isView||function(){},
+_isArray=Array.isArray,
+_strictNumExp=/(?:-?\.?\d|\.)+/gi,
+_numExp=exports._numExp=/[-+=.]*\d+[.e\-+]*\d*[e\-+]*\d*/g,
+_numWithUnitExp=exports._numWithUnitExp=/[-+=.]*\d+[.e-]*\d*[a-z%]*/g,
+_complexStringNumExp=/[-+=.]*\d+\.?\d*(?:e-|e\+)?\d*/gi,
+_relExp=exports._relExp=/[+-]=-?[.\d]+/,
+_delimitedValueExp=/[^,'"\[\]\s]+/gi,
+_unitExp=/^[+\-=e\s\d]*\d+[.\d]*([a-z]*|%)\s*$/i,
+_globalTimeline,
+_win,
+_coreInitted,
+_doc,
+_globals={},
+_installScope={},
+_coreReady,
+_install=function _install(scope){
+return(_installScope=_merge(scope,_globals))&&gsap;
+},
+_missingPlugin=exports._missingPlugin=function _missingPlugin(property,value){
+return console.warn("Invalid property",property,"set to",value,"Missing plugin? gsap.registerPlugin()");
+},
+_warn=function _warn(message,suppress){
+return!suppress&&console.warn(message);
+},
+_addGlobal=function _addGlobal(name,obj){
+return name&&(_globals[name]=obj)&&_installScope&&(_installScope[name]=obj)||_globals;
+},
+_emptyFunc=function _emptyFunc(){
+return 0;
+},
+_startAtRevertConfig={
+suppressEvents:true,
+isStart:true,
+kill:false
+},
+_revertConfigNoKill={
+suppressEvents:true,
+kill:false
+},
+_revertConfig={
+suppressEvents:true
+},
+_reservedProps={},
+_lazyTweens=[],
+_lazyLookup={},
+_lastRenderedFrame,
+_plugins=exports._plugins={},
+_effects={},
+_nextGCFrame=30,
+_harnessPlugins=[],
+_callbackNames="",
+_harness=function _harness(targets){
+var target=targets[0],
+harnessPlugin,
+i;
+_isObject(target)||_isFunction(target)||(targets=[targets]);
+if(!(harnessPlugin=(target._gsap||{}).harness)){
+i=_harnessPlugins.length;
+while(i--&&!_harnessPlugins[i].targetTest(target)){}
+harnessPlugin=_harnessPlugins[i];
+}
+i=targets.length;
+while(i--){
+targets[i]&&(targets[i]._gsap||(targets[i]._gsap=new GSCache(targets[i],harnessPlugin)))||targets.splice(i,1);
+}
+return targets;
+},
+_getCache=exports._getCache=function _getCache(target){
+return target._gsap||_harness(toArray(target))[0]._gsap;
+},
+_getProperty=exports._getProperty=function _getProperty(target,property,v){
+return(v=target[property])&&_isFunction(v)?target[property]():_isUndefined(v)&&target.getAttribute&&target.getAttribute(property)||v;
+},
+_forEachName=exports._forEachName=function _forEachName(names,func){
+return(names=names.split(",")).forEach(func)||names;
+},
+_round=exports._round=function _round(value){
+return Math.round(value*100000)/ 100000||0;
+},
+_roundPrecise=function _roundPrecise(value){
+return Math.round(value*10000000)/ 10000000||0;
+},
+_parseRelative=exports._parseRelative=function _parseRelative(start,value){
+var operator=value.charAt(0),
+end=parseFloat(value.substr(2));
+start=parseFloat(start);
+return operator==="+"?start + end:operator==="-"?start - end:operator==="*"?start*end:start / end;
+},
+_arrayContainsAny=function _arrayContainsAny(toSearch,toFind){
+var l=toFind.length,
+i=0;
+for(;toSearch.indexOf(toFind[i])<0&&++i<l;){}
+return i<l;
+},
+_lazyRender=function _lazyRender(){
+var l=_lazyTweens.length,
+a=_lazyTweens.slice(0),
+i,
+tween;
+_lazyLookup={};
+_lazyTweens.length=0;
+for(i=0;i<l;i++){
+tween=a[i];
+tween&&tween._lazy&&(tween.render(tween._lazy[0],tween._lazy[1],true)._lazy=0);
+}
+},
+_isRevertWorthy=function _isRevertWorthy(animation){
+return!!(animation._initted||animation._startAt||animation.add);
+},
+_lazySafeRender=function _lazySafeRender(animation,time,suppressEvents,force){
+_lazyTweens.length&&!_reverting&&_lazyRender();
+animation.render(time,suppressEvents,force||!!(_reverting&&time<0&&_isRevertWorthy(animation)));
+_lazyTweens.length&&!_reverting&&_lazyRender();
+},
+_numericIfPossible=function _numericIfPossible(value){
+var n=parseFloat(value);
+return(n||n===0)&&(value + "").match(_delimitedValueExp).length<2?n:_isString(value)?value.trim():value;
+},
+_passThrough=function _passThrough(p){
+return p;
+},
+_setDefaults=exports._setDefaults=function _setDefaults(obj,defaults){
+for(var p in defaults){
+p in obj||(obj[p]=defaults[p]);
+}
+return obj;
+},
+_setKeyframeDefaults=function _setKeyframeDefaults(excludeDuration){
+return function(obj,defaults){
+for(var p in defaults){
+p in obj||p==="duration"&&excludeDuration||p==="ease"||(obj[p]=defaults[p]);
+}
+};
+},
+_merge=function _merge(base,toMerge){
+for(var p in toMerge){
+base[p]=toMerge[p];
+}
+return base;
+},
+_mergeDeep=function _mergeDeep(base,toMerge){
+for(var p in toMerge){
+p!=="__proto__"&&p!=="constructor"&&p!=="prototype"&&(base[p]=_isObject(toMerge[p])?_mergeDeep(base[p]||(base[p]={}),toMerge[p]):toMerge[p]);
+}
+return base;
+},
+_copyExcluding=function _copyExcluding(obj,excluding){
+var copy={},
+p;
+for(p in obj){
+p in excluding||(copy[p]=obj[p]);
+}
+return copy;
+},
+_inheritDefaults=function _inheritDefaults(vars){
+var parent=vars.parent||_globalTimeline,
+func=vars.keyframes?_setKeyframeDefaults(_isArray(vars.keyframes)):_setDefaults;
+if(_isNotFalse(vars.inherit)){
+while(parent){
+func(vars,parent.vars.defaults);
+parent=parent.parent||parent._dp;
+}
+}
+return vars;
+},
+_arraysMatch=function _arraysMatch(a1,a2){
+var i=a1.length,
+match=i===a2.length;
+while(match&&i--&&a1[i]===a2[i]){}
+return i<0;
+},
+_addLinkedListItem=function _addLinkedListItem(parent,child,firstProp,lastProp,sortBy){
+if(firstProp===void 0){
+firstProp="_first";
+}
+if(lastProp===void 0){
+lastProp="_last";
+}
+var prev=parent[lastProp],
+t;
+if(sortBy){
+t=child[sortBy];
+while(prev&&prev[sortBy]>t){
+prev=prev._prev;
+}
+}
+if(prev){
+child._next=prev._next;
+prev._next=child;
+}else{
+child._next=parent[firstProp];
+parent[firstProp]=child;
+}
+if(child._next){
+child._next._prev=child;
+}else{
+parent[lastProp]=child;
+}
+child._prev=prev;
+child.parent=child._dp=parent;
+return child;
+},
+_removeLinkedListItem=exports._removeLinkedListItem=function _removeLinkedListItem(parent,child,firstProp,lastProp){
+if(firstProp===void 0){
+firstProp="_first";
+}
+if(lastProp===void 0){
+lastProp="_last";
+}
+var prev=child._prev,
+next=child._next;
+if(prev){
+prev._next=next;
+}else if(parent[firstProp]===child){
+parent[firstProp]=next;
+}
+if(next){
+next._prev=prev;
+}else if(parent[lastProp]===child){
+parent[lastProp]=prev;
+}
+child._next=child._prev=child.parent=null;
+},
+_removeFromParent=function _removeFromParent(child,onlyIfParentHasAutoRemove){
+child.parent&&(!onlyIfParentHasAutoRemove||child.parent.autoRemoveChildren)&&child.parent.remove&&child.parent.remove(child);
+child._act=0;
+},
+_uncache=function _uncache(animation,child){
+if(animation&&(!child||child._end>animation._dur||child._start<0)){
+var a=animation;
+while(a){
+a._dirty=1;
+a=a.parent;
+}
+}
+return animation;
+},
+_recacheAncestors=function _recacheAncestors(animation){
+var parent=animation.parent;
+while(parent&&parent.parent){
+parent._dirty=1;
+parent.totalDuration();
+parent=parent.parent;
+}
+return animation;
+},
+_rewindStartAt=function _rewindStartAt(tween,totalTime,suppressEvents,force){
+return tween._startAt&&(_reverting?tween._startAt.revert(_revertConfigNoKill):tween.vars.immediateRender&&!tween.vars.autoRevert||tween._startAt.render(totalTime,true,force));
+},
+_hasNoPausedAncestors=function _hasNoPausedAncestors(animation){
+return!animation||animation._ts&&_hasNoPausedAncestors(animation.parent);
+},
+_elapsedCycleDuration=function _elapsedCycleDuration(animation){
+return animation._repeat?_animationCycle(animation._tTime,animation=animation.duration()+ animation._rDelay)*animation:0;
+},
+_animationCycle=function _animationCycle(tTime,cycleDuration){
+var whole=Math.floor(tTime=_roundPrecise(tTime / cycleDuration));
+return tTime&&whole===tTime?whole - 1:whole;
+},
+_parentToChildTotalTime=function _parentToChildTotalTime(parentTime,child){
+return(parentTime - child._start)*child._ts +(child._ts>=0?0:child._dirty?child.totalDuration():child._tDur);
+},
+_setEnd=function _setEnd(animation){
+return animation._end=_roundPrecise(animation._start +(animation._tDur / Math.abs(animation._ts||animation._rts||_tinyNum)||0));
+},
+_alignPlayhead=function _alignPlayhead(animation,totalTime){
+var parent=animation._dp;
+if(parent&&parent.smoothChildTiming&&animation._ts){
+animation._start=_roundPrecise(parent._time -(animation._ts>0?totalTime / animation._ts:((animation._dirty?animation.totalDuration():animation._tDur)- totalTime)/ -animation._ts));
+_setEnd(animation);
+parent._dirty||_uncache(parent,animation);
+}
+return animation;
+},
+_postAddChecks=function _postAddChecks(timeline,child){
+var t;
+if(child._time||!child._dur&&child._initted||child._start<timeline._time&&(child._dur||!child.add)){
+t=_parentToChildTotalTime(timeline.rawTime(),child);
+if(!child._dur||_clamp(0,child.totalDuration(),t)- child._tTime>_tinyNum){
+child.render(t,true);
+}
+}
+if(_uncache(timeline,child)._dp&&timeline._initted&&timeline._time>=timeline._dur&&timeline._ts){
+if(timeline._dur<timeline.duration()){
+t=timeline;
+while(t._dp){
+t.rawTime()>=0&&t.totalTime(t._tTime);
+t=t._dp;
+}
+}
+timeline._zTime=-_tinyNum;
+}
+},
+_addToTimeline=function _addToTimeline(timeline,child,position,skipChecks){
+child.parent&&_removeFromParent(child);
+child._start=_roundPrecise((_isNumber(position)?position:position||timeline!==_globalTimeline?_parsePosition(timeline,position,child):timeline._time)+ child._delay);
+child._end=_roundPrecise(child._start +(child.totalDuration()/ Math.abs(child.timeScale())||0));
+_addLinkedListItem(timeline,child,"_first","_last",timeline._sort?"_start":0);
+_isFromOrFromStart(child)||(timeline._recent=child);
+skipChecks||_postAddChecks(timeline,child);
+timeline._ts<0&&_alignPlayhead(timeline,timeline._tTime);
+return timeline;
+},
+_scrollTrigger=function _scrollTrigger(animation,trigger){
+return(_globals.ScrollTrigger||_missingPlugin("scrollTrigger",trigger))&&_globals.ScrollTrigger.create(trigger,animation);
+},
+_attemptInitTween=function _attemptInitTween(tween,time,force,suppressEvents,tTime){
+_initTween(tween,time,tTime);
+if(!tween._initted){
+return 1;
+}
+if(!force&&tween._pt&&!_reverting&&(tween._dur&&tween.vars.lazy!==false||!tween._dur&&tween.vars.lazy)&&_lastRenderedFrame!==_ticker.frame){
+_lazyTweens.push(tween);
+tween._lazy=[tTime,suppressEvents];
+return 1;
+}
+},
+_parentPlayheadIsBeforeStart=function _parentPlayheadIsBeforeStart(_ref){
+var parent=_ref.parent;
+return parent&&parent._ts&&parent._initted&&!parent._lock&&(parent.rawTime()<0||_parentPlayheadIsBeforeStart(parent));
+},
+_isFromOrFromStart=function _isFromOrFromStart(_ref2){
+var data=_ref2.data;
+return data==="isFromStart"||data==="isStart";
+},
+_renderZeroDurationTween=function _renderZeroDurationTween(tween,totalTime,suppressEvents,force){
+var prevRatio=tween.ratio,
+ratio=totalTime<0||!totalTime&&(!tween._start&&_parentPlayheadIsBeforeStart(tween)&&!(!tween._initted&&_isFromOrFromStart(tween))||(tween._ts<0||tween._dp._ts<0)&&!_isFromOrFromStart(tween))?0:1,
+repeatDelay=tween._rDelay,
+tTime=0,
+pt,
+iteration,
+prevIteration;
+if(repeatDelay&&tween._repeat){
+tTime=_clamp(0,tween._tDur,totalTime);
+iteration=_animationCycle(tTime,repeatDelay);
+tween._yoyo&&iteration&1&&(ratio=1 - ratio);
+if(iteration!==_animationCycle(tween._tTime,repeatDelay)){
+prevRatio=1 - ratio;
+tween.vars.repeatRefresh&&tween._initted&&tween.invalidate();
+}
+}
+if(ratio!==prevRatio||_reverting||force||tween._zTime===_tinyNum||!totalTime&&tween._zTime){
+if(!tween._initted&&_attemptInitTween(tween,totalTime,force,suppressEvents,tTime)){
+return;
+}
+prevIteration=tween._zTime;
+tween._zTime=totalTime||(suppressEvents?_tinyNum:0);
+suppressEvents||(suppressEvents=totalTime&&!prevIteration);
+tween.ratio=ratio;
+tween._from&&(ratio=1 - ratio);
+tween._time=0;
+tween._tTime=tTime;
+pt=tween._pt;
+while(pt){
+pt.r(ratio,pt.d);
+pt=pt._next;
+}
+totalTime<0&&_rewindStartAt(tween,totalTime,suppressEvents,true);
+tween._onUpdate&&!suppressEvents&&_callback(tween,"onUpdate");
+tTime&&tween._repeat&&!suppressEvents&&tween.parent&&_callback(tween,"onRepeat");
+if((totalTime>=tween._tDur||totalTime<0)&&tween.ratio===ratio){
+ratio&&_removeFromParent(tween,1);
+if(!suppressEvents&&!_reverting){
+_callback(tween,ratio?"onComplete":"onReverseComplete",true);
+tween._prom&&tween._prom();
+}
+}
+}else if(!tween._zTime){
+tween._zTime=totalTime;
+}
+},
+_findNextPauseTween=function _findNextPauseTween(animation,prevTime,time){
+var child;
+if(time>prevTime){
+child=animation._first;
+while(child&&child._start<=time){
+if(child.data==="isPause"&&child._start>prevTime){
+return child;
+}
+child=child._next;
+}
+}else{
+child=animation._last;
+while(child&&child._start>=time){
+if(child.data==="isPause"&&child._start<prevTime){
+return child;
+}
+child=child._prev;
+}
+}
+},
+_setDuration=function _setDuration(animation,duration,skipUncache,leavePlayhead){
+var repeat=animation._repeat,
+dur=_roundPrecise(duration)||0,
+totalProgress=animation._tTime / animation._tDur;
+totalProgress&&!leavePlayhead&&(animation._time*=dur / animation._dur);
+animation._dur=dur;
+animation._tDur=!repeat?dur:repeat<0?1e10:_roundPrecise(dur*(repeat + 1)+ animation._rDelay*repeat);
+totalProgress>0&&!leavePlayhead&&_alignPlayhead(animation,animation._tTime=animation._tDur*totalProgress);
+animation.parent&&_setEnd(animation);
+skipUncache||_uncache(animation.parent,animation);
+return animation;
+},
+_onUpdateTotalDuration=function _onUpdateTotalDuration(animation){
+return animation instanceof Timeline?_uncache(animation):_setDuration(animation,animation._dur);
+},
+_zeroPosition={
+_start:0,
+endTime:_emptyFunc,
+totalDuration:_emptyFunc
+},
+_parsePosition=function _parsePosition(animation,position,percentAnimation){
+var labels=animation.labels,
+recent=animation._recent||_zeroPosition,
+clippedDuration=animation.duration()>=_bigNum?recent.endTime(false):animation._dur,
+i,
+offset,
+isPercent;
+if(_isString(position)&&(isNaN(position)||position in labels)){
+offset=position.charAt(0);
+isPercent=position.substr(-1)==="%";
+i=position.indexOf("=");
+if(offset==="<"||offset===">"){
+i>=0&&(position=position.replace(/=/,""));
+return(offset==="<"?recent._start:recent.endTime(recent._repeat>=0))+(parseFloat(position.substr(1))||0)*(isPercent?(i<0?recent:percentAnimation).totalDuration()/ 100:1);
+}
+if(i<0){
+position in labels||(labels[position]=clippedDuration);
+return labels[position];
+}
+offset=parseFloat(position.charAt(i - 1)+ position.substr(i + 1));
+if(isPercent&&percentAnimation){
+offset=offset / 100*(_isArray(percentAnimation)?percentAnimation[0]:percentAnimation).totalDuration();
+}
+return i>1?_parsePosition(animation,position.substr(0,i - 1),percentAnimation)+ offset:clippedDuration + offset;
+}
+return position==null?clippedDuration:+position;
+},
+_createTweenType=function _createTweenType(type,params,timeline){
+var isLegacy=_isNumber(params[1]),
+varsIndex=(isLegacy?2:1)+(type<2?0:1),
+vars=params[varsIndex],
+irVars,
+parent;
+isLegacy&&(vars.duration=params[1]);
+vars.parent=timeline;
+if(type){
+irVars=vars;
+parent=timeline;
+while(parent&&!("immediateRender" in irVars)){
+irVars=parent.vars.defaults||{};
+parent=_isNotFalse(parent.vars.inherit)&&parent.parent;
+}
+vars.immediateRender=_isNotFalse(irVars.immediateRender);
+type<2?vars.runBackwards=1:vars.startAt=params[varsIndex - 1];
+}
+return new Tween(params[0],vars,params[varsIndex + 1]);
+},
+_conditionalReturn=function _conditionalReturn(value,func){
+return value||value===0?func(value):func;
+},
+_clamp=function _clamp(min,max,value){
+return value<min?min:value>max?max:value;
+},
+getUnit=exports.getUnit=function getUnit(value,v){
+return!_isString(value)||!(v=_unitExp.exec(value))?"":v[1];
+},
+clamp=exports.clamp=function clamp(min,max,value){
+return _conditionalReturn(value,function(v){
+return _clamp(min,max,v);
+});
+},
+_slice=[].slice,
+_isArrayLike=function _isArrayLike(value,nonEmpty){
+return value&&_isObject(value)&&"length" in value&&(!nonEmpty&&!value.length||value.length - 1 in value&&_isObject(value[0]))&&!value.nodeType&&value!==_win;
+},
+_flatten=function _flatten(ar,leaveStrings,accumulator){
+if(accumulator===void 0){
+accumulator=[];
+}
+return ar.forEach(function(value){
+var _accumulator;
+return _isString(value)&&!leaveStrings||_isArrayLike(value,1)?(_accumulator=accumulator).push.apply(_accumulator,toArray(value)):accumulator.push(value);
+})||accumulator;
+},
+toArray=exports.toArray=function toArray(value,scope,leaveStrings){
+return _context&&!scope&&_context.selector?_context.selector(value):_isString(value)&&!leaveStrings&&(_coreInitted||!_wake())?_slice.call((scope||_doc).querySelectorAll(value),0):_isArray(value)?_flatten(value,leaveStrings):_isArrayLike(value)?_slice.call(value,0):value?[value]:[];
+},
+selector=exports.selector=function selector(value){
+value=toArray(value)[0]||_warn("Invalid scope")||{};
+return function(v){
+var el=value.current||value.nativeElement||value;
+return toArray(v,el.querySelectorAll?el:el===value?_warn("Invalid scope")||_doc.createElement("div"):value);
+};
+},
+shuffle=exports.shuffle=function shuffle(a){
+return a.sort(function(){
+return .5 - Math.random();
+});
+},
+distribute=exports.distribute=function distribute(v){
+if(_isFunction(v)){
+return v;
+}
+var vars=_isObject(v)?v:{
+each:v
+},
+ease=_parseEase(vars.ease),
+from=vars.from||0,
+base=parseFloat(vars.base)||0,
+cache={},
+isDecimal=from>0&&from<1,
+ratios=isNaN(from)||isDecimal,
+axis=vars.axis,
+ratioX=from,
+ratioY=from;
+if(_isString(from)){
+ratioX=ratioY={
+center:.5,
+edges:.5,
+end:1
+}[from]||0;
+}else if(!isDecimal&&ratios){
+ratioX=from[0];
+ratioY=from[1];
+}
+return function(i,target,a){
+var l=(a||vars).length,
+distances=cache[l],
+originX,
+originY,
+x,
+y,
+d,
+j,
+max,
+min,
+wrapAt;
+if(!distances){
+wrapAt=vars.grid==="auto"?0:(vars.grid||[1,_bigNum])[1];
+if(!wrapAt){
+max=-_bigNum;
+while(max<(max=a[wrapAt++].getBoundingClientRect().left)&&wrapAt<l){}
+wrapAt<l&&wrapAt--;
+}
+distances=cache[l]=[];
+originX=ratios?Math.min(wrapAt,l)*ratioX - .5:from%wrapAt;
+originY=wrapAt===_bigNum?0:ratios?l*ratioY / wrapAt - .5:from / wrapAt|0;
+max=0;
+min=_bigNum;
+for(j=0;j<l;j++){
+x=j%wrapAt - originX;
+y=originY -(j / wrapAt|0);
+distances[j]=d=!axis?_sqrt(x*x + y*y):Math.abs(axis==="y"?y:x);
+d>max&&(max=d);
+d<min&&(min=d);
+}
+from==="random"&&shuffle(distances);
+distances.max=max - min;
+distances.min=min;
+distances.v=l=(parseFloat(vars.amount)||parseFloat(vars.each)*(wrapAt>l?l - 1:!axis?Math.max(wrapAt,l / wrapAt):axis==="y"?l / wrapAt:wrapAt)||0)*(from==="edges"?-1:1);
+distances.b=l<0?base - l:base;
+distances.u=getUnit(vars.amount||vars.each)||0;
+ease=ease&&l<0?_invertEase(ease):ease;
+}
+l=(distances[i]- distances.min)/ distances.max||0;
+return _roundPrecise(distances.b +(ease?ease(l):l)*distances.v)+ distances.u;
+};
+},
+_roundModifier=exports._roundModifier=function _roundModifier(v){
+var p=Math.pow(10,((v + "").split(".")[1]||"").length);
+return function(raw){
+var n=_roundPrecise(Math.round(parseFloat(raw)/ v)*v*p);
+return(n - n%1)/ p +(_isNumber(raw)?0:getUnit(raw));
+};
+},
+snap=exports.snap=function snap(snapTo,value){
+var isArray=_isArray(snapTo),
+radius,
+is2D;
+if(!isArray&&_isObject(snapTo)){
+radius=isArray=snapTo.radius||_bigNum;
+if(snapTo.values){
+snapTo=toArray(snapTo.values);
+if(is2D=!_isNumber(snapTo[0])){
+radius*=radius;
+}
+}else{
+snapTo=_roundModifier(snapTo.increment);
+}
+}
+return _conditionalReturn(value,!isArray?_roundModifier(snapTo):_isFunction(snapTo)?function(raw){
+is2D=snapTo(raw);
+return Math.abs(is2D - raw)<=radius?is2D:raw;
+}:function(raw){
+var x=parseFloat(is2D?raw.x:raw),
+y=parseFloat(is2D?raw.y:0),
+min=_bigNum,
+closest=0,
+i=snapTo.length,
+dx,
+dy;
+while(i--){
+if(is2D){
+dx=snapTo[i].x - x;
+dy=snapTo[i].y - y;
+dx=dx*dx + dy*dy;
+}else{
+dx=Math.abs(snapTo[i]- x);
+}
+if(dx<min){
+min=dx;
+closest=i;
+}
+}
+closest=!radius||min<=radius?snapTo[closest]:raw;
+return is2D||closest===raw||_isNumber(raw)?closest:closest + getUnit(raw);
+});
+},
+random=exports.random=function random(min,max,roundingIncrement,returnFunction){
+return _conditionalReturn(_isArray(min)?!max:roundingIncrement===true?!!(roundingIncrement=0):!returnFunction,function(){
+return _isArray(min)?min[~~(Math.random()*min.length)]:(roundingIncrement=roundingIncrement||1e-5)&&(returnFunction=roundingIncrement<1?Math.pow(10,(roundingIncrement + "").length - 2):1)&&Math.floor(Math.round((min - roundingIncrement / 2 + Math.random()*(max - min + roundingIncrement*.99))/ roundingIncrement)*roundingIncrement*returnFunction)/ returnFunction;
+});
+},
+pipe=exports.pipe=function pipe(){
+for(var _len=arguments.length,functions=new Array(_len),_key=0;_key<_len;_key++){
+functions[_key]=arguments[_key];
+}
+return function(value){
+return functions.reduce(function(v,f){
+return f(v);
+},value);
+};
+},
+unitize=exports.unitize=function unitize(func,unit){
+return function(value){
+return func(parseFloat(value))+(unit||getUnit(value));
+};
+},
+normalize=exports.normalize=function normalize(min,max,value){
+return mapRange(min,max,0,1,value);
+},
+_wrapArray=function _wrapArray(a,wrapper,value){
+return _conditionalReturn(value,function(index){
+return a[~~wrapper(index)];
+});
+},
+wrap=exports.wrap=function wrap(min,max,value){
+var range=max - min;
+return _isArray(min)?_wrapArray(min,wrap(0,min.length),max):_conditionalReturn(value,function(value){
+return(range +(value - min)%range)%range + min;
+});
+},
+wrapYoyo=exports.wrapYoyo=function wrapYoyo(min,max,value){
+var range=max - min,
+total=range*2;
+return _isArray(min)?_wrapArray(min,wrapYoyo(0,min.length - 1),max):_conditionalReturn(value,function(value){
+value=(total +(value - min)%total)%total||0;
+return min +(value>range?total - value:value);
+});
+},
+_replaceRandom=exports._replaceRandom=function _replaceRandom(value){
+var prev=0,
+s="",
+i,
+nums,
+end,
+isArray;
+while(~(i=value.indexOf("random(",prev))){
+end=value.indexOf(")",i);
+isArray=value.charAt(i + 7)==="[";
+nums=value.substr(i + 7,end - i - 7).match(isArray?_delimitedValueExp:_strictNumExp);
+s +=value.substr(prev,i - prev)+ random(isArray?nums:+nums[0],isArray?0:+nums[1],+nums[2]||1e-5);
+prev=end + 1;
+}
+return s + value.substr(prev,value.length - prev);
+},
+mapRange=exports.mapRange=function mapRange(inMin,inMax,outMin,outMax,value){
+var inRange=inMax - inMin,
+outRange=outMax - outMin;
+return _conditionalReturn(value,function(value){
+return outMin +((value - inMin)/ inRange*outRange||0);
+});
+},
+interpolate=exports.interpolate=function interpolate(start,end,progress,mutate){
+var func=isNaN(start + end)?0:function(p){
+return(1 - p)*start + p*end;
+};
+if(!func){
+var isString=_isString(start),
+master={},
+p,
+i,
+interpolators,
+l,
+il;
+progress===true&&(mutate=1)&&(progress=null);
+if(isString){
+start={
+p:start
+};
+end={
+p:end
+};
+}else if(_isArray(start)&&!_isArray(end)){
+interpolators=[];
+l=start.length;
+il=l - 2;
+for(i=1;i<l;i++){
+interpolators.push(interpolate(start[i - 1],start[i]));
+}
+l--;
+func=function func(p){
+p*=l;
+var i=Math.min(il,~~p);
+return interpolators[i](p - i);
+};
+progress=end;
+}else if(!mutate){
+start=_merge(_isArray(start)?[]:{},start);
+}
+if(!interpolators){
+for(p in end){
+_addPropTween.call(master,start,p,"get",end[p]);
+}
+func=function func(p){
+return _renderPropTweens(p,master)||(isString?start.p:start);
+};
+}
+}
+return _conditionalReturn(progress,func);
+},
+_getLabelInDirection=function _getLabelInDirection(timeline,fromTime,backward){
+var labels=timeline.labels,
+min=_bigNum,
+p,
+distance,
+label;
+for(p in labels){
+distance=labels[p]- fromTime;
+if(distance<0===!!backward&&distance&&min>(distance=Math.abs(distance))){
+label=p;
+min=distance;
+}
+}
+return label;
+},
+_callback=function _callback(animation,type,executeLazyFirst){
+var v=animation.vars,
+callback=v[type],
+prevContext=_context,
+context=animation._ctx,
+params,
+scope,
+result;
+if(!callback){
+return;
+}
+params=v[type + "Params"];
+scope=v.callbackScope||animation;
+executeLazyFirst&&_lazyTweens.length&&_lazyRender();
+context&&(_context=context);
+result=params?callback.apply(scope,params):callback.call(scope);
+_context=prevContext;
+return result;
+},
+_interrupt=function _interrupt(animation){
+_removeFromParent(animation);
+animation.scrollTrigger&&animation.scrollTrigger.kill(!!_reverting);
+animation.progress()<1&&_callback(animation,"onInterrupt");
+return animation;
+},
+_quickTween,
+_registerPluginQueue=[],
+_createPlugin=function _createPlugin(config){
+if(!config)return;
+config=!config.name&&config["default"]||config;
+if(_windowExists()||config.headless){
+var name=config.name,
+isFunc=_isFunction(config),
+Plugin=name&&!isFunc&&config.init?function(){
+this._props=[];
+}:config,
+instanceDefaults={
+init:_emptyFunc,
+render:_renderPropTweens,
+add:_addPropTween,
+kill:_killPropTweensOf,
+modifier:_addPluginModifier,
+rawVars:0
+},
+statics={
+targetTest:0,
+get:0,
+getSetter:_getSetter,
+aliases:{},
+register:0
+};
+_wake();
+if(config!==Plugin){
+if(_plugins[name]){
+return;
+}
+_setDefaults(Plugin,_setDefaults(_copyExcluding(config,instanceDefaults),statics));
+_merge(Plugin.prototype,_merge(instanceDefaults,_copyExcluding(config,statics)));
+_plugins[Plugin.prop=name]=Plugin;
+if(config.targetTest){
+_harnessPlugins.push(Plugin);
+_reservedProps[name]=1;
+}
+name=(name==="css"?"CSS":name.charAt(0).toUpperCase()+ name.substr(1))+ "Plugin";
+}
+_addGlobal(name,Plugin);
+config.register&&config.register(gsap,Plugin,PropTween);
+}else{
+_registerPluginQueue.push(config);
+}
+},
+_255=255,
+_colorLookup={
+aqua:[0,_255,_255],
+lime:[0,_255,0],
+silver:[192,192,192],
+black:[0,0,0],
+maroon:[128,0,0],
+teal:[0,128,128],
+blue:[0,0,_255],
+navy:[0,0,128],
+white:[_255,_255,_255],
+olive:[128,128,0],
+yellow:[_255,_255,0],
+orange:[_255,165,0],
+gray:[128,128,128],
+purple:[128,0,128],
+green:[0,128,0],
+red:[_255,0,0],
+pink:[_255,192,203],
+cyan:[0,_255,_255],
+transparent:[_255,_255,_255,0]
+},
+_hue=function _hue(h,m1,m2){
+h +=h<0?1:h>1?-1:0;
+return(h*6<1?m1 +(m2 - m1)*h*6:h<.5?m2:h*3<2?m1 +(m2 - m1)*(2 / 3 - h)*6:m1)*_255 + .5|0;
+},
+splitColor=exports.splitColor=function splitColor(v,toHSL,forceAlpha){
+var a=!v?_colorLookup.black:_isNumber(v)?[v>>16,v>>8&_255,v&_255]:0,
+r,
+g,
+b,
+h,
+s,
+l,
+max,
+min,
+d,
+wasHSL;
+if(!a){
+if(v.substr(-1)===","){
+v=v.substr(0,v.length - 1);
+}
+if(_colorLookup[v]){
+a=_colorLookup[v];
+}else if(v.charAt(0)==="#"){
+if(v.length<6){
+r=v.charAt(1);
+g=v.charAt(2);
+b=v.charAt(3);
+v="#" + r + r + g + g + b + b +(v.length===5?v.charAt(4)+ v.charAt(4):"");
+}
+if(v.length===9){
+a=parseInt(v.substr(1,6),16);
+return[a>>16,a>>8&_255,a&_255,parseInt(v.substr(7),16)/ 255];
+}
+v=parseInt(v.substr(1),16);
+a=[v>>16,v>>8&_255,v&_255];
+}else if(v.substr(0,3)==="hsl"){
+a=wasHSL=v.match(_strictNumExp);
+if(!toHSL){
+h=+a[0]%360 / 360;
+s=+a[1]/ 100;
+l=+a[2]/ 100;
+g=l<=.5?l*(s + 1):l + s - l*s;
+r=l*2 - g;
+a.length>3&&(a[3]*=1);
+a[0]=_hue(h + 1 / 3,r,g);
+a[1]=_hue(h,r,g);
+a[2]=_hue(h - 1 / 3,r,g);
+}else if(~v.indexOf("=")){
+a=v.match(_numExp);
+forceAlpha&&a.length<4&&(a[3]=1);
+return a;
+}
+}else{
+a=v.match(_strictNumExp)||_colorLookup.transparent;
+}
+a=a.map(Number);
+}
+if(toHSL&&!wasHSL){
+r=a[0]/ _255;
+g=a[1]/ _255;
+b=a[2]/ _255;
+max=Math.max(r,g,b);
+min=Math.min(r,g,b);
+l=(max + min)/ 2;
+if(max===min){
+h=s=0;
+}else{
+d=max - min;
+s=l>0.5?d /(2 - max - min):d /(max + min);
+h=max===r?(g - b)/ d +(g<b?6:0):max===g?(b - r)/ d + 2:(r - g)/ d + 4;
+h*=60;
+}
+a[0]=~~(h + .5);
+a[1]=~~(s*100 + .5);
+a[2]=~~(l*100 + .5);
+}
+forceAlpha&&a.length<4&&(a[3]=1);
+return a;
+},
+_colorOrderData=function _colorOrderData(v){
+var values=[],
+c=[],
+i=-1;
+v.split(_colorExp).forEach(function(v){
+var a=v.match(_numWithUnitExp)||[];
+values.push.apply(values,a);
+c.push(i +=a.length + 1);
+});
+values.c=c;
+return values;
+},
+_formatColors=function _formatColors(s,toHSL,orderMatchData){
+var result="",
+colors=(s + result).match(_colorExp),
+type=toHSL?"hsla(":"rgba(",
+i=0,
+c,
+shell,
+d,
+l;
+if(!colors){
+return s;
+}
+colors=colors.map(function(color){
+return(color=splitColor(color,toHSL,1))&&type +(toHSL?color[0]+ "," + color[1]+ "%," + color[2]+ "%," + color[3]:color.join(","))+ ")";
+});
+if(orderMatchData){
+d=_colorOrderData(s);
+c=orderMatchData.c;
+if(c.join(result)!==d.c.join(result)){
+shell=s.replace(_colorExp,"1").split(_numWithUnitExp);
+l=shell.length - 1;
+for(;i<l;i++){
+result +=shell[i]+(~c.indexOf(i)?colors.shift()||type + "0,0,0,0)":(d.length?d:colors.length?colors:orderMatchData).shift());
+}
+}
+}
+if(!shell){
+shell=s.split(_colorExp);
+l=shell.length - 1;
+for(;i<l;i++){
+result +=shell[i]+ colors[i];
+}
+}
+return result + shell[l];
+},
+_colorExp=exports._colorExp=function(){
+var s="(?:\\b(?:(?:rgb|rgba|hsl|hsla)\\(.+?\\))|\\B#(?:[0-9a-f]{3,4}){1,2}\\b",
+p;
+for(p in _colorLookup){
+s +="|" + p + "\\b";
+}
+return new RegExp(s + ")","gi");
+}(),
+_hslExp=/hsl[a]?\(/,
+_colorStringFilter=exports._colorStringFilter=function _colorStringFilter(a){
+var combined=a.join(" "),
+toHSL;
+_colorExp.lastIndex=0;
+if(_colorExp.test(combined)){
+toHSL=_hslExp.test(combined);
+a[1]=_formatColors(a[1],toHSL);
+a[0]=_formatColors(a[0],toHSL,_colorOrderData(a[1]));
+return true;
+}
+},
+_tickerActive,
+_ticker=exports._ticker=function(){
+var _getTime=Date.now,
+_lagThreshold=500,
+_adjustedLag=33,
+_startTime=_getTime(),
+_lastUpdate=_startTime,
+_gap=1000 / 240,
+_nextTime=_gap,
+_listeners=[],
+_id,
+_req,
+_raf,
+_self,
+_delta,
+_i,
+_tick=function _tick(v){
+var elapsed=_getTime()- _lastUpdate,
+manual=v===true,
+overlap,
+dispatch,
+time,
+frame;
+(elapsed>_lagThreshold||elapsed<0)&&(_startTime +=elapsed - _adjustedLag);
+_lastUpdate +=elapsed;
+time=_lastUpdate - _startTime;
+overlap=time - _nextTime;
+if(overlap>0||manual){
+frame=++_self.frame;
+_delta=time - _self.time*1000;
+_self.time=time=time / 1000;
+_nextTime +=overlap +(overlap>=_gap?4:_gap - overlap);
+dispatch=1;
+}
+manual||(_id=_req(_tick));
+if(dispatch){
+for(_i=0;_i<_listeners.length;_i++){
+_listeners[_i](time,_delta,frame,v);
+}
+}
+};
+_self={
+time:0,
+frame:0,
+tick:function tick(){
+_tick(true);
+},
+deltaRatio:function deltaRatio(fps){
+return _delta /(1000 /(fps||60));
+},
+wake:function wake(){
+if(_coreReady){
+if(!_coreInitted&&_windowExists()){
+_win=_coreInitted=window;
+_doc=_win.document||{};
+_globals.gsap=gsap;
+(_win.gsapVersions||(_win.gsapVersions=[])).push(gsap.version);
+_install(_installScope||_win.GreenSockGlobals||!_win.gsap&&_win||{});
+_registerPluginQueue.forEach(_createPlugin);
+}
+_raf=typeof requestAnimationFrame!=="undefined"&&requestAnimationFrame;
+_id&&_self.sleep();
+_req=_raf||function(f){
+return setTimeout(f,_nextTime - _self.time*1000 + 1|0);
+};
+_tickerActive=1;
+_tick(2);
+}
+},
+sleep:function sleep(){
+(_raf?cancelAnimationFrame:clearTimeout)(_id);
+_tickerActive=0;
+_req=_emptyFunc;
+},
+lagSmoothing:function lagSmoothing(threshold,adjustedLag){
+_lagThreshold=threshold||Infinity;
+_adjustedLag=Math.min(adjustedLag||33,_lagThreshold);
+},
+fps:function fps(_fps){
+_gap=1000 /(_fps||240);
+_nextTime=_self.time*1000 + _gap;
+},
+add:function add(callback,once,prioritize){
+var func=once?function(t,d,f,v){
+callback(t,d,f,v);
+_self.remove(func);
+}:callback;
+_self.remove(callback);
+_listeners[prioritize?"unshift":"push"](func);
+_wake();
+return func;
+},
+remove:function remove(callback,i){
+~(i=_listeners.indexOf(callback))&&_listeners.splice(i,1)&&_i>=i&&_i--;
+},
+_listeners:_listeners
+};
+return _self;
+}(),
+_wake=function _wake(){
+return!_tickerActive&&_ticker.wake();
+},
+_easeMap={},
+_customEaseExp=/^[\d.\-M][\d.\-,\s]/,
+_quotesExp=/["']/g,
+_parseObjectInString=function _parseObjectInString(value){
+var obj={},
+split=value.substr(1,value.length - 3).split(":"),
+key=split[0],
+i=1,
+l=split.length,
+index,
+val,
+parsedVal;
+for(;i<l;i++){
+val=split[i];
+index=i!==l - 1?val.lastIndexOf(","):val.length;
+parsedVal=val.substr(0,index);
+obj[key]=isNaN(parsedVal)?parsedVal.replace(_quotesExp,"").trim():+parsedVal;
+key=val.substr(index + 1).trim();
+}
+return obj;
+},
+_valueInParentheses=function _valueInParentheses(value){
+var open=value.indexOf("(")+ 1,
+close=value.indexOf(")"),
+nested=value.indexOf("(",open);
+return value.substring(open,~nested&&nested<close?value.indexOf(")",close + 1):close);
+},
+_configEaseFromString=function _configEaseFromString(name){
+var split=(name + "").split("("),
+ease=_easeMap[split[0]];
+return ease&&split.length>1&&ease.config?ease.config.apply(null,~name.indexOf("{")?[_parseObjectInString(split[1])]:_valueInParentheses(name).split(",").map(_numericIfPossible)):_easeMap._CE&&_customEaseExp.test(name)?_easeMap._CE("",name):ease;
+},
+_invertEase=function _invertEase(ease){
+return function(p){
+return 1 - ease(1 - p);
+};
+},
+_propagateYoyoEase=function _propagateYoyoEase(timeline,isYoyo){
+var child=timeline._first,
+ease;
+while(child){
+if(child instanceof Timeline){
+_propagateYoyoEase(child,isYoyo);
+}else if(child.vars.yoyoEase&&(!child._yoyo||!child._repeat)&&child._yoyo!==isYoyo){
+if(child.timeline){
+_propagateYoyoEase(child.timeline,isYoyo);
+}else{
+ease=child._ease;
+child._ease=child._yEase;
+child._yEase=ease;
+child._yoyo=isYoyo;
+}
+}
+child=child._next;
+}
+},
+_parseEase=function _parseEase(ease,defaultEase){
+return!ease?defaultEase:(_isFunction(ease)?ease:_easeMap[ease]||_configEaseFromString(ease))||defaultEase;
+},
+_insertEase=function _insertEase(names,easeIn,easeOut,easeInOut){
+if(easeOut===void 0){
+easeOut=function easeOut(p){
+return 1 - easeIn(1 - p);
+};
+}
+if(easeInOut===void 0){
+easeInOut=function easeInOut(p){
+return p<.5?easeIn(p*2)/ 2:1 - easeIn((1 - p)*2)/ 2;
+};
+}
+var ease={
+easeIn:easeIn,
+easeOut:easeOut,
+easeInOut:easeInOut
+},
+lowercaseName;
+_forEachName(names,function(name){
+_easeMap[name]=_globals[name]=ease;
+_easeMap[lowercaseName=name.toLowerCase()]=easeOut;
+for(var p in ease){
+_easeMap[lowercaseName +(p==="easeIn"?".in":p==="easeOut"?".out":".inOut")]=_easeMap[name + "." + p]=ease[p];
+}
+});
+return ease;
+},
+_easeInOutFromOut=function _easeInOutFromOut(easeOut){
+return function(p){
+return p<.5?(1 - easeOut(1 - p*2))/ 2:.5 + easeOut((p - .5)*2)/ 2;
+};
+},
+_configElastic=function _configElastic(type,amplitude,period){
+var p1=amplitude>=1?amplitude:1,
+p2=(period||(type?.3:.45))/(amplitude<1?amplitude:1),
+p3=p2 / _2PI*(Math.asin(1 / p1)||0),
+easeOut=function easeOut(p){
+return p===1?1:p1*Math.pow(2,-10*p)*_sin((p - p3)*p2)+ 1;
+},
+ease=type==="out"?easeOut:type==="in"?function(p){
+return 1 - easeOut(1 - p);
+}:_easeInOutFromOut(easeOut);
+p2=_2PI / p2;
+ease.config=function(amplitude,period){
+return _configElastic(type,amplitude,period);
+};
+return ease;
+},
+_configBack=function _configBack(type,overshoot){
+if(overshoot===void 0){
+overshoot=1.70158;
+}
+var easeOut=function easeOut(p){
+return p?--p*p*((overshoot + 1)*p + overshoot)+ 1:0;
+},
+ease=type==="out"?easeOut:type==="in"?function(p){
+return 1 - easeOut(1 - p);
+}:_easeInOutFromOut(easeOut);
+ease.config=function(overshoot){
+return _configBack(type,overshoot);
+};
+return ease;
+};
+_forEachName("Linear,Quad,Cubic,Quart,Quint,Strong",function(name,i){
+var power=i<5?i + 1:i;
+_insertEase(name + ",Power" +(power - 1),i?function(p){
+return Math.pow(p,power);
+}:function(p){
+return p;
+},function(p){
+return 1 - Math.pow(1 - p,power);
+},function(p){
+return p<.5?Math.pow(p*2,power)/ 2:1 - Math.pow((1 - p)*2,power)/ 2;
+});
+});
+_easeMap.Linear.easeNone=_easeMap.none=_easeMap.Linear.easeIn;
+_insertEase("Elastic",_configElastic("in"),_configElastic("out"),_configElastic());
+(function(n,c){
+var n1=1 / c,
+n2=2*n1,
+n3=2.5*n1,
+easeOut=function easeOut(p){
+return p<n1?n*p*p:p<n2?n*Math.pow(p - 1.5 / c,2)+ .75:p<n3?n*(p -=2.25 / c)*p + .9375:n*Math.pow(p - 2.625 / c,2)+ .984375;
+};
+_insertEase("Bounce",function(p){
+return 1 - easeOut(1 - p);
+},easeOut);
+})(7.5625,2.75);
+_insertEase("Expo",function(p){
+return Math.pow(2,10*(p - 1))*p + p*p*p*p*p*p*(1 - p);
+});
+_insertEase("Circ",function(p){
+return -(_sqrt(1 - p*p)- 1);
+});
+_insertEase("Sine",function(p){
+return p===1?1:-_cos(p*_HALF_PI)+ 1;
+});
+_insertEase("Back",_configBack("in"),_configBack("out"),_configBack());
+_easeMap.SteppedEase=_easeMap.steps=_globals.SteppedEase={
+config:function config(steps,immediateStart){
+if(steps===void 0){
+steps=1;
+}
+var p1=1 / steps,
+p2=steps +(immediateStart?0:1),
+p3=immediateStart?1:0,
+max=1 - _tinyNum;
+return function(p){
+return((p2*_clamp(0,max,p)|0)+ p3)*p1;
+};
+}
+};
+_defaults.ease=_easeMap["quad.out"];
+_forEachName("onComplete,onUpdate,onStart,onRepeat,onReverseComplete,onInterrupt",function(name){
+return _callbackNames +=name + "," + name + "Params,";
+});
+var GSCache=exports.GSCache=function GSCache(target,harness){
+this.id=_gsID++;
+target._gsap=this;
+this.target=target;
+this.harness=harness;
+this.get=harness?harness.get:_getProperty;
+this.set=harness?harness.getSetter:_getSetter;
+};
+var Animation=exports.Animation= function(){
+function Animation(vars){
+this.vars=vars;
+this._delay=+vars.delay||0;
+if(this._repeat=vars.repeat===Infinity?-2:vars.repeat||0){
+this._rDelay=vars.repeatDelay||0;
+this._yoyo=!!vars.yoyo||!!vars.yoyoEase;
+}
+this._ts=1;
+_setDuration(this,+vars.duration,1,1);
+this.data=vars.data;
+if(_context){
+this._ctx=_context;
+_context.data.push(this);
+}
+_tickerActive||_ticker.wake();
+}
+var _proto=Animation.prototype;
+_proto.delay=function delay(value){
+if(value||value===0){
+this.parent&&this.parent.smoothChildTiming&&this.startTime(this._start + value - this._delay);
+this._delay=value;
+return this;
+}
+return this._delay;
+};
+_proto.duration=function duration(value){
+return arguments.length?this.totalDuration(this._repeat>0?value +(value + this._rDelay)*this._repeat:value):this.totalDuration()&&this._dur;
+};
+_proto.totalDuration=function totalDuration(value){
+if(!arguments.length){
+return this._tDur;
+}
+this._dirty=0;
+return _setDuration(this,this._repeat<0?value:(value - this._repeat*this._rDelay)/(this._repeat + 1));
+};
+_proto.totalTime=function totalTime(_totalTime,suppressEvents){
+_wake();
+if(!arguments.length){
+return this._tTime;
+}
+var parent=this._dp;
+if(parent&&parent.smoothChildTiming&&this._ts){
+_alignPlayhead(this,_totalTime);
+!parent._dp||parent.parent||_postAddChecks(parent,this);
+while(parent&&parent.parent){
+if(parent.parent._time!==parent._start +(parent._ts>=0?parent._tTime / parent._ts:(parent.totalDuration()- parent._tTime)/ -parent._ts)){
+parent.totalTime(parent._tTime,true);
+}
+parent=parent.parent;
+}
+if(!this.parent&&this._dp.autoRemoveChildren&&(this._ts>0&&_totalTime<this._tDur||this._ts<0&&_totalTime>0||!this._tDur&&!_totalTime)){
+_addToTimeline(this._dp,this,this._start - this._delay);
+}
+}
+if(this._tTime!==_totalTime||!this._dur&&!suppressEvents||this._initted&&Math.abs(this._zTime)===_tinyNum||!_totalTime&&!this._initted&&(this.add||this._ptLookup)){
+this._ts||(this._pTime=_totalTime);
+_lazySafeRender(this,_totalTime,suppressEvents);
+}
+return this;
+};
+_proto.time=function time(value,suppressEvents){
+return arguments.length?this.totalTime(Math.min(this.totalDuration(),value + _elapsedCycleDuration(this))%(this._dur + this._rDelay)||(value?this._dur:0),suppressEvents):this._time;
+};
+_proto.totalProgress=function totalProgress(value,suppressEvents){
+return arguments.length?this.totalTime(this.totalDuration()*value,suppressEvents):this.totalDuration()?Math.min(1,this._tTime / this._tDur):this.rawTime()>=0&&this._initted?1:0;
+};
+_proto.progress=function progress(value,suppressEvents){
+return arguments.length?this.totalTime(this.duration()*(this._yoyo&&!(this.iteration()&1)?1 - value:value)+ _elapsedCycleDuration(this),suppressEvents):this.duration()?Math.min(1,this._time / this._dur):this.rawTime()>0?1:0;
+};
+_proto.iteration=function iteration(value,suppressEvents){
+var cycleDuration=this.duration()+ this._rDelay;
+return arguments.length?this.totalTime(this._time +(value - 1)*cycleDuration,suppressEvents):this._repeat?_animationCycle(this._tTime,cycleDuration)+ 1:1;
+}
+;
+_proto.timeScale=function timeScale(value,suppressEvents){
+if(!arguments.length){
+return this._rts===-_tinyNum?0:this._rts;
+}
+if(this._rts===value){
+return this;
+}
+var tTime=this.parent&&this._ts?_parentToChildTotalTime(this.parent._time,this):this._tTime;
+this._rts=+value||0;
+this._ts=this._ps||value===-_tinyNum?0:this._rts;
+this.totalTime(_clamp(-Math.abs(this._delay),this.totalDuration(),tTime),suppressEvents!==false);
+_setEnd(this);
+return _recacheAncestors(this);
+};
+_proto.paused=function paused(value){
+if(!arguments.length){
+return this._ps;
+}
+if(this._ps!==value){
+this._ps=value;
+if(value){
+this._pTime=this._tTime||Math.max(-this._delay,this.rawTime());
+this._ts=this._act=0;
+}else{
+_wake();
+this._ts=this._rts;
+this.totalTime(this.parent&&!this.parent.smoothChildTiming?this.rawTime():this._tTime||this._pTime,this.progress()===1&&Math.abs(this._zTime)!==_tinyNum&&(this._tTime -=_tinyNum));
+}
+}
+return this;
+};
+_proto.startTime=function startTime(value){
+if(arguments.length){
+this._start=value;
+var parent=this.parent||this._dp;
+parent&&(parent._sort||!this.parent)&&_addToTimeline(parent,this,value - this._delay);
+return this;
+}
+return this._start;
+};
+_proto.endTime=function endTime(includeRepeats){
+return this._start +(_isNotFalse(includeRepeats)?this.totalDuration():this.duration())/ Math.abs(this._ts||1);
+};
+_proto.rawTime=function rawTime(wrapRepeats){
+var parent=this.parent||this._dp;
+return!parent?this._tTime:wrapRepeats&&(!this._ts||this._repeat&&this._time&&this.totalProgress()<1)?this._tTime%(this._dur + this._rDelay):!this._ts?this._tTime:_parentToChildTotalTime(parent.rawTime(wrapRepeats),this);
+};
+_proto.revert=function revert(config){
+if(config===void 0){
+config=_revertConfig;
+}
+var prevIsReverting=_reverting;
+_reverting=config;
+if(_isRevertWorthy(this)){
+this.timeline&&this.timeline.revert(config);
+this.totalTime(-0.01,config.suppressEvents);
+}
+this.data!=="nested"&&config.kill!==false&&this.kill();
+_reverting=prevIsReverting;
+return this;
+};
+_proto.globalTime=function globalTime(rawTime){
+var animation=this,
+time=arguments.length?rawTime:animation.rawTime();
+while(animation){
+time=animation._start + time /(Math.abs(animation._ts)||1);
+animation=animation._dp;
+}
+return!this.parent&&this._sat?this._sat.globalTime(rawTime):time;
+};
+_proto.repeat=function repeat(value){
+if(arguments.length){
+this._repeat=value===Infinity?-2:value;
+return _onUpdateTotalDuration(this);
+}
+return this._repeat===-2?Infinity:this._repeat;
+};
+_proto.repeatDelay=function repeatDelay(value){
+if(arguments.length){
+var time=this._time;
+this._rDelay=value;
+_onUpdateTotalDuration(this);
+return time?this.time(time):this;
+}
+return this._rDelay;
+};
+_proto.yoyo=function yoyo(value){
+if(arguments.length){
+this._yoyo=value;
+return this;
+}
+return this._yoyo;
+};
+_proto.seek=function seek(position,suppressEvents){
+return this.totalTime(_parsePosition(this,position),_isNotFalse(suppressEvents));
+};
+_proto.restart=function restart(includeDelay,suppressEvents){
+this.play().totalTime(includeDelay?-this._delay:0,_isNotFalse(suppressEvents));
+this._dur||(this._zTime=-_tinyNum);
+return this;
+};
+_proto.play=function play(from,suppressEvents){
+from!=null&&this.seek(from,suppressEvents);
+return this.reversed(false).paused(false);
+};
+_proto.reverse=function reverse(from,suppressEvents){
+from!=null&&this.seek(from||this.totalDuration(),suppressEvents);
+return this.reversed(true).paused(false);
+};
+_proto.pause=function pause(atTime,suppressEvents){
+atTime!=null&&this.seek(atTime,suppressEvents);
+return this.paused(true);
+};
+_proto.resume=function resume(){
+return this.paused(false);
+};
+_proto.reversed=function reversed(value){
+if(arguments.length){
+!!value!==this.reversed()&&this.timeScale(-this._rts||(value?-_tinyNum:0));
+return this;
+}
+return this._rts<0;
+};
+_proto.invalidate=function invalidate(){
+this._initted=this._act=0;
+this._zTime=-_tinyNum;
+return this;
+};
+_proto.isActive=function isActive(){
+var parent=this.parent||this._dp,
+start=this._start,
+rawTime;
+return!!(!parent||this._ts&&this._initted&&parent.isActive()&&(rawTime=parent.rawTime(true))>=start&&rawTime<this.endTime(true)- _tinyNum);
+};
+_proto.eventCallback=function eventCallback(type,callback,params){
+var vars=this.vars;
+if(arguments.length>1){
+if(!callback){
+delete vars[type];
+}else{
+vars[type]=callback;
+params&&(vars[type + "Params"]=params);
+type==="onUpdate"&&(this._onUpdate=callback);
+}
+return this;
+}
+return vars[type];
+};
+_proto.then=function then(onFulfilled){
+var self=this;
+return new Promise(function(resolve){
+var f=_isFunction(onFulfilled)?onFulfilled:_passThrough,
+_resolve=function _resolve(){
+var _then=self.then;
+self.then=null;
+_isFunction(f)&&(f=f(self))&&(f.then||f===self)&&(self.then=_then);
+resolve(f);
+self.then=_then;
+};
+if(self._initted&&self.totalProgress()===1&&self._ts>=0||!self._tTime&&self._ts<0){
+_resolve();
+}else{
+self._prom=_resolve;
+}
+});
+};
+_proto.kill=function kill(){
+_interrupt(this);
+};
+return Animation;
+}();
+_setDefaults(Animation.prototype,{
+_time:0,
+_start:0,
+_end:0,
+_tTime:0,
+_tDur:0,
+_dirty:0,
+_repeat:0,
+_yoyo:false,
+parent:null,
+_initted:false,
+_rDelay:0,
+_ts:1,
+_dp:0,
+ratio:0,
+_zTime:-_tinyNum,
+_prom:0,
+_ps:false,
+_rts:1
+});
+var Timeline=exports.TimelineLite=exports.TimelineMax=exports.Timeline= function(_Animation){
+_inheritsLoose(Timeline,_Animation);
+function Timeline(vars,position){
+var _this;
+if(vars===void 0){
+vars={};
+}
+_this=_Animation.call(this,vars)||this;
+_this.labels={};
+_this.smoothChildTiming=!!vars.smoothChildTiming;
+_this.autoRemoveChildren=!!vars.autoRemoveChildren;
+_this._sort=_isNotFalse(vars.sortChildren);
+_globalTimeline&&_addToTimeline(vars.parent||_globalTimeline,_assertThisInitialized(_this),position);
+vars.reversed&&_this.reverse();
+vars.paused&&_this.paused(true);
+vars.scrollTrigger&&_scrollTrigger(_assertThisInitialized(_this),vars.scrollTrigger);
+return _this;
+}
+var _proto2=Timeline.prototype;
+_proto2.to=function to(targets,vars,position){
+_createTweenType(0,arguments,this);
+return this;
+};
+_proto2.from=function from(targets,vars,position){
+_createTweenType(1,arguments,this);
+return this;
+};
+_proto2.fromTo=function fromTo(targets,fromVars,toVars,position){
+_createTweenType(2,arguments,this);
+return this;
+};
+_proto2.set=function set(targets,vars,position){
+vars.duration=0;
+vars.parent=this;
+_inheritDefaults(vars).repeatDelay||(vars.repeat=0);
+vars.immediateRender=!!vars.immediateRender;
+new Tween(targets,vars,_parsePosition(this,position),1);
+return this;
+};
+_proto2.call=function call(callback,params,position){
+return _addToTimeline(this,Tween.delayedCall(0,callback,params),position);
+}
+;
+_proto2.staggerTo=function staggerTo(targets,duration,vars,stagger,position,onCompleteAll,onCompleteAllParams){
+vars.duration=duration;
+vars.stagger=vars.stagger||stagger;
+vars.onComplete=onCompleteAll;
+vars.onCompleteParams=onCompleteAllParams;
+vars.parent=this;
+new Tween(targets,vars,_parsePosition(this,position));
+return this;
+};
+_proto2.staggerFrom=function staggerFrom(targets,duration,vars,stagger,position,onCompleteAll,onCompleteAllParams){
+vars.runBackwards=1;
+_inheritDefaults(vars).immediateRender=_isNotFalse(vars.immediateRender);
+return this.staggerTo(targets,duration,vars,stagger,position,onCompleteAll,onCompleteAllParams);
+};
+_proto2.staggerFromTo=function staggerFromTo(targets,duration,fromVars,toVars,stagger,position,onCompleteAll,onCompleteAllParams){
+toVars.startAt=fromVars;
+_inheritDefaults(toVars).immediateRender=_isNotFalse(toVars.immediateRender);
+return this.staggerTo(targets,duration,toVars,stagger,position,onCompleteAll,onCompleteAllParams);
+};
+_proto2.render=function render(totalTime,suppressEvents,force){
+var prevTime=this._time,
+tDur=this._dirty?this.totalDuration():this._tDur,
+dur=this._dur,
+tTime=totalTime<=0?0:_roundPrecise(totalTime),
+crossingStart=this._zTime<0!==totalTime<0&&(this._initted||!dur),
+time,
+child,
+next,
+iteration,
+cycleDuration,
+prevPaused,
+pauseTween,
+timeScale,
+prevStart,
+prevIteration,
+yoyo,
+isYoyo;
+this!==_globalTimeline&&tTime>tDur&&totalTime>=0&&(tTime=tDur);
+if(tTime!==this._tTime||force||crossingStart){
+if(prevTime!==this._time&&dur){
+tTime +=this._time - prevTime;
+totalTime +=this._time - prevTime;
+}
+time=tTime;
+prevStart=this._start;
+timeScale=this._ts;
+prevPaused=!timeScale;
+if(crossingStart){
+dur||(prevTime=this._zTime);
+(totalTime||!suppressEvents)&&(this._zTime=totalTime);
+}
+if(this._repeat){
+yoyo=this._yoyo;
+cycleDuration=dur + this._rDelay;
+if(this._repeat<-1&&totalTime<0){
+return this.totalTime(cycleDuration*100 + totalTime,suppressEvents,force);
+}
+time=_roundPrecise(tTime%cycleDuration);
+if(tTime===tDur){
+iteration=this._repeat;
+time=dur;
+}else{
+prevIteration=_roundPrecise(tTime / cycleDuration);
+iteration=~~prevIteration;
+if(iteration&&iteration===prevIteration){
+time=dur;
+iteration--;
+}
+time>dur&&(time=dur);
+}
+prevIteration=_animationCycle(this._tTime,cycleDuration);
+!prevTime&&this._tTime&&prevIteration!==iteration&&this._tTime - prevIteration*cycleDuration - this._dur<=0&&(prevIteration=iteration);
+if(yoyo&&iteration&1){
+time=dur - time;
+isYoyo=1;
+}
+if(iteration!==prevIteration&&!this._lock){
+var rewinding=yoyo&&prevIteration&1,
+doesWrap=rewinding===(yoyo&&iteration&1);
+iteration<prevIteration&&(rewinding=!rewinding);
+prevTime=rewinding?0:tTime%dur?dur:tTime;
+this._lock=1;
+this.render(prevTime||(isYoyo?0:_roundPrecise(iteration*cycleDuration)),suppressEvents,!dur)._lock=0;
+this._tTime=tTime;
+!suppressEvents&&this.parent&&_callback(this,"onRepeat");
+this.vars.repeatRefresh&&!isYoyo&&(this.invalidate()._lock=1);
+if(prevTime&&prevTime!==this._time||prevPaused!==!this._ts||this.vars.onRepeat&&!this.parent&&!this._act){
+return this;
+}
+dur=this._dur;
+tDur=this._tDur;
+if(doesWrap){
+this._lock=2;
+prevTime=rewinding?dur:-0.0001;
+this.render(prevTime,true);
+this.vars.repeatRefresh&&!isYoyo&&this.invalidate();
+}
+this._lock=0;
+if(!this._ts&&!prevPaused){
+return this;
+}
+_propagateYoyoEase(this,isYoyo);
+}
+}
+if(this._hasPause&&!this._forcing&&this._lock<2){
+pauseTween=_findNextPauseTween(this,_roundPrecise(prevTime),_roundPrecise(time));
+if(pauseTween){
+tTime -=time -(time=pauseTween._start);
+}
+}
+this._tTime=tTime;
+this._time=time;
+this._act=!timeScale;
+if(!this._initted){
+this._onUpdate=this.vars.onUpdate;
+this._initted=1;
+this._zTime=totalTime;
+prevTime=0;
+}
+if(!prevTime&&tTime&&!suppressEvents&&!prevIteration){
+_callback(this,"onStart");
+if(this._tTime!==tTime){
+return this;
+}
+}
+if(time>=prevTime&&totalTime>=0){
+child=this._first;
+while(child){
+next=child._next;
+if((child._act||time>=child._start)&&child._ts&&pauseTween!==child){
+if(child.parent!==this){
+return this.render(totalTime,suppressEvents,force);
+}
+child.render(child._ts>0?(time - child._start)*child._ts:(child._dirty?child.totalDuration():child._tDur)+(time - child._start)*child._ts,suppressEvents,force);
+if(time!==this._time||!this._ts&&!prevPaused){
+pauseTween=0;
+next&&(tTime +=this._zTime=-_tinyNum);
+break;
+}
+}
+child=next;
+}
+}else{
+child=this._last;
+var adjustedTime=totalTime<0?totalTime:time;
+while(child){
+next=child._prev;
+if((child._act||adjustedTime<=child._end)&&child._ts&&pauseTween!==child){
+if(child.parent!==this){
+return this.render(totalTime,suppressEvents,force);
+}
+child.render(child._ts>0?(adjustedTime - child._start)*child._ts:(child._dirty?child.totalDuration():child._tDur)+(adjustedTime - child._start)*child._ts,suppressEvents,force||_reverting&&_isRevertWorthy(child));
+if(time!==this._time||!this._ts&&!prevPaused){
+pauseTween=0;
+next&&(tTime +=this._zTime=adjustedTime?-_tinyNum:_tinyNum);
+break;
+}
+}
+child=next;
+}
+}
+if(pauseTween&&!suppressEvents){
+this.pause();
+pauseTween.render(time>=prevTime?0:-_tinyNum)._zTime=time>=prevTime?1:-1;
+if(this._ts){
+this._start=prevStart;
+_setEnd(this);
+return this.render(totalTime,suppressEvents,force);
+}
+}
+this._onUpdate&&!suppressEvents&&_callback(this,"onUpdate",true);
+if(tTime===tDur&&this._tTime>=this.totalDuration()||!tTime&&prevTime)
+if(prevStart===this._start||Math.abs(timeScale)!==Math.abs(this._ts))
+if(!this._lock){
+(totalTime||!dur)&&(tTime===tDur&&this._ts>0||!tTime&&this._ts<0)&&_removeFromParent(this,1);
+if(!suppressEvents&&!(totalTime<0&&!prevTime)&&(tTime||prevTime||!tDur)){
+_callback(this,tTime===tDur&&totalTime>=0?"onComplete":"onReverseComplete",true);
+this._prom&&!(tTime<tDur&&this.timeScale()>0)&&this._prom();
+}
+}
+}
+return this;
+};
+_proto2.add=function add(child,position){
+var _this2=this;
+_isNumber(position)||(position=_parsePosition(this,position,child));
+if(!(child instanceof Animation)){
+if(_isArray(child)){
+child.forEach(function(obj){
+return _this2.add(obj,position);
+});
+return this;
+}
+if(_isString(child)){
+return this.addLabel(child,position);
+}
+if(_isFunction(child)){
+child=Tween.delayedCall(0,child);
+}else{
+return this;
+}
+}
+return this!==child?_addToTimeline(this,child,position):this;
+};
+_proto2.getChildren=function getChildren(nested,tweens,timelines,ignoreBeforeTime){
+if(nested===void 0){
+nested=true;
+}
+if(tweens===void 0){
+tweens=true;
+}
+if(timelines===void 0){
+timelines=true;
+}
+if(ignoreBeforeTime===void 0){
+ignoreBeforeTime=-_bigNum;
+}
+var a=[],
+child=this._first;
+while(child){
+if(child._start>=ignoreBeforeTime){
+if(child instanceof Tween){
+tweens&&a.push(child);
+}else{
+timelines&&a.push(child);
+nested&&a.push.apply(a,child.getChildren(true,tweens,timelines));
+}
+}
+child=child._next;
+}
+return a;
+};
+_proto2.getById=function getById(id){
+var animations=this.getChildren(1,1,1),
+i=animations.length;
+while(i--){
+if(animations[i].vars.id===id){
+return animations[i];
+}
+}
+};
+_proto2.remove=function remove(child){
+if(_isString(child)){
+return this.removeLabel(child);
+}
+if(_isFunction(child)){
+return this.killTweensOf(child);
+}
+child.parent===this&&_removeLinkedListItem(this,child);
+if(child===this._recent){
+this._recent=this._last;
+}
+return _uncache(this);
+};
+_proto2.totalTime=function totalTime(_totalTime2,suppressEvents){
+if(!arguments.length){
+return this._tTime;
+}
+this._forcing=1;
+if(!this._dp&&this._ts){
+this._start=_roundPrecise(_ticker.time -(this._ts>0?_totalTime2 / this._ts:(this.totalDuration()- _totalTime2)/ -this._ts));
+}
+_Animation.prototype.totalTime.call(this,_totalTime2,suppressEvents);
+this._forcing=0;
+return this;
+};
+_proto2.addLabel=function addLabel(label,position){
+this.labels[label]=_parsePosition(this,position);
+return this;
+};
+_proto2.removeLabel=function removeLabel(label){
+delete this.labels[label];
+return this;
+};
+_proto2.addPause=function addPause(position,callback,params){
+var t=Tween.delayedCall(0,callback||_emptyFunc,params);
+t.data="isPause";
+this._hasPause=1;
+return _addToTimeline(this,t,_parsePosition(this,position));
+};
+_proto2.removePause=function removePause(position){
+var child=this._first;
+position=_parsePosition(this,position);
+while(child){
+if(child._start===position&&child.data==="isPause"){
+_removeFromParent(child);
+}
+child=child._next;
+}
+};
+_proto2.killTweensOf=function killTweensOf(targets,props,onlyActive){
+var tweens=this.getTweensOf(targets,onlyActive),
+i=tweens.length;
+while(i--){
+_overwritingTween!==tweens[i]&&tweens[i].kill(targets,props);
+}
+return this;
+};
+_proto2.getTweensOf=function getTweensOf(targets,onlyActive){
+var a=[],
+parsedTargets=toArray(targets),
+child=this._first,
+isGlobalTime=_isNumber(onlyActive),
+children;
+while(child){
+if(child instanceof Tween){
+if(_arrayContainsAny(child._targets,parsedTargets)&&(isGlobalTime?(!_overwritingTween||child._initted&&child._ts)&&child.globalTime(0)<=onlyActive&&child.globalTime(child.totalDuration())>onlyActive:!onlyActive||child.isActive())){
+a.push(child);
+}
+}else if((children=child.getTweensOf(parsedTargets,onlyActive)).length){
+a.push.apply(a,children);
+}
+child=child._next;
+}
+return a;
+}
+;
+_proto2.tweenTo=function tweenTo(position,vars){
+vars=vars||{};
+var tl=this,
+endTime=_parsePosition(tl,position),
+_vars=vars,
+startAt=_vars.startAt,
+_onStart=_vars.onStart,
+onStartParams=_vars.onStartParams,
+immediateRender=_vars.immediateRender,
+initted,
+tween=Tween.to(tl,_setDefaults({
+ease:vars.ease||"none",
+lazy:false,
+immediateRender:false,
+time:endTime,
+overwrite:"auto",
+duration:vars.duration||Math.abs((endTime -(startAt&&"time" in startAt?startAt.time:tl._time))/ tl.timeScale())||_tinyNum,
+onStart:function onStart(){
+tl.pause();
+if(!initted){
+var duration=vars.duration||Math.abs((endTime -(startAt&&"time" in startAt?startAt.time:tl._time))/ tl.timeScale());
+tween._dur!==duration&&_setDuration(tween,duration,0,1).render(tween._time,true,true);
+initted=1;
+}
+_onStart&&_onStart.apply(tween,onStartParams||[]);
+}
+},vars));
+return immediateRender?tween.render(0):tween;
+};
+_proto2.tweenFromTo=function tweenFromTo(fromPosition,toPosition,vars){
+return this.tweenTo(toPosition,_setDefaults({
+startAt:{
+time:_parsePosition(this,fromPosition)
+}
+},vars));
+};
+_proto2.recent=function recent(){
+return this._recent;
+};
+_proto2.nextLabel=function nextLabel(afterTime){
+if(afterTime===void 0){
+afterTime=this._time;
+}
+return _getLabelInDirection(this,_parsePosition(this,afterTime));
+};
+_proto2.previousLabel=function previousLabel(beforeTime){
+if(beforeTime===void 0){
+beforeTime=this._time;
+}
+return _getLabelInDirection(this,_parsePosition(this,beforeTime),1);
+};
+_proto2.currentLabel=function currentLabel(value){
+return arguments.length?this.seek(value,true):this.previousLabel(this._time + _tinyNum);
+};
+_proto2.shiftChildren=function shiftChildren(amount,adjustLabels,ignoreBeforeTime){
+if(ignoreBeforeTime===void 0){
+ignoreBeforeTime=0;
+}
+var child=this._first,
+labels=this.labels,
+p;
+while(child){
+if(child._start>=ignoreBeforeTime){
+child._start +=amount;
+child._end +=amount;
+}
+child=child._next;
+}
+if(adjustLabels){
+for(p in labels){
+if(labels[p]>=ignoreBeforeTime){
+labels[p]+=amount;
+}
+}
+}
+return _uncache(this);
+};
+_proto2.invalidate=function invalidate(soft){
+var child=this._first;
+this._lock=0;
+while(child){
+child.invalidate(soft);
+child=child._next;
+}
+return _Animation.prototype.invalidate.call(this,soft);
+};
+_proto2.clear=function clear(includeLabels){
+if(includeLabels===void 0){
+includeLabels=true;
+}
+var child=this._first,
+next;
+while(child){
+next=child._next;
+this.remove(child);
+child=next;
+}
+this._dp&&(this._time=this._tTime=this._pTime=0);
+includeLabels&&(this.labels={});
+return _uncache(this);
+};
+_proto2.totalDuration=function totalDuration(value){
+var max=0,
+self=this,
+child=self._last,
+prevStart=_bigNum,
+prev,
+start,
+parent;
+if(arguments.length){
+return self.timeScale((self._repeat<0?self.duration():self.totalDuration())/(self.reversed()?-value:value));
+}
+if(self._dirty){
+parent=self.parent;
+while(child){
+prev=child._prev;
+child._dirty&&child.totalDuration();
+start=child._start;
+if(start>prevStart&&self._sort&&child._ts&&!self._lock){
+self._lock=1;
+_addToTimeline(self,child,start - child._delay,1)._lock=0;
+}else{
+prevStart=start;
+}
+if(start<0&&child._ts){
+max -=start;
+if(!parent&&!self._dp||parent&&parent.smoothChildTiming){
+self._start +=start / self._ts;
+self._time -=start;
+self._tTime -=start;
+}
+self.shiftChildren(-start,false,-1e999);
+prevStart=0;
+}
+child._end>max&&child._ts&&(max=child._end);
+child=prev;
+}
+_setDuration(self,self===_globalTimeline&&self._time>max?self._time:max,1,1);
+self._dirty=0;
+}
+return self._tDur;
+};
+Timeline.updateRoot=function updateRoot(time){
+if(_globalTimeline._ts){
+_lazySafeRender(_globalTimeline,_parentToChildTotalTime(time,_globalTimeline));
+_lastRenderedFrame=_ticker.frame;
+}
+if(_ticker.frame>=_nextGCFrame){
+_nextGCFrame +=_config.autoSleep||120;
+var child=_globalTimeline._first;
+if(!child||!child._ts)
+if(_config.autoSleep&&_ticker._listeners.length<2){
+while(child&&!child._ts){
+child=child._next;
+}
+child||_ticker.sleep();
+}
+}
+};
+return Timeline;
+}(Animation);
+_setDefaults(Timeline.prototype,{
+_lock:0,
+_hasPause:0,
+_forcing:0
+});
+var _addComplexStringPropTween=function _addComplexStringPropTween(target,prop,start,end,setter,stringFilter,funcParam){
+var pt=new PropTween(this._pt,target,prop,0,1,_renderComplexString,null,setter),
+index=0,
+matchIndex=0,
+result,
+startNums,
+color,
+endNum,
+chunk,
+startNum,
+hasRandom,
+a;
+pt.b=start;
+pt.e=end;
+start +="";
+end +="";
+if(hasRandom=~end.indexOf("random(")){
+end=_replaceRandom(end);
+}
+if(stringFilter){
+a=[start,end];
+stringFilter(a,target,prop);
+start=a[0];
+end=a[1];
+}
+startNums=start.match(_complexStringNumExp)||[];
+while(result=_complexStringNumExp.exec(end)){
+endNum=result[0];
+chunk=end.substring(index,result.index);
+if(color){
+color=(color + 1)%5;
+}else if(chunk.substr(-5)==="rgba("){
+color=1;
+}
+if(endNum!==startNums[matchIndex++]){
+startNum=parseFloat(startNums[matchIndex - 1])||0;
+pt._pt={
+_next:pt._pt,
+p:chunk||matchIndex===1?chunk:",",
+s:startNum,
+c:endNum.charAt(1)==="="?_parseRelative(startNum,endNum)- startNum:parseFloat(endNum)- startNum,
+m:color&&color<4?Math.round:0
+};
+index=_complexStringNumExp.lastIndex;
+}
+}
+pt.c=index<end.length?end.substring(index,end.length):"";
+pt.fp=funcParam;
+if(_relExp.test(end)||hasRandom){
+pt.e=0;
+}
+this._pt=pt;
+return pt;
+},
+_addPropTween=function _addPropTween(target,prop,start,end,index,targets,modifier,stringFilter,funcParam,optional){
+_isFunction(end)&&(end=end(index||0,target,targets));
+var currentValue=target[prop],
+parsedStart=start!=="get"?start:!_isFunction(currentValue)?currentValue:funcParam?target[prop.indexOf("set")||!_isFunction(target["get" + prop.substr(3)])?prop:"get" + prop.substr(3)](funcParam):target[prop](),
+setter=!_isFunction(currentValue)?_setterPlain:funcParam?_setterFuncWithParam:_setterFunc,
+pt;
+if(_isString(end)){
+if(~end.indexOf("random(")){
+end=_replaceRandom(end);
+}
+if(end.charAt(1)==="="){
+pt=_parseRelative(parsedStart,end)+(getUnit(parsedStart)||0);
+if(pt||pt===0){
+end=pt;
+}
+}
+}
+if(!optional||parsedStart!==end||_forceAllPropTweens){
+if(!isNaN(parsedStart*end)&&end!==""){
+pt=new PropTween(this._pt,target,prop,+parsedStart||0,end -(parsedStart||0),typeof currentValue==="boolean"?_renderBoolean:_renderPlain,0,setter);
+funcParam&&(pt.fp=funcParam);
+modifier&&pt.modifier(modifier,this,target);
+return this._pt=pt;
+}!currentValue&&!(prop in target)&&_missingPlugin(prop,end);
+return _addComplexStringPropTween.call(this,target,prop,parsedStart,end,setter,stringFilter||_config.stringFilter,funcParam);
+}
+},
+_processVars=function _processVars(vars,index,target,targets,tween){
+_isFunction(vars)&&(vars=_parseFuncOrString(vars,tween,index,target,targets));
+if(!_isObject(vars)||vars.style&&vars.nodeType||_isArray(vars)||_isTypedArray(vars)){
+return _isString(vars)?_parseFuncOrString(vars,tween,index,target,targets):vars;
+}
+var copy={},
+p;
+for(p in vars){
+copy[p]=_parseFuncOrString(vars[p],tween,index,target,targets);
+}
+return copy;
+},
+_checkPlugin=exports._checkPlugin=function _checkPlugin(property,vars,tween,index,target,targets){
+var plugin,pt,ptLookup,i;
+if(_plugins[property]&&(plugin=new _plugins[property]()).init(target,plugin.rawVars?vars[property]:_processVars(vars[property],index,target,targets,tween),tween,index,targets)!==false){
+tween._pt=pt=new PropTween(tween._pt,target,property,0,1,plugin.render,plugin,0,plugin.priority);
+if(tween!==_quickTween){
+ptLookup=tween._ptLookup[tween._targets.indexOf(target)];
+i=plugin._props.length;
+while(i--){
+ptLookup[plugin._props[i]]=pt;
+}
+}
+}
+return plugin;
+},
+_overwritingTween,
+_forceAllPropTweens,
+_initTween=function _initTween(tween,time,tTime){
+var vars=tween.vars,
+ease=vars.ease,
+startAt=vars.startAt,
+immediateRender=vars.immediateRender,
+lazy=vars.lazy,
+onUpdate=vars.onUpdate,
+runBackwards=vars.runBackwards,
+yoyoEase=vars.yoyoEase,
+keyframes=vars.keyframes,
+autoRevert=vars.autoRevert,
+dur=tween._dur,
+prevStartAt=tween._startAt,
+targets=tween._targets,
+parent=tween.parent,
+fullTargets=parent&&parent.data==="nested"?parent.vars.targets:targets,
+autoOverwrite=tween._overwrite==="auto"&&!_suppressOverwrites,
+tl=tween.timeline,
+cleanVars,
+i,
+p,
+pt,
+target,
+hasPriority,
+gsData,
+harness,
+plugin,
+ptLookup,
+index,
+harnessVars,
+overwritten;
+tl&&(!keyframes||!ease)&&(ease="none");
+tween._ease=_parseEase(ease,_defaults.ease);
+tween._yEase=yoyoEase?_invertEase(_parseEase(yoyoEase===true?ease:yoyoEase,_defaults.ease)):0;
+if(yoyoEase&&tween._yoyo&&!tween._repeat){
+yoyoEase=tween._yEase;
+tween._yEase=tween._ease;
+tween._ease=yoyoEase;
+}
+tween._from=!tl&&!!vars.runBackwards;
+if(!tl||keyframes&&!vars.stagger){
+harness=targets[0]?_getCache(targets[0]).harness:0;
+harnessVars=harness&&vars[harness.prop];
+cleanVars=_copyExcluding(vars,_reservedProps);
+if(prevStartAt){
+prevStartAt._zTime<0&&prevStartAt.progress(1);
+time<0&&runBackwards&&immediateRender&&!autoRevert?prevStartAt.render(-1,true):prevStartAt.revert(runBackwards&&dur?_revertConfigNoKill:_startAtRevertConfig);
+prevStartAt._lazy=0;
+}
+if(startAt){
+_removeFromParent(tween._startAt=Tween.set(targets,_setDefaults({
+data:"isStart",
+overwrite:false,
+parent:parent,
+immediateRender:true,
+lazy:!prevStartAt&&_isNotFalse(lazy),
+startAt:null,
+delay:0,
+onUpdate:onUpdate&&function(){
+return _callback(tween,"onUpdate");
+},
+stagger:0
+},startAt)));
+tween._startAt._dp=0;
+tween._startAt._sat=tween;
+time<0&&(_reverting||!immediateRender&&!autoRevert)&&tween._startAt.revert(_revertConfigNoKill);
+if(immediateRender){
+if(dur&&time<=0&&tTime<=0){
+time&&(tween._zTime=time);
+return;
+}
+}
+}else if(runBackwards&&dur){
+if(!prevStartAt){
+time&&(immediateRender=false);
+p=_setDefaults({
+overwrite:false,
+data:"isFromStart",
+lazy:immediateRender&&!prevStartAt&&_isNotFalse(lazy),
+immediateRender:immediateRender,
+stagger:0,
+parent:parent
+},cleanVars);
+harnessVars&&(p[harness.prop]=harnessVars);
+_removeFromParent(tween._startAt=Tween.set(targets,p));
+tween._startAt._dp=0;
+tween._startAt._sat=tween;
+time<0&&(_reverting?tween._startAt.revert(_revertConfigNoKill):tween._startAt.render(-1,true));
+tween._zTime=time;
+if(!immediateRender){
+_initTween(tween._startAt,_tinyNum,_tinyNum);
+}else if(!time){
+return;
+}
+}
+}
+tween._pt=tween._ptCache=0;
+lazy=dur&&_isNotFalse(lazy)||lazy&&!dur;
+for(i=0;i<targets.length;i++){
+target=targets[i];
+gsData=target._gsap||_harness(targets)[i]._gsap;
+tween._ptLookup[i]=ptLookup={};
+_lazyLookup[gsData.id]&&_lazyTweens.length&&_lazyRender();
+index=fullTargets===targets?i:fullTargets.indexOf(target);
+if(harness&&(plugin=new harness()).init(target,harnessVars||cleanVars,tween,index,fullTargets)!==false){
+tween._pt=pt=new PropTween(tween._pt,target,plugin.name,0,1,plugin.render,plugin,0,plugin.priority);
+plugin._props.forEach(function(name){
+ptLookup[name]=pt;
+});
+plugin.priority&&(hasPriority=1);
+}
+if(!harness||harnessVars){
+for(p in cleanVars){
+if(_plugins[p]&&(plugin=_checkPlugin(p,cleanVars,tween,index,target,fullTargets))){
+plugin.priority&&(hasPriority=1);
+}else{
+ptLookup[p]=pt=_addPropTween.call(tween,target,p,"get",cleanVars[p],index,fullTargets,0,vars.stringFilter);
+}
+}
+}
+tween._op&&tween._op[i]&&tween.kill(target,tween._op[i]);
+if(autoOverwrite&&tween._pt){
+_overwritingTween=tween;
+_globalTimeline.killTweensOf(target,ptLookup,tween.globalTime(time));
+overwritten=!tween.parent;
+_overwritingTween=0;
+}
+tween._pt&&lazy&&(_lazyLookup[gsData.id]=1);
+}
+hasPriority&&_sortPropTweensByPriority(tween);
+tween._onInit&&tween._onInit(tween);
+}
+tween._onUpdate=onUpdate;
+tween._initted=(!tween._op||tween._pt)&&!overwritten;
+keyframes&&time<=0&&tl.render(_bigNum,true,true);
+},
+_updatePropTweens=function _updatePropTweens(tween,property,value,start,startIsRelative,ratio,time,skipRecursion){
+var ptCache=(tween._pt&&tween._ptCache||(tween._ptCache={}))[property],
+pt,
+rootPT,
+lookup,
+i;
+if(!ptCache){
+ptCache=tween._ptCache[property]=[];
+lookup=tween._ptLookup;
+i=tween._targets.length;
+while(i--){
+pt=lookup[i][property];
+if(pt&&pt.d&&pt.d._pt){
+pt=pt.d._pt;
+while(pt&&pt.p!==property&&pt.fp!==property){
+pt=pt._next;
+}
+}
+if(!pt){
+_forceAllPropTweens=1;
+tween.vars[property]="+=0";
+_initTween(tween,time);
+_forceAllPropTweens=0;
+return skipRecursion?_warn(property + " not eligible for reset"):1;
+}
+ptCache.push(pt);
+}
+}
+i=ptCache.length;
+while(i--){
+rootPT=ptCache[i];
+pt=rootPT._pt||rootPT;
+pt.s=(start||start===0)&&!startIsRelative?start:pt.s +(start||0)+ ratio*pt.c;
+pt.c=value - pt.s;
+rootPT.e&&(rootPT.e=_round(value)+ getUnit(rootPT.e));
+rootPT.b&&(rootPT.b=pt.s + getUnit(rootPT.b));
+}
+},
+_addAliasesToVars=function _addAliasesToVars(targets,vars){
+var harness=targets[0]?_getCache(targets[0]).harness:0,
+propertyAliases=harness&&harness.aliases,
+copy,
+p,
+i,
+aliases;
+if(!propertyAliases){
+return vars;
+}
+copy=_merge({},vars);
+for(p in propertyAliases){
+if(p in copy){
+aliases=propertyAliases[p].split(",");
+i=aliases.length;
+while(i--){
+copy[aliases[i]]=copy[p];
+}
+}
+}
+return copy;
+},
+_parseKeyframe=function _parseKeyframe(prop,obj,allProps,easeEach){
+var ease=obj.ease||easeEach||"power1.inOut",
+p,
+a;
+if(_isArray(obj)){
+a=allProps[prop]||(allProps[prop]=[]);
+obj.forEach(function(value,i){
+return a.push({
+t:i /(obj.length - 1)*100,
+v:value,
+e:ease
+});
+});
+}else{
+for(p in obj){
+a=allProps[p]||(allProps[p]=[]);
+p==="ease"||a.push({
+t:parseFloat(prop),
+v:obj[p],
+e:ease
+});
+}
+}
+},
+_parseFuncOrString=function _parseFuncOrString(value,tween,i,target,targets){
+return _isFunction(value)?value.call(tween,i,target,targets):_isString(value)&&~value.indexOf("random(")?_replaceRandom(value):value;
+},
+_staggerTweenProps=_callbackNames + "repeat,repeatDelay,yoyo,repeatRefresh,yoyoEase,autoRevert",
+_staggerPropsToSkip={};
+_forEachName(_staggerTweenProps + ",id,stagger,delay,duration,paused,scrollTrigger",function(name){
+return _staggerPropsToSkip[name]=1;
+});
+var Tween=exports.TweenLite=exports.TweenMax=exports.Tween= function(_Animation2){
+_inheritsLoose(Tween,_Animation2);
+function Tween(targets,vars,position,skipInherit){
+var _this3;
+if(typeof vars==="number"){
+position.duration=vars;
+vars=position;
+position=null;
+}
+_this3=_Animation2.call(this,skipInherit?vars:_inheritDefaults(vars))||this;
+var _this3$vars=_this3.vars,
+duration=_this3$vars.duration,
+delay=_this3$vars.delay,
+immediateRender=_this3$vars.immediateRender,
+stagger=_this3$vars.stagger,
+overwrite=_this3$vars.overwrite,
+keyframes=_this3$vars.keyframes,
+defaults=_this3$vars.defaults,
+scrollTrigger=_this3$vars.scrollTrigger,
+yoyoEase=_this3$vars.yoyoEase,
+parent=vars.parent||_globalTimeline,
+parsedTargets=(_isArray(targets)||_isTypedArray(targets)?_isNumber(targets[0]):"length" in vars)?[targets]:toArray(targets),
+tl,
+i,
+copy,
+l,
+p,
+curTarget,
+staggerFunc,
+staggerVarsToMerge;
+_this3._targets=parsedTargets.length?_harness(parsedTargets):_warn("GSAP target " + targets + " not found. https://gsap.com",!_config.nullTargetWarn)||[];
+_this3._ptLookup=[];
+_this3._overwrite=overwrite;
+if(keyframes||stagger||_isFuncOrString(duration)||_isFuncOrString(delay)){
+vars=_this3.vars;
+tl=_this3.timeline=new Timeline({
+data:"nested",
+defaults:defaults||{},
+targets:parent&&parent.data==="nested"?parent.vars.targets:parsedTargets
+});
+tl.kill();
+tl.parent=tl._dp=_assertThisInitialized(_this3);
+tl._start=0;
+if(stagger||_isFuncOrString(duration)||_isFuncOrString(delay)){
+l=parsedTargets.length;
+staggerFunc=stagger&&distribute(stagger);
+if(_isObject(stagger)){
+for(p in stagger){
+if(~_staggerTweenProps.indexOf(p)){
+staggerVarsToMerge||(staggerVarsToMerge={});
+staggerVarsToMerge[p]=stagger[p];
+}
+}
+}
+for(i=0;i<l;i++){
+copy=_copyExcluding(vars,_staggerPropsToSkip);
+copy.stagger=0;
+yoyoEase&&(copy.yoyoEase=yoyoEase);
+staggerVarsToMerge&&_merge(copy,staggerVarsToMerge);
+curTarget=parsedTargets[i];
+copy.duration=+_parseFuncOrString(duration,_assertThisInitialized(_this3),i,curTarget,parsedTargets);
+copy.delay=(+_parseFuncOrString(delay,_assertThisInitialized(_this3),i,curTarget,parsedTargets)||0)- _this3._delay;
+if(!stagger&&l===1&&copy.delay){
+_this3._delay=delay=copy.delay;
+_this3._start +=delay;
+copy.delay=0;
+}
+tl.to(curTarget,copy,staggerFunc?staggerFunc(i,curTarget,parsedTargets):0);
+tl._ease=_easeMap.none;
+}
+tl.duration()?duration=delay=0:_this3.timeline=0;
+}else if(keyframes){
+_inheritDefaults(_setDefaults(tl.vars.defaults,{
+ease:"none"
+}));
+tl._ease=_parseEase(keyframes.ease||vars.ease||"none");
+var time=0,
+a,
+kf,
+v;
+if(_isArray(keyframes)){
+keyframes.forEach(function(frame){
+return tl.to(parsedTargets,frame,">");
+});
+tl.duration();
+}else{
+copy={};
+for(p in keyframes){
+p==="ease"||p==="easeEach"||_parseKeyframe(p,keyframes[p],copy,keyframes.easeEach);
+}
+for(p in copy){
+a=copy[p].sort(function(a,b){
+return a.t - b.t;
+});
+time=0;
+for(i=0;i<a.length;i++){
+kf=a[i];
+v={
+ease:kf.e,
+duration:(kf.t -(i?a[i - 1].t:0))/ 100*duration
+};
+v[p]=kf.v;
+tl.to(parsedTargets,v,time);
+time +=v.duration;
+}
+}
+tl.duration()<duration&&tl.to({},{
+duration:duration - tl.duration()
+});
+}
+}
+duration||_this3.duration(duration=tl.duration());
+}else{
+_this3.timeline=0;
+}
+if(overwrite===true&&!_suppressOverwrites){
+_overwritingTween=_assertThisInitialized(_this3);
+_globalTimeline.killTweensOf(parsedTargets);
+_overwritingTween=0;
+}
+_addToTimeline(parent,_assertThisInitialized(_this3),position);
+vars.reversed&&_this3.reverse();
+vars.paused&&_this3.paused(true);
+if(immediateRender||!duration&&!keyframes&&_this3._start===_roundPrecise(parent._time)&&_isNotFalse(immediateRender)&&_hasNoPausedAncestors(_assertThisInitialized(_this3))&&parent.data!=="nested"){
+_this3._tTime=-_tinyNum;
+_this3.render(Math.max(0,-delay)||0);
+}
+scrollTrigger&&_scrollTrigger(_assertThisInitialized(_this3),scrollTrigger);
+return _this3;
+}
+var _proto3=Tween.prototype;
+_proto3.render=function render(totalTime,suppressEvents,force){
+var prevTime=this._time,
+tDur=this._tDur,
+dur=this._dur,
+isNegative=totalTime<0,
+tTime=totalTime>tDur - _tinyNum&&!isNegative?tDur:totalTime<_tinyNum?0:totalTime,
+time,
+pt,
+iteration,
+cycleDuration,
+prevIteration,
+isYoyo,
+ratio,
+timeline,
+yoyoEase;
+if(!dur){
+_renderZeroDurationTween(this,totalTime,suppressEvents,force);
+}else if(tTime!==this._tTime||!totalTime||force||!this._initted&&this._tTime||this._startAt&&this._zTime<0!==isNegative||this._lazy){
+time=tTime;
+timeline=this.timeline;
+if(this._repeat){
+cycleDuration=dur + this._rDelay;
+if(this._repeat<-1&&isNegative){
+return this.totalTime(cycleDuration*100 + totalTime,suppressEvents,force);
+}
+time=_roundPrecise(tTime%cycleDuration);
+if(tTime===tDur){
+iteration=this._repeat;
+time=dur;
+}else{
+prevIteration=_roundPrecise(tTime / cycleDuration);
+iteration=~~prevIteration;
+if(iteration&&iteration===prevIteration){
+time=dur;
+iteration--;
+}else if(time>dur){
+time=dur;
+}
+}
+isYoyo=this._yoyo&&iteration&1;
+if(isYoyo){
+yoyoEase=this._yEase;
+time=dur - time;
+}
+prevIteration=_animationCycle(this._tTime,cycleDuration);
+if(time===prevTime&&!force&&this._initted&&iteration===prevIteration){
+this._tTime=tTime;
+return this;
+}
+if(iteration!==prevIteration){
+timeline&&this._yEase&&_propagateYoyoEase(timeline,isYoyo);
+if(this.vars.repeatRefresh&&!isYoyo&&!this._lock&&time!==cycleDuration&&this._initted){
+this._lock=force=1;
+this.render(_roundPrecise(cycleDuration*iteration),true).invalidate()._lock=0;
+}
+}
+}
+if(!this._initted){
+if(_attemptInitTween(this,isNegative?totalTime:time,force,suppressEvents,tTime)){
+this._tTime=0;
+return this;
+}
+if(prevTime!==this._time&&!(force&&this.vars.repeatRefresh&&iteration!==prevIteration)){
+return this;
+}
+if(dur!==this._dur){
+return this.render(totalTime,suppressEvents,force);
+}
+}
+this._tTime=tTime;
+this._time=time;
+if(!this._act&&this._ts){
+this._act=1;
+this._lazy=0;
+}
+this.ratio=ratio=(yoyoEase||this._ease)(time / dur);
+if(this._from){
+this.ratio=ratio=1 - ratio;
+}
+if(!prevTime&&tTime&&!suppressEvents&&!prevIteration){
+_callback(this,"onStart");
+if(this._tTime!==tTime){
+return this;
+}
+}
+pt=this._pt;
+while(pt){
+pt.r(ratio,pt.d);
+pt=pt._next;
+}
+timeline&&timeline.render(totalTime<0?totalTime:timeline._dur*timeline._ease(time / this._dur),suppressEvents,force)||this._startAt&&(this._zTime=totalTime);
+if(this._onUpdate&&!suppressEvents){
+isNegative&&_rewindStartAt(this,totalTime,suppressEvents,force);
+_callback(this,"onUpdate");
+}
+this._repeat&&iteration!==prevIteration&&this.vars.onRepeat&&!suppressEvents&&this.parent&&_callback(this,"onRepeat");
+if((tTime===this._tDur||!tTime)&&this._tTime===tTime){
+isNegative&&!this._onUpdate&&_rewindStartAt(this,totalTime,true,true);
+(totalTime||!dur)&&(tTime===this._tDur&&this._ts>0||!tTime&&this._ts<0)&&_removeFromParent(this,1);
+if(!suppressEvents&&!(isNegative&&!prevTime)&&(tTime||prevTime||isYoyo)){
+_callback(this,tTime===tDur?"onComplete":"onReverseComplete",true);
+this._prom&&!(tTime<tDur&&this.timeScale()>0)&&this._prom();
+}
+}
+}
+return this;
+};
+_proto3.targets=function targets(){
+return this._targets;
+};
+_proto3.invalidate=function invalidate(soft){
+(!soft||!this.vars.runBackwards)&&(this._startAt=0);
+this._pt=this._op=this._onUpdate=this._lazy=this.ratio=0;
+this._ptLookup=[];
+this.timeline&&this.timeline.invalidate(soft);
+return _Animation2.prototype.invalidate.call(this,soft);
+};
+_proto3.resetTo=function resetTo(property,value,start,startIsRelative,skipRecursion){
+_tickerActive||_ticker.wake();
+this._ts||this.play();
+var time=Math.min(this._dur,(this._dp._time - this._start)*this._ts),
+ratio;
+this._initted||_initTween(this,time);
+ratio=this._ease(time / this._dur);
+if(_updatePropTweens(this,property,value,start,startIsRelative,ratio,time,skipRecursion)){
+return this.resetTo(property,value,start,startIsRelative,1);
+}
+_alignPlayhead(this,0);
+this.parent||_addLinkedListItem(this._dp,this,"_first","_last",this._dp._sort?"_start":0);
+return this.render(0);
+};
+_proto3.kill=function kill(targets,vars){
+if(vars===void 0){
+vars="all";
+}
+if(!targets&&(!vars||vars==="all")){
+this._lazy=this._pt=0;
+this.parent?_interrupt(this):this.scrollTrigger&&this.scrollTrigger.kill(!!_reverting);
+return this;
+}
+if(this.timeline){
+var tDur=this.timeline.totalDuration();
+this.timeline.killTweensOf(targets,vars,_overwritingTween&&_overwritingTween.vars.overwrite!==true)._first||_interrupt(this);
+this.parent&&tDur!==this.timeline.totalDuration()&&_setDuration(this,this._dur*this.timeline._tDur / tDur,0,1);
+return this;
+}
+var parsedTargets=this._targets,
+killingTargets=targets?toArray(targets):parsedTargets,
+propTweenLookup=this._ptLookup,
+firstPT=this._pt,
+overwrittenProps,
+curLookup,
+curOverwriteProps,
+props,
+p,
+pt,
+i;
+if((!vars||vars==="all")&&_arraysMatch(parsedTargets,killingTargets)){
+vars==="all"&&(this._pt=0);
+return _interrupt(this);
+}
+overwrittenProps=this._op=this._op||[];
+if(vars!=="all"){
+if(_isString(vars)){
+p={};
+_forEachName(vars,function(name){
+return p[name]=1;
+});
+vars=p;
+}
+vars=_addAliasesToVars(parsedTargets,vars);
+}
+i=parsedTargets.length;
+while(i--){
+if(~killingTargets.indexOf(parsedTargets[i])){
+curLookup=propTweenLookup[i];
+if(vars==="all"){
+overwrittenProps[i]=vars;
+props=curLookup;
+curOverwriteProps={};
+}else{
+curOverwriteProps=overwrittenProps[i]=overwrittenProps[i]||{};
+props=vars;
+}
+for(p in props){
+pt=curLookup&&curLookup[p];
+if(pt){
+if(!("kill" in pt.d)||pt.d.kill(p)===true){
+_removeLinkedListItem(this,pt,"_pt");
+}
+delete curLookup[p];
+}
+if(curOverwriteProps!=="all"){
+curOverwriteProps[p]=1;
+}
+}
+}
+}
+this._initted&&!this._pt&&firstPT&&_interrupt(this);
+return this;
+};
+Tween.to=function to(targets,vars){
+return new Tween(targets,vars,arguments[2]);
+};
+Tween.from=function from(targets,vars){
+return _createTweenType(1,arguments);
+};
+Tween.delayedCall=function delayedCall(delay,callback,params,scope){
+return new Tween(callback,0,{
+immediateRender:false,
+lazy:false,
+overwrite:false,
+delay:delay,
+onComplete:callback,
+onReverseComplete:callback,
+onCompleteParams:params,
+onReverseCompleteParams:params,
+callbackScope:scope
+});
+};
+Tween.fromTo=function fromTo(targets,fromVars,toVars){
+return _createTweenType(2,arguments);
+};
+Tween.set=function set(targets,vars){
+vars.duration=0;
+vars.repeatDelay||(vars.repeat=0);
+return new Tween(targets,vars);
+};
+Tween.killTweensOf=function killTweensOf(targets,props,onlyActive){
+return _globalTimeline.killTweensOf(targets,props,onlyActive);
+};
+return Tween;
+}(Animation);
+_setDefaults(Tween.prototype,{
+_targets:[],
+_lazy:0,
+_startAt:0,
+_op:0,
+_onInit:0
+});
+_forEachName("staggerTo,staggerFrom,staggerFromTo",function(name){
+Tween[name]=function(){
+var tl=new Timeline(),
+params=_slice.call(arguments,0);
+params.splice(name==="staggerFromTo"?5:4,0,0);
+return tl[name].apply(tl,params);
+};
+});
+var _setterPlain=function _setterPlain(target,property,value){
+return target[property]=value;
+},
+_setterFunc=function _setterFunc(target,property,value){
+return target[property](value);
+},
+_setterFuncWithParam=function _setterFuncWithParam(target,property,value,data){
+return target[property](data.fp,value);
+},
+_setterAttribute=function _setterAttribute(target,property,value){
+return target.setAttribute(property,value);
+},
+_getSetter=exports._getSetter=function _getSetter(target,property){
+return _isFunction(target[property])?_setterFunc:_isUndefined(target[property])&&target.setAttribute?_setterAttribute:_setterPlain;
+},
+_renderPlain=function _renderPlain(ratio,data){
+return data.set(data.t,data.p,Math.round((data.s + data.c*ratio)*1000000)/ 1000000,data);
+},
+_renderBoolean=function _renderBoolean(ratio,data){
+return data.set(data.t,data.p,!!(data.s + data.c*ratio),data);
+},
+_renderComplexString=exports._renderComplexString=function _renderComplexString(ratio,data){
+var pt=data._pt,
+s="";
+if(!ratio&&data.b){
+s=data.b;
+}else if(ratio===1&&data.e){
+s=data.e;
+}else{
+while(pt){
+s=pt.p +(pt.m?pt.m(pt.s + pt.c*ratio):Math.round((pt.s + pt.c*ratio)*10000)/ 10000)+ s;
+pt=pt._next;
+}
+s +=data.c;
+}
+data.set(data.t,data.p,s,data);
+},
+_renderPropTweens=function _renderPropTweens(ratio,data){
+var pt=data._pt;
+while(pt){
+pt.r(ratio,pt.d);
+pt=pt._next;
+}
+},
+_addPluginModifier=function _addPluginModifier(modifier,tween,target,property){
+var pt=this._pt,
+next;
+while(pt){
+next=pt._next;
+pt.p===property&&pt.modifier(modifier,tween,target);
+pt=next;
+}
+},
+_killPropTweensOf=function _killPropTweensOf(property){
+var pt=this._pt,
+hasNonDependentRemaining,
+next;
+while(pt){
+next=pt._next;
+if(pt.p===property&&!pt.op||pt.op===property){
+_removeLinkedListItem(this,pt,"_pt");
+}else if(!pt.dep){
+hasNonDependentRemaining=1;
+}
+pt=next;
+}
+return!hasNonDependentRemaining;
+},
+_setterWithModifier=function _setterWithModifier(target,property,value,data){
+data.mSet(target,property,data.m.call(data.tween,value,data.mt),data);
+},
+_sortPropTweensByPriority=exports._sortPropTweensByPriority=function _sortPropTweensByPriority(parent){
+var pt=parent._pt,
+next,
+pt2,
+first,
+last;
+while(pt){
+next=pt._next;
+pt2=first;
+while(pt2&&pt2.pr>pt.pr){
+pt2=pt2._next;
+}
+if(pt._prev=pt2?pt2._prev:last){
+pt._prev._next=pt;
+}else{
+first=pt;
+}
+if(pt._next=pt2){
+pt2._prev=pt;
+}else{
+last=pt;
+}
+pt=next;
+}
+parent._pt=first;
+};
+var PropTween=exports.PropTween= function(){
+function PropTween(next,target,prop,start,change,renderer,data,setter,priority){
+this.t=target;
+this.s=start;
+this.c=change;
+this.p=prop;
+this.r=renderer||_renderPlain;
+this.d=data||this;
+this.set=setter||_setterPlain;
+this.pr=priority||0;
+this._next=next;
+if(next){
+next._prev=this;
+}
+}
+var _proto4=PropTween.prototype;
+_proto4.modifier=function modifier(func,tween,target){
+this.mSet=this.mSet||this.set;
+this.set=_setterWithModifier;
+this.m=func;
+this.mt=target;
+this.tween=tween;
+};
+return PropTween;
+}();
+_forEachName(_callbackNames + "parent,duration,ease,delay,overwrite,runBackwards,startAt,yoyo,immediateRender,repeat,repeatDelay,data,paused,reversed,lazy,callbackScope,stringFilter,id,yoyoEase,stagger,inherit,repeatRefresh,keyframes,autoRevert,scrollTrigger",function(name){
+return _reservedProps[name]=1;
+});
+_globals.TweenMax=_globals.TweenLite=Tween;
+_globals.TimelineLite=_globals.TimelineMax=Timeline;
+_globalTimeline=new Timeline({
+sortChildren:false,
+defaults:_defaults,
+autoRemoveChildren:true,
+id:"root",
+smoothChildTiming:true
+});
+_config.stringFilter=_colorStringFilter;
+var _media=[],
+_listeners={},
+_emptyArray=[],
+_lastMediaTime=0,
+_contextID=0,
+_dispatch=function _dispatch(type){
+return(_listeners[type]||_emptyArray).map(function(f){
+return f();
+});
+},
+_onMediaChange=function _onMediaChange(){
+var time=Date.now(),
+matches=[];
+if(time - _lastMediaTime>2){
+_dispatch("matchMediaInit");
+_media.forEach(function(c){
+var queries=c.queries,
+conditions=c.conditions,
+match,
+p,
+anyMatch,
+toggled;
+for(p in queries){
+match=_win.matchMedia(queries[p]).matches;
+match&&(anyMatch=1);
+if(match!==conditions[p]){
+conditions[p]=match;
+toggled=1;
+}
+}
+if(toggled){
+c.revert();
+anyMatch&&matches.push(c);
+}
+});
+_dispatch("matchMediaRevert");
+matches.forEach(function(c){
+return c.onMatch(c,function(func){
+return c.add(null,func);
+});
+});
+_lastMediaTime=time;
+_dispatch("matchMedia");
+}
+};
+var Context= function(){
+function Context(func,scope){
+this.selector=scope&&selector(scope);
+this.data=[];
+this._r=[];
+this.isReverted=false;
+this.id=_contextID++;
+func&&this.add(func);
+}
+var _proto5=Context.prototype;
+_proto5.add=function add(name,func,scope){
+if(_isFunction(name)){
+scope=func;
+func=name;
+name=_isFunction;
+}
+var self=this,
+f=function f(){
+var prev=_context,
+prevSelector=self.selector,
+result;
+prev&&prev!==self&&prev.data.push(self);
+scope&&(self.selector=selector(scope));
+_context=self;
+result=func.apply(self,arguments);
+_isFunction(result)&&self._r.push(result);
+_context=prev;
+self.selector=prevSelector;
+self.isReverted=false;
+return result;
+};
+self.last=f;
+return name===_isFunction?f(self,function(func){
+return self.add(null,func);
+}):name?self[name]=f:f;
+};
+_proto5.ignore=function ignore(func){
+var prev=_context;
+_context=null;
+func(this);
+_context=prev;
+};
+_proto5.getTweens=function getTweens(){
+var a=[];
+this.data.forEach(function(e){
+return e instanceof Context?a.push.apply(a,e.getTweens()):e instanceof Tween&&!(e.parent&&e.parent.data==="nested")&&a.push(e);
+});
+return a;
+};
+_proto5.clear=function clear(){
+this._r.length=this.data.length=0;
+};
+_proto5.kill=function kill(revert,matchMedia){
+var _this4=this;
+if(revert){
+(function(){
+var tweens=_this4.getTweens(),
+i=_this4.data.length,
+t;
+while(i--){
+t=_this4.data[i];
+if(t.data==="isFlip"){
+t.revert();
+t.getChildren(true,true,false).forEach(function(tween){
+return tweens.splice(tweens.indexOf(tween),1);
+});
+}
+}
+tweens.map(function(t){
+return{
+g:t._dur||t._delay||t._sat&&!t._sat.vars.immediateRender?t.globalTime(0):-Infinity,
+t:t
+};
+}).sort(function(a,b){
+return b.g - a.g||-Infinity;
+}).forEach(function(o){
+return o.t.revert(revert);
+});
+i=_this4.data.length;
+while(i--){
+t=_this4.data[i];
+if(t instanceof Timeline){
+if(t.data!=="nested"){
+t.scrollTrigger&&t.scrollTrigger.revert();
+t.kill();
+}
+}else{
+!(t instanceof Tween)&&t.revert&&t.revert(revert);
+}
+}
+_this4._r.forEach(function(f){
+return f(revert,_this4);
+});
+_this4.isReverted=true;
+})();
+}else{
+this.data.forEach(function(e){
+return e.kill&&e.kill();
+});
+}
+this.clear();
+if(matchMedia){
+var i=_media.length;
+while(i--){
+_media[i].id===this.id&&_media.splice(i,1);
+}
+}
+}
+;
+_proto5.revert=function revert(config){
+this.kill(config||{});
+};
+return Context;
+}();
+var MatchMedia= function(){
+function MatchMedia(scope){
+this.contexts=[];
+this.scope=scope;
+_context&&_context.data.push(this);
+}
+var _proto6=MatchMedia.prototype;
+_proto6.add=function add(conditions,func,scope){
+_isObject(conditions)||(conditions={
+matches:conditions
+});
+var context=new Context(0,scope||this.scope),
+cond=context.conditions={},
+mq,
+p,
+active;
+_context&&!context.selector&&(context.selector=_context.selector);
+this.contexts.push(context);
+func=context.add("onMatch",func);
+context.queries=conditions;
+for(p in conditions){
+if(p==="all"){
+active=1;
+}else{
+mq=_win.matchMedia(conditions[p]);
+if(mq){
+_media.indexOf(context)<0&&_media.push(context);
+(cond[p]=mq.matches)&&(active=1);
+mq.addListener?mq.addListener(_onMediaChange):mq.addEventListener("change",_onMediaChange);
+}
+}
+}
+active&&func(context,function(f){
+return context.add(null,f);
+});
+return this;
+}
+;
+_proto6.revert=function revert(config){
+this.kill(config||{});
+};
+_proto6.kill=function kill(revert){
+this.contexts.forEach(function(c){
+return c.kill(revert,true);
+});
+};
+return MatchMedia;
+}();
+var _gsap={
+registerPlugin:function registerPlugin(){
+for(var _len2=arguments.length,args=new Array(_len2),_key2=0;_key2<_len2;_key2++){
+args[_key2]=arguments[_key2];
+}
+args.forEach(function(config){
+return _createPlugin(config);
+});
+},
+timeline:function timeline(vars){
+return new Timeline(vars);
+},
+getTweensOf:function getTweensOf(targets,onlyActive){
+return _globalTimeline.getTweensOf(targets,onlyActive);
+},
+getProperty:function getProperty(target,property,unit,uncache){
+_isString(target)&&(target=toArray(target)[0]);
+var getter=_getCache(target||{}).get,
+format=unit?_passThrough:_numericIfPossible;
+unit==="native"&&(unit="");
+return!target?target:!property?function(property,unit,uncache){
+return format((_plugins[property]&&_plugins[property].get||getter)(target,property,unit,uncache));
+}:format((_plugins[property]&&_plugins[property].get||getter)(target,property,unit,uncache));
+},
+quickSetter:function quickSetter(target,property,unit){
+target=toArray(target);
+if(target.length>1){
+var setters=target.map(function(t){
+return gsap.quickSetter(t,property,unit);
+}),
+l=setters.length;
+return function(value){
+var i=l;
+while(i--){
+setters[i](value);
+}
+};
+}
+target=target[0]||{};
+var Plugin=_plugins[property],
+cache=_getCache(target),
+p=cache.harness&&(cache.harness.aliases||{})[property]||property,
+setter=Plugin?function(value){
+var p=new Plugin();
+_quickTween._pt=0;
+p.init(target,unit?value + unit:value,_quickTween,0,[target]);
+p.render(1,p);
+_quickTween._pt&&_renderPropTweens(1,_quickTween);
+}:cache.set(target,p);
+return Plugin?setter:function(value){
+return setter(target,p,unit?value + unit:value,cache,1);
+};
+},
+quickTo:function quickTo(target,property,vars){
+var _setDefaults2;
+var tween=gsap.to(target,_setDefaults((_setDefaults2={},_setDefaults2[property]="+=0.1",_setDefaults2.paused=true,_setDefaults2.stagger=0,_setDefaults2),vars||{})),
+func=function func(value,start,startIsRelative){
+return tween.resetTo(property,value,start,startIsRelative);
+};
+func.tween=tween;
+return func;
+},
+isTweening:function isTweening(targets){
+return _globalTimeline.getTweensOf(targets,true).length>0;
+},
+defaults:function defaults(value){
+value&&value.ease&&(value.ease=_parseEase(value.ease,_defaults.ease));
+return _mergeDeep(_defaults,value||{});
+},
+config:function config(value){
+return _mergeDeep(_config,value||{});
+},
+registerEffect:function registerEffect(_ref3){
+var name=_ref3.name,
+effect=_ref3.effect,
+plugins=_ref3.plugins,
+defaults=_ref3.defaults,
+extendTimeline=_ref3.extendTimeline;
+(plugins||"").split(",").forEach(function(pluginName){
+return pluginName&&!_plugins[pluginName]&&!_globals[pluginName]&&_warn(name + " effect requires " + pluginName + " plugin.");
+});
+_effects[name]=function(targets,vars,tl){
+return effect(toArray(targets),_setDefaults(vars||{},defaults),tl);
+};
+if(extendTimeline){
+Timeline.prototype[name]=function(targets,vars,position){
+return this.add(_effects[name](targets,_isObject(vars)?vars:(position=vars)&&{},this),position);
+};
+}
+},
+registerEase:function registerEase(name,ease){
+_easeMap[name]=_parseEase(ease);
+},
+parseEase:function parseEase(ease,defaultEase){
+return arguments.length?_parseEase(ease,defaultEase):_easeMap;
+},
+getById:function getById(id){
+return _globalTimeline.getById(id);
+},
+exportRoot:function exportRoot(vars,includeDelayedCalls){
+if(vars===void 0){
+vars={};
+}
+var tl=new Timeline(vars),
+child,
+next;
+tl.smoothChildTiming=_isNotFalse(vars.smoothChildTiming);
+_globalTimeline.remove(tl);
+tl._dp=0;
+tl._time=tl._tTime=_globalTimeline._time;
+child=_globalTimeline._first;
+while(child){
+next=child._next;
+if(includeDelayedCalls||!(!child._dur&&child instanceof Tween&&child.vars.onComplete===child._targets[0])){
+_addToTimeline(tl,child,child._start - child._delay);
+}
+child=next;
+}
+_addToTimeline(_globalTimeline,tl,0);
+return tl;
+},
+context:function context(func,scope){
+return func?new Context(func,scope):_context;
+},
+matchMedia:function matchMedia(scope){
+return new MatchMedia(scope);
+},
+matchMediaRefresh:function matchMediaRefresh(){
+return _media.forEach(function(c){
+var cond=c.conditions,
+found,
+p;
+for(p in cond){
+if(cond[p]){
+cond[p]=false;
+found=1;
+}
+}
+found&&c.revert();
+})||_onMediaChange();
+},
+addEventListener:function addEventListener(type,callback){
+var a=_listeners[type]||(_listeners[type]=[]);
+~a.indexOf(callback)||a.push(callback);
+},
+removeEventListener:function removeEventListener(type,callback){
+var a=_listeners[type],
+i=a&&a.indexOf(callback);
+i>=0&&a.splice(i,1);
+},
+utils:{
+wrap:wrap,
+wrapYoyo:wrapYoyo,
+distribute:distribute,
+random:random,
+snap:snap,
+normalize:normalize,
+getUnit:getUnit,
+clamp:clamp,
+splitColor:splitColor,
+toArray:toArray,
+selector:selector,
+mapRange:mapRange,
+pipe:pipe,
+unitize:unitize,
+interpolate:interpolate,
+shuffle:shuffle
+},
+install:_install,
+effects:_effects,
+ticker:_ticker,
+updateRoot:Timeline.updateRoot,
+plugins:_plugins,
+globalTimeline:_globalTimeline,
+core:{
+PropTween:PropTween,
+globals:_addGlobal,
+Tween:Tween,
+Timeline:Timeline,
+Animation:Animation,
+getCache:_getCache,
+_removeLinkedListItem:_removeLinkedListItem,
+reverting:function reverting(){
+return _reverting;
+},
+context:function context(toAdd){
+if(toAdd&&_context){
+_context.data.push(toAdd);
+toAdd._ctx=_context;
+}
+return _context;
+},
+suppressOverwrites:function suppressOverwrites(value){
+return _suppressOverwrites=value;
+}
+}
+};
+_forEachName("to,from,fromTo,delayedCall,set,killTweensOf",function(name){
+return _gsap[name]=Tween[name];
+});
+_ticker.add(Timeline.updateRoot);
+_quickTween=_gsap.to({},{
+duration:0
+});
+var _getPluginPropTween=function _getPluginPropTween(plugin,prop){
+var pt=plugin._pt;
+while(pt&&pt.p!==prop&&pt.op!==prop&&pt.fp!==prop){
+pt=pt._next;
+}
+return pt;
+},
+_addModifiers=function _addModifiers(tween,modifiers){
+var targets=tween._targets,
+p,
+i,
+pt;
+for(p in modifiers){
+i=targets.length;
+while(i--){
+pt=tween._ptLookup[i][p];
+if(pt&&(pt=pt.d)){
+if(pt._pt){
+pt=_getPluginPropTween(pt,p);
+}
+pt&&pt.modifier&&pt.modifier(modifiers[p],tween,targets[i],p);
+}
+}
+}
+},
+_buildModifierPlugin=function _buildModifierPlugin(name,modifier){
+return{
+name:name,
+headless:1,
+rawVars:1,
+init:function init(target,vars,tween){
+tween._onInit=function(tween){
+var temp,p;
+if(_isString(vars)){
+temp={};
+_forEachName(vars,function(name){
+return temp[name]=1;
+});
+vars=temp;
+}
+if(modifier){
+temp={};
+for(p in vars){
+temp[p]=modifier(vars[p]);
+}
+vars=temp;
+}
+_addModifiers(tween,vars);
+};
+}
+};
+};
+var gsap=exports.default=exports.gsap=_gsap.registerPlugin({
+name:"attr",
+init:function init(target,vars,tween,index,targets){
+var p,pt,v;
+this.tween=tween;
+for(p in vars){
+v=target.getAttribute(p)||"";
+pt=this.add(target,"setAttribute",(v||0)+ "",vars[p],index,targets,0,0,p);
+pt.op=p;
+pt.b=v;
+this._props.push(p);
+}
+},
+render:function render(ratio,data){
+var pt=data._pt;
+while(pt){
+_reverting?pt.set(pt.t,pt.p,pt.b,pt):pt.r(ratio,pt.d);
+pt=pt._next;
+}
+}
+},{
+name:"endArray",
+headless:1,
+init:function init(target,value){
+var i=value.length;
+while(i--){
+this.add(target,i,target[i]||0,value[i],0,0,0,0,0,1);
+}
+}
+},_buildModifierPlugin("roundProps",_roundModifier),_buildModifierPlugin("modifiers"),_buildModifierPlugin("snap",snap))||_gsap;
+Tween.version=Timeline.version=gsap.version="3.13.0";
+_coreReady=1;
+_windowExists()&&_wake();
+var Power0=exports.Power0=_easeMap.Power0,
+Power1=exports.Power1=_easeMap.Power1,
+Power2=exports.Power2=_easeMap.Power2,
+Power3=exports.Power3=_easeMap.Power3,
+Power4=exports.Power4=_easeMap.Power4,
+Linear=exports.Linear=_easeMap.Linear,
+Quad=exports.Quad=_easeMap.Quad,
+Cubic=exports.Cubic=_easeMap.Cubic,
+Quart=exports.Quart=_easeMap.Quart,
+Quint=exports.Quint=_easeMap.Quint,
+Strong=exports.Strong=_easeMap.Strong,
+Elastic=exports.Elastic=_easeMap.Elastic,
+Back=exports.Back=_easeMap.Back,
+SteppedEase=exports.SteppedEase=_easeMap.SteppedEase,
+Bounce=exports.Bounce=_easeMap.Bounce,
+Sine=exports.Sine=_easeMap.Sine,
+Expo=exports.Expo=_easeMap.Expo,
+Circ=exports.Circ=_easeMap.Circ;
+},{}],
+"bp4Z":[function(require,module,exports){
+"use strict";
+Object.defineProperty(exports,"__esModule",{
+value:true
+});
+exports.default=exports.checkPrefix=exports._getBBox=exports._createElement=exports.CSSPlugin=void 0;
+var _gsapCore=require("./gsap-core.js");
+var _win,
+_doc,
+_docElement,
+_pluginInitted,
+_tempDiv,
+_tempDivStyler,
+_recentSetterPlugin,
+_reverting,
+_windowExists=function _windowExists(){
+return typeof window!=="undefined";
+},
+_transformProps={},
+_RAD2DEG=180 / Math.PI,
+_DEG2RAD=Math.PI / 180,
+_atan2=Math.atan2,
+_bigNum=1e8,
+_capsExp=/([A-Z])/g,
+_horizontalExp=/(left|right|width|margin|padding|x)/i,
+_complexExp=/[\s,\(]\S/,
+_propertyAliases={
+autoAlpha:"opacity,visibility",
+scale:"scaleX,scaleY",
+alpha:"opacity"
+},
+_renderCSSProp=function _renderCSSProp(ratio,data){
+return data.set(data.t,data.p,Math.round((data.s + data.c*ratio)*10000)/ 10000 + data.u,data);
+},
+_renderPropWithEnd=function _renderPropWithEnd(ratio,data){
+return data.set(data.t,data.p,ratio===1?data.e:Math.round((data.s + data.c*ratio)*10000)/ 10000 + data.u,data);
+},
+_renderCSSPropWithBeginning=function _renderCSSPropWithBeginning(ratio,data){
+return data.set(data.t,data.p,ratio?Math.round((data.s + data.c*ratio)*10000)/ 10000 + data.u:data.b,data);
+},
+_renderRoundedCSSProp=function _renderRoundedCSSProp(ratio,data){
+var value=data.s + data.c*ratio;
+data.set(data.t,data.p,~~(value +(value<0?-.5:.5))+ data.u,data);
+},
+_renderNonTweeningValue=function _renderNonTweeningValue(ratio,data){
+return data.set(data.t,data.p,ratio?data.e:data.b,data);
+},
+_renderNonTweeningValueOnlyAtEnd=function _renderNonTweeningValueOnlyAtEnd(ratio,data){
+return data.set(data.t,data.p,ratio!==1?data.b:data.e,data);
+},
+_setterCSSStyle=function _setterCSSStyle(target,property,value){
+return target.style[property]=value;
+},
+_setterCSSProp=function _setterCSSProp(target,property,value){
+return target.style.setProperty(property,value);
+},
+_setterTransform=function _setterTransform(target,property,value){
+return target._gsap[property]=value;
+},
+_setterScale=function _setterScale(target,property,value){
+return target._gsap.scaleX=target._gsap.scaleY=value;
+},
+_setterScaleWithRender=function _setterScaleWithRender(target,property,value,data,ratio){
+var cache=target._gsap;
+cache.scaleX=cache.scaleY=value;
+cache.renderTransform(ratio,cache);
+},
+_setterTransformWithRender=function _setterTransformWithRender(target,property,value,data,ratio){
+var cache=target._gsap;
+cache[property]=value;
+cache.renderTransform(ratio,cache);
+},
+_transformProp="transform",
+_transformOriginProp=_transformProp + "Origin",
+_saveStyle=function _saveStyle(property,isNotCSS){
+var _this=this;
+var target=this.target,
+style=target.style,
+cache=target._gsap;
+if(property in _transformProps&&style){
+this.tfm=this.tfm||{};
+if(property!=="transform"){
+property=_propertyAliases[property]||property;
+~property.indexOf(",")?property.split(",").forEach(function(a){
+return _this.tfm[a]=_get(target,a);
+}):this.tfm[property]=cache.x?cache[property]:_get(target,property);
+property===_transformOriginProp&&(this.tfm.zOrigin=cache.zOrigin);
+}else{
+return _propertyAliases.transform.split(",").forEach(function(p){
+return _saveStyle.call(_this,p,isNotCSS);
+});
+}
+if(this.props.indexOf(_transformProp)>=0){
+return;
+}
+if(cache.svg){
+this.svgo=target.getAttribute("data-svg-origin");
+this.props.push(_transformOriginProp,isNotCSS,"");
+}
+property=_transformProp;
+}
+(style||isNotCSS)&&this.props.push(property,isNotCSS,style[property]);
+},
+_removeIndependentTransforms=function _removeIndependentTransforms(style){
+if(style.translate){
+style.removeProperty("translate");
+style.removeProperty("scale");
+style.removeProperty("rotate");
+}
+},
+_revertStyle=function _revertStyle(){
+var props=this.props,
+target=this.target,
+style=target.style,
+cache=target._gsap,
+i,
+p;
+for(i=0;i<props.length;i +=3){
+if(!props[i + 1]){
+props[i + 2]?style[props[i]]=props[i + 2]:style.removeProperty(props[i].substr(0,2)==="--"?props[i]:props[i].replace(_capsExp,"-$1").toLowerCase());
+}else if(props[i + 1]===2){
+target[props[i]](props[i + 2]);
+}else{
+target[props[i]]=props[i + 2];
+}
+}
+if(this.tfm){
+for(p in this.tfm){
+cache[p]=this.tfm[p];
+}
+if(cache.svg){
+cache.renderTransform();
+target.setAttribute("data-svg-origin",this.svgo||"");
+}
+i=_reverting();
+if((!i||!i.isStart)&&!style[_transformProp]){
+_removeIndependentTransforms(style);
+if(cache.zOrigin&&style[_transformOriginProp]){
+style[_transformOriginProp]+=" " + cache.zOrigin + "px";
+cache.zOrigin=0;
+cache.renderTransform();
+}
+cache.uncache=1;
+}
+}
+},
+_getStyleSaver=function _getStyleSaver(target,properties){
+var saver={
+target:target,
+props:[],
+revert:_revertStyle,
+save:_saveStyle
+};
+target._gsap||_gsapCore.gsap.core.getCache(target);
+properties&&target.style&&target.nodeType&&properties.split(",").forEach(function(p){
+return saver.save(p);
+});
+return saver;
+},
+_supports3D,
+_createElement=exports._createElement=function _createElement(type,ns){
+var e=_doc.createElementNS?_doc.createElementNS((ns||"http://www.w3.org/1999/xhtml").replace(/^https/,"http"),type):_doc.createElement(type);
+return e&&e.style?e:_doc.createElement(type);
+},
+_getComputedProperty=function _getComputedProperty(target,property,skipPrefixFallback){
+var cs=getComputedStyle(target);
+return cs[property]||cs.getPropertyValue(property.replace(_capsExp,"-$1").toLowerCase())||cs.getPropertyValue(property)||!skipPrefixFallback&&_getComputedProperty(target,_checkPropPrefix(property)||property,1)||"";
+},
+_prefixes="O,Moz,ms,Ms,Webkit".split(","),
+_checkPropPrefix=exports.checkPrefix=function _checkPropPrefix(property,element,preferPrefix){
+var e=element||_tempDiv,
+s=e.style,
+i=5;
+if(property in s&&!preferPrefix){
+return property;
+}
+property=property.charAt(0).toUpperCase()+ property.substr(1);
+while(i--&&!(_prefixes[i]+ property in s)){}
+return i<0?null:(i===3?"ms":i>=0?_prefixes[i]:"")+ property;
+},
+_initCore=function _initCore(){
+if(_windowExists()&&window.document){
+_win=window;
+_doc=_win.document;
+_docElement=_doc.documentElement;
+_tempDiv=_createElement("div")||{
+style:{}
+};
+_tempDivStyler=_createElement("div");
+_transformProp=_checkPropPrefix(_transformProp);
+_transformOriginProp=_transformProp + "Origin";
+_tempDiv.style.cssText="border-width:0;line-height:0;position:absolute;padding:0";
+_supports3D=!!_checkPropPrefix("perspective");
+_reverting=_gsapCore.gsap.core.reverting;
+_pluginInitted=1;
+}
+},
+_getReparentedCloneBBox=function _getReparentedCloneBBox(target){
+var owner=target.ownerSVGElement,
+svg=_createElement("svg",owner&&owner.getAttribute("xmlns")||"http://www.w3.org/2000/svg"),
+clone=target.cloneNode(true),
+bbox;
+clone.style.display="block";
+svg.appendChild(clone);
+_docElement.appendChild(svg);
+try{
+bbox=clone.getBBox();
+}catch(e){}
+svg.removeChild(clone);
+_docElement.removeChild(svg);
+return bbox;
+},
+_getAttributeFallbacks=function _getAttributeFallbacks(target,attributesArray){
+var i=attributesArray.length;
+while(i--){
+if(target.hasAttribute(attributesArray[i])){
+return target.getAttribute(attributesArray[i]);
+}
+}
+},
+_getBBox=exports._getBBox=function _getBBox(target){
+var bounds,cloned;
+try{
+bounds=target.getBBox();
+}catch(error){
+bounds=_getReparentedCloneBBox(target);
+cloned=1;
+}
+bounds&&(bounds.width||bounds.height)||cloned||(bounds=_getReparentedCloneBBox(target));
+return bounds&&!bounds.width&&!bounds.x&&!bounds.y?{
+x:+_getAttributeFallbacks(target,["x","cx","x1"])||0,
+y:+_getAttributeFallbacks(target,["y","cy","y1"])||0,
+width:0,
+height:0
+}:bounds;
+},
+_isSVG=function _isSVG(e){
+return!!(e.getCTM&&(!e.parentNode||e.ownerSVGElement)&&_getBBox(e));
+},
+_removeProperty=function _removeProperty(target,property){
+if(property){
+var style=target.style,
+first2Chars;
+if(property in _transformProps&&property!==_transformOriginProp){
+property=_transformProp;
+}
+if(style.removeProperty){
+first2Chars=property.substr(0,2);
+if(first2Chars==="ms"||property.substr(0,6)==="webkit"){
+property="-" + property;
+}
+style.removeProperty(first2Chars==="--"?property:property.replace(_capsExp,"-$1").toLowerCase());
+}else{
+style.removeAttribute(property);
+}
+}
+},
+_addNonTweeningPT=function _addNonTweeningPT(plugin,target,property,beginning,end,onlySetAtEnd){
+var pt=new _gsapCore.PropTween(plugin._pt,target,property,0,1,onlySetAtEnd?_renderNonTweeningValueOnlyAtEnd:_renderNonTweeningValue);
+plugin._pt=pt;
+pt.b=beginning;
+pt.e=end;
+plugin._props.push(property);
+return pt;
+},
+_nonConvertibleUnits={
+deg:1,
+rad:1,
+turn:1
+},
+_nonStandardLayouts={
+grid:1,
+flex:1
+},
+_convertToUnit=function _convertToUnit(target,property,value,unit){
+var curValue=parseFloat(value)||0,
+curUnit=(value + "").trim().substr((curValue + "").length)||"px",
+style=_tempDiv.style,
+horizontal=_horizontalExp.test(property),
+isRootSVG=target.tagName.toLowerCase()==="svg",
+measureProperty=(isRootSVG?"client":"offset")+(horizontal?"Width":"Height"),
+amount=100,
+toPixels=unit==="px",
+toPercent=unit==="%",
+px,
+parent,
+cache,
+isSVG;
+if(unit===curUnit||!curValue||_nonConvertibleUnits[unit]||_nonConvertibleUnits[curUnit]){
+return curValue;
+}
+curUnit!=="px"&&!toPixels&&(curValue=_convertToUnit(target,property,value,"px"));
+isSVG=target.getCTM&&_isSVG(target);
+if((toPercent||curUnit==="%")&&(_transformProps[property]||~property.indexOf("adius"))){
+px=isSVG?target.getBBox()[horizontal?"width":"height"]:target[measureProperty];
+return(0,_gsapCore._round)(toPercent?curValue / px*amount:curValue / 100*px);
+}
+style[horizontal?"width":"height"]=amount +(toPixels?curUnit:unit);
+parent=unit!=="rem"&&~property.indexOf("adius")||unit==="em"&&target.appendChild&&!isRootSVG?target:target.parentNode;
+if(isSVG){
+parent=(target.ownerSVGElement||{}).parentNode;
+}
+if(!parent||parent===_doc||!parent.appendChild){
+parent=_doc.body;
+}
+cache=parent._gsap;
+if(cache&&toPercent&&cache.width&&horizontal&&cache.time===_gsapCore._ticker.time&&!cache.uncache){
+return(0,_gsapCore._round)(curValue / cache.width*amount);
+}else{
+if(toPercent&&(property==="height"||property==="width")){
+var v=target.style[property];
+target.style[property]=amount + unit;
+px=target[measureProperty];
+v?target.style[property]=v:_removeProperty(target,property);
+}else{
+(toPercent||curUnit==="%")&&!_nonStandardLayouts[_getComputedProperty(parent,"display")]&&(style.position=_getComputedProperty(target,"position"));
+parent===target&&(style.position="static");
+parent.appendChild(_tempDiv);
+px=_tempDiv[measureProperty];
+parent.removeChild(_tempDiv);
+style.position="absolute";
+}
+if(horizontal&&toPercent){
+cache=(0,_gsapCore._getCache)(parent);
+cache.time=_gsapCore._ticker.time;
+cache.width=parent[measureProperty];
+}
+}
+return(0,_gsapCore._round)(toPixels?px*curValue / amount:px&&curValue?amount / px*curValue:0);
+},
+_get=function _get(target,property,unit,uncache){
+var value;
+_pluginInitted||_initCore();
+if(property in _propertyAliases&&property!=="transform"){
+property=_propertyAliases[property];
+if(~property.indexOf(",")){
+property=property.split(",")[0];
+}
+}
+if(_transformProps[property]&&property!=="transform"){
+value=_parseTransform(target,uncache);
+value=property!=="transformOrigin"?value[property]:value.svg?value.origin:_firstTwoOnly(_getComputedProperty(target,_transformOriginProp))+ " " + value.zOrigin + "px";
+}else{
+value=target.style[property];
+if(!value||value==="auto"||uncache||~(value + "").indexOf("calc(")){
+value=_specialProps[property]&&_specialProps[property](target,property,unit)||_getComputedProperty(target,property)||(0,_gsapCore._getProperty)(target,property)||(property==="opacity"?1:0);
+}
+}
+return unit&&!~(value + "").trim().indexOf(" ")?_convertToUnit(target,property,value,unit)+ unit:value;
+},
+_tweenComplexCSSString=function _tweenComplexCSSString(target,prop,start,end){
+if(!start||start==="none"){
+var p=_checkPropPrefix(prop,target,1),
+s=p&&_getComputedProperty(target,p,1);
+if(s&&s!==start){
+prop=p;
+start=s;
+}else if(prop==="borderColor"){
+start=_getComputedProperty(target,"borderTopColor");
+}
+}
+var pt=new _gsapCore.PropTween(this._pt,target.style,prop,0,1,_gsapCore._renderComplexString),
+index=0,
+matchIndex=0,
+a,
+result,
+startValues,
+startNum,
+color,
+startValue,
+endValue,
+endNum,
+chunk,
+endUnit,
+startUnit,
+endValues;
+pt.b=start;
+pt.e=end;
+start +="";
+end +="";
+if(end.substring(0,6)==="var(--"){
+end=_getComputedProperty(target,end.substring(4,end.indexOf(")")));
+}
+if(end==="auto"){
+startValue=target.style[prop];
+target.style[prop]=end;
+end=_getComputedProperty(target,prop)||end;
+startValue?target.style[prop]=startValue:_removeProperty(target,prop);
+}
+a=[start,end];
+(0,_gsapCore._colorStringFilter)(a);
+start=a[0];
+end=a[1];
+startValues=start.match(_gsapCore._numWithUnitExp)||[];
+endValues=end.match(_gsapCore._numWithUnitExp)||[];
+if(endValues.length){
+while(result=_gsapCore._numWithUnitExp.exec(end)){
+endValue=result[0];
+chunk=end.substring(index,result.index);
+if(color){
+color=(color + 1)%5;
+}else if(chunk.substr(-5)==="rgba("||chunk.substr(-5)==="hsla("){
+color=1;
+}
+if(endValue!==(startValue=startValues[matchIndex++]||"")){
+startNum=parseFloat(startValue)||0;
+startUnit=startValue.substr((startNum + "").length);
+endValue.charAt(1)==="="&&(endValue=(0,_gsapCore._parseRelative)(startNum,endValue)+ startUnit);
+endNum=parseFloat(endValue);
+endUnit=endValue.substr((endNum + "").length);
+index=_gsapCore._numWithUnitExp.lastIndex - endUnit.length;
+if(!endUnit){
+endUnit=endUnit||_gsapCore._config.units[prop]||startUnit;
+if(index===end.length){
+end +=endUnit;
+pt.e +=endUnit;
+}
+}
+if(startUnit!==endUnit){
+startNum=_convertToUnit(target,prop,startValue,endUnit)||0;
+}
+pt._pt={
+_next:pt._pt,
+p:chunk||matchIndex===1?chunk:",",
+s:startNum,
+c:endNum - startNum,
+m:color&&color<4||prop==="zIndex"?Math.round:0
+};
+}
+}
+pt.c=index<end.length?end.substring(index,end.length):"";
+}else{
+pt.r=prop==="display"&&end==="none"?_renderNonTweeningValueOnlyAtEnd:_renderNonTweeningValue;
+}
+_gsapCore._relExp.test(end)&&(pt.e=0);
+this._pt=pt;
+return pt;
+},
+_keywordToPercent={
+top:"0%",
+bottom:"100%",
+left:"0%",
+right:"100%",
+center:"50%"
+},
+_convertKeywordsToPercentages=function _convertKeywordsToPercentages(value){
+var split=value.split(" "),
+x=split[0],
+y=split[1]||"50%";
+if(x==="top"||x==="bottom"||y==="left"||y==="right"){
+value=x;
+x=y;
+y=value;
+}
+split[0]=_keywordToPercent[x]||x;
+split[1]=_keywordToPercent[y]||y;
+return split.join(" ");
+},
+_renderClearProps=function _renderClearProps(ratio,data){
+if(data.tween&&data.tween._time===data.tween._dur){
+var target=data.t,
+style=target.style,
+props=data.u,
+cache=target._gsap,
+prop,
+clearTransforms,
+i;
+if(props==="all"||props===true){
+style.cssText="";
+clearTransforms=1;
+}else{
+props=props.split(",");
+i=props.length;
+while(--i>-1){
+prop=props[i];
+if(_transformProps[prop]){
+clearTransforms=1;
+prop=prop==="transformOrigin"?_transformOriginProp:_transformProp;
+}
+_removeProperty(target,prop);
+}
+}
+if(clearTransforms){
+_removeProperty(target,_transformProp);
+if(cache){
+cache.svg&&target.removeAttribute("transform");
+style.scale=style.rotate=style.translate="none";
+_parseTransform(target,1);
+cache.uncache=1;
+_removeIndependentTransforms(style);
+}
+}
+}
+},
+_specialProps={
+clearProps:function clearProps(plugin,target,property,endValue,tween){
+if(tween.data!=="isFromStart"){
+var pt=plugin._pt=new _gsapCore.PropTween(plugin._pt,target,property,0,0,_renderClearProps);
+pt.u=endValue;
+pt.pr=-10;
+pt.tween=tween;
+plugin._props.push(property);
+return 1;
+}
+}
+},
+_identity2DMatrix=[1,0,0,1,0,0],
+_rotationalProperties={},
+_isNullTransform=function _isNullTransform(value){
+return value==="matrix(1, 0, 0, 1, 0, 0)"||value==="none"||!value;
+},
+_getComputedTransformMatrixAsArray=function _getComputedTransformMatrixAsArray(target){
+var matrixString=_getComputedProperty(target,_transformProp);
+return _isNullTransform(matrixString)?_identity2DMatrix:matrixString.substr(7).match(_gsapCore._numExp).map(_gsapCore._round);
+},
+_getMatrix=function _getMatrix(target,force2D){
+var cache=target._gsap||(0,_gsapCore._getCache)(target),
+style=target.style,
+matrix=_getComputedTransformMatrixAsArray(target),
+parent,
+nextSibling,
+temp,
+addedToDOM;
+if(cache.svg&&target.getAttribute("transform")){
+temp=target.transform.baseVal.consolidate().matrix;
+matrix=[temp.a,temp.b,temp.c,temp.d,temp.e,temp.f];
+return matrix.join(",")==="1,0,0,1,0,0"?_identity2DMatrix:matrix;
+}else if(matrix===_identity2DMatrix&&!target.offsetParent&&target!==_docElement&&!cache.svg){
+temp=style.display;
+style.display="block";
+parent=target.parentNode;
+if(!parent||!target.offsetParent&&!target.getBoundingClientRect().width){
+addedToDOM=1;
+nextSibling=target.nextElementSibling;
+_docElement.appendChild(target);
+}
+matrix=_getComputedTransformMatrixAsArray(target);
+temp?style.display=temp:_removeProperty(target,"display");
+if(addedToDOM){
+nextSibling?parent.insertBefore(target,nextSibling):parent?parent.appendChild(target):_docElement.removeChild(target);
+}
+}
+return force2D&&matrix.length>6?[matrix[0],matrix[1],matrix[4],matrix[5],matrix[12],matrix[13]]:matrix;
+},
+_applySVGOrigin=function _applySVGOrigin(target,origin,originIsAbsolute,smooth,matrixArray,pluginToAddPropTweensTo){
+var cache=target._gsap,
+matrix=matrixArray||_getMatrix(target,true),
+xOriginOld=cache.xOrigin||0,
+yOriginOld=cache.yOrigin||0,
+xOffsetOld=cache.xOffset||0,
+yOffsetOld=cache.yOffset||0,
+a=matrix[0],
+b=matrix[1],
+c=matrix[2],
+d=matrix[3],
+tx=matrix[4],
+ty=matrix[5],
+originSplit=origin.split(" "),
+xOrigin=parseFloat(originSplit[0])||0,
+yOrigin=parseFloat(originSplit[1])||0,
+bounds,
+determinant,
+x,
+y;
+if(!originIsAbsolute){
+bounds=_getBBox(target);
+xOrigin=bounds.x +(~originSplit[0].indexOf("%")?xOrigin / 100*bounds.width:xOrigin);
+yOrigin=bounds.y +(~(originSplit[1]||originSplit[0]).indexOf("%")?yOrigin / 100*bounds.height:yOrigin);
+}else if(matrix!==_identity2DMatrix&&(determinant=a*d - b*c)){
+x=xOrigin*(d / determinant)+ yOrigin*(-c / determinant)+(c*ty - d*tx)/ determinant;
+y=xOrigin*(-b / determinant)+ yOrigin*(a / determinant)-(a*ty - b*tx)/ determinant;
+xOrigin=x;
+yOrigin=y;
+}
+if(smooth||smooth!==false&&cache.smooth){
+tx=xOrigin - xOriginOld;
+ty=yOrigin - yOriginOld;
+cache.xOffset=xOffsetOld +(tx*a + ty*c)- tx;
+cache.yOffset=yOffsetOld +(tx*b + ty*d)- ty;
+}else{
+cache.xOffset=cache.yOffset=0;
+}
+cache.xOrigin=xOrigin;
+cache.yOrigin=yOrigin;
+cache.smooth=!!smooth;
+cache.origin=origin;
+cache.originIsAbsolute=!!originIsAbsolute;
+target.style[_transformOriginProp]="0px 0px";
+if(pluginToAddPropTweensTo){
+_addNonTweeningPT(pluginToAddPropTweensTo,cache,"xOrigin",xOriginOld,xOrigin);
+_addNonTweeningPT(pluginToAddPropTweensTo,cache,"yOrigin",yOriginOld,yOrigin);
+_addNonTweeningPT(pluginToAddPropTweensTo,cache,"xOffset",xOffsetOld,cache.xOffset);
+_addNonTweeningPT(pluginToAddPropTweensTo,cache,"yOffset",yOffsetOld,cache.yOffset);
+}
+target.setAttribute("data-svg-origin",xOrigin + " " + yOrigin);
+},
+_parseTransform=function _parseTransform(target,uncache){
+var cache=target._gsap||new _gsapCore.GSCache(target);
+if("x" in cache&&!uncache&&!cache.uncache){
+return cache;
+}
+var style=target.style,
+invertedScaleX=cache.scaleX<0,
+px="px",
+deg="deg",
+cs=getComputedStyle(target),
+origin=_getComputedProperty(target,_transformOriginProp)||"0",
+x,
+y,
+z,
+scaleX,
+scaleY,
+rotation,
+rotationX,
+rotationY,
+skewX,
+skewY,
+perspective,
+xOrigin,
+yOrigin,
+matrix,
+angle,
+cos,
+sin,
+a,
+b,
+c,
+d,
+a12,
+a22,
+t1,
+t2,
+t3,
+a13,
+a23,
+a33,
+a42,
+a43,
+a32;
+x=y=z=rotation=rotationX=rotationY=skewX=skewY=perspective=0;
+scaleX=scaleY=1;
+cache.svg=!!(target.getCTM&&_isSVG(target));
+if(cs.translate){
+if(cs.translate!=="none"||cs.scale!=="none"||cs.rotate!=="none"){
+style[_transformProp]=(cs.translate!=="none"?"translate3d(" +(cs.translate + " 0 0").split(" ").slice(0,3).join(", ")+ ") ":"")+(cs.rotate!=="none"?"rotate(" + cs.rotate + ") ":"")+(cs.scale!=="none"?"scale(" + cs.scale.split(" ").join(",")+ ") ":"")+(cs[_transformProp]!=="none"?cs[_transformProp]:"");
+}
+style.scale=style.rotate=style.translate="none";
+}
+matrix=_getMatrix(target,cache.svg);
+if(cache.svg){
+if(cache.uncache){
+t2=target.getBBox();
+origin=cache.xOrigin - t2.x + "px " +(cache.yOrigin - t2.y)+ "px";
+t1="";
+}else{
+t1=!uncache&&target.getAttribute("data-svg-origin");
+}
+_applySVGOrigin(target,t1||origin,!!t1||cache.originIsAbsolute,cache.smooth!==false,matrix);
+}
+xOrigin=cache.xOrigin||0;
+yOrigin=cache.yOrigin||0;
+if(matrix!==_identity2DMatrix){
+a=matrix[0];
+b=matrix[1];
+c=matrix[2];
+d=matrix[3];
+x=a12=matrix[4];
+y=a22=matrix[5];
+if(matrix.length===6){
+scaleX=Math.sqrt(a*a + b*b);
+scaleY=Math.sqrt(d*d + c*c);
+rotation=a||b?_atan2(b,a)*_RAD2DEG:0;
+skewX=c||d?_atan2(c,d)*_RAD2DEG + rotation:0;
+skewX&&(scaleY*=Math.abs(Math.cos(skewX*_DEG2RAD)));
+if(cache.svg){
+x -=xOrigin -(xOrigin*a + yOrigin*c);
+y -=yOrigin -(xOrigin*b + yOrigin*d);
+}
+}else{
+a32=matrix[6];
+a42=matrix[7];
+a13=matrix[8];
+a23=matrix[9];
+a33=matrix[10];
+a43=matrix[11];
+x=matrix[12];
+y=matrix[13];
+z=matrix[14];
+angle=_atan2(a32,a33);
+rotationX=angle*_RAD2DEG;
+if(angle){
+cos=Math.cos(-angle);
+sin=Math.sin(-angle);
+t1=a12*cos + a13*sin;
+t2=a22*cos + a23*sin;
+t3=a32*cos + a33*sin;
+a13=a12*-sin + a13*cos;
+a23=a22*-sin + a23*cos;
+a33=a32*-sin + a33*cos;
+a43=a42*-sin + a43*cos;
+a12=t1;
+a22=t2;
+a32=t3;
+}
+angle=_atan2(-c,a33);
+rotationY=angle*_RAD2DEG;
+if(angle){
+cos=Math.cos(-angle);
+sin=Math.sin(-angle);
+t1=a*cos - a13*sin;
+t2=b*cos - a23*sin;
+t3=c*cos - a33*sin;
+a43=d*sin + a43*cos;
+a=t1;
+b=t2;
+c=t3;
+}
+angle=_atan2(b,a);
+rotation=angle*_RAD2DEG;
+if(angle){
+cos=Math.cos(angle);
+sin=Math.sin(angle);
+t1=a*cos + b*sin;
+t2=a12*cos + a22*sin;
+b=b*cos - a*sin;
+a22=a22*cos - a12*sin;
+a=t1;
+a12=t2;
+}
+if(rotationX&&Math.abs(rotationX)+ Math.abs(rotation)>359.9){
+rotationX=rotation=0;
+rotationY=180 - rotationY;
+}
+scaleX=(0,_gsapCore._round)(Math.sqrt(a*a + b*b + c*c));
+scaleY=(0,_gsapCore._round)(Math.sqrt(a22*a22 + a32*a32));
+angle=_atan2(a12,a22);
+skewX=Math.abs(angle)>0.0002?angle*_RAD2DEG:0;
+perspective=a43?1 /(a43<0?-a43:a43):0;
+}
+if(cache.svg){
+t1=target.getAttribute("transform");
+cache.forceCSS=target.setAttribute("transform","")||!_isNullTransform(_getComputedProperty(target,_transformProp));
+t1&&target.setAttribute("transform",t1);
+}
+}
+if(Math.abs(skewX)>90&&Math.abs(skewX)<270){
+if(invertedScaleX){
+scaleX*=-1;
+skewX +=rotation<=0?180:-180;
+rotation +=rotation<=0?180:-180;
+}else{
+scaleY*=-1;
+skewX +=skewX<=0?180:-180;
+}
+}
+uncache=uncache||cache.uncache;
+cache.x=x -((cache.xPercent=x&&(!uncache&&cache.xPercent||(Math.round(target.offsetWidth / 2)===Math.round(-x)?-50:0)))?target.offsetWidth*cache.xPercent / 100:0)+ px;
+cache.y=y -((cache.yPercent=y&&(!uncache&&cache.yPercent||(Math.round(target.offsetHeight / 2)===Math.round(-y)?-50:0)))?target.offsetHeight*cache.yPercent / 100:0)+ px;
+cache.z=z + px;
+cache.scaleX=(0,_gsapCore._round)(scaleX);
+cache.scaleY=(0,_gsapCore._round)(scaleY);
+cache.rotation=(0,_gsapCore._round)(rotation)+ deg;
+cache.rotationX=(0,_gsapCore._round)(rotationX)+ deg;
+cache.rotationY=(0,_gsapCore._round)(rotationY)+ deg;
+cache.skewX=skewX + deg;
+cache.skewY=skewY + deg;
+cache.transformPerspective=perspective + px;
+if(cache.zOrigin=parseFloat(origin.split(" ")[2])||!uncache&&cache.zOrigin||0){
+style[_transformOriginProp]=_firstTwoOnly(origin);
+}
+cache.xOffset=cache.yOffset=0;
+cache.force3D=_gsapCore._config.force3D;
+cache.renderTransform=cache.svg?_renderSVGTransforms:_supports3D?_renderCSSTransforms:_renderNon3DTransforms;
+cache.uncache=0;
+return cache;
+},
+_firstTwoOnly=function _firstTwoOnly(value){
+return(value=value.split(" "))[0]+ " " + value[1];
+},
+_addPxTranslate=function _addPxTranslate(target,start,value){
+var unit=(0,_gsapCore.getUnit)(start);
+return(0,_gsapCore._round)(parseFloat(start)+ parseFloat(_convertToUnit(target,"x",value + "px",unit)))+ unit;
+},
+_renderNon3DTransforms=function _renderNon3DTransforms(ratio,cache){
+cache.z="0px";
+cache.rotationY=cache.rotationX="0deg";
+cache.force3D=0;
+_renderCSSTransforms(ratio,cache);
+},
+_zeroDeg="0deg",
+_zeroPx="0px",
+_endParenthesis=") ",
+_renderCSSTransforms=function _renderCSSTransforms(ratio,cache){
+var _ref=cache||this,
+xPercent=_ref.xPercent,
+yPercent=_ref.yPercent,
+x=_ref.x,
+y=_ref.y,
+z=_ref.z,
+rotation=_ref.rotation,
+rotationY=_ref.rotationY,
+rotationX=_ref.rotationX,
+skewX=_ref.skewX,
+skewY=_ref.skewY,
+scaleX=_ref.scaleX,
+scaleY=_ref.scaleY,
+transformPerspective=_ref.transformPerspective,
+force3D=_ref.force3D,
+target=_ref.target,
+zOrigin=_ref.zOrigin,
+transforms="",
+use3D=force3D==="auto"&&ratio&&ratio!==1||force3D===true;
+if(zOrigin&&(rotationX!==_zeroDeg||rotationY!==_zeroDeg)){
+var angle=parseFloat(rotationY)*_DEG2RAD,
+a13=Math.sin(angle),
+a33=Math.cos(angle),
+cos;
+angle=parseFloat(rotationX)*_DEG2RAD;
+cos=Math.cos(angle);
+x=_addPxTranslate(target,x,a13*cos*-zOrigin);
+y=_addPxTranslate(target,y,-Math.sin(angle)*-zOrigin);
+z=_addPxTranslate(target,z,a33*cos*-zOrigin + zOrigin);
+}
+if(transformPerspective!==_zeroPx){
+transforms +="perspective(" + transformPerspective + _endParenthesis;
+}
+if(xPercent||yPercent){
+transforms +="translate(" + xPercent + "%, " + yPercent + "%) ";
+}
+if(use3D||x!==_zeroPx||y!==_zeroPx||z!==_zeroPx){
+transforms +=z!==_zeroPx||use3D?"translate3d(" + x + ", " + y + ", " + z + ") ":"translate(" + x + ", " + y + _endParenthesis;
+}
+if(rotation!==_zeroDeg){
+transforms +="rotate(" + rotation + _endParenthesis;
+}
+if(rotationY!==_zeroDeg){
+transforms +="rotateY(" + rotationY + _endParenthesis;
+}
+if(rotationX!==_zeroDeg){
+transforms +="rotateX(" + rotationX + _endParenthesis;
+}
+if(skewX!==_zeroDeg||skewY!==_zeroDeg){
+transforms +="skew(" + skewX + ", " + skewY + _endParenthesis;
+}
+if(scaleX!==1||scaleY!==1){
+transforms +="scale(" + scaleX + ", " + scaleY + _endParenthesis;
+}
+target.style[_transformProp]=transforms||"translate(0, 0)";
+},
+_renderSVGTransforms=function _renderSVGTransforms(ratio,cache){
+var _ref2=cache||this,
+xPercent=_ref2.xPercent,
+yPercent=_ref2.yPercent,
+x=_ref2.x,
+y=_ref2.y,
+rotation=_ref2.rotation,
+skewX=_ref2.skewX,
+skewY=_ref2.skewY,
+scaleX=_ref2.scaleX,
+scaleY=_ref2.scaleY,
+target=_ref2.target,
+xOrigin=_ref2.xOrigin,
+yOrigin=_ref2.yOrigin,
+xOffset=_ref2.xOffset,
+yOffset=_ref2.yOffset,
+forceCSS=_ref2.forceCSS,
+tx=parseFloat(x),
+ty=parseFloat(y),
+a11,
+a21,
+a12,
+a22,
+temp;
+rotation=parseFloat(rotation);
+skewX=parseFloat(skewX);
+skewY=parseFloat(skewY);
+if(skewY){
+skewY=parseFloat(skewY);
+skewX +=skewY;
+rotation +=skewY;
+}
+if(rotation||skewX){
+rotation*=_DEG2RAD;
+skewX*=_DEG2RAD;
+a11=Math.cos(rotation)*scaleX;
+a21=Math.sin(rotation)*scaleX;
+a12=Math.sin(rotation - skewX)*-scaleY;
+a22=Math.cos(rotation - skewX)*scaleY;
+if(skewX){
+skewY*=_DEG2RAD;
+temp=Math.tan(skewX - skewY);
+temp=Math.sqrt(1 + temp*temp);
+a12*=temp;
+a22*=temp;
+if(skewY){
+temp=Math.tan(skewY);
+temp=Math.sqrt(1 + temp*temp);
+a11*=temp;
+a21*=temp;
+}
+}
+a11=(0,_gsapCore._round)(a11);
+a21=(0,_gsapCore._round)(a21);
+a12=(0,_gsapCore._round)(a12);
+a22=(0,_gsapCore._round)(a22);
+}else{
+a11=scaleX;
+a22=scaleY;
+a21=a12=0;
+}
+if(tx&&!~(x + "").indexOf("px")||ty&&!~(y + "").indexOf("px")){
+tx=_convertToUnit(target,"x",x,"px");
+ty=_convertToUnit(target,"y",y,"px");
+}
+if(xOrigin||yOrigin||xOffset||yOffset){
+tx=(0,_gsapCore._round)(tx + xOrigin -(xOrigin*a11 + yOrigin*a12)+ xOffset);
+ty=(0,_gsapCore._round)(ty + yOrigin -(xOrigin*a21 + yOrigin*a22)+ yOffset);
+}
+if(xPercent||yPercent){
+temp=target.getBBox();
+tx=(0,_gsapCore._round)(tx + xPercent / 100*temp.width);
+ty=(0,_gsapCore._round)(ty + yPercent / 100*temp.height);
+}
+temp="matrix(" + a11 + "," + a21 + "," + a12 + "," + a22 + "," + tx + "," + ty + ")";
+target.setAttribute("transform",temp);
+forceCSS&&(target.style[_transformProp]=temp);
+},
+_addRotationalPropTween=function _addRotationalPropTween(plugin,target,property,startNum,endValue){
+var cap=360,
+isString=(0,_gsapCore._isString)(endValue),
+endNum=parseFloat(endValue)*(isString&&~endValue.indexOf("rad")?_RAD2DEG:1),
+change=endNum - startNum,
+finalValue=startNum + change + "deg",
+direction,
+pt;
+if(isString){
+direction=endValue.split("_")[1];
+if(direction==="short"){
+change%=cap;
+if(change!==change%(cap / 2)){
+change +=change<0?cap:-cap;
+}
+}
+if(direction==="cw"&&change<0){
+change=(change + cap*_bigNum)%cap -~~(change / cap)*cap;
+}else if(direction==="ccw"&&change>0){
+change=(change - cap*_bigNum)%cap -~~(change / cap)*cap;
+}
+}
+plugin._pt=pt=new _gsapCore.PropTween(plugin._pt,target,property,startNum,change,_renderPropWithEnd);
+pt.e=finalValue;
+pt.u="deg";
+plugin._props.push(property);
+return pt;
+},
+_assign=function _assign(target,source){
+for(var p in source){
+target[p]=source[p];
+}
+return target;
+},
+_addRawTransformPTs=function _addRawTransformPTs(plugin,transforms,target){
+var startCache=_assign({},target._gsap),
+exclude="perspective,force3D,transformOrigin,svgOrigin",
+style=target.style,
+endCache,
+p,
+startValue,
+endValue,
+startNum,
+endNum,
+startUnit,
+endUnit;
+if(startCache.svg){
+startValue=target.getAttribute("transform");
+target.setAttribute("transform","");
+style[_transformProp]=transforms;
+endCache=_parseTransform(target,1);
+_removeProperty(target,_transformProp);
+target.setAttribute("transform",startValue);
+}else{
+startValue=getComputedStyle(target)[_transformProp];
+style[_transformProp]=transforms;
+endCache=_parseTransform(target,1);
+style[_transformProp]=startValue;
+}
+for(p in _transformProps){
+startValue=startCache[p];
+endValue=endCache[p];
+if(startValue!==endValue&&exclude.indexOf(p)<0){
+startUnit=(0,_gsapCore.getUnit)(startValue);
+endUnit=(0,_gsapCore.getUnit)(endValue);
+startNum=startUnit!==endUnit?_convertToUnit(target,p,startValue,endUnit):parseFloat(startValue);
+endNum=parseFloat(endValue);
+plugin._pt=new _gsapCore.PropTween(plugin._pt,endCache,p,startNum,endNum - startNum,_renderCSSProp);
+plugin._pt.u=endUnit||0;
+plugin._props.push(p);
+}
+}
+_assign(endCache,startCache);
+};
+(0,_gsapCore._forEachName)("padding,margin,Width,Radius",function(name,index){
+var t="Top",
+r="Right",
+b="Bottom",
+l="Left",
+props=(index<3?[t,r,b,l]:[t + l,t + r,b + r,b + l]).map(function(side){
+return index<2?name + side:"border" + side + name;
+});
+_specialProps[index>1?"border" + name:name]=function(plugin,target,property,endValue,tween){
+var a,vars;
+if(arguments.length<4){
+a=props.map(function(prop){
+return _get(plugin,prop,property);
+});
+vars=a.join(" ");
+return vars.split(a[0]).length===5?a[0]:vars;
+}
+a=(endValue + "").split(" ");
+vars={};
+props.forEach(function(prop,i){
+return vars[prop]=a[i]=a[i]||a[(i - 1)/ 2|0];
+});
+plugin.init(target,vars,tween);
+};
+});
+var CSSPlugin=exports.default=exports.CSSPlugin={
+name:"css",
+register:_initCore,
+targetTest:function targetTest(target){
+return target.style&&target.nodeType;
+},
+init:function init(target,vars,tween,index,targets){
+var props=this._props,
+style=target.style,
+startAt=tween.vars.startAt,
+startValue,
+endValue,
+endNum,
+startNum,
+type,
+specialProp,
+p,
+startUnit,
+endUnit,
+relative,
+isTransformRelated,
+transformPropTween,
+cache,
+smooth,
+hasPriority,
+inlineProps;
+_pluginInitted||_initCore();
+this.styles=this.styles||_getStyleSaver(target);
+inlineProps=this.styles.props;
+this.tween=tween;
+for(p in vars){
+if(p==="autoRound"){
+continue;
+}
+endValue=vars[p];
+if(_gsapCore._plugins[p]&&(0,_gsapCore._checkPlugin)(p,vars,tween,index,target,targets)){
+continue;
+}
+type=typeof endValue;
+specialProp=_specialProps[p];
+if(type==="function"){
+endValue=endValue.call(tween,index,target,targets);
+type=typeof endValue;
+}
+if(type==="string"&&~endValue.indexOf("random(")){
+endValue=(0,_gsapCore._replaceRandom)(endValue);
+}
+if(specialProp){
+specialProp(this,target,p,endValue,tween)&&(hasPriority=1);
+}else if(p.substr(0,2)==="--"){
+startValue=(getComputedStyle(target).getPropertyValue(p)+ "").trim();
+endValue +="";
+_gsapCore._colorExp.lastIndex=0;
+if(!_gsapCore._colorExp.test(startValue)){
+startUnit=(0,_gsapCore.getUnit)(startValue);
+endUnit=(0,_gsapCore.getUnit)(endValue);
+}
+endUnit?startUnit!==endUnit&&(startValue=_convertToUnit(target,p,startValue,endUnit)+ endUnit):startUnit&&(endValue +=startUnit);
+this.add(style,"setProperty",startValue,endValue,index,targets,0,0,p);
+props.push(p);
+inlineProps.push(p,0,style[p]);
+}else if(type!=="undefined"){
+if(startAt&&p in startAt){
+startValue=typeof startAt[p]==="function"?startAt[p].call(tween,index,target,targets):startAt[p];
+(0,_gsapCore._isString)(startValue)&&~startValue.indexOf("random(")&&(startValue=(0,_gsapCore._replaceRandom)(startValue));
+(0,_gsapCore.getUnit)(startValue + "")||startValue==="auto"||(startValue +=_gsapCore._config.units[p]||(0,_gsapCore.getUnit)(_get(target,p))||"");
+(startValue + "").charAt(1)==="="&&(startValue=_get(target,p));
+}else{
+startValue=_get(target,p);
+}
+startNum=parseFloat(startValue);
+relative=type==="string"&&endValue.charAt(1)==="="&&endValue.substr(0,2);
+relative&&(endValue=endValue.substr(2));
+endNum=parseFloat(endValue);
+if(p in _propertyAliases){
+if(p==="autoAlpha"){
+if(startNum===1&&_get(target,"visibility")==="hidden"&&endNum){
+startNum=0;
+}
+inlineProps.push("visibility",0,style.visibility);
+_addNonTweeningPT(this,style,"visibility",startNum?"inherit":"hidden",endNum?"inherit":"hidden",!endNum);
+}
+if(p!=="scale"&&p!=="transform"){
+p=_propertyAliases[p];
+~p.indexOf(",")&&(p=p.split(",")[0]);
+}
+}
+isTransformRelated=p in _transformProps;
+if(isTransformRelated){
+this.styles.save(p);
+if(type==="string"&&endValue.substring(0,6)==="var(--"){
+endValue=_getComputedProperty(target,endValue.substring(4,endValue.indexOf(")")));
+endNum=parseFloat(endValue);
+}
+if(!transformPropTween){
+cache=target._gsap;
+cache.renderTransform&&!vars.parseTransform||_parseTransform(target,vars.parseTransform);
+smooth=vars.smoothOrigin!==false&&cache.smooth;
+transformPropTween=this._pt=new _gsapCore.PropTween(this._pt,style,_transformProp,0,1,cache.renderTransform,cache,0,-1);
+transformPropTween.dep=1;
+}
+if(p==="scale"){
+this._pt=new _gsapCore.PropTween(this._pt,cache,"scaleY",cache.scaleY,(relative?(0,_gsapCore._parseRelative)(cache.scaleY,relative + endNum):endNum)- cache.scaleY||0,_renderCSSProp);
+this._pt.u=0;
+props.push("scaleY",p);
+p +="X";
+}else if(p==="transformOrigin"){
+inlineProps.push(_transformOriginProp,0,style[_transformOriginProp]);
+endValue=_convertKeywordsToPercentages(endValue);
+if(cache.svg){
+_applySVGOrigin(target,endValue,0,smooth,0,this);
+}else{
+endUnit=parseFloat(endValue.split(" ")[2])||0;
+endUnit!==cache.zOrigin&&_addNonTweeningPT(this,cache,"zOrigin",cache.zOrigin,endUnit);
+_addNonTweeningPT(this,style,p,_firstTwoOnly(startValue),_firstTwoOnly(endValue));
+}
+continue;
+}else if(p==="svgOrigin"){
+_applySVGOrigin(target,endValue,1,smooth,0,this);
+continue;
+}else if(p in _rotationalProperties){
+_addRotationalPropTween(this,cache,p,startNum,relative?(0,_gsapCore._parseRelative)(startNum,relative + endValue):endValue);
+continue;
+}else if(p==="smoothOrigin"){
+_addNonTweeningPT(this,cache,"smooth",cache.smooth,endValue);
+continue;
+}else if(p==="force3D"){
+cache[p]=endValue;
+continue;
+}else if(p==="transform"){
+_addRawTransformPTs(this,endValue,target);
+continue;
+}
+}else if(!(p in style)){
+p=_checkPropPrefix(p)||p;
+}
+if(isTransformRelated||(endNum||endNum===0)&&(startNum||startNum===0)&&!_complexExp.test(endValue)&&p in style){
+startUnit=(startValue + "").substr((startNum + "").length);
+endNum||(endNum=0);
+endUnit=(0,_gsapCore.getUnit)(endValue)||(p in _gsapCore._config.units?_gsapCore._config.units[p]:startUnit);
+startUnit!==endUnit&&(startNum=_convertToUnit(target,p,startValue,endUnit));
+this._pt=new _gsapCore.PropTween(this._pt,isTransformRelated?cache:style,p,startNum,(relative?(0,_gsapCore._parseRelative)(startNum,relative + endNum):endNum)- startNum,!isTransformRelated&&(endUnit==="px"||p==="zIndex")&&vars.autoRound!==false?_renderRoundedCSSProp:_renderCSSProp);
+this._pt.u=endUnit||0;
+if(startUnit!==endUnit&&endUnit!=="%"){
+this._pt.b=startValue;
+this._pt.r=_renderCSSPropWithBeginning;
+}
+}else if(!(p in style)){
+if(p in target){
+this.add(target,p,startValue||target[p],relative?relative + endValue:endValue,index,targets);
+}else if(p!=="parseTransform"){
+(0,_gsapCore._missingPlugin)(p,endValue);
+continue;
+}
+}else{
+_tweenComplexCSSString.call(this,target,p,startValue,relative?relative + endValue:endValue);
+}
+isTransformRelated||(p in style?inlineProps.push(p,0,style[p]):typeof target[p]==="function"?inlineProps.push(p,2,target[p]()):inlineProps.push(p,1,startValue||target[p]));
+props.push(p);
+}
+}
+hasPriority&&(0,_gsapCore._sortPropTweensByPriority)(this);
+},
+render:function render(ratio,data){
+if(data.tween._time||!_reverting()){
+var pt=data._pt;
+while(pt){
+pt.r(ratio,pt.d);
+pt=pt._next;
+}
+}else{
+data.styles.revert();
+}
+},
+get:_get,
+aliases:_propertyAliases,
+getSetter:function getSetter(target,property,plugin){
+var p=_propertyAliases[property];
+p&&p.indexOf(",")<0&&(property=p);
+return property in _transformProps&&property!==_transformOriginProp&&(target._gsap.x||_get(target,"x"))?plugin&&_recentSetterPlugin===plugin?property==="scale"?_setterScale:_setterTransform:(_recentSetterPlugin=plugin||{})&&(property==="scale"?_setterScaleWithRender:_setterTransformWithRender):target.style&&!(0,_gsapCore._isUndefined)(target.style[property])?_setterCSSStyle:~property.indexOf("-")?_setterCSSProp:(0,_gsapCore._getSetter)(target,property);
+},
+core:{
+_removeProperty:_removeProperty,
+_getMatrix:_getMatrix
+}
+};
+_gsapCore.gsap.utils.checkPrefix=_checkPropPrefix;
+_gsapCore.gsap.core.getStyleSaver=_getStyleSaver;
+(function(positionAndScale,rotation,others,aliases){
+var all=(0,_gsapCore._forEachName)(positionAndScale + "," + rotation + "," + others,function(name){
+_transformProps[name]=1;
+});
+(0,_gsapCore._forEachName)(rotation,function(name){
+_gsapCore._config.units[name]="deg";
+_rotationalProperties[name]=1;
+});
+_propertyAliases[all[13]]=positionAndScale + "," + rotation;
+(0,_gsapCore._forEachName)(aliases,function(name){
+var split=name.split(":");
+_propertyAliases[split[1]]=all[split[0]];
+});
+})("x,y,z,scale,scaleX,scaleY,xPercent,yPercent","rotation,rotationX,rotationY,skewX,skewY","transform,transformOrigin,svgOrigin,force3D,smoothOrigin,transformPerspective","0:translateX,1:translateY,2:translateZ,8:rotate,8:rotationZ,8:rotateZ,9:rotateX,10:rotateY");
+(0,_gsapCore._forEachName)("x,y,z,top,right,bottom,left,width,height,fontSize,padding,margin,perspective",function(name){
+_gsapCore._config.units[name]="px";
+});
+_gsapCore.gsap.registerPlugin(CSSPlugin);
+},{
+"./gsap-core.js":"TNS6"
+}],
+"TpQl":[function(require,module,exports){
+"use strict";
+Object.defineProperty(exports,"__esModule",{
+value:true
+});
+Object.defineProperty(exports,"Back",{
+enumerable:true,
+get:function(){
+return _gsapCore.Back;
+}
+});
+Object.defineProperty(exports,"Bounce",{
+enumerable:true,
+get:function(){
+return _gsapCore.Bounce;
+}
+});
+Object.defineProperty(exports,"CSSPlugin",{
+enumerable:true,
+get:function(){
+return _CSSPlugin.CSSPlugin;
+}
+});
+Object.defineProperty(exports,"Circ",{
+enumerable:true,
+get:function(){
+return _gsapCore.Circ;
+}
+});
+Object.defineProperty(exports,"Cubic",{
+enumerable:true,
+get:function(){
+return _gsapCore.Cubic;
+}
+});
+Object.defineProperty(exports,"Elastic",{
+enumerable:true,
+get:function(){
+return _gsapCore.Elastic;
+}
+});
+Object.defineProperty(exports,"Expo",{
+enumerable:true,
+get:function(){
+return _gsapCore.Expo;
+}
+});
+Object.defineProperty(exports,"Linear",{
+enumerable:true,
+get:function(){
+return _gsapCore.Linear;
+}
+});
+Object.defineProperty(exports,"Power0",{
+enumerable:true,
+get:function(){
+return _gsapCore.Power0;
+}
+});
+Object.defineProperty(exports,"Power1",{
+enumerable:true,
+get:function(){
+return _gsapCore.Power1;
+}
+});
+Object.defineProperty(exports,"Power2",{
+enumerable:true,
+get:function(){
+return _gsapCore.Power2;
+}
+});
+Object.defineProperty(exports,"Power3",{
+enumerable:true,
+get:function(){
+return _gsapCore.Power3;
+}
+});
+Object.defineProperty(exports,"Power4",{
+enumerable:true,
+get:function(){
+return _gsapCore.Power4;
+}
+});
+Object.defineProperty(exports,"Quad",{
+enumerable:true,
+get:function(){
+return _gsapCore.Quad;
+}
+});
+Object.defineProperty(exports,"Quart",{
+enumerable:true,
+get:function(){
+return _gsapCore.Quart;
+}
+});
+Object.defineProperty(exports,"Quint",{
+enumerable:true,
+get:function(){
+return _gsapCore.Quint;
+}
+});
+Object.defineProperty(exports,"Sine",{
+enumerable:true,
+get:function(){
+return _gsapCore.Sine;
+}
+});
+Object.defineProperty(exports,"SteppedEase",{
+enumerable:true,
+get:function(){
+return _gsapCore.SteppedEase;
+}
+});
+Object.defineProperty(exports,"Strong",{
+enumerable:true,
+get:function(){
+return _gsapCore.Strong;
+}
+});
+Object.defineProperty(exports,"TimelineLite",{
+enumerable:true,
+get:function(){
+return _gsapCore.TimelineLite;
+}
+});
+Object.defineProperty(exports,"TimelineMax",{
+enumerable:true,
+get:function(){
+return _gsapCore.TimelineMax;
+}
+});
+Object.defineProperty(exports,"TweenLite",{
+enumerable:true,
+get:function(){
+return _gsapCore.TweenLite;
+}
+});
+exports.gsap=exports.default=exports.TweenMax=void 0;
+var _gsapCore=require("./gsap-core.js");
+var _CSSPlugin=require("./CSSPlugin.js");
+var gsapWithCSS=exports.default=exports.gsap=_gsapCore.gsap.registerPlugin(_CSSPlugin.CSSPlugin)||_gsapCore.gsap,
+TweenMaxWithCSS=exports.TweenMax=gsapWithCSS.core.Tween;
+},{
+"./gsap-core.js":"TNS6",
+"./CSSPlugin.js":"bp4Z"
+}],
+"Jcyn":[function(require,module,exports){
+"use strict";
+Object.defineProperty(exports,"__esModule",{
+value:true
+});
+exports.Slideshow=void 0;
+var _slide=require("../slide");
+var _events=require("events");
+var _gsap=require("gsap");
+function _typeof(o){
+"@babel/helpers - typeof";
+return _typeof="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(o){
+return typeof o;
+}:function(o){
+return o&&"function"==typeof Symbol&&o.constructor===Symbol&&o!==Symbol.prototype?"symbol":typeof o;
+},_typeof(o);
+}
+function _createForOfIteratorHelper(r,e){
+var t="undefined"!=typeof Symbol&&r[Symbol.iterator]||r["@@iterator"];
+if(!t){
+if(Array.isArray(r)||(t=_unsupportedIterableToArray(r))||e&&r&&"number"==typeof r.length){
+t&&(r=t);
+var _n=0,
+F=function F(){};
+return{
+s:F,
+n:function n(){
+return _n>=r.length?{
+done:!0
+}:{
+done:!1,
+value:r[_n++]
+};
+},
+e:function e(r){
+throw r;
+},
+f:F
+};
+}
+throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.");
+}
+var o,a=!0,
+u=!1;
+return{
+s:function s(){
+t=t.call(r);
+},
+n:function n(){
+var r=t.next();
+return a=r.done,r;
+},
+e:function e(r){
+u=!0,o=r;
+},
+f:function f(){
+try{
+a||null==t.return||t.return();
+}finally{
+if(u)throw o;
+}
+}
+};
+}
+function _toConsumableArray(r){
+return _arrayWithoutHoles(r)||_iterableToArray(r)||_unsupportedIterableToArray(r)||_nonIterableSpread();
+}
+function _nonIterableSpread(){
+throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.");
+}
+function _unsupportedIterableToArray(r,a){
+if(r){
+if("string"==typeof r)return _arrayLikeToArray(r,a);
+var t={}.toString.call(r).slice(8,-1);
+return "Object"===t&&r.constructor&&(t=r.constructor.name),"Map"===t||"Set"===t?Array.from(r):"Arguments"===t||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(t)?_arrayLikeToArray(r,a):void 0;
+}
+}
+function _iterableToArray(r){
+if("undefined"!=typeof Symbol&&null!=r[Symbol.iterator]||null!=r["@@iterator"])return Array.from(r);
+}
+function _arrayWithoutHoles(r){
+if(Array.isArray(r))return _arrayLikeToArray(r);
+}
+function _arrayLikeToArray(r,a){
+(null==a||a>r.length)&&(a=r.length);
+for(var e=0,n=Array(a);e<a;e++)n[e]=r[e];
+return n;
+}
+function _classCallCheck(a,n){
+if(!(a instanceof n))throw new TypeError("Cannot call a class as a function");
+}
+function _defineProperties(e,r){
+for(var t=0;t<r.length;t++){
+var o=r[t];
+o.enumerable=o.enumerable||!1,o.configurable=!0,"value" in o&&(o.writable=!0),Object.defineProperty(e,_toPropertyKey(o.key),o);
+}
+}
+function _createClass(e,r,t){
+return r&&_defineProperties(e.prototype,r),t&&_defineProperties(e,t),Object.defineProperty(e,"prototype",{
+writable:!1
+}),e;
+}
+function _toPropertyKey(t){
+var i=_toPrimitive(t,"string");
+return "symbol"==_typeof(i)?i:i + "";
+}
+function _toPrimitive(t,r){
+if("object"!=_typeof(t)||!t)return t;
+var e=t[Symbol.toPrimitive];
+if(void 0!==e){
+var i=e.call(t,r||"default");
+if("object"!=_typeof(i))return i;
+throw new TypeError("@@toPrimitive must return a primitive value.");
+}
+return("string"===r?String:Number)(t);
+}
+function _callSuper(t,o,e){
+return o=_getPrototypeOf(o),_possibleConstructorReturn(t,_isNativeReflectConstruct()?Reflect.construct(o,e||[],_getPrototypeOf(t).constructor):o.apply(t,e));
+}
+function _possibleConstructorReturn(t,e){
+if(e&&("object"==_typeof(e)||"function"==typeof e))return e;
+if(void 0!==e)throw new TypeError("Derived constructors may only return object or undefined");
+return _assertThisInitialized(t);
+}
+function _assertThisInitialized(e){
+if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");
+return e;
+}
+function _isNativeReflectConstruct(){
+try{
+var t=!Boolean.prototype.valueOf.call(Reflect.construct(Boolean,[],function(){}));
+}catch(t){}
+return(_isNativeReflectConstruct=function _isNativeReflectConstruct(){
+return!!t;
+})();
+}
+function _getPrototypeOf(t){
+return _getPrototypeOf=Object.setPrototypeOf?Object.getPrototypeOf.bind():function(t){
+return t.__proto__||Object.getPrototypeOf(t);
+},_getPrototypeOf(t);
+}
+function _inherits(t,e){
+if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function");
+t.prototype=Object.create(e&&e.prototype,{
+constructor:{
+value:t,
+writable:!0,
+configurable:!0
+}
+}),Object.defineProperty(t,"prototype",{
+writable:!1
+}),e&&_setPrototypeOf(t,e);
+}
+function _setPrototypeOf(t,e){
+return _setPrototypeOf=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(t,e){
+return t.__proto__=e,t;
+},_setPrototypeOf(t,e);
+}
+var Slideshow=exports.Slideshow= function(_EventEmitter){
+function Slideshow(el){
+var _this;
+_classCallCheck(this,Slideshow);
+_this=_callSuper(this,Slideshow);
+_this.DOM={
+el:el
+};
+_this.DOM.slides=_toConsumableArray(_this.DOM.el.querySelectorAll('.slide'));
+_this.slides=[];
+_this.DOM.slides.forEach(function(slide){
+return _this.slides.push(new _slide.Slide(slide));
+});
+_this.slidesTotal=_this.slides.length;
+_this.current=0;
+_this.config={
+clipPath:{
+initial:'circle(55% at 70% 50%)',
+final:'circle(15% at 70% 50%)',
+hover:'circle(20% at 30% 50%)'
+}
+};
+_this.init();
+return _this;
+}
+_inherits(Slideshow,_EventEmitter);
+return _createClass(Slideshow,[{
+key:"init",
+value:function init(){
+var _this2=this;
+this.DOM.slides[this.current].classList.add('slide--current');
+this.startKenBurns(this.slides[this.current]);
+var firstSlide=this.slides[this.current];
+_gsap.gsap.set(firstSlide.DOM.imgWrap,{
+clipPath:this.config.clipPath.initial
+});
+_gsap.gsap.timeline({delay:3})
+.fromTo(firstSlide.textLines,
+{yPercent:100,opacity:0},
+{
+duration:0.8,
+yPercent:0,
+opacity:1,
+stagger:0.1,
+ease:"expo.out"
+},0)
+.fromTo(firstSlide.linkSplit.lines,
+{yPercent:100,opacity:0},
+{
+duration:0.8,
+yPercent:0,
+opacity:1,
+stagger:0.05,
+ease:"expo.out"
+},0.4);
+var _iterator=_createForOfIteratorHelper(this.slides),
+_step;
+try{
+var _loop=function _loop(){
+var slide=_step.value;
+slide.DOM.link.addEventListener('mouseenter',function(){
+_gsap.gsap.killTweensOf(slide.DOM.imgWrap);
+_gsap.gsap.to(slide.DOM.imgWrap,{
+duration:1,
+ease:'expo',
+clipPath:_this2.config.clipPath.hover
+});
+});
+slide.DOM.link.addEventListener('mouseleave',function(){
+_gsap.gsap.killTweensOf(slide.DOM.imgWrap);
+_gsap.gsap.to(slide.DOM.imgWrap,{
+duration:1,
+ease:'expo',
+clipPath:_this2.config.clipPath.initial
+});
+});
+};
+for(_iterator.s();!(_step=_iterator.n()).done;){
+_loop();
+}
+}catch(err){
+_iterator.e(err);
+}finally{
+_iterator.f();
+}
+}
+},{
+key:"next",
+value:function next(){
+this.navigate('next');
+}
+},{
+key:"prev",
+value:function prev(){
+this.navigate('prev');
+}
+},{
+key:"navigate",
+value:function navigate(direction){
+var _this3=this;
+if(this.isAnimating){
+return false;
+}
+this.isAnimating=true;
+var currentSlide=this.slides[this.current];
+if(direction==='next'){
+this.current=this.current<this.slidesTotal - 1?this.current + 1:0;
+}else{
+this.current=this.current>0?this.current - 1:this.slidesTotal - 1;
+}
+var upcomingSlide=this.slides[this.current];
+_gsap.gsap.killTweensOf(currentSlide.DOM.img);
+_gsap.gsap.timeline({
+onStart:function onStart(){
+return upcomingSlide.DOM.el.classList.add('slide--current');
+},
+onComplete:function onComplete(){
+_this3.isAnimating=false;
+currentSlide.DOM.el.classList.remove('slide--current');
+_this3.startKenBurns(upcomingSlide);
+}
+}).addLabel('start',0)
+.set(upcomingSlide.DOM.imgWrap,{
+y:direction==='next'?'100%':'-100%',
+clipPath:this.config.clipPath.final
+},'start')
+.set(upcomingSlide.DOM.el,{
+opacity:1
+},'start')
+.set(upcomingSlide.DOM.img,{
+y:direction==='next'?'-50%':'50%'
+},'start')
+.to(currentSlide.DOM.imgWrap,{
+duration:1,
+ease:'power3.in',
+clipPath:this.config.clipPath.final,
+rotation:0.001
+},'start')
+.to(currentSlide.textLines,{
+duration:0.6,
+opacity:0,
+ease:"power2.in"
+},'start')
+.to(currentSlide.textLines,{
+duration:0.4,
+yPercent:100,
+ease:"power2.in"
+},'start+=0.6')
+.to(currentSlide.linkSplit.lines,{
+duration:0.6,
+opacity:0,
+ease:"power2.in"
+},'start')
+.to(currentSlide.linkSplit.lines,{
+duration:0.4,
+yPercent:100,
+ease:"power2.in"
+},'start+=0.6')
+.to(currentSlide.DOM.imgWrap,{
+duration:1,
+ease:'power2.inOut',
+y:direction==='next'?'-100%':'100%',
+rotation:0.001
+},'start+=0.6')
+.to(currentSlide.DOM.img,{
+duration:1,
+ease:'power2.inOut',
+y:direction==='next'?'50%':'-50%'
+},'start+=0.6')
+.to(upcomingSlide.DOM.imgWrap,{
+duration:1,
+ease:'power2.inOut',
+y:'0%',
+rotation:0.001
+},'start+=0.6')
+.to(upcomingSlide.DOM.img,{
+duration:1,
+ease:'power2.inOut',
+y:'0%'
+},'start+=0.6')
+.to(upcomingSlide.DOM.imgWrap,{
+duration:1.5,
+ease:'expo.inOut',
+clipPath:this.config.clipPath.initial
+},'start+=1.2')
+.fromTo(upcomingSlide.textLines,
+{yPercent:100,opacity:0},
+{
+duration:0.8,
+yPercent:0,
+opacity:1,
+stagger:0.08,
+ease:"expo.out"
+},'start+=2.5')
+.fromTo(upcomingSlide.linkSplit.lines,
+{yPercent:100,opacity:0},
+{
+duration:0.8,
+yPercent:0,
+opacity:1,
+stagger:0.04,
+ease:"expo.out"
+},'start+=2.9');
+this.emit('updateCurrent',this.current);
+}
+},{
+key:"startKenBurns",
+value:function startKenBurns(slide){
+if(!slide||!slide.DOM.img)return;
+_gsap.gsap.killTweensOf(slide.DOM.img);
+var origins=["center center","top left","top right","bottom left","bottom right"];
+var randomOrigin=origins[Math.floor(Math.random()*origins.length)];
+_gsap.gsap.fromTo(slide.DOM.img,{
+scale:1,
+transformOrigin:randomOrigin
+},{
+scale:1.15,
+duration:14,
+ease:"power1.inOut",
+repeat:-1,
+yoyo:true
+});
+}
+}]);
+}(_events.EventEmitter);
+},{
+"../slide":"Drnq",
+"events":"dr5l",
+"gsap":"TpQl"
+}],
+"C3Xv":[function(require,module,exports){
+"use strict";
+var _utils=require("../utils");
+var _navigation=require("../navigation");
+var _slideshow=require("./slideshow");
+(0,_utils.preloadImages)('.slide__img').then(function(){
+document.body.classList.remove('loading');
+var slideshow=new _slideshow.Slideshow(document.querySelector('.slideshow'));
+var navigation=new _navigation.Navigation(document.querySelector('.slides-nav'));
+slideshow.goToSlide=function(targetIndex){
+if(this.isAnimating||targetIndex===this.current)return false;
+if(targetIndex<0||targetIndex>=this.slidesTotal)return false;
+var direction=targetIndex>this.current?'next':'prev';
+while(this.current!==targetIndex){
+if(direction==='next'){
+this.current=this.current<this.slidesTotal - 1?this.current + 1:0;
+}else{
+this.current=this.current>0?this.current - 1:this.slidesTotal - 1;
+}
+}
+this.slides.forEach(function(s,i){
+s.DOM.el.classList.toggle('slide--current',i===targetIndex);
+});
+this.emit('updateCurrent',this.current);
+return true;
+};
+slideshow.goToSlideByIdname=function(idname){
+var slides=document.querySelectorAll('.slide[data-slide-id]');
+for(var i=0;i<slides.length;i++){
+if(slides[i].getAttribute('data-slide-id')===idname){
+return this.goToSlide(i);
+}
+}
+return false;
+};
+window.prideSlideshow=slideshow;
+navigation.DOM.ctrls.next.addEventListener('click',function(){
+return slideshow.next();
+});
+navigation.DOM.ctrls.prev.addEventListener('click',function(){
+return slideshow.prev();
+});
+navigation.updateCurrent(slideshow.current);
+navigation.DOM.total.innerHTML=slideshow.current<10?"0".concat(slideshow.slidesTotal):slideshow.slidesTotal;
+slideshow.on('updateCurrent',function(position){
+return navigation.updateCurrent(position);
+});
+function handleSlideHash(){
+var hash=window.location.hash;
+if(hash&&hash.startsWith('#slide_')){
+var idname=hash.replace('#slide_','');
+if(idname&&window.prideSlideshow){
+setTimeout(function(){
+window.prideSlideshow.goToSlideByIdname(idname);
+},100);
+}
+}
+}
+handleSlideHash();
+window.addEventListener('hashchange',handleSlideHash);
+});
+var tourBtn=document.querySelector(".tour-fixed");
+function updateTourButton(){
+var firstSlide=document.querySelector(".slide:first-child");
+if(firstSlide&&firstSlide.classList.contains("slide--current")){
+tourBtn.style.display="block";
+}else{
+tourBtn.style.display="none";
+}
+}
+updateTourButton();
+document.querySelectorAll(".slides-nav__button").forEach(function(btn){
+btn.addEventListener("click",function(){
+setTimeout(updateTourButton,300);
+});
+});
+},{
+"../utils":"MgTz",
+"../navigation":"qr24",
+"./slideshow":"Jcyn"
+}]
+},{},["C3Xv"],null)
+window.addEventListener("load",()=>{
+document.body.classList.add("loaded");
+});
+let selectedPath=[];
+let lastSelected=null;
+let formConfig=null;
+window.selectedPath=selectedPath;
+window.lastSelected=lastSelected;
+window.formConfig=formConfig;
+function showError(input,message){
+let errorEl=input.parentNode.querySelector(".error-message");
+if(!errorEl){
+errorEl=document.createElement("div");
+errorEl.className="error-message";
+errorEl.style.color="red";
+errorEl.style.fontSize="12px";
+errorEl.style.marginTop="3px";
+input.parentNode.appendChild(errorEl);
+}
+errorEl.textContent=message;
+input.classList.add("error");
+}
+function clearError(input){
+let errorEl=input.parentNode.querySelector(".error-message");
+if(errorEl)errorEl.textContent="";
+input.classList.remove("error");
+}
+function openFulldescModal(content){
+let modal=document.getElementById('fulldescModal');
+if(!modal){
+modal=document.createElement('div');
+modal.id='fulldescModal';
+modal.className='fulldesc-modal';
+modal.setAttribute('aria-hidden','true');
+modal.setAttribute('role','dialog');
+modal.setAttribute('aria-modal','true');
+modal.innerHTML=`
+            <div class="fulldesc-modal-header">
+                <button class="fulldesc-close" id="closeFulldesc">×</button>
+            </div>
+            <div class="fulldesc-content"></div>
+        `;
+document.body.appendChild(modal);
+const closeBtn=modal.querySelector('#closeFulldesc');
+if(closeBtn){
+closeBtn.addEventListener('click',closeFulldescModal);
+}
+}
+const modalContent=modal.querySelector('.fulldesc-content');
+modalContent.innerHTML=content;
+modal.style.display='block';
+setTimeout(()=>{
+modal.classList.add('active');
+},10);
+}
+function closeFulldescModal(){
+const modal=document.getElementById('fulldescModal');
+if(!modal)return;
+modal.classList.remove('active');
+setTimeout(()=>{
+modal.style.display='none';
+},500);
+}
+async function loadFormConfig(){
+try{
+console.log("Загрузка form.json...");
+console.log("Текущий URL:",window.location.href);
+let response=await fetch(`form.min.json?t=${Date.now()}`);
+if(!response.ok){
+response=await fetch(`form.json?t=${Date.now()}`);
+}
+console.log("Response status:",response.status);
+if(!response.ok){
+throw new Error(`HTTP error! status: ${response.status}`);
+}
+formConfig=await response.json();
+console.log("form.json загружен:",formConfig);
+console.log("formConfig.main:",formConfig.main);
+document.getElementById("step1").innerHTML="";
+document.getElementById("step2").innerHTML="";
+document.getElementById("step3").innerHTML="";
+document.getElementById("finalFields").innerHTML="";
+selectedPath=[];
+lastSelected=null;
+window.lastSelected=null;
+console.log("Рендерим опции:",formConfig.main);
+renderOptions(formConfig.main,"step1",handleSelection);
+document.getElementById("step1").style.display="block";
+document.getElementById("step2").style.display="none";
+document.getElementById("step3").style.display="none";
+document.getElementById("finalFields").style.display="none";
+console.log("Форма отрендерена");
+}catch(err){
+console.error("Ошибка загрузки form.json:",err);
+const step1=document.getElementById("step1");
+if(step1){
+step1.innerHTML=`<div style="color: #ff6b6b; padding: 20px; text-align: center;">
+                <p>Ошибка загрузки формы</p>
+                <p style="font-size: 0.9rem; opacity: 0.8;">${err.message}</p>
+            </div>`;
+step1.style.display="block";
+}
+}
+}
+function renderOptions(options,stepContainerId,onSelect,backCallback=null){
+console.log("renderOptions вызван:",{options,stepContainerId});
+const container=document.getElementById(stepContainerId);
+if(!container){
+console.error("Контейнер не найден:",stepContainerId);
+return;
+}
+if(!options||!options.length){
+console.error("Нет опций для рендеринга");
+container.innerHTML='<p style="color: #fff; padding: 20px;">Нет доступных опций</p>';
+return;
+}
+container.innerHTML=options.map(opt=>`
+    <div class="custom-option" data-value="${opt.value}" data-label="${opt.label}">
+      <img src="${opt.image||'icons/empty.png'}" alt="${opt.label}">
+      <div class="option-text">
+        <span class="option-title">${opt.label}</span>
+        ${opt.sub?`<span class="option-sub">${opt.sub}</span>`:""}
+      </div>
+    </div>
+  `).join("");
+console.log("HTML создан, количество опций:",options.length);
+const isEventsSection=options.some(opt=>
+opt.value==='mafia'||opt.value==='cake-pops'||opt.value==='disco90'||
+opt.value==='vine-painting'||opt.value==='burger-cooking'
+);
+if(isEventsSection){
+container.innerHTML +=`
+      <div class="review-cta-box" style="margin-top: 20px; padding: 20px; text-align: center;">
+        <p class="review-cta-subtitle" style="margin: 0 0 10px 0; color: var(--accent-color); font-weight: 600;">Нам это важно!</p>
+        <button id="openReviewFormInline" class="review-cta-btn" style="background: var(--accent-color); color: #fff; border: none; padding: 12px 24px; border-radius: 8px; font-size: 1rem; cursor: pointer; transition: all 0.3s ease;">Оставить отзыв</button>
+      </div>
+    `;
+}
+if(backCallback){
+container.innerHTML +=`
+      <div class="custom-option go-back" style="justify-content:center;" data-back="true">
+        &larr; Вернуться
+      </div>
+    `;
+}
+container.querySelectorAll(".custom-option").forEach(el=>{
+if(el.dataset.back==="true"){
+el.addEventListener("click",()=>{
+selectedPath.pop();
+backCallback();
+});
+}else{
+el.addEventListener("click",()=>{
+const value=el.dataset.value;
+const label=el.dataset.label;
+const opt=options.find(o=>o.value===value);
+selectedPath.push(label);
+window.selectedPath=selectedPath;
+lastSelected=opt;
+window.lastSelected=opt;
+onSelect(opt);
+});
+}
+});
+if(isEventsSection){
+const reviewBtn=container.querySelector('#openReviewFormInline');
+if(reviewBtn){
+reviewBtn.addEventListener('click',function(e){
+e.preventDefault();
+const reviewFormModal=document.getElementById('reviewFormModal');
+if(reviewFormModal){
+reviewFormModal.classList.add('active');
+reviewFormModal.setAttribute('aria-hidden','false');
+console.log('📝 Форма отзыва открыта из раздела мероприятий');
+}
+});
+}
+}
+}
+function handleSelection(opt){
+if(opt.children&&opt.children.length>0){
+const step1=document.getElementById("step1");
+const step2=document.getElementById("step2");
+const step3=document.getElementById("step3");
+let nextContainer;
+if(step1.style.display!=="none"){
+step1.style.display="none";
+step2.style.display="block";
+nextContainer="step2";
+}else if(step2.style.display!=="none"){
+step2.style.display="none";
+step3.style.display="block";
+nextContainer="step3";
+}else{
+step3.style.display="block";
+nextContainer="step3";
+}
+renderOptions(opt.children,nextContainer,handleSelection,()=>{
+document.getElementById(nextContainer).style.display="none";
+if(nextContainer==="step2")step1.style.display="block";
+if(nextContainer==="step3")step2.style.display="block";
+});
+}else{
+showFinalFields(opt);
+}
+}
+function showFinalFields(opt=lastSelected){
+console.log('showFinalFields called with opt:',opt);
+console.log('opt.label:',opt?.label);
+console.log('selectedPath:',selectedPath);
+document.getElementById("step1").style.display="none";
+document.getElementById("step2").style.display="none";
+document.getElementById("step3").style.display="none";
+const finalFields=document.getElementById("finalFields");
+finalFields.style.display="block";
+const pathText=selectedPath.join(" → ");
+const isKids=selectedPath.includes("Детские");
+const isFight=selectedPath.includes("Единоборства");
+const htmlContent=`
+    <form id="finalStepForm">
+      ${opt?.fimage?`
+        <div class="form-image-wrapper">
+          <img src="${opt.fimage}" alt="" class="form-image">
+          <div class="form-image-gradient"></div>
+        </div>
+      `:""}
+      <div class="breadcrumb-info">
+        <strong>Вы хотите оставить заявку:</strong><br>${pathText}
+      </div>
+      ${opt?.label?`<h2 class="final-fields-title">${opt.label}</h2>`:""}
+      ${opt?.desc?`<p class="form-description">${opt.desc}</p>`:""}`;
+console.log('Generated HTML includes h2:',htmlContent.includes('<h2'));
+console.log('HTML snippet:',htmlContent.substring(htmlContent.indexOf('breadcrumb'),htmlContent.indexOf('breadcrumb')+ 200));
+finalFields.innerHTML=htmlContent + `
+      ${opt?.timetable?`<div class="form-timetable"><strong>📅 Расписание:</strong> ${opt.timetable}</div>`:""}
+      ${opt?.price?`<div class="form-price"><strong>💰 Стоимость:</strong> ${opt.price}</div>`:""}
+      ${opt?.fulldesc?`<button type="button" class="show-fulldesc-btn">Подробнее &rarr;</button>`:""}
+      <div class="custom-option go-back" style="justify-content:center;" data-back="true">
+        &larr; Вернуться
+      </div>
+      ${isKids||isFight?`
+        <input type="number" name="child_age" placeholder="Возраст ребенка (лет)" min="3" max="16" required>
+        <input type="text" name="child_name" placeholder="Имя ребенка" required>
+      `:""}
+      <input type="text" name="fullname" placeholder="Имя Фамилия" required>
+      <input type="tel" id="phoneInput" name="phone" placeholder="+7 999 777-66-55" required>
+      <input type="email" name="email" placeholder="Email (необязательно)">
+      <input type="date" name="date" required>
+      <button type="submit">Отправить</button>
+
+      ${['disco90','wine_painting','mafia','burger','bunker'].includes(opt?.value)?`
+        <div class="share-buttons-container">
+          <p class="share-text">Пригласи друга и получи бонус!</p>
+          <button type="button" class="share-event-btn" data-event="${opt.value}" data-event-title="${opt.label}">
+            <svg width="20" height="20" viewBox="0 0 24 24" fill="currentColor">
+              <path d="M18 16.08c-.76 0-1.44.3-1.96.77L8.91 12.7c.05-.23.09-.46.09-.7s-.04-.47-.09-.7l7.05-4.11c.54.5 1.25.81 2.04.81 1.66 0 3-1.34 3-3s-1.34-3-3-3-3 1.34-3 3c0 .24.04.47.09.7L8.04 9.81C7.5 9.31 6.79 9 6 9c-1.66 0-3 1.34-3 3s1.34 3 3 3c.79 0 1.5-.31 2.04-.81l7.12 4.16c-.05.21-.08.43-.08.65 0 1.61 1.31 2.92 2.92 2.92 1.61 0 2.92-1.31 2.92-2.92s-1.31-2.92-2.92-2.92z"/>
+            </svg>
+            Поделиться событием
+          </button>
+        </div>
+      `:""}
+    </form>
+  `;
+finalFields.querySelector("input[name='fullname']").focus();
+const fulldescBtn=finalFields.querySelector(".show-fulldesc-btn");
+if(fulldescBtn&&opt?.fulldesc){
+fulldescBtn.addEventListener("click",()=>{
+openFulldescModal(opt.fulldesc);
+});
+}
+const shareEventBtn=finalFields.querySelector(".share-event-btn");
+if(shareEventBtn){
+shareEventBtn.addEventListener("click",(e)=>{
+e.preventDefault();
+const eventHash=shareEventBtn.dataset.event;
+const eventTitle=shareEventBtn.dataset.eventTitle;
+if(typeof window.openShareModal==='function'){
+window.openShareModal(eventHash,eventTitle);
+}
+});
+}
+finalFields.querySelector("[data-back='true']").addEventListener("click",()=>{
+finalFields.style.display="none";
+selectedPath.pop();
+if(selectedPath.length===0){
+document.getElementById("step1").style.display="block";
+}else if(selectedPath.length===1){
+const parentValue=selectedPath[0];
+const parent=formConfig.main.find(item=>item.label===parentValue);
+if(parent&&parent.children){
+document.getElementById("step1").style.display="none";
+document.getElementById("step2").style.display="block";
+renderOptions(parent.children,"step2",handleSelection,()=>{
+document.getElementById("step2").style.display="none";
+document.getElementById("step1").style.display="block";
+});
+}
+}else if(selectedPath.length===2){
+const grandParentLabel=selectedPath[0];
+const parentLabel=selectedPath[1];
+const grandParent=formConfig.main.find(item=>item.label===grandParentLabel);
+if(grandParent&&grandParent.children){
+const parent=grandParent.children.find(item=>item.label===parentLabel);
+if(parent&&parent.children){
+document.getElementById("step1").style.display="none";
+document.getElementById("step2").style.display="none";
+document.getElementById("step3").style.display="block";
+renderOptions(parent.children,"step3",handleSelection,()=>{
+document.getElementById("step3").style.display="none";
+document.getElementById("step2").style.display="block";
+});
+}
+}
+}else if(selectedPath.length===3){
+const level1=selectedPath[0];
+const level2=selectedPath[1];
+const level3=selectedPath[2];
+const parent1=formConfig.main.find(item=>item.label===level1);
+if(parent1?.children){
+const parent2=parent1.children.find(item=>item.label===level2);
+if(parent2?.children){
+const parent3=parent2.children.find(item=>item.label===level3);
+if(parent3?.children){
+document.getElementById("step1").style.display="none";
+document.getElementById("step2").style.display="none";
+document.getElementById("step3").style.display="block";
+renderOptions(parent3.children,"step3",handleSelection,()=>{
+document.getElementById("step3").style.display="none";
+document.getElementById("step2").style.display="block";
+});
+}
+}
+}
+}
+});
+const phoneInput=document.getElementById("phoneInput");
+if(phoneInput){
+phoneInput.addEventListener("input",()=>{
+let val=phoneInput.value.replace(/\D/g,"");
+if(val.startsWith("8"))val="7" + val.slice(1);
+if(!val.startsWith("7"))val="7" + val;
+let formatted="+7";
+if(val.length>1)formatted +=" " + val.substring(1,4);
+if(val.length>=5)formatted +=" " + val.substring(4,7);
+if(val.length>=8)formatted +="-" + val.substring(7,9);
+if(val.length>=10)formatted +="-" + val.substring(9,11);
+phoneInput.value=formatted;
+});
+}
+attachFormSubmitHandler();
+}
+window.showFinalFields=showFinalFields;
+window.renderOptions=renderOptions;
+window.handleSelection=handleSelection;
+function attachFormSubmitHandler(){
+const formEl=document.getElementById("finalStepForm");
+if(!formEl)return;
+formEl.addEventListener("submit",async(e)=>{
+e.preventDefault();
+const formData=new FormData(formEl);
+formEl.querySelectorAll("input").forEach(i=>clearError(i));
+let valid=true;
+const fullnameInput=formEl.querySelector("input[name='fullname']");
+const fullname=fullnameInput.value.trim();
+const nameRegex=/^[a-zA-Zа-яА-ЯёЁ\s\-]{2,100}$/u;
+if(!nameRegex.test(fullname)){
+showError(fullnameInput,"Введите имя (только буквы, пробелы и дефисы, до 100 символов)");
+valid=false;
+}
+const phoneInput=formEl.querySelector("input[name='phone']");
+const phone=phoneInput.value.trim();
+const phoneRegex=/^\+7\s\d{3}\s\d{3}-\d{2}-\d{2}$/;
+if(!phoneRegex.test(phone)){
+showError(phoneInput,"Введите телефон в формате +7 999 123-45-67");
+valid=false;
+}
+const childAgeInput=formEl.querySelector("input[name='child_age']");
+if(childAgeInput){
+const ageNum=parseInt(childAgeInput.value,10);
+if(isNaN(ageNum)||ageNum<3||ageNum>16){
+showError(childAgeInput,"Возраст ребёнка от 3 до 16 лет");
+valid=false;
+}
+}
+const emailInput=formEl.querySelector("input[name='email']");
+if(emailInput&&emailInput.value.trim()!==""){
+const email=emailInput.value.trim();
+const emailRegex=/^[^\s@]+@[^\s@]+\.[^\s@]+$/;
+if(!emailRegex.test(email)){
+showError(emailInput,"Введите корректный email");
+valid=false;
+}
+}
+if(!valid)return;
+formData.append("path",selectedPath.join(" → "));
+const params=new URLSearchParams(window.location.search);
+["utm_source","utm_medium","utm_campaign","utm_term","utm_content","ref"].forEach(key=>{
+if(params.get(key))formData.append(key,params.get(key));
+});
+formData.append("user_agent",navigator.userAgent);
+formData.append("platform",navigator.platform);
+grecaptcha.ready(()=>{
+grecaptcha.execute("6LdV7dQbAAAAAE8FTLy4eaMAEVMBi8jMOvaFMdHk",{action:"submit"})
+.then(async(token)=>{
+formData.append("recaptcha_token",token);
+try{
+const response=await fetch("https://i.pride34.ru/sendlead/send.php",{
+method:"POST",
+body:formData
+});
+const result=await response.json();
+console.log("Ответ сервера:",result);
+if(result.success){
+const name=formData.get("fullname")||"";
+window.location.href="thx.html?name=" + encodeURIComponent(name);
+}else{
+alert("Ошибка: " +(result.error||"Не удалось отправить"));
+}
+}catch(err){
+console.error("Ошибка соединения:",err);
+alert("Ошибка соединения. Попробуйте позже.");
+}
+});
+});
+});
+}
+document.addEventListener("DOMContentLoaded",()=>{
+const bookingPanel=document.getElementById("bookingPanel");
+const backdrop=document.getElementById("offcanvasBackdrop");
+const openBtn=document.getElementById("openBooking");
+const closeBtn=document.getElementById("closeBooking");
+function closeOffcanvas(){
+bookingPanel.classList.remove("active");
+backdrop.classList.remove("show");
+}
+if(openBtn){
+openBtn.addEventListener("click",()=>{
+bookingPanel.classList.add("active");
+backdrop.classList.add("show");
+loadFormConfig();
+});
+}
+if(closeBtn){
+closeBtn.addEventListener("click",closeOffcanvas);
+}
+if(backdrop){
+backdrop.addEventListener("click",closeOffcanvas);
+}
+document.addEventListener("keydown",(e)=>{
+if(e.key==='Escape'&&bookingPanel.classList.contains('active')){
+closeOffcanvas();
+}
+});
+});
+const SLIDE_IMAGE_PROBES={
+avif:'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAADrbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAAB5pbG9jAAAAAEQAAAEAAQAAAAEAAAETAAAAIAAAAChpaW5mAAAAAAABAAAAGmluZmUCAAAAAAEAAGF2MDFDb2xvcgAAAABqaXBycAAAAEtpcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAABdpcG1hAAAAAAAAAAEAAQQBAoMEAAAAKG1kYXQSAAoIGAAGiAhoNCAyEh7Hh4VZ3///4sAAAJA1jjx+rQ==',
+webp:'data:image/webp;base64,UklGRiQAAABXRUJQVlA4IBgAAAAwAQCdASoBAAEAB0CWJaQAA3AA/u+5AAA='
+};
+function supportsImageFormat(format){
+return new Promise(resolve=>{
+const probe=new Image();
+probe.onload=()=>resolve(probe.width>0);
+probe.onerror=()=>resolve(false);
+probe.src=SLIDE_IMAGE_PROBES[format];
+});
+}
+async function supportedSlideFormats(){
+const formats=Object.keys(SLIDE_IMAGE_PROBES);
+const supported=await Promise.all(formats.map(supportsImageFormat));
+return formats.filter((format,i)=>supported[i]);
+}
+function pickFromSrcset(srcset,targetWidth){
+const candidates=srcset.split(',')
+.map(candidate=>{
+const[url,width]=candidate.trim().split(/\s+/);
+return{url,width:parseInt(width,10)};
+})
+.sort((a,b)=>a.width - b.width);
+const fitting=candidates.find(candidate=>candidate.width>=targetWidth);
+return(fitting||candidates[candidates.length - 1]).url;
+}
+document.addEventListener("DOMContentLoaded",async()=>{
+const isMobile=window.innerWidth<=768;
+const hasResponsive=document.querySelector('.slide__img[data-srcset-avif], .slide__img[data-srcset-webp]');
+const formats=hasResponsive?await supportedSlideFormats():[];
+const targetWidth=window.innerWidth*Math.min(window.devicePixelRatio||1,2);
+document.querySelectorAll(".slide__img-wrap").forEach(wrap=>{
+let img=wrap.dataset.img;
+if(!img)return;
+const imgEl=wrap.querySelector('.slide__img');
+const format=imgEl&&formats.find(name=>imgEl.hasAttribute(`data-srcset-${name}`));
+if(format){
+img=pickFromSrcset(imgEl.getAttribute(`data-srcset-${format}`),targetWidth);
+wrap.dataset.img=img;
+}else if(isMobile){
+img=img.replace(/(\.\w+)$/,"m$1");
+}
+if(imgEl){
+imgEl.style.backgroundImage=`url("${img}")`;
+}
+});
+});
+async function loadPartial(url){
+const name=url.split('?')[0].replace(/\.html$/,'');
+const template=document.getElementById(`partial-${name}`);
+if(template)return template.innerHTML;
+const response=await fetch(url,url.includes('?v=')?{}:{cache:'no-cache'});
+return response.text();
+}
+document.addEventListener('DOMContentLoaded',()=>{
+const btnOpen=document.getElementById('sportBtn');
+const wantSportBtn=document.getElementById('wantSportBtn');
+const modal=document.getElementById('sportModal');
+if(!modal)return;
+const loadModalContent=async()=>{
+if(modal.children.length>1)return;
+try{
+const html=await loadPartial('sportModal.html?v=abb069eaa3');
+modal.innerHTML=html;
+const prevBtn=modal.querySelector('.slides-nav__button--prev, [data-sport-prev]');
+const nextBtn=modal.querySelector('.slides-nav__button--next, [data-sport-next]');
+if(prevBtn){
+prevBtn.classList.add('arrow-hidden');
+prevBtn.classList.remove('arrow-visible');
+}
+if(nextBtn){
+nextBtn.classList.add('arrow-visible');
+nextBtn.classList.remove('arrow-hidden');
+}
+}catch(error){
+console.error('Ошибка загрузки sportModal.html:',error);
+}
+};
+const openModal=async(e)=>{
+e?.preventDefault?.();
+await loadModalContent();
+const content=document.getElementById('sportContent');
+const videoBg=modal.querySelector('.sport-bg');
+const slider=document.getElementById('sportSlider');
+if(!content||!slider)return;
+document.body.classList.add('modal-open');
+modal.classList.add('active');
+window.PrideURLHandler?.updateHashOnModalOpen('sportModal');
+const statsSection=modal.querySelector('.sport-stats');
+const introText=modal.querySelector('.sport-intro');
+const cards=slider.querySelectorAll('.sport-card');
+gsap.set(videoBg,{opacity:0});
+gsap.set(content,{autoAlpha:0,y:20});
+gsap.set(cards,{opacity:0,y:30,visibility:'hidden'});
+if(statsSection){
+gsap.set(statsSection,{visibility:'visible',opacity:0});
+gsap.set(statsSection.querySelectorAll('div'),{opacity:0,scale:0.8,y:20});
+}
+if(introText){
+gsap.set(introText,{visibility:'visible',opacity:0,y:20});
+}
+const tl=gsap.timeline();
+tl.to(videoBg,{opacity:1,duration:0.8,ease:'power2.out'},0)
+.to(content,{autoAlpha:1,y:0,duration:0.6,ease:'power2.out'},0.2);
+if(statsSection){
+tl.to(statsSection,{opacity:1,duration:0.3},0.5)
+.to(statsSection.querySelectorAll('div'),{
+opacity:1,scale:1,y:0,
+duration:1.0,ease:'power1.out',stagger:0.1
+},0.5);
+}
+if(introText){
+tl.to(introText,{opacity:1,y:0,duration:1.0,ease:'power1.out'},0.7);
+}
+const hideIntroTime=3.5;
+tl.to(cards,{
+opacity:1,y:0,visibility:'visible',
+duration:0.5,ease:'power2.out',stagger:0.1
+},hideIntroTime + 1.2);
+const prevBtn=modal.querySelector('[data-sport-prev]');
+const nextBtn=modal.querySelector('[data-sport-next]');
+const step=()=>{
+const card=slider.querySelector('.sport-card');
+const gap=parseFloat(getComputedStyle(slider).gap||20);
+return(card?.offsetWidth||320)+(isNaN(gap)?20:gap);
+};
+if(prevBtn&&!prevBtn.hasAttribute('data-initialized')){
+prevBtn.setAttribute('data-initialized','true');
+prevBtn.addEventListener('click',()=>slider.scrollBy({left:-step(),behavior:'smooth'}));
+}
+if(nextBtn&&!nextBtn.hasAttribute('data-initialized')){
+nextBtn.setAttribute('data-initialized','true');
+nextBtn.addEventListener('click',()=>slider.scrollBy({left:step(),behavior:'smooth'}));
+}
+};
+const closeModal=()=>{
+const content=document.getElementById('sportContent');
+const videoBg=modal.querySelector('.sport-bg');
+const tl=gsap.timeline({
+onComplete:()=>{
+modal.classList.remove('active');
+document.body.classList.remove('modal-open');
+}
+});
+tl.to(content,{autoAlpha:0,y:-20,duration:0.8,ease:'power2.inOut'},0)
+.to(videoBg,{opacity:0,duration:1.0,ease:'power2.inOut'},0);
+};
+if(btnOpen)btnOpen.addEventListener('click',openModal);
+if(wantSportBtn)wantSportBtn.addEventListener('click',openModal);
+modal.addEventListener('click',(e)=>{
+if(e.target.id==='closeSport'){
+e.preventDefault();
+closeModal();
+}
+if(e.target.classList.contains('booking-trigger')){
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const gymOption=document.querySelector('[data-value="gym"]');
+if(gymOption){
+gymOption.click();
+}
+});
+}
+}
+}
+if(e.target.classList.contains('trainer-selector-trigger')){
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const gymOption=document.querySelector('[data-value="gym"]');
+if(gymOption){
+gymOption.click();
+setTimeout(()=>{
+const trainerOption=document.querySelector('[data-value="trainer"]');
+if(trainerOption){
+trainerOption.click();
+}
+},100);
+}
+});
+}
+}
+}
+if(e.target.classList.contains('fight-selector-trigger')){
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const sectionOption=document.querySelector('[data-value="section"]');
+if(sectionOption){
+sectionOption.click();
+setTimeout(()=>{
+const fightOption=document.querySelector('[data-value="fight"]');
+if(fightOption){
+fightOption.click();
+setTimeout(()=>{
+const sectionsOption=document.querySelector('[data-value="sections"]');
+if(sectionsOption){
+sectionsOption.click();
+}
+},100);
+}
+},100);
+}
+});
+}
+}
+}
+if(e.target.classList.contains('trainers-link')||(e.target.href&&e.target.href.includes('pride34.ru/trainers/'))){
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const sectionOption=document.querySelector('[data-value="section"]');
+if(sectionOption){
+sectionOption.click();
+setTimeout(()=>{
+const fightOption=document.querySelector('[data-value="fight"]');
+if(fightOption){
+fightOption.click();
+setTimeout(()=>{
+const trainersOption=document.querySelector('[data-value="trainers"]');
+if(trainersOption){
+trainersOption.click();
+}
+},100);
+}
+},100);
+}
+});
+}
+}
+}
+if(e.target.href&&e.target.href.includes('pride34.ru/classes/hokkey/')){
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const sectionOption=document.querySelector('[data-value="section"]');
+if(sectionOption){
+sectionOption.click();
+setTimeout(()=>{
+const kidsOption=document.querySelector('[data-value="kids"]');
+if(kidsOption){
+kidsOption.click();
+setTimeout(()=>{
+const hockeyOption=document.querySelector('[data-value="hockey"]');
+if(hockeyOption){
+hockeyOption.click();
+}
+},100);
+}
+},100);
+}
+});
+}
+}
+}
+if(e.target.href&&e.target.href.includes('pride34.ru/classes/figurnoe-katanie/')){
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const sectionOption=document.querySelector('[data-value="section"]');
+if(sectionOption){
+sectionOption.click();
+setTimeout(()=>{
+const kidsOption=document.querySelector('[data-value="kids"]');
+if(kidsOption){
+kidsOption.click();
+setTimeout(()=>{
+const skatingOption=document.querySelector('[data-value="skating"]');
+if(skatingOption){
+skatingOption.click();
+}
+},100);
+}
+},100);
+}
+});
+}
+}
+}
+if(e.target.href&&e.target.href.includes('pride34.ru/classes/football/')){
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const sectionOption=document.querySelector('[data-value="section"]');
+if(sectionOption){
+sectionOption.click();
+setTimeout(()=>{
+const kidsOption=document.querySelector('[data-value="kids"]');
+if(kidsOption){
+kidsOption.click();
+setTimeout(()=>{
+const footballOption=document.querySelector('[data-value="football_kids"]');
+if(footballOption){
+footballOption.click();
+}
+},100);
+}
+},100);
+}
+});
+}
+}
+}
+});
+const trainersBtn=document.getElementById('trainersBtn');
+const trialBtn=document.getElementById('trialBtn');
+if(trainersBtn){
+trainersBtn.addEventListener('click',(e)=>{
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const gymOption=document.querySelector('[data-value="gym"]');
+if(gymOption){
+gymOption.click();
+setTimeout(()=>{
+const trainerOption=document.querySelector('[data-value="trainer"]');
+if(trainerOption){
+trainerOption.click();
+}
+},100);
+}
+});
+}
+}
+});
+}
+if(trialBtn){
+trialBtn.addEventListener('click',(e)=>{
+e.preventDefault();
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const gymOption=document.querySelector('[data-value="gym"]');
+if(gymOption){
+gymOption.click();
+setTimeout(()=>{
+const trialOption=document.querySelector('[data-value="trial"]');
+if(trialOption){
+trialOption.click();
+}
+},100);
+}
+});
+}
+}
+});
+}
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&modal.classList.contains('active'))closeModal();
+});
+const scheduleModal=document.getElementById('scheduleModal');
+const loadScheduleContent=async()=>{
+if(scheduleModal.children.length>0)return;
+try{
+const html=await loadPartial('schedule-fight.html');
+scheduleModal.innerHTML=html;
+const closeBtn=scheduleModal.querySelector('#closeSchedule');
+if(closeBtn){
+closeBtn.addEventListener('click',closeSchedule);
+}
+scheduleModal.querySelectorAll('.class-link').forEach(link=>{
+link.addEventListener('click',(e)=>{
+e.preventDefault();
+const className=e.currentTarget.getAttribute('data-class');
+closeSchedule();
+setTimeout(()=>{
+openBookingForClass(className);
+},600);
+});
+});
+}catch(error){
+console.error('Ошибка загрузки schedule-fight.html:',error);
+}
+};
+const openSchedule=async()=>{
+await loadScheduleContent();
+scheduleModal.classList.add('active');
+};
+const closeSchedule=()=>{
+scheduleModal.classList.remove('active');
+};
+modal.addEventListener('click',(e)=>{
+if(e.target.classList.contains('schedule-trigger')){
+e.preventDefault();
+openSchedule();
+}
+});
+const openBookingForClass=(className)=>{
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(bookingPanel&&backdrop){
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const sectionOption=document.querySelector('[data-value="section"]');
+if(sectionOption){
+sectionOption.click();
+setTimeout(()=>{
+const fightOption=document.querySelector('[data-value="fight"]');
+if(fightOption){
+fightOption.click();
+setTimeout(()=>{
+const specificClass=document.querySelector(`[data-value="${className}"]`);
+if(specificClass){
+specificClass.click();
+}
+},100);
+}
+},100);
+}
+});
+}
+}
+};
+});
+document.addEventListener('DOMContentLoaded',()=>{
+const themeToggle=document.getElementById('themeToggle');
+const savedTheme=localStorage.getItem('theme')||'light';
+console.log('🎨 Переключатель темы инициализирован');
+console.log('💾 Сохраненная тема:',savedTheme);
+console.log('🔘 Кнопка найдена:',themeToggle?'ДА':'НЕТ');
+const updateLogo=(isLight)=>{
+const logoImg=document.querySelector('.logo-container img');
+if(logoImg){
+if(isLight){
+logoImg.setAttribute('src','logo-black.webp');
+logoImg.setAttribute('srcset','logo-black.webp 1x, logo-2x-black.webp 2x');
+console.log('🎨 Логотип: черный (светлая тема)');
+}else{
+logoImg.setAttribute('src','logo.webp');
+logoImg.setAttribute('srcset','logo.webp 1x, logo-2x.webp 2x');
+console.log('🎨 Логотип: белый (тёмная тема)');
+}
+}
+};
+if(savedTheme==='light'){
+document.body.classList.add('light-theme');
+console.log('☀️ Применена светлая тема');
+}else{
+document.body.classList.remove('light-theme');
+console.log('🌙 Применена тёмная тема');
+}
+setTimeout(()=>updateLogo(savedTheme==='light'),100);
+if(themeToggle){
+themeToggle.addEventListener('click',()=>{
+document.body.classList.toggle('light-theme');
+const currentTheme=document.body.classList.contains('light-theme')?'light':'dark';
+localStorage.setItem('theme',currentTheme);
+updateLogo(currentTheme==='light');
+console.log('🔄 Тема переключена на:',currentTheme==='light'?'☀️ СВЕТЛУЮ':'🌙 ТЁМНУЮ');
+});
+console.log('✅ Обработчик клика установлен');
+}else{
+console.error('❌ ОШИБКА: Кнопка #themeToggle не найдена!');
+}
+const btnOpen=document.getElementById('sportBtn');
+const modal=document.getElementById('sportModal');
+const content=document.getElementById('sportContent');
+const videoBg=modal?modal.querySelector('.sport-bg'):null;
+const btnClose=document.getElementById('closeSport');
+const slider=document.getElementById('sportSlider');
+const panels=modal?modal.querySelectorAll('.sport-transition__panel'):[];
+if(!btnOpen||!modal||!content||!slider)return;
+window.addEventListener('load',()=>document.body.classList.add('loaded'));
+const openModal=(e)=>{
+e?.preventDefault?.();
+document.body.classList.add('modal-open');
+modal.classList.add('active');
+gsap.set(panels,{yPercent:100});
+gsap.set(videoBg,{opacity:0});
+gsap.set(content,{autoAlpha:0,y:28,scale:0.985});
+const tl=gsap.timeline();
+tl.fromTo('.sport-panel.diagonal',
+{yPercent:-120,rotate:-15,scale:2},
+{yPercent:0,duration:1.8,ease:'power2.out'}
+)
+.to(panels,{yPercent:0,duration:0.7,ease:'power2.out',stagger:0.18})
+.to(panels,{yPercent:-100,duration:1.0,ease:'power2.in',stagger:0.18})
+.to(videoBg,{opacity:1,duration:2.2,ease:'power1.out'},'-=0.8')
+.to(content,{autoAlpha:1,y:0,scale:1,duration:1.4,ease:'power2.out'},'-=1.2')
+.from(slider.querySelectorAll('.sport-card'),{
+autoAlpha:0,y:36,duration:0.9,ease:'power2.out',stagger:0.4
+},'-=0.4');
+};
+const closeModal=()=>{
+const cards=Array.from(slider.querySelectorAll('.sport-card')).reverse();
+const tl=gsap.timeline({
+onComplete:()=>{
+modal.classList.remove('active');
+document.body.classList.remove('modal-open');
+gsap.set('.sport-panel.diagonal',{yPercent:-120,rotate:-15,scale:2});
+gsap.set(panels,{yPercent:100});
+}
+});
+tl.to(cards,{autoAlpha:0,y:36,duration:0.7,ease:'power2.in',stagger:0.35})
+.to(content,{autoAlpha:0,y:28,scale:0.985,duration:0.9,ease:'power2.in'},'-=0.3')
+.to(videoBg,{opacity:0,duration:0.9,ease:'power2.in'},'-=0.7')
+.fromTo(panels,{yPercent:100},{yPercent:0,duration:0.7,ease:'power2.out',stagger:0.18},'-=0.5');
+};
+btnOpen .addEventListener('click',openModal);
+btnClose.addEventListener('click',(e)=>{e.preventDefault();closeModal();});
+document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active'))closeModal();});
+const prevBtn=modal.querySelector('.sport-slider-wrap .slides-nav__button--prev');
+const nextBtn=modal.querySelector('.sport-slider-wrap .slides-nav__button--next');
+const step=()=>{
+const card=slider.querySelector('.sport-card');
+const gap=parseFloat(getComputedStyle(slider).gap||20);
+return(card?.offsetWidth||320)+(isNaN(gap)?20:gap);
+};
+prevBtn?.addEventListener('click',()=>slider.scrollBy({left:-step(),behavior:'smooth'}));
+nextBtn?.addEventListener('click',()=>slider.scrollBy({left:step(),behavior:'smooth'}));
+let isDown=false,isDragging=false,startX=0,startScroll=0;
+slider.style.cursor='grab';
+slider.addEventListener('pointerdown',(e)=>{
+isDown=true;isDragging=false;
+startX=e.clientX;startScroll=slider.scrollLeft;
+slider.setPointerCapture(e.pointerId);
+slider.classList.add('is-dragging');slider.style.cursor='grabbing';
+document.body.style.userSelect='none';
+});
+slider.addEventListener('pointermove',(e)=>{
+if(!isDown)return;
+const dx=e.clientX - startX;
+if(Math.abs(dx)>3)isDragging=true;
+slider.scrollLeft=startScroll - dx;
+});
+const endDrag=(e)=>{
+isDown=false;slider.classList.remove('is-dragging');slider.style.cursor='grab';
+slider.releasePointerCapture?.(e.pointerId);
+document.body.style.userSelect='';
+};
+slider.addEventListener('pointerup',endDrag);
+slider.addEventListener('pointercancel',endDrag);
+slider.addEventListener('pointerleave',endDrag);
+slider.addEventListener('click',(e)=>{
+if(isDragging){e.preventDefault();e.stopPropagation();}
+},true);
+slider.addEventListener('wheel',(e)=>{
+if(Math.abs(e.deltaY)>=Math.abs(e.deltaX)){
+slider.scrollLeft +=e.deltaY;
+e.preventDefault();
+}
+},{passive:false});
+});
+document.addEventListener('DOMContentLoaded',async()=>{
+const btnOpen=document.getElementById('restBtn');
+const wantrestBtn=document.getElementById('wantrestBtn');
+const modal=document.getElementById('restModal');
+if(!modal)return;
+try{
+const html=await loadPartial('restModal.html?v=deb9f91a7c');
+modal.innerHTML=html;
+const prevBtn=modal.querySelector('.slides-nav__button--prev');
+const nextBtn=modal.querySelector('.slides-nav__button--next');
+if(prevBtn){
+prevBtn.classList.add('arrow-hidden');
+prevBtn.classList.remove('arrow-visible');
+}
+if(nextBtn){
+nextBtn.classList.add('arrow-visible');
+nextBtn.classList.remove('arrow-hidden');
+}
+}catch(err){
+console.error('Ошибка загрузки restModal.html:',err);
+return;
+}
+const content=document.getElementById('restContent');
+const videoBg=modal.querySelector('.rest-bg');
+const btnClose=document.getElementById('closeRest');
+const slider=document.getElementById('restSlider');
+const panels=modal.querySelectorAll('.rest-transition__panel');
+if(!content||!slider)return;
+const openModal=(e)=>{
+e?.preventDefault?.();
+document.body.classList.add('modal-open');
+modal.classList.add('active');
+window.PrideURLHandler?.updateHashOnModalOpen('restModal');
+gsap.set(videoBg,{opacity:0});
+gsap.set(content,{autoAlpha:0,y:20});
+gsap.set(slider.querySelectorAll('.rest-card'),{opacity:0,y:30});
+const tl=gsap.timeline();
+tl.to(videoBg,{opacity:1,duration:0.8,ease:'power2.out'},0)
+.to(content,{autoAlpha:1,y:0,duration:0.6,ease:'power2.out'},0.2)
+.to(slider.querySelectorAll('.rest-card'),{
+opacity:1,y:0,duration:0.5,ease:'power2.out',stagger:0.1
+},0.4);
+};
+const closeModal=()=>{
+const tl=gsap.timeline({
+onComplete:()=>{
+modal.classList.remove('active');
+document.body.classList.remove('modal-open');
+}
+});
+tl.to(content,{autoAlpha:0,y:-20,duration:0.8,ease:'power2.inOut'},0)
+.to(videoBg,{opacity:0,duration:1.0,ease:'power2.inOut'},0);
+};
+if(btnOpen)btnOpen.addEventListener('click',openModal);
+if(wantrestBtn)wantrestBtn.addEventListener('click',openModal);
+btnClose?.addEventListener('click',(e)=>{e.preventDefault();closeModal();});
+document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active'))closeModal();});
+const prevBtn=modal.querySelector('.rest-slider-wrap .slides-nav__button--prev');
+const nextBtn=modal.querySelector('.rest-slider-wrap .slides-nav__button--next');
+const step=()=>{
+const card=slider.querySelector('.rest-card');
+const gap=parseFloat(getComputedStyle(slider).gap||20);
+return(card?.offsetWidth||320)+(isNaN(gap)?20:gap);
+};
+prevBtn?.addEventListener('click',()=>slider.scrollBy({left:-step(),behavior:'smooth'}));
+nextBtn?.addEventListener('click',()=>slider.scrollBy({left:step(),behavior:'smooth'}));
+let isDown=false,isDragging=false,startX=0,startScroll=0;
+slider.style.cursor='grab';
+slider.addEventListener('pointerdown',(e)=>{
+const clickedButton=e.target.closest('.flip-card-button, .flip-close-button, button, a');
+if(clickedButton){
+console.log('🚫 Клик на кнопке, drag отменен');
+return;
+}
+isDown=true;isDragging=false;
+startX=e.clientX;startScroll=slider.scrollLeft;
+slider.setPointerCapture(e.pointerId);
+slider.classList.add('is-dragging');slider.style.cursor='grabbing';
+document.body.style.userSelect='none';
+});
+slider.addEventListener('pointermove',(e)=>{
+if(!isDown)return;
+const dx=e.clientX - startX;
+if(Math.abs(dx)>3)isDragging=true;
+slider.scrollLeft=startScroll - dx;
+});
+const endDrag=(e)=>{
+isDown=false;
+slider.classList.remove('is-dragging');slider.style.cursor='grab';
+slider.releasePointerCapture?.(e.pointerId);
+document.body.style.userSelect='';
+setTimeout(()=>{isDragging=false;},10);
+};
+slider.addEventListener('pointerup',endDrag);
+slider.addEventListener('pointercancel',endDrag);
+slider.addEventListener('pointerleave',endDrag);
+slider.addEventListener('click',(e)=>{
+const clickedFlipButton=e.target.closest('.flip-card-button, .flip-close-button');
+if(clickedFlipButton){
+console.log('✅ Клик на кнопке разрешен');
+return;
+}
+if(isDragging){
+console.log('🚫 Клик заблокирован, был драг');
+e.preventDefault();
+e.stopPropagation();
+isDragging=false;
+}
+},true);
+slider.addEventListener('wheel',(e)=>{
+if(Math.abs(e.deltaY)>=Math.abs(e.deltaX)){
+slider.scrollLeft +=e.deltaY;
+e.preventDefault();
+}
+},{passive:false});
+});
+document.addEventListener('DOMContentLoaded',()=>{
+const modal=document.getElementById('eventsModal');
+if(!modal)return;
+const waitForContent=setInterval(()=>{
+const content=document.getElementById('eventsContent');
+const videoBg=modal.querySelector('.events-bg');
+const btnClose=document.getElementById('closeEvents');
+const slider=document.getElementById('eventsSlider');
+if(!content||!slider)return;
+clearInterval(waitForContent);
+console.log('✅ Events modal content ready, initializing slider...');
+console.log('🎴 Добавляем исправления для flip-карточек в events слайдере');
+const btnOpen=document.getElementById('eventsBtn');
+if(!btnOpen)return;
+const openModal=(e)=>{
+e?.preventDefault?.();
+document.body.classList.add('modal-open');
+modal.classList.add('active');
+window.PrideURLHandler?.updateHashOnModalOpen('eventsModal');
+gsap.set(videoBg,{opacity:0});
+gsap.set(content,{autoAlpha:0,y:20});
+gsap.set(slider.querySelectorAll('.flip-card-interactive'),{opacity:0,y:30});
+const tl=gsap.timeline();
+tl.to(videoBg,{opacity:1,duration:0.8,ease:'power2.out'},0)
+.to(content,{autoAlpha:1,y:0,duration:0.6,ease:'power2.out'},0.2)
+.to(slider.querySelectorAll('.flip-card-interactive'),{
+opacity:1,y:0,duration:0.5,ease:'power2.out',stagger:0.1
+},0.4);
+};
+const closeModal=()=>{
+const tl=gsap.timeline({
+onComplete:()=>{
+modal.classList.remove('active');
+document.body.classList.remove('modal-open');
+}
+});
+tl.to(content,{autoAlpha:0,duration:0.3,ease:'power2.in'},0)
+.to(videoBg,{opacity:0,duration:0.3,ease:'power2.in'},0);
+};
+btnOpen .addEventListener('click',openModal);
+btnClose?.addEventListener('click',(e)=>{e.preventDefault();closeModal();});
+document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active'))closeModal();});
+const prevBtn=modal.querySelector('.events-slider-wrap .slides-nav__button--prev');
+const nextBtn=modal.querySelector('.events-slider-wrap .slides-nav__button--next');
+const step=()=>{
+const card=slider.querySelector('.flip-card-interactive');
+const gap=parseFloat(getComputedStyle(slider).gap||20);
+return(card?.offsetWidth||320)+(isNaN(gap)?20:gap);
+};
+prevBtn?.addEventListener('click',()=>slider.scrollBy({left:-step(),behavior:'smooth'}));
+nextBtn?.addEventListener('click',()=>slider.scrollBy({left:step(),behavior:'smooth'}));
+let isDown=false,isDragging=false,startX=0,startScroll=0;
+slider.style.cursor='grab';
+slider.addEventListener('pointerdown',(e)=>{
+const clickedButton=e.target.closest('.flip-card-button, .flip-close-button, button, a');
+if(clickedButton){
+console.log('🚫 Клик на кнопке, drag отменен');
+return;
+}
+isDown=true;isDragging=false;
+startX=e.clientX;startScroll=slider.scrollLeft;
+slider.setPointerCapture(e.pointerId);
+slider.classList.add('is-dragging');slider.style.cursor='grabbing';
+document.body.style.userSelect='none';
+});
+slider.addEventListener('pointermove',(e)=>{
+if(!isDown)return;
+const dx=e.clientX - startX;
+if(Math.abs(dx)>3)isDragging=true;
+slider.scrollLeft=startScroll - dx;
+});
+const endDrag=(e)=>{
+isDown=false;
+slider.classList.remove('is-dragging');slider.style.cursor='grab';
+slider.releasePointerCapture?.(e.pointerId);
+document.body.style.userSelect='';
+setTimeout(()=>{isDragging=false;},10);
+};
+slider.addEventListener('pointerup',endDrag);
+slider.addEventListener('pointercancel',endDrag);
+slider.addEventListener('pointerleave',endDrag);
+slider.addEventListener('click',(e)=>{
+const clickedFlipButton=e.target.closest('.flip-card-button, .flip-close-button');
+if(clickedFlipButton){
+console.log('✅ Клик на кнопке разрешен');
+return;
+}
+if(isDragging){
+console.log('🚫 Клик заблокирован, был драг');
+e.preventDefault();
+e.stopPropagation();
+isDragging=false;
+}
+},true);
+slider.addEventListener('wheel',(e)=>{
+if(Math.abs(e.deltaY)>=Math.abs(e.deltaX)){
+slider.scrollLeft +=e.deltaY;
+e.preventDefault();
+}
+},{passive:false});
+const cards=slider.querySelectorAll('.flip-card-interactive');
+const observerOptions={
+root:slider,
+threshold:0.5,
+rootMargin:'-10% 0px -10% 0px'
+};
+const cardObserver=new IntersectionObserver((entries)=>{
+entries.forEach(entry=>{
+const card=entry.target;
+const textElements=card.querySelectorAll('.flip-card-title, .flip-card-description, .flip-card-meta, .flip-card-button, .flip-card-content p, .flip-card-content a');
+if(entry.isIntersecting){
+gsap.to(textElements,{
+opacity:1,
+y:0,
+duration:0.4,
+stagger:0.05,
+ease:'power2.out'
+});
+}else{
+gsap.to(textElements,{
+opacity:0,
+y:10,
+duration:0.3,
+ease:'power2.in'
+});
+}
+});
+},observerOptions);
+cards.forEach(card=>cardObserver.observe(card));
+},100);
+});
+document.addEventListener('DOMContentLoaded',async()=>{
+const btnOpen=document.getElementById('kidsBtn');
+const wantKidsBtn=document.getElementById('wantKidsBtn');
+const modal=document.getElementById('kidsModal');
+if(!modal)return;
+try{
+const html=await loadPartial('kidsModal.html?v=c3e4146d59');
+modal.innerHTML=html;
+const prevBtn=modal.querySelector('.slides-nav__button--prev');
+const nextBtn=modal.querySelector('.slides-nav__button--next');
+if(prevBtn){
+prevBtn.classList.add('arrow-hidden');
+prevBtn.classList.remove('arrow-visible');
+}
+if(nextBtn){
+nextBtn.classList.add('arrow-visible');
+nextBtn.classList.remove('arrow-hidden');
+}
+}catch(err){
+console.error('Ошибка загрузки kidsModal.html:',err);
+return;
+}
+const content=document.getElementById('kidsContent');
+const videoBg=modal.querySelector('.kids-bg');
+const btnClose=document.getElementById('closeKids');
+const slider=document.getElementById('kidsSlider');
+const panels=modal.querySelectorAll('.kids-transition__panel');
+if(!content||!slider)return;
+const openModal=(e)=>{
+e?.preventDefault?.();
+document.body.classList.add('modal-open');
+modal.classList.add('active');
+window.PrideURLHandler?.updateHashOnModalOpen('kidsModal');
+gsap.set(videoBg,{opacity:0});
+gsap.set(content,{autoAlpha:0,y:20});
+gsap.set(slider.querySelectorAll('.kids-card'),{opacity:0,y:30});
+const tl=gsap.timeline();
+tl.to(videoBg,{opacity:1,duration:0.8,ease:'power2.out'},0)
+.to(content,{autoAlpha:1,y:0,duration:0.6,ease:'power2.out'},0.2)
+.to(slider.querySelectorAll('.kids-card'),{
+opacity:1,y:0,duration:0.5,ease:'power2.out',stagger:0.1
+},0.4);
+};
+const closeModal=()=>{
+const tl=gsap.timeline({
+onComplete:()=>{
+modal.classList.remove('active');
+document.body.classList.remove('modal-open');
+}
+});
+tl.to(content,{autoAlpha:0,duration:0.3,ease:'power2.in'},0)
+.to(videoBg,{opacity:0,duration:0.3,ease:'power2.in'},0);
+};
+if(btnOpen)btnOpen.addEventListener('click',openModal);
+if(wantKidsBtn)wantKidsBtn.addEventListener('click',openModal);
+btnClose?.addEventListener('click',(e)=>{e.preventDefault();closeModal();});
+document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active'))closeModal();});
+const prevBtn=modal.querySelector('.kids-slider-wrap .slides-nav__button--prev');
+const nextBtn=modal.querySelector('.kids-slider-wrap .slides-nav__button--next');
+const step=()=>{
+const card=slider.querySelector('.kids-card');
+const gap=parseFloat(getComputedStyle(slider).gap||20);
+return(card?.offsetWidth||320)+(isNaN(gap)?20:gap);
+};
+prevBtn?.addEventListener('click',()=>slider.scrollBy({left:-step(),behavior:'smooth'}));
+nextBtn?.addEventListener('click',()=>slider.scrollBy({left:step(),behavior:'smooth'}));
+let isDown=false,isDragging=false,startX=0,startScroll=0;
+slider.style.cursor='grab';
+slider.addEventListener('pointerdown',(e)=>{
+const clickedButton=e.target.closest('.flip-card-button, .flip-close-button, button, a');
+if(clickedButton){
+console.log('🚫 Клик на кнопке, drag отменен');
+return;
+}
+isDown=true;isDragging=false;
+startX=e.clientX;startScroll=slider.scrollLeft;
+slider.setPointerCapture(e.pointerId);
+slider.classList.add('is-dragging');slider.style.cursor='grabbing';
+document.body.style.userSelect='none';
+});
+slider.addEventListener('pointermove',(e)=>{
+if(!isDown)return;
+const dx=e.clientX - startX;
+if(Math.abs(dx)>3)isDragging=true;
+slider.scrollLeft=startScroll - dx;
+});
+const endDrag=(e)=>{
+isDown=false;
+slider.classList.remove('is-dragging');slider.style.cursor='grab';
+slider.releasePointerCapture?.(e.pointerId);
+document.body.style.userSelect='';
+setTimeout(()=>{isDragging=false;},10);
+};
+slider.addEventListener('pointerup',endDrag);
+slider.addEventListener('pointercancel',endDrag);
+slider.addEventListener('pointerleave',endDrag);
+slider.addEventListener('click',(e)=>{
+const clickedFlipButton=e.target.closest('.flip-card-button, .flip-close-button');
+if(clickedFlipButton){
+console.log('✅ Клик на кнопке разрешен');
+return;
+}
+if(isDragging){
+console.log('🚫 Клик заблокирован, был драг');
+e.preventDefault();
+e.stopPropagation();
+isDragging=false;
+}
+},true);
+slider.addEventListener('wheel',(e)=>{
+if(Math.abs(e.deltaY)>=Math.abs(e.deltaX)){
+slider.scrollLeft +=e.deltaY;
+e.preventDefault();
+}
+},{passive:false});
+});
+document.addEventListener('DOMContentLoaded',async()=>{
+const btnOpen=document.getElementById('contactsBtn');
+const modal=document.getElementById('contactsModal');
+if(!btnOpen||!modal)return;
+try{
+const html=await loadPartial('contactsModal.html?v=6c59e03926');
+modal.innerHTML=html;
+}catch(err){
+console.error('Ошибка загрузки contactsModal.html:',err);
+return;
+}
+const content=document.getElementById('contactsContent');
+const btnClose=document.getElementById('closeContacts');
+const panels=modal.querySelectorAll('.contacts-transition__panel');
+if(!content)return;
+let map=null;
+let mapInitialized=false;
+const initMap=async()=>{
+if(mapInitialized)return;
+if(!window.ymaps){
+const script=document.createElement('script');
+script.src='https://api-maps.yandex.ru/2.1/?apikey=0cba5453-810a-4bce-a6ed-f76ca5248e84&lang=ru_RU';
+script.async=true;
+document.head.appendChild(script);
+await new Promise((resolve)=>{
+script.onload=resolve;
+});
+}
+ymaps.ready(()=>{
+map=new ymaps.Map('contactsMap',{
+center:[48.502298,44.550232],
+zoom:16,
+controls:['zoomControl','fullscreenControl']
+});
+const placemark=new ymaps.Placemark([48.502298,44.550232],{
+balloonContent:'<strong>СК ПРАЙД</strong><br>Волгоград, Хабаровская 10<br><a href="tel:+78442980398">+7 (844) 298-03-98</a>'
+},{
+preset:'islands#redSportIcon'
+});
+map.geoObjects.add(placemark);
+mapInitialized=true;
+});
+};
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',()=>{
+setTimeout(()=>initMap(),500);
+});
+}else{
+setTimeout(()=>initMap(),500);
+}
+const openModal=async(e)=>{
+e?.preventDefault?.();
+document.body.classList.add('modal-open');
+modal.classList.add('active');
+window.PrideURLHandler?.updateHashOnModalOpen('contactsModal');
+gsap.set(content,{autoAlpha:0,y:20});
+const tl=gsap.timeline();
+tl.to(content,{autoAlpha:1,y:0,duration:0.6,ease:'power2.out'},0.2);
+};
+const closeModal=()=>{
+const tl=gsap.timeline({
+onComplete:()=>{
+modal.classList.remove('active');
+document.body.classList.remove('modal-open');
+}
+});
+tl.to(content,{autoAlpha:0,y:-20,duration:0.8,ease:'power2.inOut'},0);
+};
+btnOpen.addEventListener('click',openModal);
+btnClose?.addEventListener('click',(e)=>{e.preventDefault();closeModal();});
+document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active'))closeModal();});
+});
+document.addEventListener('DOMContentLoaded',async()=>{
+const btnOpen=document.getElementById('planEventBtn');
+const modal=document.getElementById('planEventModal');
+if(!btnOpen||!modal)return;
+try{
+const html=await loadPartial('planEventModal.html?v=bb17799a09');
+modal.innerHTML=html;
+}catch(err){
+console.error('Ошибка загрузки planEventModal.html:',err);
+return;
+}
+const content=document.getElementById('planEventContent');
+const videoBg=modal.querySelector('.planevent-bg');
+const btnClose=document.getElementById('closePlanEvent');
+const panels=modal.querySelectorAll('.planevent-transition__panel');
+if(!content)return;
+const openModal=(e)=>{
+e?.preventDefault?.();
+document.body.classList.add('modal-open');
+modal.classList.add('active');
+window.PrideURLHandler?.updateHashOnModalOpen('planEventModal');
+gsap.set(videoBg,{opacity:0});
+gsap.set(content,{autoAlpha:0,y:20});
+const tl=gsap.timeline();
+tl.to(videoBg,{opacity:1,duration:0.8,ease:'power2.out'},0)
+.to(content,{autoAlpha:1,y:0,duration:0.6,ease:'power2.out'},0.2);
+};
+const closeModal=()=>{
+const tl=gsap.timeline({
+onComplete:()=>{
+modal.classList.remove('active');
+document.body.classList.remove('modal-open');
+gsap.set('.planevent-panel.diagonal',{yPercent:-120,rotate:-15,scale:2});
+gsap.set(panels,{yPercent:100});
+}
+});
+tl.to(content,{autoAlpha:0,y:28,scale:0.985,duration:0.9,ease:'power2.in'},'-=0.3')
+.to(videoBg,{opacity:0,duration:0.9,ease:'power2.in'},'-=0.7')
+.fromTo(panels,{yPercent:100},{yPercent:0,duration:0.7,ease:'power2.out',stagger:0.18},'-=0.5');
+};
+btnOpen.addEventListener('click',openModal);
+btnClose?.addEventListener('click',(e)=>{e.preventDefault();closeModal();});
+document.addEventListener('keydown',(e)=>{if(e.key==='Escape'&&modal.classList.contains('active'))closeModal();});
+});
+;
+document.addEventListener('DOMContentLoaded',()=>{
+const originalOpenFulldescModal=window.openFulldescModal;
+function processTrainerInfo(content){
+const temp=document.createElement('div');
+temp.innerHTML=content;
+const trainerInfo=temp.querySelector('.trainer-info');
+if(trainerInfo){
+const allH3=Array.from(trainerInfo.querySelectorAll('h3'));
+let startH3=null;
+let endH3=null;
+allH3.forEach(h3=>{
+if(h3.textContent.trim()==='Описание направления'){
+startH3=h3;
+}
+if(h3.textContent.trim()==='Расписание'){
+endH3=h3;
+}
+});
+if(startH3&&endH3){
+const newTrainerInfo=document.createElement('div');
+newTrainerInfo.className='trainer-info';
+let currentElement=startH3;
+while(currentElement&&currentElement!==endH3){
+newTrainerInfo.appendChild(currentElement.cloneNode(true));
+currentElement=currentElement.nextElementSibling;
+}
+trainerInfo.parentNode.replaceChild(newTrainerInfo,trainerInfo);
+}
+}
+return temp.innerHTML;
+}
+window.openFulldescModal=function(content,opt){
+if(opt&&window.innerWidth<=768){
+let processedFulldesc=opt.fulldesc||content;
+processedFulldesc=processTrainerInfo(processedFulldesc);
+const mobileContent=`
+        ${opt.label?`<h1>${opt.label}</h1>`:''}
+        ${opt.sub?`<p class="fulldesc-sub">${opt.sub}</p>`:''}
+        ${opt.fimage?`<img src="${opt.fimage}" alt="${opt.label||''}" class="fulldesc-image">`:''}
+        ${opt.price?`<div class="fulldesc-price"><strong>💰 Стоимость:</strong> ${opt.price}</div>`:''}
+        ${opt.timetable?`<div class="fulldesc-timetable"><strong>📅 Расписание:</strong> ${opt.timetable}</div>`:''}
+        ${processedFulldesc}
+      `;
+originalOpenFulldescModal.call(this,mobileContent);
+}else{
+originalOpenFulldescModal.call(this,content);
+}
+};
+const originalShowFinalFields=window.showFinalFields;
+if(originalShowFinalFields){
+window.showFinalFields=function(opt){
+originalShowFinalFields.call(this,opt);
+setTimeout(()=>{
+const finalFields=document.getElementById("finalFields");
+const fulldescBtn=finalFields?.querySelector(".show-fulldesc-btn");
+if(fulldescBtn&&opt?.fulldesc){
+const newBtn=fulldescBtn.cloneNode(true);
+fulldescBtn.parentNode.replaceChild(newBtn,fulldescBtn);
+newBtn.addEventListener("click",()=>{
+window.openFulldescModal(opt.fulldesc,opt);
+});
+}
+},100);
+};
+}
+});
+;
+gsap.registerPlugin(
+ScrollTrigger,
+ScrollSmoother,
+SplitText,
+Flip,
+Draggable,
+DrawSVGPlugin,
+ScrambleTextPlugin,
+MorphSVGPlugin,
+Observer
+);
+console.log('🎉 Все GSAP плагины зарегистрированы (БЕСПЛАТНО!)');
+let smoother;
+function initSmoothScrolling(){
+const isMobile=window.innerWidth<=768||'ontouchstart' in window;
+if(isMobile){
+console.log('📱 ScrollSmoother отключен на мобильном устройстве');
+return;
+}
+if(!document.getElementById('smooth-wrapper')){
+const wrapper=document.createElement('div');
+wrapper.id='smooth-wrapper';
+const content=document.createElement('div');
+content.id='smooth-content';
+while(document.body.firstChild){
+content.appendChild(document.body.firstChild);
+}
+wrapper.appendChild(content);
+document.body.appendChild(wrapper);
+}
+smoother=ScrollSmoother.create({
+wrapper:'#smooth-wrapper',
+content:'#smooth-content',
+smooth:1.5,
+effects:true,
+smoothTouch:false,
+normalizeScroll:false
+});
+console.log('✅ ScrollSmoother активирован - бархатная прокрутка (только десктоп)');
+}
+function animateHeadlinesAdvanced(){
+const headlines=document.querySelectorAll('.sport-modal h1, .sport-modal h2, .kids-modal h1, .kids-modal h2, .rest-modal h1, .rest-modal h2, .events-modal h1, .events-modal h2');
+headlines.forEach((headline,index)=>{
+const split=new SplitText(headline,{
+type:'chars, words, lines',
+charsClass:'char',
+wordsClass:'word',
+linesClass:'line'
+});
+split.lines.forEach(line=>{
+const wrapper=document.createElement('div');
+wrapper.style.overflow='hidden';
+line.parentNode.insertBefore(wrapper,line);
+wrapper.appendChild(line);
+});
+const tl=gsap.timeline({paused:true});
+tl.from(split.chars,{
+opacity:0,
+y:100,
+rotationX:-90,
+transformOrigin:'0% 50% -50',
+stagger:0.02,
+duration:0.8,
+ease:'back.out(1.7)'
+},0);
+headline.animationTimeline=tl;
+});
+console.log('✅ SplitText анимации с продвинутыми эффектами');
+}
+function animatePromoText(){
+const promoTexts=document.querySelectorAll('.promo-text, .discount-label');
+promoTexts.forEach(text=>{
+const originalText=text.textContent;
+gsap.to(text,{
+scrollTrigger:{
+trigger:text,
+start:'top 80%',
+once:true
+},
+duration:1.5,
+scrambleText:{
+text:originalText,
+chars:'01АБВГДЕЖ%₽$#',
+revealDelay:0.3,
+speed:0.4,
+tweenLength:false
+}
+});
+});
+console.log('✅ ScrambleText для акций активирован');
+}
+function animateSVGIcons(){
+const logoPaths=document.querySelectorAll('.logo svg path');
+if(logoPaths.length>0){
+gsap.from(logoPaths,{
+drawSVG:0,
+duration:2,
+stagger:0.2,
+ease:'power2.inOut',
+delay:0.5
+});
+}
+const icons=document.querySelectorAll('.icon svg path');
+icons.forEach(icon=>{
+const parent=icon.closest('.icon');
+if(!parent)return;
+parent.addEventListener('mouseenter',()=>{
+gsap.fromTo(icon,{
+drawSVG:'0% 0%'
+},{
+drawSVG:'0% 100%',
+duration:0.6,
+ease:'power2.out'
+});
+});
+});
+console.log('✅ DrawSVG анимации для иконок');
+}
+function setupMorphingShapes(){
+const morphButtons=document.querySelectorAll('[data-morph]');
+morphButtons.forEach(button=>{
+const svg=button.querySelector('svg');
+if(!svg)return;
+const shape1=svg.querySelector('#shape1');
+const shape2=svg.querySelector('#shape2');
+if(shape1&&shape2){
+button.addEventListener('click',function(){
+gsap.to(shape1,{
+morphSVG:shape2,
+duration:0.8,
+ease:'power2.inOut'
+});
+});
+}
+});
+console.log('✅ MorphSVG для интерактивных элементов');
+}
+function setupDraggableCarousels(){
+const carousels=document.querySelectorAll('.horizontal-scroll');
+carousels.forEach(carousel=>{
+const cards=carousel.querySelectorAll('.card');
+const cardWidth=cards[0]?.offsetWidth||300;
+Draggable.create(carousel,{
+type:'x',
+edgeResistance:0.65,
+bounds:{
+minX:-(cards.length*cardWidth - carousel.offsetWidth),
+maxX:0
+},
+inertia:true,
+snap:{
+x:endValue=>Math.round(endValue / cardWidth)*cardWidth
+},
+onDrag:function(){
+cards.forEach((card,i)=>{
+const cardCenter=card.offsetLeft + cardWidth / 2;
+const carouselCenter=-this.x + carousel.offsetWidth / 2;
+const distance=Math.abs(cardCenter - carouselCenter);
+const scale=Math.max(0.8,1 - distance / 1000);
+gsap.to(card,{
+scale:scale,
+duration:0.3
+});
+});
+}
+});
+});
+console.log('✅ Draggable карусели активированы');
+}
+let currentSlide=0;
+const totalSlides=10;
+function setupTouchNavigation(){
+Observer.create({
+target:window,
+type:'wheel,touch',
+onLeft:()=>{
+if(currentSlide<totalSlides - 1){
+currentSlide++;
+navigateToSlide(currentSlide);
+}
+},
+onRight:()=>{
+if(currentSlide>0){
+currentSlide--;
+navigateToSlide(currentSlide);
+}
+},
+tolerance:10,
+preventDefault:false,
+ignore:".sport-modal, .kids-modal, .rest-modal, .events-modal, .about-modal, .pricing-modal, .relax-modal, .ice-modal, .review-modal, #mobile-nav"
+});
+console.log('✅ Observer для touch навигации');
+}
+function navigateToSlide(index){
+const slides=document.querySelectorAll('.slide');
+const targetSlide=slides[index];
+if(!targetSlide)return;
+const targetPosition=targetSlide.getBoundingClientRect().top + window.pageYOffset;
+window.scrollTo({
+top:targetPosition,
+behavior:'smooth'
+});
+}
+function setupAdvancedParallax(){
+gsap.utils.toArray('[data-speed]').forEach(element=>{
+const speed=parseFloat(element.getAttribute('data-speed'));
+gsap.to(element,{
+y:(i,target)=>-ScrollTrigger.maxScroll(window)*speed,
+ease:'none',
+scrollTrigger:{
+start:0,
+end:'max',
+invalidateOnRefresh:true,
+scrub:0
+}
+});
+});
+console.log('✅ Продвинутый параллакс с data-speed');
+}
+function setupAdvancedModals(){
+const modalTriggers=document.querySelectorAll('[data-modal]');
+modalTriggers.forEach(trigger=>{
+trigger.addEventListener('click',function(e){
+e.preventDefault();
+const modalId=this.getAttribute('data-modal');
+const modal=document.getElementById(modalId);
+if(!modal)return;
+const state=Flip.getState([this,modal]);
+modal.classList.add('active');
+this.style.opacity=0;
+Flip.from(state,{
+duration:0.7,
+ease:'power3.inOut',
+scale:true,
+absolute:true,
+onComplete:()=>{
+this.style.opacity=1;
+}
+});
+});
+});
+console.log('✅ Flip анимации для модальных окон');
+}
+function setupScrollEffects(){
+gsap.utils.toArray('.reveal-image').forEach(image=>{
+const overlay=document.createElement('div');
+overlay.className='image-overlay';
+image.parentNode.insertBefore(overlay,image);
+image.parentNode.style.position='relative';
+image.parentNode.style.overflow='hidden';
+overlay.style.position='absolute';
+overlay.style.top=0;
+overlay.style.left=0;
+overlay.style.width='100%';
+overlay.style.height='100%';
+overlay.style.background='var(--color-accent, #FF6B35)';
+overlay.style.zIndex=10;
+gsap.timeline({
+scrollTrigger:{
+trigger:image,
+start:'top 80%',
+end:'top 20%',
+once:true
+}
+})
+.to(overlay,{
+xPercent:100,
+duration:1,
+ease:'power3.inOut'
+})
+.from(image,{
+scale:1.3,
+duration:1,
+ease:'power3.out'
+},0);
+});
+gsap.utils.toArray('.slide-in').forEach(element=>{
+gsap.from(element,{
+scrollTrigger:{
+trigger:element,
+start:'top 85%',
+end:'top 15%'
+},
+x:element.classList.contains('from-left')?-100:100,
+opacity:0,
+duration:1,
+ease:'power3.out'
+});
+});
+gsap.utils.toArray('.fade-in-scale').forEach((element,i)=>{
+gsap.from(element,{
+scrollTrigger:{
+trigger:element,
+start:'top 80%'
+},
+opacity:0,
+scale:0.8,
+duration:0.8,
+delay:i*0.1,
+ease:'back.out(1.7)'
+});
+});
+console.log('✅ Продвинутые scroll эффекты активированы');
+}
+function setupInteractiveButtons(){
+const buttons=document.querySelectorAll('.animated-button');
+buttons.forEach(button=>{
+button.addEventListener('mousemove',function(e){
+const rect=this.getBoundingClientRect();
+const x=e.clientX - rect.left - rect.width / 2;
+const y=e.clientY - rect.top - rect.height / 2;
+gsap.to(this,{
+x:x*0.3,
+y:y*0.3,
+duration:0.3,
+ease:'power2.out'
+});
+});
+button.addEventListener('mouseleave',function(){
+gsap.to(this,{
+x:0,
+y:0,
+duration:0.5,
+ease:'elastic.out(1, 0.3)'
+});
+});
+button.addEventListener('click',function(e){
+const ripple=document.createElement('span');
+ripple.classList.add('ripple');
+this.appendChild(ripple);
+const rect=this.getBoundingClientRect();
+const size=Math.max(rect.width,rect.height);
+const x=e.clientX - rect.left - size / 2;
+const y=e.clientY - rect.top - size / 2;
+gsap.set(ripple,{
+width:size,
+height:size,
+left:x,
+top:y
+});
+gsap.to(ripple,{
+scale:4,
+opacity:0,
+duration:0.8,
+ease:'power2.out',
+onComplete:()=>ripple.remove()
+});
+});
+});
+console.log('✅ Интерактивные кнопки с магнитным эффектом');
+}
+function animateStatsCounters(){
+const counters=document.querySelectorAll('[data-counter]');
+counters.forEach(counter=>{
+const target=parseInt(counter.getAttribute('data-counter'));
+const suffix=counter.getAttribute('data-suffix')||'';
+const prefix=counter.getAttribute('data-prefix')||'';
+gsap.to({val:0},{
+val:target,
+scrollTrigger:{
+trigger:counter,
+start:'top 80%',
+once:true
+},
+duration:2,
+ease:'power2.out',
+onUpdate:function(){
+const current=Math.round(this.targets()[0].val);
+counter.textContent=prefix + current.toLocaleString()+ suffix;
+}
+});
+});
+console.log('✅ Анимация счетчиков активирована');
+}
+function initPremiumAnimations(){
+console.log('🎬 Инициализация ПРЕМИАЛЬНЫХ анимаций...');
+console.log('🎉 Все GSAP плагины теперь БЕСПЛАТНЫ!');
+if(typeof gsap==='undefined'){
+console.error('❌ GSAP не загружен!');
+return;
+}
+try{
+if(typeof ScrollSmoother!=='undefined'){
+initSmoothScrolling();
+}
+if(typeof SplitText!=='undefined'){
+animateHeadlinesAdvanced();
+}
+if(typeof ScrambleTextPlugin!=='undefined'){
+animatePromoText();
+}
+if(typeof DrawSVGPlugin!=='undefined'){
+animateSVGIcons();
+}
+if(typeof MorphSVGPlugin!=='undefined'){
+setupMorphingShapes();
+}
+if(typeof Draggable!=='undefined'){
+setupDraggableCarousels();
+}
+if(typeof Observer!=='undefined'){
+setupTouchNavigation();
+}
+if(typeof Flip!=='undefined'){
+setupAdvancedModals();
+}
+if(typeof ScrollTrigger!=='undefined'){
+setupAdvancedParallax();
+setupScrollEffects();
+animateStatsCounters();
+}
+setupInteractiveButtons();
+console.log('✅ ВСЕ ПРЕМИАЛЬНЫЕ АНИМАЦИИ АКТИВИРОВАНЫ!');
+console.log('💎 Ваш сайт теперь выглядит на миллион!');
+}catch(error){
+console.error('❌ Ошибка инициализации:',error);
+}
+}
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',initPremiumAnimations);
+}else{
+initPremiumAnimations();
+}
+window.prideAnimationsPremium={
+init:initPremiumAnimations,
+navigateToSlide:navigateToSlide,
+smoother:smoother
+};
+console.log('📦 Премиальные анимации загружены (БЕСПЛАТНО! 🎉)');
+;
+(function(){
+'use strict';
+const ANIMATION_CONFIG={
+duration:{
+modalOpen:0.8,
+modalClose:0.9,
+backdrop:0.6,
+text:1.0,
+card:0.6,
+introDisplay:4.0,
+introFadeOut:0.8,
+},
+delay:{
+textAfterModal:0.3,
+cardsAfterText:0.2,
+cardStagger:0.15,
+wordStagger:0.05,
+},
+ease:{
+modalOpen:'power3.out',
+modalClose:'power1.inOut',
+text:'power1.out',
+card:'power2.out',
+backdrop:'power2.inOut',
+},
+effects:{
+modalScale:0.9,
+textY:20,
+cardY:50,
+cardRotation:3,
+}
+};
+function animateCounter(element,duration=1.5){
+const text=element.textContent.trim();
+const match=text.match(/^([\d,.\s]+)(.*)$/);
+if(!match)return;
+const targetNum=parseFloat(match[1].replace(/\s/g,'').replace(',','.'));
+const suffix=match[2]||'';
+if(isNaN(targetNum))return;
+element.dataset.originalText=text;
+const counter={value:0};
+gsap.to(counter,{
+value:targetNum,
+duration:duration,
+ease:'power2.out',
+onUpdate:()=>{
+let displayValue;
+if(targetNum>=100){
+displayValue=Math.round(counter.value);
+}else if(targetNum>=10){
+displayValue=Math.round(counter.value);
+}else{
+displayValue=Math.round(counter.value*10)/ 10;
+}
+element.textContent=displayValue + suffix;
+},
+onComplete:()=>{
+element.textContent=text;
+}
+});
+}
+function ensureBackdrop(modal){
+let backdrop=modal.querySelector('.modal-backdrop-premium');
+if(!backdrop){
+backdrop=document.createElement('div');
+backdrop.className='modal-backdrop-premium';
+modal.insertBefore(backdrop,modal.firstChild);
+}
+return backdrop;
+}
+function splitTextIntoWords(element){
+const text=element.textContent;
+const words=text.split(' ');
+element.innerHTML=words.map(word=>
+`<span class="word-wrapper"><span class="word-animated">${word}</span></span>`
+).join(' ');
+return element.querySelectorAll('.word-animated');
+}
+function prepareElements(modal,selectors){
+const elements={
+backdrop:ensureBackdrop(modal),
+content:modal.querySelector(selectors.content),
+videoBg:Array.from(modal.querySelectorAll(selectors.videoBg)),
+statsSection:modal.querySelector(selectors.stats),
+introText:modal.querySelector(selectors.intro),
+cards:Array.from(modal.querySelectorAll(selectors.cards)),
+headlines:Array.from(modal.querySelectorAll(selectors.headlines)),
+};
+elements.textElements=[];
+if(elements.statsSection){
+elements.textElements.push(...elements.statsSection.querySelectorAll('span, p'));
+}
+if(elements.introText){
+elements.textElements.push(elements.introText);
+}
+return elements;
+}
+function createOpenAnimation(modal,elements){
+const cfg=ANIMATION_CONFIG;
+const introKey=`pride_intro_shown_${modal.id}`;
+const introAlreadyShown=false;
+const masterTL=gsap.timeline({
+onStart:()=>{
+modal.classList.add('modal-animating');
+console.log('🎬 Начало анимации открытия:',modal.id);
+console.log('🎥 Intro будет показан');
+},
+onComplete:()=>{
+modal.classList.remove('modal-animating');
+console.log('✅ Анимация открытия завершена:',modal.id);
+}
+});
+masterTL.fromTo(elements.backdrop,
+{
+opacity:0,
+visibility:'hidden',
+backdropFilter:'blur(0px)',
+},
+{
+opacity:1,
+visibility:'visible',
+backdropFilter:'blur(20px)',
+duration:cfg.duration.backdrop,
+ease:cfg.ease.backdrop,
+},
+0
+);
+if(elements.content){
+masterTL.fromTo(elements.content,
+{
+opacity:0,
+visibility:'hidden',
+scale:cfg.effects.modalScale,
+y:30,
+},
+{
+opacity:1,
+visibility:'visible',
+scale:1,
+y:0,
+duration:cfg.duration.modalOpen,
+ease:cfg.ease.modalOpen,
+},
+0.2
+);
+}
+if(elements.videoBg&&elements.videoBg.length>0){
+elements.videoBg.forEach(video=>{
+masterTL.fromTo(video,
+{opacity:0},
+{
+opacity:1,
+duration:cfg.duration.backdrop,
+ease:cfg.ease.backdrop,
+},
+0
+);
+});
+}
+const textStartTime=cfg.duration.modalOpen*0.5;
+if(elements.statsSection&&!introAlreadyShown){
+gsap.set(elements.statsSection,{visibility:'visible'});
+const statItems=elements.statsSection.querySelectorAll(':scope > div');
+const statNumbers=elements.statsSection.querySelectorAll(':scope > div > span');
+statItems.forEach((item,index)=>{
+const delay=textStartTime +(index*0.25);
+masterTL.fromTo(item,
+{
+opacity:0,
+scale:0.8,
+y:40,
+},
+{
+opacity:1,
+scale:1,
+y:0,
+duration:0.8,
+ease:'back.out(1.4)',
+},
+delay
+);
+const numberEl=item.querySelector('span');
+if(numberEl){
+masterTL.call(()=>{
+animateCounter(numberEl,1.2);
+},null,delay + 0.2);
+}
+});
+const allBlocksAppeared=textStartTime +(statItems.length*0.25)+ 0.8;
+const statsHideTime=allBlocksAppeared + cfg.duration.introDisplay;
+masterTL.to(statItems,{
+opacity:0,
+y:-30,
+scale:0.95,
+duration:cfg.duration.introFadeOut,
+ease:'power2.inOut',
+stagger:0.1,
+},statsHideTime);
+}
+const statBlocksCount=elements.statsSection?elements.statsSection.querySelectorAll(':scope > div').length:0;
+const introTextStartTime=textStartTime +(statBlocksCount*0.25)+ 0.5;
+if(elements.introText&&!introAlreadyShown){
+gsap.set(elements.introText,{visibility:'visible'});
+const words=splitTextIntoWords(elements.introText);
+masterTL.fromTo(words,
+{
+opacity:0,
+y:cfg.effects.textY,
+},
+{
+opacity:1,
+y:0,
+duration:cfg.duration.text,
+ease:cfg.ease.text,
+stagger:cfg.delay.wordStagger,
+},
+introTextStartTime
+);
+const allElementsAppeared=introTextStartTime + cfg.duration.text;
+const hideIntroTime=allElementsAppeared + cfg.duration.introDisplay;
+masterTL.to(words,{
+opacity:0,
+y:-30,
+duration:cfg.duration.introFadeOut,
+ease:'power2.inOut',
+stagger:0.01,
+},hideIntroTime);
+}
+const allElementsAppeared=introTextStartTime + cfg.duration.text;
+const hideIntroTime=allElementsAppeared + cfg.duration.introDisplay;
+if((elements.statsSection||elements.introText)&&!introAlreadyShown){
+masterTL.call(()=>{
+if(elements.content){
+elements.content.classList.add('slider-visible');
+}
+console.log('📦 Intro скрыт, показываем слайдер');
+},null,hideIntroTime + cfg.duration.introFadeOut);
+}
+const cardsStartTime=introAlreadyShown
+?cfg.duration.modalOpen + 0.3
+:hideIntroTime + cfg.duration.introFadeOut + 0.2;
+if(elements.cards.length>0){
+elements.cards.forEach((card,index)=>{
+const cardTL=gsap.timeline();
+cardTL.fromTo(card,
+{
+opacity:0,
+visibility:'hidden',
+y:cfg.effects.cardY,
+rotationY:cfg.effects.cardRotation,
+scale:0.95,
+},
+{
+opacity:1,
+visibility:'visible',
+y:0,
+rotationY:0,
+scale:1,
+duration:cfg.duration.card,
+ease:cfg.ease.card,
+}
+);
+const cardImage=card.querySelector('img');
+const cardHeading=card.querySelector('h3');
+const cardText=card.querySelector('p');
+const cardButtons=card.querySelectorAll('.sport-btn, a');
+if(cardImage){
+cardTL.fromTo(cardImage,
+{
+scale:1.2,
+opacity:0,
+},
+{
+scale:1,
+opacity:1,
+duration:0.5,
+ease:'power2.out',
+},
+0
+);
+}
+if(cardHeading){
+cardTL.fromTo(cardHeading,
+{
+opacity:0,
+y:20,
+},
+{
+opacity:1,
+y:0,
+duration:0.4,
+ease:'power2.out',
+},
+0.1
+);
+}
+if(cardText){
+cardTL.fromTo(cardText,
+{
+opacity:0,
+},
+{
+opacity:1,
+duration:0.4,
+ease:'power2.out',
+},
+0.2
+);
+}
+if(cardButtons.length>0){
+cardTL.fromTo(cardButtons,
+{
+opacity:0,
+y:10,
+},
+{
+opacity:1,
+y:0,
+duration:0.3,
+ease:'back.out(1.5)',
+stagger:0.05,
+},
+0.3
+);
+}
+masterTL.add(cardTL,cardsStartTime +(index*cfg.delay.cardStagger));
+});
+}
+return masterTL;
+}
+function createCloseAnimation(modal,elements){
+const cfg=ANIMATION_CONFIG;
+const closeTL=gsap.timeline({
+onStart:()=>{
+modal.classList.add('modal-closing');
+console.log('🎬 Начало анимации закрытия:',modal.id);
+},
+onComplete:()=>{
+modal.classList.remove('modal-closing','active');
+console.log('✅ Анимация закрытия завершена:',modal.id);
+resetModalElements(modal,elements);
+}
+});
+if(elements.cards.length>0){
+closeTL.to(elements.cards.reverse(),
+{
+opacity:0,
+y:-80,
+scale:0.95,
+duration:cfg.duration.modalClose,
+ease:cfg.ease.modalClose,
+stagger:0.05,
+},
+0
+);
+}
+if(elements.content){
+closeTL.to([elements.statsSection,elements.introText,...elements.headlines].filter(Boolean),
+{
+opacity:0,
+y:-60,
+duration:cfg.duration.modalClose,
+ease:cfg.ease.modalClose,
+stagger:0.03,
+},
+0.1
+);
+}
+closeTL.to(elements.content,
+{
+opacity:0,
+scale:0.95,
+y:-40,
+duration:cfg.duration.modalClose,
+ease:cfg.ease.modalClose,
+},
+0.2
+);
+closeTL.to(elements.backdrop,
+{
+opacity:0,
+backdropFilter:'blur(0px)',
+duration:cfg.duration.modalClose,
+ease:cfg.ease.modalClose,
+},
+0.2
+);
+if(elements.videoBg&&elements.videoBg.length>0){
+closeTL.to(elements.videoBg,
+{
+opacity:0,
+duration:cfg.duration.modalClose*0.8,
+ease:cfg.ease.modalClose,
+},
+0.2
+);
+}
+return closeTL;
+}
+function resetModalElements(modal,elements){
+gsap.set([
+elements.backdrop,
+elements.content,
+...(elements.videoBg||[]),
+elements.statsSection,
+elements.introText,
+...elements.cards,
+...elements.headlines,
+].filter(Boolean),{
+clearProps:'all'
+});
+[...elements.headlines,elements.introText].filter(Boolean).forEach(el=>{
+const text=el.textContent;
+el.innerHTML=text;
+});
+modal.classList.remove('intro-hidden');
+}
+class ModalAnimationController{
+constructor(modalId,selectors){
+this.modal=document.getElementById(modalId);
+if(!this.modal){
+console.warn(`❌ Модальное окно ${modalId} не найдено`);
+return;
+}
+this.selectors=selectors;
+this.elements=null;
+this.openTimeline=null;
+this.closeTimeline=null;
+this.isAnimating=false;
+this.init();
+}
+init(){
+this.elements=prepareElements(this.modal,this.selectors);
+this.hideAllElements();
+this.observeModalState();
+this.setupCloseHandlers();
+console.log(`✅ Контроллер анимации для ${this.modal.id} инициализирован`);
+}
+hideAllElements(){
+gsap.set([
+this.elements.backdrop,
+this.elements.content,
+].filter(Boolean),{
+opacity:0,
+visibility:'hidden'
+});
+gsap.set(this.elements.cards,{
+opacity:0,
+visibility:'hidden'
+});
+const headlines=this.modal.querySelectorAll(this.selectors.headlines);
+const stats=this.modal.querySelector(this.selectors.stats);
+const intro=this.modal.querySelector(this.selectors.intro);
+gsap.set([...headlines,stats,intro].filter(Boolean),{
+opacity:0,
+visibility:'hidden'
+});
+}
+observeModalState(){
+const observer=new MutationObserver((mutations)=>{
+mutations.forEach((mutation)=>{
+if(mutation.attributeName==='class'){
+const isActive=this.modal.classList.contains('active');
+const wasActive=mutation.oldValue?.includes('active');
+if(isActive&&!wasActive&&!this.isAnimating){
+this.playOpenAnimation();
+}
+}
+});
+});
+observer.observe(this.modal,{
+attributes:true,
+attributeOldValue:true,
+attributeFilter:['class']
+});
+}
+setupCloseHandlers(){
+const closeButtons=this.modal.querySelectorAll('[id^="close"], .modal-close, .close-btn');
+closeButtons.forEach(btn=>{
+btn.addEventListener('click',(e)=>{
+e.preventDefault();
+e.stopPropagation();
+this.playCloseAnimation();
+});
+});
+document.addEventListener('keydown',(e)=>{
+if(e.key==='Escape'&&this.modal.classList.contains('active')){
+this.playCloseAnimation();
+}
+});
+}
+playOpenAnimation(){
+if(this.isAnimating)return;
+this.isAnimating=true;
+if(this.openTimeline)this.openTimeline.kill();
+if(this.closeTimeline)this.closeTimeline.kill();
+this.elements=prepareElements(this.modal,this.selectors);
+this.openTimeline=createOpenAnimation(this.modal,this.elements);
+this.openTimeline.eventCallback('onComplete',()=>{
+this.isAnimating=false;
+});
+}
+playCloseAnimation(){
+if(this.isAnimating)return;
+this.isAnimating=true;
+if(this.openTimeline)this.openTimeline.kill();
+if(this.closeTimeline)this.closeTimeline.kill();
+this.closeTimeline=createCloseAnimation(this.modal,this.elements);
+this.closeTimeline.eventCallback('onComplete',()=>{
+this.isAnimating=false;
+});
+}
+}
+function initAllModals(){
+console.log('🎬 Инициализация премиум анимаций модальных окон...');
+if(typeof gsap==='undefined'){
+console.error('❌ GSAP не загружен! Премиум анимации недоступны.');
+return;
+}
+gsap.defaults({
+overwrite:'auto',
+});
+const modals=[
+{
+id:'sportModal',
+selectors:{
+content:'#sportContent',
+videoBg:'.sport-bg',
+stats:'.sport-stats',
+intro:'.sport-intro',
+cards:'.sport-card',
+headlines:'.sport-content h1, .sport-content h2',
+}
+},
+{
+id:'kidsModal',
+selectors:{
+content:'#kidsContent',
+videoBg:'.kids-bg',
+stats:'.kids-stats',
+intro:'.kids-intro',
+cards:'.kids-card',
+headlines:'.kids-content h1, .kids-content h2',
+}
+},
+{
+id:'restModal',
+selectors:{
+content:'#restContent',
+videoBg:'.rest-bg',
+stats:'.rest-stats',
+intro:'.rest-intro',
+cards:'.rest-card',
+headlines:'.rest-content h1, .rest-content h2',
+}
+},
+{
+id:'eventsModal',
+selectors:{
+content:'#eventsContent',
+videoBg:'.events-bg',
+stats:'.events-stats',
+intro:'.events-intro',
+cards:'.flip-card-interactive',
+headlines:'.events-content h1, .events-content h2',
+}
+},
+{
+id:'contactsModal',
+selectors:{
+content:'#contactsContent',
+videoBg:null,
+stats:'.contacts-stats',
+intro:'.contacts-intro',
+cards:'.contact-card, .social-link',
+headlines:'.contacts-content h1, .contacts-content h2',
+}
+}
+];
+const controllers=modals.map(config=>new ModalAnimationController(config.id,config.selectors));
+console.log(`✅ Премиум анимации инициализированы для ${controllers.length} модальных окон`);
+window.ModalAnimationControllers=controllers;
+}
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',()=>{
+setTimeout(initAllModals,1000);
+});
+}else{
+setTimeout(initAllModals,1000);
+}
+window.PrideModalAnimationsPremium={
+init:initAllModals,
+config:ANIMATION_CONFIG,
+ModalAnimationController:ModalAnimationController,
+};
+console.log('📦 modal-animations-premium.js загружен');
+function hideArrow(btn){
+if(!btn)return;
+btn.style.removeProperty('opacity');
+btn.style.removeProperty('visibility');
+btn.style.removeProperty('pointer-events');
+btn.classList.add('arrow-hidden');
+btn.classList.remove('arrow-visible');
+}
+function showArrow(btn){
+if(!btn)return;
+btn.style.removeProperty('opacity');
+btn.style.removeProperty('visibility');
+btn.style.removeProperty('pointer-events');
+btn.classList.add('arrow-visible');
+btn.classList.remove('arrow-hidden');
+}
+function updateSliderArrows(slider,prevBtn,nextBtn){
+if(!slider||!prevBtn||!nextBtn)return;
+const scrollLeft=Math.round(slider.scrollLeft);
+const scrollWidth=slider.scrollWidth;
+const clientWidth=slider.clientWidth;
+const maxScroll=scrollWidth - clientWidth;
+const threshold=5;
+if(maxScroll<=threshold){
+hideArrow(prevBtn);
+hideArrow(nextBtn);
+return;
+}
+if(scrollLeft<=threshold){
+hideArrow(prevBtn);
+}else{
+showArrow(prevBtn);
+}
+if(scrollLeft>=maxScroll - threshold){
+hideArrow(nextBtn);
+}else{
+showArrow(nextBtn);
+}
+}
+function initSliderArrowsControl(sliderWrap){
+if(!sliderWrap)return;
+if(sliderWrap.dataset.arrowsInitialized==='true'){
+return;
+}
+sliderWrap.dataset.arrowsInitialized='true';
+const slider=sliderWrap.querySelector('#sportSlider, #kidsSlider, #restSlider, #eventsSlider, [class$="-slider"]');
+const prevBtn=sliderWrap.querySelector('.slides-nav__button--prev, [data-sport-prev], [data-kids-prev], [data-rest-prev], [data-events-prev]');
+const nextBtn=sliderWrap.querySelector('.slides-nav__button--next, [data-sport-next], [data-kids-next], [data-rest-next], [data-events-next]');
+if(!slider||!prevBtn||!nextBtn){
+console.warn('⚠️ Не найдены элементы слайдера:',sliderWrap);
+sliderWrap.dataset.arrowsInitialized='false';
+return;
+}
+hideArrow(prevBtn);
+showArrow(nextBtn);
+slider.addEventListener('scroll',()=>{
+updateSliderArrows(slider,prevBtn,nextBtn);
+});
+prevBtn.addEventListener('click',()=>{
+const card=slider.querySelector('.sport-card, .kids-card, .rest-card, .events-card');
+const scrollAmount=card?card.offsetWidth + 32:300;
+slider.scrollBy({left:-scrollAmount,behavior:'smooth'});
+});
+nextBtn.addEventListener('click',()=>{
+const card=slider.querySelector('.sport-card, .kids-card, .rest-card, .events-card');
+const scrollAmount=card?card.offsetWidth + 32:300;
+slider.scrollBy({left:scrollAmount,behavior:'smooth'});
+});
+window.addEventListener('resize',()=>{
+updateSliderArrows(slider,prevBtn,nextBtn);
+});
+console.log('✅ Управление стрелками слайдера инициализировано');
+}
+function initAllSliderArrows(){
+const sliderWraps=document.querySelectorAll('.sport-slider-wrap, .kids-slider-wrap, .rest-slider-wrap, .events-slider-wrap');
+sliderWraps.forEach(wrap=>{
+initSliderArrowsControl(wrap);
+});
+console.log(`✅ Управление стрелками инициализировано для ${sliderWraps.length} слайдеров`);
+}
+function hideAllLeftArrows(){
+const modalPrevBtns='.sport-slider-wrap .slides-nav__button--prev, .kids-slider-wrap .slides-nav__button--prev, .rest-slider-wrap .slides-nav__button--prev, .events-slider-wrap .slides-nav__button--prev, [data-sport-prev], [data-kids-prev], [data-rest-prev], [data-events-prev]';
+const modalNextBtns='.sport-slider-wrap .slides-nav__button--next, .kids-slider-wrap .slides-nav__button--next, .rest-slider-wrap .slides-nav__button--next, .events-slider-wrap .slides-nav__button--next, [data-sport-next], [data-kids-next], [data-rest-next], [data-events-next]';
+document.querySelectorAll(modalPrevBtns).forEach(btn=>{
+btn.classList.add('arrow-hidden');
+btn.classList.remove('arrow-visible');
+});
+document.querySelectorAll(modalNextBtns).forEach(btn=>{
+btn.classList.add('arrow-visible');
+btn.classList.remove('arrow-hidden');
+});
+}
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',()=>{
+hideAllLeftArrows();
+setTimeout(initAllSliderArrows,1500);
+});
+}else{
+hideAllLeftArrows();
+setTimeout(initAllSliderArrows,1500);
+}
+function updateArrowsForModal(modal){
+const sliderWrap=modal.querySelector('.sport-slider-wrap, .kids-slider-wrap, .rest-slider-wrap, .events-slider-wrap');
+if(!sliderWrap)return;
+const slider=sliderWrap.querySelector('#sportSlider, #kidsSlider, #restSlider, #eventsSlider');
+const prevBtn=sliderWrap.querySelector('.slides-nav__button--prev, [data-sport-prev]');
+const nextBtn=sliderWrap.querySelector('.slides-nav__button--next, [data-sport-next]');
+if(slider&&prevBtn&&nextBtn){
+slider.scrollLeft=0;
+hideArrow(prevBtn);
+const maxScroll=slider.scrollWidth - slider.clientWidth;
+if(maxScroll>5){
+showArrow(nextBtn);
+}else{
+hideArrow(nextBtn);
+}
+}
+}
+const modalObserver=new MutationObserver((mutations)=>{
+mutations.forEach((mutation)=>{
+if(mutation.attributeName==='class'){
+const target=mutation.target;
+if(target.classList.contains('active')){
+target.querySelectorAll('.slides-nav__button--prev, [data-sport-prev]').forEach(btn=>{
+btn.classList.add('arrow-hidden');
+btn.classList.remove('arrow-visible');
+});
+target.querySelectorAll('.slides-nav__button--next, [data-sport-next]').forEach(btn=>{
+btn.classList.add('arrow-visible');
+btn.classList.remove('arrow-hidden');
+});
+const initWithRetry=(attempt=0)=>{
+const sliderWrap=target.querySelector('.sport-slider-wrap, .kids-slider-wrap, .rest-slider-wrap, .events-slider-wrap');
+if(sliderWrap){
+const slider=sliderWrap.querySelector('#sportSlider, #kidsSlider, #restSlider, #eventsSlider');
+if(slider&&slider.scrollWidth>0){
+initSliderArrowsControl(sliderWrap);
+updateArrowsForModal(target);
+}else if(attempt<10){
+setTimeout(()=>initWithRetry(attempt + 1),200);
+}
+}
+};
+setTimeout(()=>initWithRetry(),300);
+}
+if(!target.classList.contains('active')){
+const sliderWrap=target.querySelector('.sport-slider-wrap, .kids-slider-wrap, .rest-slider-wrap, .events-slider-wrap');
+if(sliderWrap){
+sliderWrap.dataset.arrowsInitialized='false';
+}
+}
+if(target.classList.contains('intro-hidden')){
+updateArrowsForModal(target);
+setTimeout(()=>updateArrowsForModal(target),200);
+}
+}
+});
+});
+document.querySelectorAll('.sport-modal, .kids-modal, .rest-modal, .events-modal').forEach(modal=>{
+modalObserver.observe(modal,{attributes:true,attributeFilter:['class']});
+});
+window.PrideSliderArrows={
+update:updateSliderArrows,
+init:initSliderArrowsControl,
+initAll:initAllSliderArrows
+};
+})();
+;
+(function(){
+'use strict';
+console.log('📦 modal-url-handler.js загружен');
+function saveUTMParams(){
+const urlParams=new URLSearchParams(window.location.search);
+const utmParams={};
+const utmKeys=[
+'utm_source',
+'utm_medium',
+'utm_campaign',
+'utm_term',
+'utm_content',
+'utm_id',
+'gclid',
+'fbclid',
+'yclid'
+];
+utmKeys.forEach(key=>{
+const value=urlParams.get(key);
+if(value){
+utmParams[key]=value;
+sessionStorage.setItem(key,value);
+}
+});
+if(Object.keys(utmParams).length>0){
+console.log('📊 UTM метки сохранены:',utmParams);
+return utmParams;
+}
+return null;
+}
+function getSavedUTMParams(){
+const utmParams={};
+const utmKeys=[
+'utm_source',
+'utm_medium',
+'utm_campaign',
+'utm_term',
+'utm_content',
+'utm_id',
+'gclid',
+'fbclid',
+'yclid'
+];
+utmKeys.forEach(key=>{
+const value=sessionStorage.getItem(key);
+if(value){
+utmParams[key]=value;
+}
+});
+return utmParams;
+}
+function addUTMToForm(form){
+const utmParams=getSavedUTMParams();
+if(Object.keys(utmParams).length===0){
+return;
+}
+Object.keys(utmParams).forEach(key=>{
+let input=form.querySelector(`input[name="${key}"]`);
+if(!input){
+input=document.createElement('input');
+input.type='hidden';
+input.name=key;
+input.value=utmParams[key];
+form.appendChild(input);
+console.log(`📝 Добавлено UTM поле в форму: ${key}=${utmParams[key]}`);
+}else{
+input.value=utmParams[key];
+}
+});
+}
+function initFormHandlers(){
+const forms=document.querySelectorAll('form');
+forms.forEach(form=>{
+addUTMToForm(form);
+form.addEventListener('submit',function(e){
+addUTMToForm(form);
+});
+});
+console.log(`✅ UTM метки добавлены к ${forms.length} формам`);
+}
+const MODAL_HASH_MAP={
+'sport':'sportModal',
+'kids':'kidsModal',
+'rest':'restModal',
+'events':'eventsModal',
+'contacts':'contactsModal',
+'about':'aboutModal',
+'vesotdyh':'relaxModal',
+'ice':'iceModal',
+'pricing':'pricingModal',
+'review':'reviewModal',
+'leave-review':'reviewFormModal',
+'plan-event':'planEventModal'
+};
+function openModalByHash(hash){
+const cleanHash=hash.replace('#','');
+if(!cleanHash){
+return;
+}
+const baseHash=cleanHash.split('/')[0];
+const modalId=MODAL_HASH_MAP[baseHash];
+if(!modalId){
+console.warn(`⚠️ Неизвестный hash: ${baseHash}`);
+return;
+}
+const modal=document.getElementById(modalId);
+if(!modal){
+console.warn(`⚠️ Модальное окно не найдено: ${modalId}`);
+return;
+}
+console.log(`🔗 Открытие модального окна по hash: ${baseHash} -> ${modalId}`);
+setTimeout(()=>{
+modal.classList.add('active');
+modal.dispatchEvent(new Event('modalopen'));
+},1200);
+}
+function handleHashChange(){
+const hash=window.location.hash;
+if(hash){
+openModalByHash(hash);
+}
+}
+function updateHashOnModalOpen(modalId){
+const hash=Object.keys(MODAL_HASH_MAP).find(
+key=>MODAL_HASH_MAP[key]===modalId
+);
+if(hash){
+window.location.hash=`#${hash}`;
+console.log(`🔗 Hash обновлен: #${hash}`);
+}
+}
+function clearHashOnModalClose(){
+if(window.location.hash){
+history.pushState(null,null,window.location.pathname + window.location.search);
+console.log('🔗 Hash очищен');
+}
+}
+function init(){
+console.log('🎬 Инициализация обработчика URL и UTM меток...');
+saveUTMParams();
+window.addEventListener('hashchange',handleHashChange);
+if(window.location.hash){
+handleHashChange();
+}
+document.addEventListener('click',function(e){
+const button=e.target.closest('[data-modal]');
+if(button){
+e.preventDefault();
+const modalId=button.getAttribute('data-modal');
+if(modalId){
+updateHashOnModalOpen(modalId);
+}
+}
+});
+document.addEventListener('click',function(e){
+const closeButton=e.target.closest('[id^="close"], .modal-close, .close-btn, .sport-close, .rest-close, .about-modal-close, .relax-modal-close, .ice-modal-close, .pricing-modal-close');
+if(closeButton){
+setTimeout(()=>{
+clearHashOnModalClose();
+},100);
+}
+});
+document.addEventListener('click',function(e){
+const modal=e.target.closest('.sport-modal, .kids-modal, .rest-modal, .events-modal, .contacts-modal, .about-modal, .relax-modal, .pricing-modal, .ice-modal, .review-modal');
+if(modal&&e.target===modal){
+setTimeout(()=>{
+clearHashOnModalClose();
+},100);
+}
+});
+document.addEventListener('keydown',function(e){
+if(e.key==='Escape'){
+const activeModal=document.querySelector('.sport-modal.active, .kids-modal.active, .rest-modal.active, .events-modal.active, .contacts-modal.active, .about-modal.active, .relax-modal.active, .pricing-modal.active, .ice-modal.active, .review-modal.active');
+if(activeModal){
+setTimeout(()=>{
+clearHashOnModalClose();
+},100);
+}
+}
+});
+document.addEventListener('modalclose',function(){
+clearHashOnModalClose();
+});
+const modals=document.querySelectorAll('.sport-modal, .kids-modal, .rest-modal, .events-modal, .contacts-modal, .about-modal, .relax-modal, .pricing-modal, .ice-modal, .review-modal');
+modals.forEach(modal=>{
+const observer=new MutationObserver(function(mutations){
+mutations.forEach(function(mutation){
+if(mutation.attributeName==='class'){
+const wasActive=mutation.oldValue&&mutation.oldValue.includes('active');
+const isActive=modal.classList.contains('active');
+if(wasActive&&!isActive){
+clearHashOnModalClose();
+}
+}
+});
+});
+observer.observe(modal,{attributes:true,attributeOldValue:true});
+});
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',initFormHandlers);
+}else{
+initFormHandlers();
+}
+modals.forEach(modal=>{
+modal.addEventListener('modalopen',function(){
+const forms=this.querySelectorAll('form');
+forms.forEach(form=>addUTMToForm(form));
+});
+});
+console.log('✅ Обработчик URL и UTM меток инициализирован');
+}
+window.PrideURLHandler={
+init:init,
+saveUTMParams:saveUTMParams,
+getSavedUTMParams:getSavedUTMParams,
+addUTMToForm:addUTMToForm,
+openModalByHash:openModalByHash,
+updateHashOnModalOpen:updateHashOnModalOpen,
+clearHashOnModalClose:clearHashOnModalClose
+};
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',init);
+}else{
+init();
+}
+})();
+;
+(function(){
+'use strict';
+console.log('📦 modal-slide-hash.js загружен');
+const CONFIG={
+sliders:{
+'sportModal':{
+sliderId:'sportSlider',
+cardClass:'sport-card'
+},
+'kidsModal':{
+sliderId:'kidsSlider',
+cardClass:'kids-card'
+},
+'restModal':{
+sliderId:'restSlider',
+cardClass:'rest-card'
+},
+'eventsModal':{
+sliderId:'eventsSlider',
+cardClass:'events-card'
+}
+},
+scrollDebounceDelay:300
+};
+function debounce(func,wait){
+let timeout;
+return function executedFunction(...args){
+const later=()=>{
+clearTimeout(timeout);
+func(...args);
+};
+clearTimeout(timeout);
+timeout=setTimeout(later,wait);
+};
+}
+function getActiveCard(slider,cardClass){
+if(!slider)return null;
+const cards=slider.querySelectorAll(`.${cardClass}`);
+const sliderRect=slider.getBoundingClientRect();
+const sliderCenter=sliderRect.left + sliderRect.width / 2;
+let closestCard=null;
+let closestDistance=Infinity;
+cards.forEach(card=>{
+const cardRect=card.getBoundingClientRect();
+const cardCenter=cardRect.left + cardRect.width / 2;
+const distance=Math.abs(cardCenter - sliderCenter);
+if(distance<closestDistance){
+closestDistance=distance;
+closestCard=card;
+}
+});
+return closestCard;
+}
+function getModalIdFromHash(hash){
+const cleanHash=hash.replace('#','');
+const parts=cleanHash.split('/');
+const hashToModalId={
+'sport':'sportModal',
+'kids':'kidsModal',
+'rest':'restModal',
+'events':'eventsModal'
+};
+return hashToModalId[parts[0]]||null;
+}
+function getSlideIdFromHash(hash){
+const cleanHash=hash.replace('#','');
+const parts=cleanHash.split('/');
+return parts[1]||null;
+}
+function createHash(modalId,slideId){
+const modalIdToHash={
+'sportModal':'sport',
+'kidsModal':'kids',
+'restModal':'rest',
+'eventsModal':'events'
+};
+const modalHash=modalIdToHash[modalId];
+if(!modalHash)return null;
+if(slideId){
+return `#${modalHash}/${slideId}`;
+}
+return `#${modalHash}`;
+}
+function updateHashFromSlider(modalId){
+const config=CONFIG.sliders[modalId];
+if(!config)return;
+const slider=document.getElementById(config.sliderId);
+if(!slider)return;
+const activeCard=getActiveCard(slider,config.cardClass);
+if(!activeCard)return;
+const slideId=activeCard.getAttribute('data-slide-id');
+if(!slideId)return;
+const newHash=createHash(modalId,slideId);
+if(newHash&&window.location.hash!==newHash){
+history.replaceState(null,null,newHash);
+console.log(`🔗 Хэш обновлен: ${newHash}`);
+}
+}
+function scrollToSlide(modalId,slideId){
+const config=CONFIG.sliders[modalId];
+if(!config){
+console.warn(`⚠️ Конфигурация для ${modalId} не найдена`);
+return false;
+}
+const slider=document.getElementById(config.sliderId);
+if(!slider){
+console.warn(`⚠️ Слайдер ${config.sliderId} не найден`);
+return false;
+}
+const targetCard=slider.querySelector(`[data-slide-id="${slideId}"]`);
+if(!targetCard){
+console.warn(`⚠️ Карточка с ID "${slideId}" не найдена`);
+return false;
+}
+targetCard.scrollIntoView({
+behavior:'smooth',
+block:'nearest',
+inline:'center'
+});
+console.log(`🎯 Прокрутка к слайду: ${modalId}/${slideId}`);
+return true;
+}
+function handleHashChange(){
+const hash=window.location.hash;
+if(!hash||!hash.includes('/'))return;
+const modalId=getModalIdFromHash(hash);
+const slideId=getSlideIdFromHash(hash);
+if(!modalId||!slideId)return;
+const modal=document.getElementById(modalId);
+if(!modal||!modal.classList.contains('active')){
+return;
+}
+setTimeout(()=>{
+scrollToSlide(modalId,slideId);
+},100);
+}
+function initSliderTracking(modalId){
+const config=CONFIG.sliders[modalId];
+if(!config)return;
+const slider=document.getElementById(config.sliderId);
+if(!slider)return;
+const debouncedUpdate=debounce(()=>{
+updateHashFromSlider(modalId);
+},CONFIG.scrollDebounceDelay);
+slider.addEventListener('scroll',debouncedUpdate);
+console.log(`✅ Отслеживание слайдера ${modalId} инициализировано`);
+const hash=window.location.hash;
+if(hash&&hash.includes('/')){
+const hashModalId=getModalIdFromHash(hash);
+const slideId=getSlideIdFromHash(hash);
+if(hashModalId===modalId&&slideId){
+setTimeout(()=>{
+scrollToSlide(modalId,slideId);
+},500);
+}
+}
+}
+function initModalSliders(modalId){
+setTimeout(()=>{
+initSliderTracking(modalId);
+},100);
+}
+function init(){
+console.log('🎬 Инициализация управления хэшами слайдов...');
+window.addEventListener('hashchange',handleHashChange);
+Object.keys(CONFIG.sliders).forEach(modalId=>{
+const modal=document.getElementById(modalId);
+if(!modal)return;
+const observer=new MutationObserver((mutations)=>{
+mutations.forEach((mutation)=>{
+if(mutation.attributeName==='class'){
+if(modal.classList.contains('active')){
+initModalSliders(modalId);
+}
+}
+});
+});
+observer.observe(modal,{
+attributes:true,
+attributeFilter:['class']
+});
+modal.addEventListener('modalopen',()=>{
+initModalSliders(modalId);
+});
+});
+setTimeout(()=>{
+Object.keys(CONFIG.sliders).forEach(modalId=>{
+const modal=document.getElementById(modalId);
+if(modal&&modal.classList.contains('active')){
+initModalSliders(modalId);
+}
+});
+},1500);
+console.log('✅ Управление хэшами слайдов инициализировано');
+}
+window.PrideSlideHash={
+init:init,
+scrollToSlide:scrollToSlide,
+updateHashFromSlider:updateHashFromSlider
+};
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',init);
+}else{
+init();
+}
+})();
+//# sourceMappingURL=bundle-main.a816923d29.min.js.map
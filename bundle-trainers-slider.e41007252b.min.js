@@ -0,0 +1,357 @@
+(function(){
+'use strict';
+console.log('📦 trainers-slider.js загружен');
+const TRAINERS_DATA={
+'ivanov':{
+name:'Иванов Сергей',
+specialty:'Фитнес-тренер',
+photo:'img/trainers/sergey.png',
+formValue:'ivanov'
+},
+'bogachev':{
+name:'Андрей Богачев',
+specialty:'Тренер по функциональному тренингу',
+photo:'img/trainers/bogachev.png',
+formValue:'bogachev'
+},
+'brunina':{
+name:'Елена Брюнина',
+specialty:'Фитнес-тренер',
+photo:'img/trainers/brunina.png',
+formValue:'brunina'
+},
+'yagunova':{
+name:'Марина Ягунова',
+specialty:'Сертифицированный фитнес-инструктор',
+photo:'img/trainers/gorsheneva.png',
+formValue:'yagunova'
+},
+'murashkin':{
+name:'Антон Мурашкин',
+specialty:'Фитнес-тренер',
+photo:'img/trainers/murashkin.png',
+formValue:'murashkin'
+},
+'savkin':{
+name:'Алексей Савкин',
+specialty:'Фитнес-тренер',
+photo:'img/trainers/savkin.png',
+formValue:'savkin'
+},
+'tatarenko':{
+name:'Наталья Татаренко',
+specialty:'Персональный тренер по фитнесу',
+photo:'img/trainers/tatarenko.png',
+formValue:'tatarenko'
+}
+};
+function initTrainersSlider(){
+const slider=document.getElementById('trainersSlider');
+const prevBtn=document.querySelector('.trainers-nav-prev');
+const nextBtn=document.querySelector('.trainers-nav-next');
+if(!slider||!prevBtn||!nextBtn)return;
+const scrollStep=320;
+prevBtn.addEventListener('click',()=>{
+slider.scrollBy({
+left:-scrollStep,
+behavior:'smooth'
+});
+});
+nextBtn.addEventListener('click',()=>{
+slider.scrollBy({
+left:scrollStep,
+behavior:'smooth'
+});
+});
+console.log('✅ Слайдер тренеров инициализирован');
+}
+let currentTrainerId=null;
+function openBookingForTrainer(trainerId){
+currentTrainerId=trainerId;
+const trainer=TRAINERS_DATA[trainerId];
+if(!trainer){
+console.error(`Тренер с ID ${trainerId} не найден`);
+return;
+}
+const bookingPanel=document.getElementById('bookingPanel');
+const backdrop=document.getElementById('offcanvasBackdrop');
+if(!bookingPanel||!backdrop){
+console.error('bookingPanel или offcanvasBackdrop не найдены');
+return;
+}
+bookingPanel.classList.add('active');
+backdrop.classList.add('show');
+if(typeof loadFormConfig==='function'){
+loadFormConfig().then(()=>{
+const gymOption=document.querySelector('[data-value="gym"]');
+if(gymOption){
+gymOption.click();
+setTimeout(()=>{
+const trainerOption=document.querySelector('[data-value="trainer"]');
+if(trainerOption){
+trainerOption.click();
+setTimeout(()=>{
+const specificTrainerOption=document.querySelector(`[data-value="${trainer.formValue}"]`);
+if(specificTrainerOption){
+specificTrainerOption.click();
+console.log(`✅ Выбран тренер: ${trainer.name}`);
+}else{
+console.warn(`⚠️ Не найден тренер с value="${trainer.formValue}"`);
+}
+updateHashForTrainer(trainerId);
+console.log(`✅ Открыта форма записи к тренеру: ${trainer.name}`);
+},150);
+}
+},100);
+}
+});
+}
+}
+function updateHashForTrainer(trainerId){
+const newHash=`#about/trainer-${trainerId}`;
+if(window.location.hash!==newHash){
+history.pushState(null,null,newHash);
+console.log(`🔗 Hash обновлен: ${newHash}`);
+}
+}
+function handleTrainerHashChange(){
+const hash=window.location.hash;
+if(hash.includes('/trainer-')){
+const trainerId=hash.split('/trainer-')[1];
+if(TRAINERS_DATA[trainerId]){
+setTimeout(()=>{
+openBookingForTrainer(trainerId);
+},1500);
+}
+}
+}
+function init(){
+console.log('🎬 Инициализация слайдера тренеров...');
+const aboutModal=document.getElementById('aboutModal');
+if(aboutModal){
+const observer=new MutationObserver((mutations)=>{
+mutations.forEach((mutation)=>{
+if(mutation.attributeName==='class'){
+if(aboutModal.classList.contains('active')){
+setTimeout(()=>{
+initTrainersSlider();
+initTrainerCards();
+},100);
+}
+}
+});
+});
+observer.observe(aboutModal,{
+attributes:true,
+attributeFilter:['class']
+});
+aboutModal.addEventListener('modalopen',()=>{
+setTimeout(()=>{
+initTrainersSlider();
+initTrainerCards();
+},100);
+});
+}
+window.addEventListener('hashchange',handleTrainerHashChange);
+if(window.location.hash.includes('/trainer-')){
+handleTrainerHashChange();
+}
+console.log('✅ Слайдер тренеров готов к работе');
+}
+function initTrainerCards(){
+const trainerCards=document.querySelectorAll('.trainer-card');
+trainerCards.forEach(card=>{
+const bookBtn=card.querySelector('.trainer-book-btn');
+if(!bookBtn)return;
+const newBookBtn=bookBtn.cloneNode(true);
+bookBtn.parentNode.replaceChild(newBookBtn,bookBtn);
+newBookBtn.addEventListener('click',(e)=>{
+e.preventDefault();
+e.stopPropagation();
+const trainerId=card.getAttribute('data-trainer-id');
+if(trainerId){
+openBookingForTrainer(trainerId);
+}
+});
+});
+console.log(`✅ Инициализировано ${trainerCards.length} карточек тренеров`);
+}
+window.PrideTrainersSlider={
+init:init,
+openTrainer:openBookingForTrainer
+};
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',init);
+}else{
+init();
+}
+})();
+;
+(function(){
+'use strict';
+console.log('📦 about-theme.js загружен');
+const THEME_KEY='aboutModalTheme';
+function getSavedTheme(){
+return localStorage.getItem(THEME_KEY)||'light';
+}
+function saveTheme(theme){
+localStorage.setItem(THEME_KEY,theme);
+}
+function applyTheme(theme){
+const modal=document.getElementById('aboutModal');
+if(!modal)return;
+if(theme==='dark'){
+modal.classList.add('theme-dark');
+console.log('🌙 Применена темная тема');
+}else{
+modal.classList.remove('theme-dark');
+console.log('☀️ Применена светлая тема');
+}
+}
+function toggleTheme(){
+const currentTheme=getSavedTheme();
+const newTheme=currentTheme==='light'?'dark':'light';
+saveTheme(newTheme);
+applyTheme(newTheme);
+}
+function init(){
+console.log('🎬 Инициализация переключателя тем...');
+const savedTheme=getSavedTheme();
+applyTheme(savedTheme);
+const toggleButton=document.getElementById('aboutThemeToggle');
+if(toggleButton){
+toggleButton.addEventListener('click',toggleTheme);
+console.log('✅ Кнопка переключения темы подключена');
+}
+const modal=document.getElementById('aboutModal');
+if(modal){
+modal.addEventListener('modalopen',()=>{
+applyTheme(getSavedTheme());
+});
+}
+console.log('✅ Переключатель тем инициализирован');
+}
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',init);
+}else{
+init();
+}
+window.AboutTheme={
+toggle:toggleTheme,
+apply:applyTheme,
+get:getSavedTheme
+};
+})();
+;
+(function(){
+'use strict';
+console.log('📦 relax-theme.js загружен');
+const THEME_KEY='relaxModalTheme';
+function getSavedTheme(){
+return localStorage.getItem(THEME_KEY)||'light';
+}
+function saveTheme(theme){
+localStorage.setItem(THEME_KEY,theme);
+}
+function applyTheme(theme){
+const modal=document.getElementById('relaxModal');
+if(!modal)return;
+if(theme==='dark'){
+modal.classList.add('theme-dark');
+console.log('🌙 Применена темная тема');
+}else{
+modal.classList.remove('theme-dark');
+console.log('☀️ Применена светлая тема');
+}
+}
+function toggleTheme(){
+const currentTheme=getSavedTheme();
+const newTheme=currentTheme==='light'?'dark':'light';
+saveTheme(newTheme);
+applyTheme(newTheme);
+}
+function init(){
+console.log('🎬 Инициализация переключателя тем...');
+const savedTheme=getSavedTheme();
+applyTheme(savedTheme);
+const toggleButton=document.getElementById('relaxThemeToggle');
+if(toggleButton){
+toggleButton.addEventListener('click',toggleTheme);
+console.log('✅ Кнопка переключения темы подключена');
+}
+const modal=document.getElementById('relaxModal');
+if(modal){
+modal.addEventListener('modalopen',()=>{
+applyTheme(getSavedTheme());
+});
+}
+console.log('✅ Переключатель тем инициализирован');
+}
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',init);
+}else{
+init();
+}
+window.RelaxTheme={
+toggle:toggleTheme,
+apply:applyTheme,
+get:getSavedTheme
+};
+})();
+;
+(function(){
+'use strict';
+console.log('📦 ice-theme.js загружен');
+const THEME_KEY='iceModalTheme';
+function getSavedTheme(){
+return localStorage.getItem(THEME_KEY)||'light';
+}
+function saveTheme(theme){
+localStorage.setItem(THEME_KEY,theme);
+}
+function applyTheme(theme){
+const modal=document.getElementById('iceModal');
+if(!modal)return;
+if(theme==='dark'){
+modal.classList.add('theme-dark');
+console.log('🌙 Применена темная тема');
+}else{
+modal.classList.remove('theme-dark');
+console.log('☀️ Применена светлая тема');
+}
+}
+function toggleTheme(){
+const currentTheme=getSavedTheme();
+const newTheme=currentTheme==='light'?'dark':'light';
+saveTheme(newTheme);
+applyTheme(newTheme);
+}
+function init(){
+console.log('🎬 Инициализация переключателя тем...');
+const savedTheme=getSavedTheme();
+applyTheme(savedTheme);
+const toggleButton=document.getElementById('iceThemeToggle');
+if(toggleButton){
+toggleButton.addEventListener('click',toggleTheme);
+console.log('✅ Кнопка переключения темы подключена');
+}
+const modal=document.getElementById('iceModal');
+if(modal){
+modal.addEventListener('modalopen',()=>{
+applyTheme(getSavedTheme());
+});
+}
+console.log('✅ Переключатель тем инициализирован');
+}
+if(document.readyState==='loading'){
+document.addEventListener('DOMContentLoaded',init);
+}else{
+init();
+}
+window.IceTheme={
+toggle:toggleTheme,
+apply:applyTheme,
+get:getSavedTheme
+};
+})();
+//# sourceMappingURL=bundle-trainers-slider.e41007252b.min.js.map
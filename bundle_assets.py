@@ -0,0 +1,721 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Сборка CSS/JS сайта в минифицированные бандлы с картами исходников
+
+Идущие подряд в index.html локальные стили (<link rel="stylesheet">) и скрипты
+(<script src>) объединяются в один файл в том же порядке:
+
+    bundle-<первый файл>.<хеш>.min.css / .js   + .map (source map v3)
+
+Между тегами одной группы могут быть только пробелы и комментарии, поэтому
+порядок выполнения скриптов и каскад стилей не меняются. Теги с async, defer,
+type, media и файлы из подпапок не объединяются.
+
+Минификация построчная: удаляются комментарии, отступы, пустые строки и лишние
+пробелы, но переводы строк в коде сохраняются (автоподстановка ; в JS работает
+как раньше). Каждая строка бандла указывает в source map на строку исходника.
+
+В index.html группа заменяется блоком:
+
+    <!-- bundle:style src="style.css theme-styles.css ..." -->
+    <link rel="stylesheet" href="bundle-style.<хеш>.min.css">
+    <!-- /bundle -->
+
+Если в <head> уже встроен критический CSS (critical_css.py), бандл стилей
+подключается без блокировки отрисовки: <link rel="preload"> с переключением
+на stylesheet после загрузки и <noscript> для браузеров без JS.
+
+Повторный запуск пересобирает бандлы из исходников, перечисленных в src.
+Чтобы вернуть отдельные теги (например, для отладки), используйте --unbundle.
+С --pruned стили берутся из pruned/ (без неиспользуемых селекторов, см. critical_css.py).
+
+Запуск:
+    python bundle_assets.py
+    python bundle_assets.py --pruned
+    python bundle_assets.py --unbundle
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from bisect import bisect_right
+from pathlib import Path
+
+from asset_manifest import collect_refs, split_ref, version_partials
+from safe_output import write_text_atomic
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+INDEX_FILE = 'index.html'
+BUNDLE_PREFIX = 'bundle-'
+PRUNED_DIR = 'pruned'
+
+BLOCK_PATTERN = re.compile(
+    r'(?P<indent>[ \t]*)<!-- bundle:(?P<name>[\w.-]+) src="(?P<sources>[^"]*)" -->\n'
+    r'(?P<tag_indent>[ \t]*)(?P<tag>[^\n]*)\n[ \t]*<!-- /bundle -->'
+)
+
+# Начало блока критического CSS (см. critical_css.py)
+CRITICAL_MARKER = '<!-- critical-css:start'
+
+# Между тегами одной группы допустимы только пробелы и комментарии
+COMMENT = r'<!--(?:(?!-->).)*-->'
+GAP_PATTERN = re.compile(rf'(?:\s|{COMMENT})*', re.DOTALL)
+COMMENT_PATTERN = re.compile(COMMENT, re.DOTALL)
+
+BASE64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+# ---------------------------------------------------------------------------
+# Построчная минификация
+# ---------------------------------------------------------------------------
+
+class LineWriter:
+    """
+    Собирает выходные строки и запоминает, с какой строки и колонки
+    исходника начинается каждая из них
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.current = []
+        self.origin = None
+        self.keep = False  # строка содержит значимые пробелы (шаблонная строка JS)
+
+    def emit(self, text, line, column):
+        if self.origin is None:
+            self.origin = (line, column)
+        self.current.append(text)
+
+    def last_char(self):
+        for part in reversed(self.current):
+            if part:
+                return part[-1]
+        return ''
+
+    def space(self):
+        """Один пробел вместо последовательности пробелов (не в начале строки)"""
+        if self.current and self.last_char() != ' ':
+            self.current.append(' ')
+
+    def drop_space(self):
+        if self.current and self.current[-1] == ' ':
+            self.current.pop()
+
+    def newline(self):
+        text = ''.join(self.current)
+        if not self.keep:
+            text = text.strip()
+        if text or self.keep:
+            self.lines.append((text, self.origin))
+        self.current = []
+        self.origin = None
+        self.keep = False
+
+    def finish(self):
+        self.newline()
+        return self.lines
+
+
+def line_offsets(source):
+    """Смещения начала каждой строки"""
+    offsets = [0]
+    for match in re.finditer('\n', source):
+        offsets.append(match.end())
+    return offsets
+
+
+def position(offsets, index):
+    """(строка, колонка) с нуля для смещения index"""
+    line = bisect_right(offsets, index) - 1
+    return line, index - offsets[line]
+
+
+# Знаки, вокруг которых пробелы не нужны (+, -, / и . не входят: a + +b, a - -b)
+JS_TIGHT = set('{}()[];,:=<>?!&|*%^~')
+JS_IDENTIFIER = re.compile(r'[\w$]')
+
+# После этих знаков и слов / начинает регулярное выражение, а не деление
+REGEX_AFTER_CHARS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_AFTER_WORDS = {
+    'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+    'void', 'throw', 'instanceof', 'yield', 'await'
+}
+
+
+def minify_js(source):
+    """
+    Построчная минификация JavaScript
+
+    Возвращает список (строка, (строка исходника, колонка) или None)
+    """
+    out = LineWriter()
+    offsets = line_offsets(source)
+    length = len(source)
+    i = 0
+
+    # Стек шаблонных строк: глубина фигурных скобок внутри ${...}
+    templates = []
+    last_significant = ''   # последний значимый символ кода
+    last_word = ''          # последнее слово (для return /re/ и т.п.)
+
+    def regex_allowed():
+        if not last_significant:
+            return True
+        if last_significant in REGEX_AFTER_CHARS:
+            return True
+        return last_word in REGEX_AFTER_WORDS and JS_IDENTIFIER.match(last_significant)
+
+    def copy_template_chunk(start):
+        """Копирует текст шаблонной строки до ` или ${, возвращает новую позицию"""
+        j = start
+        while j < length:
+            char = source[j]
+            if char == '\\':
+                j += 2
+                continue
+            if char == '`' or (char == '$' and source.startswith('${', j)):
+                break
+            j += 1
+
+        chunk_start = start
+        for k in range(start, min(j, length)):
+            if source[k] == '\n':
+                line, column = position(offsets, chunk_start)
+                out.emit(source[chunk_start:k], line, column)
+                out.keep = True
+                out.newline()
+                chunk_start = k + 1
+                out.keep = True
+        if chunk_start < min(j, length):
+            line, column = position(offsets, chunk_start)
+            out.emit(source[chunk_start:j], line, column)
+            out.keep = True
+        return j
+
+    while i < length:
+        char = source[i]
+
+        # Комментарии
+        if char == '/' and source.startswith('//', i):
+            end = source.find('\n', i)
+            i = length if end == -1 else end
+            continue
+
+        if char == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            # Многострочный комментарий работает как перевод строки
+            if '\n' in source[i:end]:
+                out.newline()
+            else:
+                out.space()
+            i = end
+            continue
+
+        if char == '\n':
+            out.newline()
+            i += 1
+            continue
+
+        if char in ' \t\r\f\v':
+            j = i
+            while j < length and source[j] in ' \t\r\f\v':
+                j += 1
+            following = source[j] if j < length else ''
+            if out.last_char() not in JS_TIGHT and following not in JS_TIGHT:
+                out.space()
+            i = j
+            continue
+
+        line, column = position(offsets, i)
+
+        # Строки
+        if char in '\'"':
+            j = i + 1
+            while j < length and source[j] != char:
+                j += 2 if source[j] == '\\' else 1
+            j = min(j + 1, length)
+            out.emit(source[i:j], line, column)
+            last_significant, last_word = char, ''
+            i = j
+            continue
+
+        # Шаблонные строки
+        if char == '`':
+            out.emit('`', line, column)
+            i = copy_template_chunk(i + 1)
+            if i < length and source[i] == '`':
+                out.emit('`', *position(offsets, i))
+                i += 1
+                last_significant, last_word = '`', ''
+            elif i < length:
+                out.emit('${', *position(offsets, i))
+                templates.append(0)
+                i += 2
+                last_significant, last_word = '{', ''
+            continue
+
+        if templates and char == '{':
+            templates[-1] += 1
+        elif templates and char == '}':
+            if templates[-1] == 0:
+                templates.pop()
+                out.drop_space()
+                out.emit('}', line, column)
+                i = copy_template_chunk(i + 1)
+                if i < length and source[i] == '`':
+                    out.emit('`', *position(offsets, i))
+                    i += 1
+                    last_significant, last_word = '`', ''
+                elif i < length:
+                    out.emit('${', *position(offsets, i))
+                    templates.append(0)
+                    i += 2
+                    last_significant, last_word = '{', ''
+                continue
+            templates[-1] -= 1
+
+        # Регулярные выражения
+        if char == '/' and regex_allowed():
+            j = i + 1
+            in_class = False
+            while j < length and source[j] != '\n':
+                if source[j] == '\\':
+                    j += 2
+                    continue
+                if source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                elif source[j] == '/' and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < length and JS_IDENTIFIER.match(source[j]):
+                j += 1
+            out.emit(source[i:j], line, column)
+            last_significant, last_word = 'a', ''
+            i = j
+            continue
+
+        if char in JS_TIGHT:
+            out.drop_space()
+
+        # Слова и числа целиком
+        if JS_IDENTIFIER.match(char):
+            j = i
+            while j < length and JS_IDENTIFIER.match(source[j]):
+                j += 1
+            word = source[i:j]
+            out.emit(word, line, column)
+            last_significant, last_word = word[-1], word
+            i = j
+            continue
+
+        out.emit(char, line, column)
+        last_significant, last_word = char, ''
+        i += 1
+
+    return out.finish()
+
+
+CSS_TIGHT = set('{};,>')
+
+
+def minify_css(source, keep_lines=True):
+    """
+    Построчная минификация CSS
+
+    keep_lines=False - все в одну строку (для встраивания в HTML, без source map)
+    Возвращает список (строка, (строка исходника, колонка) или None)
+    """
+    out = LineWriter()
+    offsets = line_offsets(source)
+    length = len(source)
+    spaces = ' \t\r\f\v' if keep_lines else ' \t\r\f\v\n'
+    i = 0
+
+    while i < length:
+        char = source[i]
+
+        if char == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            if keep_lines and '\n' in source[i:end]:
+                out.newline()
+            i = end
+            continue
+
+        if char == '\n' and keep_lines:
+            out.newline()
+            i += 1
+            continue
+
+        if char in spaces:
+            j = i
+            while j < length and source[j] in spaces:
+                j += 1
+            following = source[j] if j < length else ''
+            if out.last_char() not in CSS_TIGHT | {':'} and following not in CSS_TIGHT:
+                out.space()
+            i = j
+            continue
+
+        line, column = position(offsets, i)
+
+        if char in '\'"':
+            j = i + 1
+            while j < length and source[j] != char and source[j] != '\n':
+                j += 2 if source[j] == '\\' else 1
+            j = min(j + 1, length)
+            out.emit(source[i:j], line, column)
+            i = j
+            continue
+
+        # url(...) без кавычек копируется как есть
+        if source.startswith('url(', i) and source[i + 4:i + 5] not in ('"', "'"):
+            end = source.find(')', i)
+            end = length if end == -1 else end + 1
+            out.emit(source[i:end], line, column)
+            i = end
+            continue
+
+        if char in CSS_TIGHT:
+            out.drop_space()
+            # ; перед } не нужна
+            if char == '}' and out.last_char() == ';':
+                out.current[-1] = out.current[-1][:-1]
+                if not out.current[-1]:
+                    out.current.pop()
+
+        out.emit(char, line, column)
+        i += 1
+
+    return out.finish()
+
+
+def passthrough(source):
+    """Уже минифицированные файлы (*.min.js) - без изменений, строка в строку"""
+    return [(text, (number, 0)) for number, text in enumerate(source.split('\n'))]
+
+
+# ---------------------------------------------------------------------------
+# Source map
+# ---------------------------------------------------------------------------
+
+def _vlq(value):
+    value = ((-value) << 1) | 1 if value < 0 else value << 1
+    encoded = ''
+    while True:
+        digit = value & 31
+        value >>= 5
+        if value:
+            digit |= 32
+        encoded += BASE64[digit]
+        if not value:
+            return encoded
+
+
+def build_source_map(file_name, sources, mapped_lines):
+    """
+    Source map v3
+
+    mapped_lines: [(индекс исходника, строка, колонка) или None] на каждую строку бандла
+    """
+    segments = []
+    previous = [0, 0, 0]
+
+    for mapping in mapped_lines:
+        if mapping is None:
+            segments.append('')
+            continue
+        source_index, line, column = mapping
+        segments.append(
+            _vlq(0) + _vlq(source_index - previous[0]) + _vlq(line - previous[1]) + _vlq(column - previous[2])
+        )
+        previous = [source_index, line, column]
+
+    return {
+        'version': 3,
+        'file': file_name,
+        'sources': sources,
+        'names': [],
+        'mappings': ';'.join(segments)
+    }
+
+
+def build_bundle(name, kind, sources, root, pruned_dir=None):
+    """
+    Собирает бандл из исходников
+
+    pruned_dir - папка с очищенными стилями critical_css.py: если там есть
+    одноименный CSS-файл, в бандл идет он.
+    Возвращает (имя файла бандла, текст, source map, размер исходников в байтах)
+    """
+    lines = []
+    mapped = []
+    source_size = 0
+    map_sources = []
+
+    for index, source_name in enumerate(sources):
+        path = root / source_name
+        if kind == 'js':
+            version_partials(path, root)
+        elif pruned_dir and (root / pruned_dir / source_name).is_file():
+            path = root / pruned_dir / source_name
+        map_sources.append(path.relative_to(root).as_posix())
+
+        source = path.read_text(encoding='utf-8')
+        source_size += len(source.encode('utf-8'))
+
+        if source_name.endswith(('.min.js', '.min.css')):
+            minified = passthrough(source)
+        else:
+            minified = minify_js(source) if kind == 'js' else minify_css(source)
+
+        # Разделитель между файлами: незакрытая последняя инструкция не склеится со следующим файлом
+        if kind == 'js' and lines:
+            lines.append(';')
+            mapped.append(None)
+
+        for text, origin in minified:
+            lines.append(text)
+            mapped.append((index, origin[0], origin[1]) if origin else None)
+
+    body = '\n'.join(lines) + '\n'
+    digest = hashlib.sha256(body.encode('utf-8')).hexdigest()[:10]
+    file_name = f"{BUNDLE_PREFIX}{name}.{digest}.min.{kind}"
+
+    if kind == 'js':
+        body += f"//# sourceMappingURL={file_name}.map\n"
+    else:
+        body += f"/*# sourceMappingURL={file_name}.map */\n"
+
+    return file_name, body, build_source_map(file_name, map_sources, mapped), source_size
+
+
+# ---------------------------------------------------------------------------
+# index.html
+# ---------------------------------------------------------------------------
+
+def plain_tag(kind, url):
+    if kind == 'css':
+        return f'<link rel="stylesheet" type="text/css" href="{url}">'
+    return f'<script src="{url}"></script>'
+
+
+def bundle_tag(kind, url, deferred=False):
+    """Тег бандла; deferred - стили без блокировки отрисовки (есть критический CSS)"""
+    if kind == 'css' and deferred:
+        return (f'<link rel="preload" href="{url}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+                f'<noscript>{plain_tag(kind, url)}</noscript>')
+    return plain_tag(kind, url)
+
+
+def _bundle_url(tag):
+    return re.search(r'(?:href|src)="([^"]+)"', tag).group(1)
+
+
+def has_style_bundle(html):
+    return any(match.group('sources').split()[0].endswith('.css')
+               for match in BLOCK_PATTERN.finditer(html) if match.group('sources').split())
+
+
+def set_style_loading(html, deferred):
+    """Переключает теги бандлов стилей между блокирующим и неблокирующим подключением"""
+    def retag(match):
+        sources = match.group('sources').split()
+        if not sources or not sources[0].endswith('.css'):
+            return match.group(0)
+        tag = bundle_tag('css', _bundle_url(match.group('tag')), deferred)
+        start, end = match.span('tag')
+        offset = match.start()
+        return match.group(0)[:start - offset] + tag + match.group(0)[end - offset:]
+
+    return BLOCK_PATTERN.sub(retag, html)
+
+
+def unbundle(html):
+    """Заменяет блоки бандлов обратно на отдельные теги исходников"""
+    def restore(match):
+        sources = match.group('sources').split()
+        kind = 'css' if sources and sources[0].endswith('.css') else 'js'
+        indent = match.group('indent')
+        return '\n'.join(indent + plain_tag(kind, url) for url in sources)
+
+    return BLOCK_PATTERN.sub(restore, html)
+
+
+def _bundle_kind(ref, root):
+    """'css', 'js' или None, если тег нельзя объединять"""
+    attrs = ref['attrs']
+    file_name = split_ref(ref['value'])[1]
+
+    if '/' in file_name or file_name.startswith(BUNDLE_PREFIX) or not (root / file_name).is_file():
+        return None
+
+    if ref['element'] == 'link' and ref['attr'] == 'href':
+        rel = (attrs.get('rel') or '').lower().split()
+        if rel == ['stylesheet'] and not attrs.get('media') and 'disabled' not in attrs:
+            return 'css'
+
+    if ref['element'] == 'script' and ref['attr'] == 'src':
+        script_type = (attrs.get('type') or 'text/javascript').lower()
+        blocked = {'async', 'defer', 'nomodule', 'integrity'} & set(attrs)
+        if script_type in ('text/javascript', 'application/javascript') and not blocked:
+            return 'js'
+
+    return None
+
+
+def find_groups(html, root):
+    """Группы идущих подряд тегов одного типа: [{'kind', 'start', 'end', 'urls', 'comments'}]"""
+    groups = []
+    current = None
+
+    for ref in collect_refs(html):
+        kind = _bundle_kind(ref, root)
+        if kind is None:
+            current = None
+            continue
+
+        start, end = ref['start'], ref['end']
+        if kind == 'js':
+            closing = re.compile(r'\s*</script\s*>', re.IGNORECASE).match(html, end)
+            if not closing:
+                current = None
+                continue
+            end = closing.end()
+
+        gap = html[current['end']:start] if current else None
+        if current and current['kind'] == kind and GAP_PATTERN.fullmatch(gap):
+            current['urls'].append(split_ref(ref['value'])[0])
+            current['comments'].extend(COMMENT_PATTERN.findall(gap))
+            current['end'] = end
+        else:
+            current = {'kind': kind, 'start': start, 'end': end,
+                       'urls': [split_ref(ref['value'])[0]], 'comments': []}
+            groups.append(current)
+
+    return [group for group in groups if len(group['urls']) > 1]
+
+
+def bundle_index(index_file=INDEX_FILE, pruned_dir=None):
+    """
+    Собирает бандлы и обновляет index.html за один проход
+
+    pruned_dir - брать стили из очищенных копий critical_css.py
+
+    Возвращает список бандлов: {'file', 'sources', 'size', 'source_size'}
+    """
+    index_path = Path(index_file)
+    root = index_path.parent
+    original = index_path.read_text(encoding='utf-8')
+    html = unbundle(original)
+
+    parts = []
+    cursor = 0
+    bundles = []
+    used_names = set()
+
+    for group in find_groups(html, root):
+        sources = [split_ref(url)[1] for url in group['urls']]
+
+        name = Path(sources[0]).stem.replace('.min', '')
+        if name in used_names:
+            name = f"{name}-{len(used_names)}"
+        used_names.add(name)
+
+        file_name, body, source_map, source_size = build_bundle(name, group['kind'], sources, root, pruned_dir)
+
+        bundle_path = root / file_name
+        if not bundle_path.exists() or bundle_path.read_text(encoding='utf-8') != body:
+            write_text_atomic(bundle_path, body)
+        write_text_atomic(root / f"{file_name}.map", json.dumps(source_map, ensure_ascii=False))
+
+        # Комментарии между тегами остаются над блоком, отступ - как у первого тега
+        line_start = html.rfind('\n', 0, group['start']) + 1
+        indent = re.match(r'[ \t]*', html[line_start:group['start']]).group(0)
+        block = [*group['comments'],
+                 f'<!-- bundle:{name} src="{" ".join(group["urls"])}" -->',
+                 bundle_tag(group['kind'], file_name, deferred=CRITICAL_MARKER in html),
+                 '<!-- /bundle -->']
+
+        parts.append(html[cursor:group['start']])
+        parts.append(f'\n{indent}'.join(block))
+        cursor = group['end']
+
+        bundles.append({
+            'file': file_name,
+            'sources': sources,
+            'size': len(body.encode('utf-8')),
+            'source_size': source_size
+        })
+
+    parts.append(html[cursor:])
+    updated = ''.join(parts)
+
+    if updated != original:
+        write_text_atomic(index_path, updated)
+
+    # Старые бандлы, на которые index.html больше не ссылается
+    current = {bundle['file'] for bundle in bundles}
+    for path in root.glob(f'{BUNDLE_PREFIX}*.min.*'):
+        file_name = path.name[:-len('.map')] if path.name.endswith('.map') else path.name
+        if file_name not in current:
+            path.unlink()
+
+    return bundles
+
+
+def unbundle_index(index_file=INDEX_FILE):
+    """Возвращает в index.html отдельные теги исходников вместо бандлов"""
+    index_path = Path(index_file)
+    original = index_path.read_text(encoding='utf-8')
+    updated = unbundle(original)
+    if updated != original:
+        write_text_atomic(index_path, updated)
+    return updated != original
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Сборка CSS/JS сайта в минифицированные бандлы')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--pruned', action='store_true',
+                      help=f'стили из {PRUNED_DIR}/ без неиспользуемых селекторов (см. critical_css.py)')
+    mode.add_argument('--unbundle', action='store_true',
+                      help='вернуть в index.html отдельные теги исходников')
+    args = parser.parse_args(argv)
+
+    if args.unbundle:
+        if unbundle_index():
+            print(f"✓ В {INDEX_FILE} возвращены отдельные теги CSS/JS")
+            print("  Запустите python asset_manifest.py для версий ?v= в ссылках")
+        else:
+            print(f"✓ В {INDEX_FILE} нет бандлов")
+        return
+
+    bundles = bundle_index(pruned_dir=PRUNED_DIR if args.pruned else None)
+    if not bundles:
+        print("Нет групп CSS/JS для объединения")
+        return
+
+    total_before = total_after = 0
+    for bundle in bundles:
+        total_before += bundle['source_size']
+        total_after += bundle['size']
+        print(f"📦 {bundle['file']}: {len(bundle['sources'])} файлов, "
+              f"{bundle['source_size'] / 1024:.1f} KB -> {bundle['size'] / 1024:.1f} KB")
+
+    print(f"✓ Запросов меньше на {sum(len(b['sources']) - 1 for b in bundles)}, "
+          f"размер {total_before / 1024:.1f} KB -> {total_after / 1024:.1f} KB")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Критический CSS и удаление неиспользуемых селекторов
+
+Скрипт разбирает index.html, HTML-фрагменты модальных окон и все подключенные
+скрипты и собирает классы, id, теги и атрибуты, которые реально встречаются
+на странице. Затем для каждой таблицы стилей из index.html:
+
+- pruned/<файл>.css - та же таблица без правил, селекторы которых не
+  встречаются нигде (ни в HTML, ни в строках JS)
+- в <head> index.html вставляется блок <style> с критическим CSS: правила
+  для первого экрана (прелоадер, шапка, первый слайд) без модальных окон,
+  <template> и скрытых элементов. В него попадают только селекторы с классом
+  или id первого экрана (и сбросы html, body, :root, *), без :hover/:focus.
+  Бандл стилей при этом подключается без блокировки отрисовки (preload),
+  иначе браузер все равно ждал бы полный CSS. Если стили не собраны в бандл
+  или блок после сжатия больше CRITICAL_LIMIT, он не вставляется
+
+Проверка осторожная: классы, которые JS собирает из частей ('slide--' + state),
+считаются используемыми по префиксу, а :hover, :not(...) и т.п. не учитываются.
+@font-face, @keyframes и прочие at-правила в pruned/ сохраняются без изменений.
+
+Результат кешируется по хешам входных файлов (critical_css.cache.json):
+если ни HTML, ни скрипты, ни стили не изменились, повторный запуск ничего
+не пересчитывает. В конце печатается отчет: сколько байт сэкономлено в каждом файле.
+
+Чтобы собрать бандл стилей из очищенных файлов: python bundle_assets.py --pruned
+
+Запуск: python critical_css.py
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from asset_manifest import collect_refs, split_ref
+from bundle_assets import (BLOCK_PATTERN, CRITICAL_MARKER, PRUNED_DIR, has_style_bundle, minify_css,
+                           set_style_loading)
+from safe_output import write_json_atomic, write_text_atomic
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+INDEX_FILE = 'index.html'
+CACHE_FILE = 'critical_css.cache.json'
+CACHE_VERSION = 2
+
+# Критический CSS больше ~14 KB (после gzip) не помещается в первый ответ сервера
+CRITICAL_LIMIT = 14 * 1024
+
+BLOCK_START = f'{CRITICAL_MARKER} (сгенерировано critical_css.py, не редактировать) -->'
+BLOCK_END = '<!-- critical-css:end -->'
+CRITICAL_PATTERN = re.compile(r'[ \t]*' + re.escape(BLOCK_START) + r'.*?' + re.escape(BLOCK_END) + r'\n?', re.DOTALL)
+
+# At-правила, внутри которых обычные правила со селекторами
+NESTED_AT_RULES = {'media', 'supports', 'layer', 'container', 'document', '-moz-document'}
+
+# Всплывающие окна и панели, которые на первом экране скрыты стилями
+OVERLAY_WORDS = ('modal', 'popup', 'offcanvas', 'dialog', 'overlay', 'backdrop', 'selector-panel')
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+}
+
+# Состояния, которых нет при первой отрисовке
+INTERACTION_STATE = re.compile(r':(?:hover|focus|focus-visible|focus-within|active|visited)\b')
+# Селекторы без классов и id, допустимые в критическом CSS
+ROOT_TAGS = {'html', 'body'}
+
+JS_WORD = re.compile(r'[A-Za-z_][\w-]*')
+# 'slide--' + state, `theme-${name}`
+JS_PREFIX = re.compile(r"""(?<=['"`\s])([A-Za-z][\w-]*[-_])(?=['"`]|\$\{)""")
+MIN_PREFIX = 3
+
+# fetch('./aboutModal.html'), loadPartial('sportModal.html?v=...'), { file: 'eventsModal.html' }
+PARTIAL_REF = re.compile(r"""(?:\b(?:fetch|loadPartial)\(\s*|\bfile\s*:\s*)(['"`])(?:\./)?([\w-]+\.html)(?:\?[^'"`]*)?\1""")
+
+
+# ---------------------------------------------------------------------------
+# Что используется на странице
+# ---------------------------------------------------------------------------
+
+def empty_usage():
+    return {'tags': set(), 'classes': set(), 'ids': set(), 'attrs': set(), 'words': set(), 'prefixes': set()}
+
+
+class UsageCollector(HTMLParser):
+    """
+    Теги, классы, id и атрибуты документа
+
+    usage - все элементы, critical - только первый экран: без <template>,
+    модальных окон и всплывающих панелей (role="dialog", aria-hidden="true",
+    классы из OVERLAY_WORDS), скрытых элементов и слайдов после первого.
+    Текст <script> собирается в scripts.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.usage = empty_usage()
+        self.critical = empty_usage()
+        self.scripts = []
+        self.stack = []          # [(тег, скрыт ли от первого экрана)]
+        self.slides_seen = 0
+
+    def _hidden(self, tag, attrs):
+        classes = (attrs.get('class') or '').split()
+        if tag == 'template' or 'hidden' in attrs:
+            return True
+        if attrs.get('role') == 'dialog' or attrs.get('aria-hidden') == 'true':
+            return True
+        if re.search(r'display\s*:\s*none', attrs.get('style') or ''):
+            return True
+        if any(word in name for name in classes for word in OVERLAY_WORDS):
+            return True
+        if tag == 'figure' and 'slide' in classes:
+            self.slides_seen += 1
+            return self.slides_seen > 1
+        return False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        parent_hidden = self.stack[-1][1] if self.stack else False
+        hidden = parent_hidden or self._hidden(tag, attrs)
+
+        targets = [self.usage] if hidden else [self.usage, self.critical]
+        for usage in targets:
+            usage['tags'].add(tag)
+            usage['classes'].update((attrs.get('class') or '').split())
+            if attrs.get('id'):
+                usage['ids'].add(attrs['id'])
+            usage['attrs'].update(attrs)
+
+        if tag not in VOID_ELEMENTS:
+            self.stack.append((tag, hidden))
+
+    def handle_endtag(self, tag):
+        # Незакрытые вложенные теги снимаются вместе с родителем
+        for depth in range(len(self.stack) - 1, -1, -1):
+            if self.stack[depth][0] == tag:
+                del self.stack[depth:]
+                break
+
+    def handle_data(self, data):
+        if self.stack and self.stack[-1][0] == 'script':
+            self.scripts.append(data)
+
+
+def add_script_words(usage, source):
+    """Слова из JS: классы и id, которые скрипты добавляют динамически"""
+    usage['words'].update(JS_WORD.findall(source))
+    usage['prefixes'].update(prefix for prefix in JS_PREFIX.findall(source) if len(prefix) >= MIN_PREFIX)
+
+
+def script_partials(source):
+    """
+    HTML-фрагменты, которые загружает скрипт
+
+    fetch('./aboutModal.html'), loadPartial('sportModal.html?v=...') и списки
+    вида { file: 'eventsModal.html' }, из которых имя подставляется в fetch(`./${...}`)
+    """
+    return [match.group(2) for match in PARTIAL_REF.finditer(source)]
+
+
+def page_sources(index_path):
+    """
+    Файлы, от которых зависит результат
+
+    Возвращает (стили в порядке подключения, скрипты, HTML-фрагменты)
+    """
+    root = index_path.parent
+    html = index_path.read_text(encoding='utf-8')
+
+    styles = []
+    scripts = []
+
+    def add(url):
+        file_name = split_ref(url)[1]
+        if not (root / file_name).is_file():
+            return
+        target = styles if file_name.endswith('.css') else scripts
+        if file_name not in target:
+            target.append(file_name)
+
+    # Исходники бандлов перечислены в комментарии блока, отдельные теги - как есть
+    blocks = list(BLOCK_PATTERN.finditer(html))
+    refs = collect_refs(html)
+    items = [(match.start(), match.group('sources').split()) for match in blocks]
+    items += [(ref['start'], [ref['value']]) for ref in refs
+              if ref['element'] == 'script' or 'stylesheet' in (ref['attrs'].get('rel') or '').split()]
+
+    for _, urls in sorted(items, key=lambda item: item[0]):
+        for url in urls:
+            add(url)
+
+    # Фрагменты загружают и подключенные скрипты, и <script> внутри index.html
+    collector = UsageCollector()
+    collector.feed(html)
+    collector.close()
+    sources = [(root / script).read_text(encoding='utf-8') for script in scripts] + collector.scripts
+
+    partials = []
+    for source in sources:
+        for name in script_partials(source):
+            if (root / name).is_file() and name not in partials:
+                partials.append(name)
+
+    return styles, scripts, partials
+
+
+def collect_usage(index_path, scripts, partials):
+    """(все используемое на странице, только первый экран)"""
+    root = index_path.parent
+
+    collector = UsageCollector()
+    collector.feed(index_path.read_text(encoding='utf-8'))
+    collector.close()
+    usage, critical = collector.usage, collector.critical
+
+    for name in partials:
+        partial = UsageCollector()
+        partial.feed((root / name).read_text(encoding='utf-8'))
+        partial.close()
+        for key, values in partial.usage.items():
+            usage[key].update(values)
+        collector.scripts.extend(partial.scripts)
+
+    for script in scripts:
+        add_script_words(usage, (root / script).read_text(encoding='utf-8'))
+    for source in collector.scripts:
+        add_script_words(usage, source)
+
+    return usage, critical
+
+
+# ---------------------------------------------------------------------------
+# Разбор CSS
+# ---------------------------------------------------------------------------
+
+def _skip_string(css, i):
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == '\\' else 1
+    return i + 1
+
+
+def _skip_comment(css, i):
+    end = css.find('*/', i + 2)
+    return len(css) if end == -1 else end + 2
+
+
+def _matching_brace(css, i):
+    """Позиция после }, закрывающей { в позиции i"""
+    depth = 0
+    while i < len(css):
+        char = css[i]
+        if char in '\'"':
+            i = _skip_string(css, i)
+            continue
+        if css.startswith('/*', i):
+            i = _skip_comment(css, i)
+            continue
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(css)
+
+
+def parse_css(css, start=0, end=None):
+    """
+    Правила верхнего уровня
+
+    Каждое правило - словарь: prelude (селекторы или @media ...), start/end -
+    границы в тексте, body - смещение {, children - вложенные правила для
+    @media/@supports, None для остальных
+    """
+    end = len(css) if end is None else end
+    rules = []
+    i = start
+
+    while i < end:
+        char = css[i]
+        if char.isspace() or char == '}':
+            i += 1
+            continue
+        if css.startswith('/*', i):
+            i = _skip_comment(css, i)
+            continue
+
+        rule_start = i
+        prelude = []
+        depth = 0
+        while i < end:
+            char = css[i]
+            if char in '\'"':
+                string_end = _skip_string(css, i)
+                prelude.append(css[i:string_end])
+                i = string_end
+                continue
+            if css.startswith('/*', i):
+                i = _skip_comment(css, i)
+                continue
+            if char in '([':
+                depth += 1
+            elif char in ')]':
+                depth -= 1
+            elif depth == 0 and char in '{;':
+                break
+            prelude.append(char)
+            i += 1
+
+        prelude = ' '.join(''.join(prelude).split())
+        if i >= end or css[i] == ';':
+            # @import, @charset и т.п.
+            rules.append({'prelude': prelude, 'start': rule_start, 'end': min(i + 1, end),
+                          'body': None, 'children': None})
+            i += 1
+            continue
+
+        body = i
+        i = _matching_brace(css, i)
+        children = None
+        if prelude.startswith('@'):
+            name = prelude[1:].split(None, 1)[0].lower() if len(prelude) > 1 else ''
+            if name in NESTED_AT_RULES:
+                children = parse_css(css, body + 1, i - 1)
+        rules.append({'prelude': prelude, 'start': rule_start, 'end': i, 'body': body, 'children': children})
+
+    return rules
+
+
+def split_selectors(prelude):
+    """Список селекторов через запятую (запятые внутри скобок не делят)"""
+    selectors = []
+    depth = 0
+    current = []
+    for char in prelude:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    selectors.append(''.join(current).strip())
+    return [selector for selector in selectors if selector]
+
+
+def _strip_pseudo(selector):
+    """Убирает :hover, ::before, :not(...) и т.п. вместе с содержимым скобок"""
+    result = []
+    i = 0
+    while i < len(selector):
+        char = selector[i]
+        if char == '\\':
+            result.append(selector[i:i + 2])
+            i += 2
+            continue
+        if char == ':':
+            i += 1
+            while i < len(selector) and (selector[i] == ':' or selector[i].isalnum() or selector[i] in '-_'):
+                i += 1
+            if i < len(selector) and selector[i] == '(':
+                depth = 0
+                while i < len(selector):
+                    if selector[i] == '(':
+                        depth += 1
+                    elif selector[i] == ')':
+                        depth -= 1
+                        if depth == 0:
+                            i += 1
+                            break
+                    i += 1
+            continue
+        result.append(char)
+        i += 1
+    return ''.join(result)
+
+
+NAME = r'-?(?:[_a-zA-Z]|\\.|[^\x00-\x7f])(?:[\w-]|\\.|[^\x00-\x7f])*'
+CLASS_PATTERN = re.compile(r'\.(' + NAME + ')')
+ID_PATTERN = re.compile(r'#(' + NAME + ')')
+ATTR_PATTERN = re.compile(r'\[\s*([\w-]+)[^\]]*\]')
+TAG_PATTERN = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+
+
+def _unescape(name):
+    return re.sub(r'\\(.)', r'\1', name)
+
+
+def selector_parts(selector):
+    """Классы, id, атрибуты и теги, которые должны быть на странице"""
+    selector = _strip_pseudo(selector)
+    attrs = [name.lower() for name in ATTR_PATTERN.findall(selector)]
+    selector = ATTR_PATTERN.sub(' ', selector)
+    classes = [_unescape(name) for name in CLASS_PATTERN.findall(selector)]
+    ids = [_unescape(name) for name in ID_PATTERN.findall(selector)]
+    selector = ID_PATTERN.sub(' ', CLASS_PATTERN.sub(' ', selector))
+    tags = [name.lower() for name in TAG_PATTERN.findall(selector)]
+    return classes, ids, attrs, tags
+
+
+def _known(name, found, usage, prefix=False):
+    if name in found or name in usage['words']:
+        return True
+    return prefix and any(name.startswith(start) for start in usage['prefixes'])
+
+
+def selector_used(selector, usage):
+    classes, ids, attrs, tags = selector_parts(selector)
+    return (
+        all(_known(name, usage['classes'], usage, prefix=True) for name in classes)
+        and all(_known(name, usage['ids'], usage, prefix=True) for name in ids)
+        and all(_known(name, usage['attrs'], usage) for name in attrs)
+        and all(_known(name, usage['tags'], usage) for name in tags)
+    )
+
+
+def critical_selector_used(selector, usage):
+    """
+    Селектор нужен для первой отрисовки
+
+    Кроме проверки selector_used: без :hover/:focus и без селекторов только
+    по тегам или атрибутам (button, [id^="close"]) - они относятся к окнам
+    и элементам ниже первого экрана. Исключение - сбросы html, body, :root, *.
+    """
+    if INTERACTION_STATE.search(selector):
+        return False
+    classes, ids, attrs, tags = selector_parts(selector)
+    if not classes and not ids:
+        bare = _strip_pseudo(selector).strip()
+        if not ((tags and set(tags) <= ROOT_TAGS) or bare in ('*', '')):
+            return False
+    return selector_used(selector, usage)
+
+
+def filter_rules(css, rules, usage, keep_at_rules=True, used=selector_used):
+    """
+    Текст только с правилами, хотя бы один селектор которых используется
+
+    used: проверка селектора (selector_used или critical_selector_used)
+    Возвращает (текст, сколько правил удалено)
+    """
+    parts = []
+    removed = 0
+
+    for rule in rules:
+        prelude = rule['prelude']
+        if rule['children'] is not None:
+            inner, inner_removed = filter_rules(css, rule['children'], usage, keep_at_rules, used)
+            removed += inner_removed
+            if inner:
+                parts.append(f"{prelude} {{\n{inner}\n}}")
+            continue
+
+        if prelude.startswith('@'):
+            if keep_at_rules:
+                parts.append(css[rule['start']:rule['end']])
+            continue
+
+        selectors = split_selectors(prelude)
+        kept = [selector for selector in selectors if used(selector, usage)]
+        if not kept:
+            removed += 1
+            continue
+
+        if len(kept) == len(selectors):
+            parts.append(css[rule['start']:rule['end']])
+        else:
+            parts.append(',\n'.join(kept) + ' ' + css[rule['body']:rule['end']])
+
+    return '\n\n'.join(parts), removed
+
+
+def keyframes_for(css, rules, text):
+    """@keyframes, на которые ссылаются правила из text"""
+    words = set(JS_WORD.findall(text))
+    found = []
+    for rule in rules:
+        prelude = rule['prelude']
+        if re.match(r'@(?:-\w+-)?keyframes\s', prelude) and prelude.split()[-1] in words:
+            found.append(css[rule['start']:rule['end']])
+        elif rule['children'] is not None:
+            found.extend(keyframes_for(css, rule['children'], text))
+    return found
+
+
+# ---------------------------------------------------------------------------
+# Кеш и запуск
+# ---------------------------------------------------------------------------
+
+def content_hash(*texts):
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()[:16]
+
+
+def usage_fingerprint(usage):
+    return content_hash(json.dumps({key: sorted(values) for key, values in usage.items()}, sort_keys=True))
+
+
+def load_cache(cache_file):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+    return {'version': CACHE_VERSION}
+
+
+def input_fingerprint(index_path, styles, scripts, partials):
+    root = index_path.parent
+    html = CRITICAL_PATTERN.sub('', index_path.read_text(encoding='utf-8'))
+    texts = [html, ' '.join(OVERLAY_WORDS)]
+    for name in [*styles, *scripts, *partials]:
+        texts.append(name)
+        texts.append((root / name).read_text(encoding='utf-8'))
+    return content_hash(*texts)
+
+
+def insert_critical_block(html, critical_css):
+    """
+    Вставляет <style> с критическим CSS перед первой таблицей стилей
+    и переводит бандл стилей на неблокирующую загрузку
+
+    Без бандла стилей блок не вставляется: отдельные <link> остались бы
+    блокирующими, и страница загружала бы стили дважды без выигрыша
+    """
+    html = CRITICAL_PATTERN.sub('', html)
+    if not critical_css or not has_style_bundle(html):
+        return set_style_loading(html, deferred=False)
+    html = set_style_loading(html, deferred=True)
+
+    position = None
+    for ref in collect_refs(html):
+        if ref['element'] == 'link' and 'stylesheet' in (ref['attrs'].get('rel') or '').split():
+            position = ref['start']
+            break
+    for match in BLOCK_PATTERN.finditer(html):
+        if position is None or match.start() < position:
+            position = match.start() + len(match.group('indent'))
+            break
+    if position is None:
+        position = html.find('</head>')
+        if position == -1:
+            raise ValueError(f"В {INDEX_FILE} не найден </head>")
+
+    line_start = html.rfind('\n', 0, position) + 1
+    indent = re.match(r'[ \t]*', html[line_start:position]).group(0)
+    block = f"{BLOCK_START}\n{indent}<style>\n{critical_css}\n{indent}</style>\n{indent}{BLOCK_END}\n"
+    return html[:line_start] + indent + block + html[line_start:]
+
+
+def build_critical(index_file=INDEX_FILE, pruned_dir=PRUNED_DIR, cache_file=CACHE_FILE):
+    """
+    Пересобирает pruned/ и блок критического CSS в index.html
+
+    Возвращает словарь: files - отчет по каждой таблице стилей
+    ({file, size, pruned, removed}), critical - размер критического CSS,
+    cached - результат взят из кеша без пересчета, changed - изменен ли index.html
+    """
+    index_path = Path(index_file)
+    root = index_path.parent
+    output_dir = root / pruned_dir
+    styles, scripts, partials = page_sources(index_path)
+
+    cache = load_cache(root / cache_file)
+    fingerprint = input_fingerprint(index_path, styles, scripts, partials)
+    outputs_exist = all((output_dir / name).exists() for name in styles)
+
+    if cache.get('inputs') == fingerprint and outputs_exist:
+        files, critical_css = cache['files'], cache['critical']
+        cached = True
+    else:
+        usage, critical_usage = collect_usage(index_path, scripts, partials)
+        output_dir.mkdir(exist_ok=True)
+        files = []
+        critical_parts = []
+        for name in styles:
+            css = (root / name).read_text(encoding='utf-8')
+            rules = parse_css(css)
+            pruned, removed = filter_rules(css, rules, usage)
+            write_text_atomic(output_dir / name, pruned + '\n')
+
+            critical, _ = filter_rules(css, rules, critical_usage, keep_at_rules=False, used=critical_selector_used)
+            if critical:
+                critical_parts.extend(keyframes_for(css, rules, critical))
+                critical_parts.append(critical)
+
+            files.append({
+                'file': name,
+                'size': len(css.encode('utf-8')),
+                'pruned': len(pruned.encode('utf-8')) + 1,
+                'removed': removed
+            })
+
+        critical_css = ''.join(text for text, _ in minify_css('\n'.join(critical_parts), keep_lines=False))
+        cached = False
+        write_json_atomic(root / cache_file, {
+            'version': CACHE_VERSION,
+            'inputs': fingerprint,
+            'usage': usage_fingerprint(usage),
+            'files': files,
+            'critical': critical_css
+        }, indent=None, separators=(',', ':'))
+
+    critical_gzip = len(gzip.compress(critical_css.encode('utf-8'))) if critical_css else 0
+    too_large = critical_gzip > CRITICAL_LIMIT
+
+    html = index_path.read_text(encoding='utf-8')
+    updated = insert_critical_block(html, '' if too_large else critical_css)
+    if updated != html:
+        write_text_atomic(index_path, updated)
+
+    return {
+        'files': files,
+        'critical': len(critical_css.encode('utf-8')),
+        'critical_gzip': critical_gzip,
+        'injected': CRITICAL_MARKER in updated,
+        'cached': cached,
+        'changed': updated != html
+    }
+
+
+def main():
+    result = build_critical()
+
+    if result['cached']:
+        print("✓ Стили, HTML и скрипты не изменились, взят результат из кеша")
+
+    total_size = total_pruned = 0
+    print(f"{'Файл':<32} {'Было':>10} {'Стало':>10} {'Экономия':>10}  Правил удалено")
+    for item in result['files']:
+        total_size += item['size']
+        total_pruned += item['pruned']
+        saved = item['size'] - item['pruned']
+        print(f"{item['file']:<32} {item['size']:>10,} {item['pruned']:>10,} {saved:>10,}  {item['removed']}")
+    print(f"{'Итого':<32} {total_size:>10,} {total_pruned:>10,} {total_size - total_pruned:>10,}")
+
+    print(f"\n📄 Очищенные стили: {PRUNED_DIR}/ (бандл из них: python bundle_assets.py --pruned)")
+    print(f"⚡ Критический CSS: {result['critical'] / 1024:.1f} KB ({result['critical_gzip'] / 1024:.1f} KB gzip)")
+    if result['critical_gzip'] > CRITICAL_LIMIT:
+        print(f"  [WARNING] больше {CRITICAL_LIMIT // 1024} KB - не встроен, стили подключены блокирующим бандлом")
+    elif result['injected']:
+        print(f"  встроен в {INDEX_FILE}, бандл стилей загружается без блокировки отрисовки")
+    else:
+        print(f"  не встроен: в {INDEX_FILE} нет бандла стилей (запустите python bundle_assets.py)")
+
+    if result['changed']:
+        print(f"✓ {INDEX_FILE} обновлен")
+
+
+if __name__ == '__main__':
+    main()
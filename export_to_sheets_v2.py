@@ -3,14 +3,23 @@
 """
 Скрипт экспорта данных из form.json в CSV файлы для загрузки в Google Таблицы v2.0
 Версия с разделением по логическим вкладкам
+
+Использование:
+    python export_to_sheets_v2.py                       # TSV-файлы вкладок
+    python export_to_sheets_v2.py --format tsv xlsx     # плюс книга ВСЕ_ВКЛАДКИ.xlsx
 """
 
-import json
+import argparse
 import csv
+import io
+import json
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
-from bs4 import BeautifulSoup
+
+from safe_output import write_text_atomic
+from sheet_workbook import WRITERS
 
 
 def escape_csv(text):
@@ -22,238 +31,359 @@ def escape_csv(text):
     return text
 
 
-def parse_slide_html(html_file='index.html'):
-    """Извлечение данных о слайдах из HTML"""
-    with open(html_file, 'r', encoding='utf-8') as f:
-        content = f.read()
+# Размер порции чтения index.html: разбор останавливается после блока слайдов
+READ_CHUNK = 16 * 1024
+
+
+class SlideExtractor(HTMLParser):
+    """
+    Потоковый разбор index.html: слайды <figure class="slide"> и их позиции
+
+    Текст подается порциями (feed_chunk); после закрытия <div class="slideshow">
+    done становится True и остаток документа можно не читать. Для каждого
+    слайда запоминается диапазон символов исходного текста, HTML берется
+    из него без пересборки.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.slides = []
+        self.done = False
+        self.text = []
+        self.base = 0
+        self.length = 0
+        self.line_starts = [0]
+        self.slideshow_depth = 0
+        self.figure = None
+        self.data = []
+
+    def feed_chunk(self, chunk):
+        # Начала строк нужны для перевода getpos() (строка, столбец) в позицию символа
+        position = chunk.find('\n')
+        while position != -1:
+            self.line_starts.append(self.length + position + 1)
+            position = chunk.find('\n', position + 1)
+
+        self.text.append(chunk)
+        self.length += len(chunk)
+        self.feed(chunk)
+
+        # Вне слайда держится только еще не разобранный хвост
+        if self.figure is None:
+            keep = self.length - len(self.rawdata)
+            self.text = [''.join(self.text)[keep - self.base:]]
+            self.base = keep
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_starts[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_data()
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if tag == 'div' and (self.slideshow_depth or 'slideshow' in classes):
+            self.slideshow_depth += 1
+
+        figure = self.figure
+        if figure is None:
+            if tag == 'figure' and 'slide' in classes:
+                self.figure = {
+                    'start': self._offset(), 'depth': 1, 'image': None,
+                    'title': None, 'title_depth': 0, 'links': [], 'open_links': []
+                }
+            return
+
+        if tag == 'figure':
+            figure['depth'] += 1
+        elif tag == 'div' and figure['image'] is None and 'slide__img-wrap' in classes:
+            figure['image'] = attrs.get('data-img') or ''
+        elif tag == 'h2' and figure['title_depth']:
+            figure['title_depth'] += 1
+        elif tag == 'h2' and figure['title'] is None and 'slides__caption-headline' in classes:
+            figure['title'] = []
+            figure['title_depth'] = 1
+        elif tag == 'a':
+            link = {'id': attrs.get('id') or '', 'text': []}
+            figure['links'].append(link)
+            figure['open_links'].append(link)
+
+    def handle_data(self, data):
+        # На границе порций один текстовый узел приходит несколькими кусками
+        if self.figure is not None:
+            self.data.append(data)
+
+    def handle_comment(self, data):
+        self._flush_data()
+
+    def _flush_data(self):
+        if not self.data:
+            return
+        data = ''.join(self.data)
+        self.data = []
+
+        figure = self.figure
+        if figure['title_depth']:
+            figure['title'].append(data)
+        for link in figure['open_links']:
+            link['text'].append(data)
+
+    def handle_endtag(self, tag):
+        self._flush_data()
+        figure = self.figure
+
+        if figure is not None:
+            if tag == 'h2' and figure['title_depth']:
+                figure['title_depth'] -= 1
+            elif tag == 'a' and figure['open_links']:
+                figure['open_links'].pop()
+            elif tag == 'figure':
+                figure['depth'] -= 1
+                if not figure['depth']:
+                    self._finish_figure()
+
+        if tag == 'div' and self.slideshow_depth:
+            self.slideshow_depth -= 1
+            if not self.slideshow_depth:
+                self.done = True
+
+    def _finish_figure(self):
+        figure = self.figure
+        self.figure = None
+
+        text = ''.join(self.text)
+        self.text = [text]
+        start = figure['start']
+        end = text.index('>', self._offset() - self.base) + 1 + self.base
 
-    soup = BeautifulSoup(content, 'html.parser')
-    slides = []
-
-    figures = soup.find_all('figure', class_='slide')
-    for idx, figure in enumerate(figures, 1):
-        # Извлекаем путь к картинке
-        img_wrap = figure.find('div', class_='slide__img-wrap')
-        img_path = img_wrap.get('data-img', '') if img_wrap else ''
-
-        # Извлекаем заголовок
-        headline = figure.find('h2', class_='slides__caption-headline')
-        title = headline.get_text(strip=True) if headline else ''
-
-        # Извлекаем ссылки
-        links = figure.find_all('a')
         buttons = []
-        for link in links:
-            button_text = link.get_text(strip=True)
-            button_id = link.get('id', '')
+        for link in figure['links']:
+            button_text = strip_join(link['text'])
             if button_text:
-                buttons.append({'text': button_text, 'id': button_id})
+                buttons.append({'text': button_text, 'id': link['id']})
 
-        slides.append({
-            'number': idx,
-            'image': img_path,
-            'title': title,
+        self.slides.append({
+            'number': len(self.slides) + 1,
+            'image': figure['image'] or '',
+            'title': strip_join(figure['title'] or []),
             'buttons': buttons,
-            'html': str(figure)
+            'html': text[start - self.base:end - self.base],
+            'span': (start, end)
         })
 
-    return slides
-
-
-def create_slides_csv(slides, output_dir):
-    """Создание CSV для слайдов"""
-    headers = ['Номер', 'Название', 'Картинка', 'Кнопки', 'HTML']
-
-    rows = []
-    for slide in slides:
-        buttons_text = '; '.join([b['text'] for b in slide['buttons']])
-        rows.append({
-            'Номер': slide['number'],
-            'Название': escape_csv(slide['title']),
-            'Картинка': slide['image'],
-            'Кнопки': escape_csv(buttons_text),
-            'HTML': escape_csv(slide['html'])
-        })
-
-    csv_file = output_dir / '01_СЛАЙДЫ.csv'
-    with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-        writer.writeheader()
-        writer.writerows(rows)
-
-    return len(rows)
-
-
-def flatten_item(item, level=0, parent_path="", row_id=None):
-    """Преобразование элемента в плоскую структуру"""
-    current_path = f"{parent_path}/{item['value']}" if parent_path else item['value']
 
-    if row_id is None:
-        row_id = current_path.replace('/', '_')
+def strip_join(parts):
+    """Текст элемента: куски без пробелов по краям, склеенные без разделителя"""
+    return ''.join(part.strip() for part in parts)
 
-    row = {
-        'ID': row_id,
-        'Родитель': parent_path,
-        'Уровень': level,
-        'Название': escape_csv(item.get('label', '')),
-        'Значение': escape_csv(item.get('value', '')),
-        'Подпись': escape_csv(item.get('sub', '')),
-        'Иконка': escape_csv(item.get('image', '')),
-        'Обложка': escape_csv(item.get('fimage', '')),
-        'Краткое описание': escape_csv(item.get('desc', '')),
-        'Полное описание': escape_csv(item.get('fulldesc', '')),
-        'Расписание': escape_csv(item.get('timetable', '')),
-        'Цена': escape_csv(item.get('price', ''))
-    }
 
-    rows = [row]
-
-    if 'children' in item and item['children']:
-        for i, child in enumerate(item['children']):
-            child_id = f"{row_id}_{i+1}"
-            child_rows = flatten_item(child, level + 1, current_path, child_id)
-            rows.extend(child_rows)
-
-    return rows
-
-
-def export_category_tabs(data, output_dir):
-    """Экспорт по логическим вкладкам"""
-
-    headers = [
-        'ID', 'Родитель', 'Уровень', 'Название', 'Значение', 'Подпись',
-        'Иконка', 'Обложка', 'Краткое описание', 'Полное описание',
-        'Расписание', 'Цена'
-    ]
+def parse_slide_html(html_file='index.html'):
+    """
+    Извлечение данных о слайдах из HTML
 
-    stats = {}
+    Файл читается порциями до конца блока слайдов; span - позиции
+    (начало, конец) слайда в тексте файла, html - исходный текст слайда
+    """
+    extractor = SlideExtractor()
 
-    # Вкладка 2: Тренажерный зал
-    gym = [x for x in data['main'] if x['value'] == 'gym']
-    if gym:
-        rows = flatten_item(gym[0])
-        csv_file = output_dir / '02_ТРЕНАЖЕРНЫЙ_ЗАЛ.csv'
-        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(rows)
-        stats['Тренажерный зал'] = len(rows)
-        print(f"[OK] Тренажерный зал: {len(rows)} строк")
-
-    # Секции - разбиваем по подкатегориям
-    section = [x for x in data['main'] if x['value'] == 'section']
-    if section and 'children' in section[0]:
-        tab_num = 3
-        section_mapping = {
-            'kids': ('ДЕТСКИЕ_СЕКЦИИ', 'Детские секции'),
-            'fight': ('ЕДИНОБОРСТВА', 'Единоборства'),
-            'dance': ('ТАНЦЫ', 'Танцы'),
-            'women': ('ЖЕНСКИЕ_СЕКЦИИ', 'Женские секции'),
-            'winter': ('ЗИМНИЕ_СЕКЦИИ', 'Зимние секции'),
-            'men': ('МУЖСКИЕ_СЕКЦИИ', 'Мужские секции')
-        }
+    with open(html_file, 'r', encoding='utf-8') as f:
+        while not extractor.done:
+            chunk = f.read(READ_CHUNK)
+            if not chunk:
+                break
+            extractor.feed_chunk(chunk)
 
-        for subsection in section[0]['children']:
-            value = subsection['value']
-            if value in section_mapping:
-                filename, label = section_mapping[value]
-                rows = flatten_item(subsection)
-                csv_file = output_dir / f'{tab_num:02d}_{filename}.csv'
-                with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-                    writer.writeheader()
-                    writer.writerows(rows)
-                stats[label] = len(rows)
-                print(f"[OK] {label}: {len(rows)} строк")
-                tab_num += 1
-
-    # Вкладка 9: Отдых (relax + massage + solarium)
-    rest_categories = ['relax', 'massage', 'solarium']
-    rest_rows = []
-    for cat_value in rest_categories:
-        cat = [x for x in data['main'] if x['value'] == cat_value]
-        if cat:
-            rest_rows.extend(flatten_item(cat[0]))
-
-    if rest_rows:
-        csv_file = output_dir / '09_ОТДЫХ_И_СПА.csv'
-        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(rest_rows)
-        stats['Отдых и СПА'] = len(rest_rows)
-        print(f"[OK] Отдых и СПА: {len(rest_rows)} строк")
-
-    # Вкладка 10: Отель
-    hotel = [x for x in data['main'] if x['value'] == 'hotel']
-    if hotel:
-        rows = flatten_item(hotel[0])
-        csv_file = output_dir / '10_ОТЕЛЬ.csv'
-        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(rows)
-        stats['Отель'] = len(rows)
-        print(f"[OK] Отель: {len(rows)} строк")
-
-    # Вкладка 11: Ресторан
-    restaurant = [x for x in data['main'] if x['value'] == 'restaurant']
-    if restaurant:
-        rows = flatten_item(restaurant[0])
-        csv_file = output_dir / '11_РЕСТОРАН.csv'
-        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(rows)
-        stats['Ресторан'] = len(rows)
-        print(f"[OK] Ресторан: {len(rows)} строк")
-
-    # Вкладка 12: Ледовая арена
-    arena = [x for x in data['main'] if x['value'] == 'arena']
-    if arena:
-        rows = flatten_item(arena[0])
-        csv_file = output_dir / '12_ЛЕДОВАЯ_АРЕНА.csv'
-        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(rows)
-        stats['Ледовая арена'] = len(rows)
-        print(f"[OK] Ледовая арена: {len(rows)} строк")
-
-    # Вкладка 13: Футбольное поле
-    field = [x for x in data['main'] if x['value'] == 'field']
-    if field:
-        rows = flatten_item(field[0])
-        csv_file = output_dir / '13_ФУТБОЛЬНОЕ_ПОЛЕ.csv'
-        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(rows)
-        stats['Футбольное поле'] = len(rows)
-        print(f"[OK] Футбольное поле: {len(rows)} строк")
-
-    # Вкладка 14: События (events + event)
-    event_categories = ['events', 'event']
-    event_rows = []
-    for cat_value in event_categories:
-        cat = [x for x in data['main'] if x['value'] == cat_value]
-        if cat:
-            event_rows.extend(flatten_item(cat[0]))
-
-    if event_rows:
-        csv_file = output_dir / '14_СОБЫТИЯ.csv'
-        with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=headers, delimiter='\t')
-            writer.writeheader()
-            writer.writerows(event_rows)
-        stats['События'] = len(event_rows)
-        print(f"[OK] События: {len(event_rows)} строк")
+    extractor.close()
+    return extractor.slides
 
-    return stats
 
+def slides_tab(slides):
+    """Вкладка слайдов: (файл, заголовки, строки)"""
+    headers = ['Номер', 'Название', 'Картинка', 'Кнопки', 'HTML']
 
-def create_promo_templates(output_dir):
-    """Создание шаблонов для акций и новостей"""
+    rows = []
+    for slide in slides:
+        buttons_text = '; '.join([b['text'] for b in slide['buttons']])
+        rows.append([
+            slide['number'],
+            escape_csv(slide['title']),
+            slide['image'],
+            escape_csv(buttons_text),
+            escape_csv(slide['html'])
+        ])
+
+    return ('01_СЛАЙДЫ', headers, rows)
+
+
+# Колонки вкладок категорий и соответствующие поля элемента form.json
+COLUMNS = [
+    'ID', 'Родитель', 'Уровень', 'Название', 'Значение', 'Подпись',
+    'Иконка', 'Обложка', 'Краткое описание', 'Полное описание',
+    'Расписание', 'Цена'
+]
+ITEM_FIELDS = [
+    ('Название', 'label'),
+    ('Значение', 'value'),
+    ('Подпись', 'sub'),
+    ('Иконка', 'image'),
+    ('Обложка', 'fimage'),
+    ('Краткое описание', 'desc'),
+    ('Полное описание', 'fulldesc'),
+    ('Расписание', 'timetable'),
+    ('Цена', 'price'),
+]
+
+# Вкладки категорий: (файл, название, значения категорий верхнего уровня).
+# Старая структура хранила секции внутри категории 'section' - они ищутся
+# и там (см. FlatTable.find)
+CATEGORY_TABS = [
+    ('02_ТРЕНАЖЕРНЫЙ_ЗАЛ', 'Тренажерный зал', ['gym']),
+    ('03_ДЕТСКИЕ_СЕКЦИИ', 'Детские секции', ['kids']),
+    ('04_ЕДИНОБОРСТВА', 'Единоборства', ['fight']),
+    ('05_ТАНЦЫ', 'Танцы', ['dance']),
+    ('06_ЖЕНСКИЕ_СЕКЦИИ', 'Женские секции', ['women']),
+    ('07_ЗИМНИЕ_СЕКЦИИ', 'Зимние секции', ['winter']),
+    ('08_МУЖСКИЕ_СЕКЦИИ', 'Мужские секции', ['men']),
+    ('09_ОТДЫХ_И_СПА', 'Отдых и СПА', ['relax', 'massage', 'solarium']),
+    ('10_ОТЕЛЬ', 'Отель', ['hotel']),
+    ('11_РЕСТОРАН', 'Ресторан', ['restaurant']),
+    ('12_ЛЕДОВАЯ_АРЕНА', 'Ледовая арена', ['arena']),
+    ('13_ФУТБОЛЬНОЕ_ПОЛЕ', 'Футбольное поле', ['field']),
+    ('14_СОБЫТИЯ', 'События', ['events', 'event']),
+]
+SECTION_GROUP = 'section'
+
+# Имя книги со всеми вкладками (xlsx/ods)
+WORKBOOK_NAME = 'ВСЕ_ВКЛАДКИ'
+
+
+class FlatTable:
+    """
+    Плоское представление всего дерева form.json по колонкам
+
+    Дерево обходится один раз в прямом порядке, поэтому поддерево любого
+    элемента - непрерывный диапазон строк. index: {путь: (начало, конец)}.
+    Текстовые колонки экранируются один раз при построении.
+    """
+
+    def __init__(self, items):
+        self.ids = []
+        self.parents = []
+        self.levels = []
+        self.own_ids = []
+        self.columns = {column: [] for column, _ in ITEM_FIELDS}
+        self.index = {}
+
+        for item in items:
+            self._add(item, 0, '', None)
+
+    def _add(self, item, level, parent_path, row_id):
+        current_path = f"{parent_path}/{item['value']}" if parent_path else item['value']
+        if row_id is None:
+            row_id = current_path.replace('/', '_')
+
+        start = len(self.ids)
+        self.ids.append(row_id)
+        self.parents.append(parent_path)
+        self.levels.append(level)
+        # ID элемента, если экспортировать его отдельно от родителя
+        self.own_ids.append(item['value'].replace('/', '_'))
+        for column, key in ITEM_FIELDS:
+            self.columns[column].append(escape_csv(item.get(key, '')))
+
+        for i, child in enumerate(item.get('children') or []):
+            self._add(child, level + 1, current_path, f"{row_id}_{i+1}")
+
+        # Первый элемент с таким путем, как и прежний поиск по списку
+        self.index.setdefault(current_path, (start, len(self.ids)))
+
+    def find(self, value):
+        """Диапазон строк категории верхнего уровня (или секции внутри 'section')"""
+        return self.index.get(value) or self.index.get(f"{SECTION_GROUP}/{value}")
+
+    def rows(self, span):
+        """
+        Строки поддерева как отдельной вкладки: элемент становится корнем
+        (уровень 0, без родителя, ID - его значение)
+        """
+        start, end = span
+        prefix = len(self.ids[start])
+        root_id = self.own_ids[start]
+        root_parent = self.parents[start]
+        cut = len(root_parent) + 1 if root_parent else 0
+        base_level = self.levels[start]
+        values = [self.columns[column] for column, _ in ITEM_FIELDS]
+
+        for i in range(start, end):
+            yield [
+                root_id + self.ids[i][prefix:],
+                self.parents[i][cut:] if i != start else '',
+                self.levels[i] - base_level,
+                *(column[i] for column in values)
+            ]
+
+
+def flatten_item(item):
+    """Преобразование элемента в плоскую структуру (список словарей-строк)"""
+    table = FlatTable([item])
+    return [dict(zip(COLUMNS, row)) for row in table.rows((0, len(table.ids)))]
+
+
+def category_tabs(data):
+    """
+    Таблицы вкладок категорий по CATEGORY_TABS
+
+    Возвращает список (файл, название, строки) для непустых вкладок
+    """
+    table = FlatTable(data['main'])
+    tabs = []
+
+    for filename, label, values in CATEGORY_TABS:
+        rows = []
+        for value in values:
+            span = table.find(value)
+            if span:
+                rows.extend(table.rows(span))
+        if rows:
+            tabs.append((filename, label, rows))
+
+    return tabs
+
+
+def write_tsv(path, headers, rows):
+    """TSV-файл для Google Таблиц (UTF-8 с BOM, разделитель - табуляция)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t')
+    writer.writerow(headers)
+    writer.writerows(rows)
+    write_text_atomic(path, buffer.getvalue(), encoding='utf-8-sig')
+
+
+def write_tabs(tabs, output_dir, formats=('tsv',), workers=None):
+    """
+    Запись вкладок: TSV-файлы параллельно в пуле потоков, книги xlsx/ods -
+    одним файлом со всеми вкладками
+
+    tabs: список (файл, заголовки, строки)
+    """
+    if 'tsv' in formats:
+        workers = workers or min(len(tabs), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(write_tsv, output_dir / f"{name}.csv", headers, rows)
+                       for name, headers, rows in tabs]
+            for future in futures:
+                future.result()
+
+    for fmt in formats:
+        if fmt in WRITERS:
+            workbook = output_dir / f"{WORKBOOK_NAME}.{fmt}"
+            WRITERS[fmt](workbook, tabs)
+            print(f"[OK] Книга {fmt}: {workbook.name} ({len(tabs)} вкладок)")
+
+
+def promo_tabs():
+    """Шаблоны вкладок акций и новостей: [(файл, название, заголовки, строки)]"""
 
     # Вкладка 15: Акции
     promo_headers = ['ID', 'Название', 'Описание', 'Срок действия', 'Картинка', 'Активна']
@@ -276,13 +406,6 @@ def create_promo_templates(output_dir):
         }
     ]
 
-    csv_file = output_dir / '15_АКЦИИ.csv'
-    with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=promo_headers, delimiter='\t')
-        writer.writeheader()
-        writer.writerows(promo_rows)
-    print(f"[OK] Акции: {len(promo_rows)} строк (шаблон)")
-
     # Вкладка 16: Новости
     news_headers = ['ID', 'Дата', 'Заголовок', 'Краткое описание', 'Полный текст', 'Картинка', 'Опубликована']
     news_rows = [
@@ -315,18 +438,19 @@ def create_promo_templates(output_dir):
         }
     ]
 
-    csv_file = output_dir / '16_НОВОСТИ.csv'
-    with open(csv_file, 'w', encoding='utf-8-sig', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=news_headers, delimiter='\t')
-        writer.writeheader()
-        writer.writerows(news_rows)
-    print(f"[OK] Новости: {len(news_rows)} строк (шаблон)")
+    return [
+        ('15_АКЦИИ', 'Акции', promo_headers, [[row[h] for h in promo_headers] for row in promo_rows]),
+        ('16_НОВОСТИ', 'Новости', news_headers, [[row[h] for h in news_headers] for row in news_rows]),
+    ]
 
-    return {'Акции': len(promo_rows), 'Новости': len(news_rows)}
 
+def export_to_csv_v2(json_file='form.json', html_file='index.html', output_dir='google_sheets_tabs',
+                     formats=('tsv',)):
+    """
+    Главная функция экспорта v2
 
-def export_to_csv_v2(json_file='form.json', html_file='index.html', output_dir='google_sheets_tabs'):
-    """Главная функция экспорта v2"""
+    formats: 'tsv' - отдельные файлы вкладок; 'xlsx', 'ods' - книга со всеми вкладками
+    """
 
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
@@ -338,14 +462,15 @@ def export_to_csv_v2(json_file='form.json', html_file='index.html', output_dir='
     print()
 
     stats = {}
+    tabs = []
 
     # 1. Экспорт слайдов
     print("Экспорт слайдов...")
     try:
         slides = parse_slide_html(html_file)
-        slides_count = create_slides_csv(slides, output_path)
-        stats['Слайды'] = slides_count
-        print(f"[OK] Слайды: {slides_count} строк")
+        tabs.append(slides_tab(slides))
+        stats['Слайды'] = len(slides)
+        print(f"[OK] Слайды: {len(slides)} строк")
     except Exception as e:
         print(f"[WARNING] Ошибка экспорта слайдов: {e}")
         print("Продолжаем без слайдов...")
@@ -357,15 +482,22 @@ def export_to_csv_v2(json_file='form.json', html_file='index.html', output_dir='
     with open(json_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
 
-    category_stats = export_category_tabs(data, output_path)
-    stats.update(category_stats)
+    for filename, label, rows in category_tabs(data):
+        tabs.append((filename, COLUMNS, rows))
+        stats[label] = len(rows)
+        print(f"[OK] {label}: {len(rows)} строк")
 
     print()
 
     # 3. Создание шаблонов акций и новостей
     print("Создание шаблонов...")
-    promo_stats = create_promo_templates(output_path)
-    stats.update(promo_stats)
+    for filename, label, headers, rows in promo_tabs():
+        tabs.append((filename, headers, rows))
+        stats[label] = len(rows)
+        print(f"[OK] {label}: {len(rows)} строк (шаблон)")
+
+    # 4. Запись всех вкладок
+    write_tabs(tabs, output_path, formats)
 
     print()
     print("="*60)
@@ -383,13 +515,9 @@ def export_to_csv_v2(json_file='form.json', html_file='index.html', output_dir='
 
 
 if __name__ == '__main__':
-    try:
-        from bs4 import BeautifulSoup
-    except ImportError:
-        print("[ERROR] Требуется установить библиотеку BeautifulSoup4")
-        print("Запустите: pip install beautifulsoup4")
-        print()
-        print("Продолжаем экспорт без слайдов...")
-        print()
-
-    export_to_csv_v2()
+    parser = argparse.ArgumentParser(description='Экспорт form.json и слайдов во вкладки Google Таблиц')
+    parser.add_argument('--format', nargs='+', choices=['tsv', *WRITERS], default=['tsv'],
+                        help='tsv - файлы вкладок; xlsx/ods - одна книга со всеми вкладками')
+    args = parser.parse_args()
+
+    export_to_csv_v2(formats=args.format)
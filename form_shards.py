@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Разбиение form.json на части по главным категориям для ленивой загрузки
+
+Создаются:
+- form.manifest.json - легкий список главных категорий (label, value, sub, image...)
+  со ссылкой на файл категории в поле "shard";
+- form-shards/<value>.<хеш>.json - полная категория со всеми подкатегориями.
+
+Имя файла категории содержит хеш содержимого, поэтому такие файлы можно
+кешировать в браузере бессрочно: при изменении категории меняется имя.
+
+Проверка собранных частей:
+    python form_shards.py [form.json]
+"""
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from safe_output import write_bytes_atomic, write_json_atomic
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+SHARD_DIR = 'form-shards'
+MANIFEST_VERSION = 1
+
+
+def manifest_path_for(output_file):
+    """form.json -> form.manifest.json"""
+    path = Path(output_file)
+    return path.with_name(f"{path.stem}.manifest{path.suffix}")
+
+
+def _minify(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _safe_name(value):
+    """Значение категории -> безопасная часть имени файла"""
+    return re.sub(r'[^A-Za-z0-9_-]+', '_', value) or 'category'
+
+
+def build_shards(data, shard_dir=SHARD_DIR):
+    """
+    Разбивает данные form.json на манифест и части
+
+    Возвращает (manifest, {относительный путь части: байты})
+    """
+    manifest = {'version': MANIFEST_VERSION, 'main': []}
+    shards = {}
+
+    for item in data.get('main', []):
+        payload = _minify(item)
+        digest = hashlib.sha256(payload).hexdigest()[:12]
+        shard_name = f"{shard_dir}/{_safe_name(item.get('value', ''))}.{digest}.json"
+
+        entry = {key: value for key, value in item.items() if key != 'children'}
+        entry['children_count'] = len(item.get('children', []))
+        entry['shard'] = shard_name
+
+        manifest['main'].append(entry)
+        shards[shard_name] = payload
+
+    return manifest, shards
+
+
+def _load_json(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def publish_shards(output_file, data):
+    """
+    Записывает манифест и части рядом с output_file
+
+    Части неизменяемые: существующий файл с тем же хешем не перезаписывается.
+    Удаляются только части, на которые не ссылается ни новый, ни предыдущий
+    манифест (чтобы не сломать страницы, открытые со старым манифестом).
+    Возвращает список записанных файлов.
+    """
+    base = Path(output_file).parent
+    manifest_path = manifest_path_for(output_file)
+    manifest, shards = build_shards(data)
+
+    written = []
+
+    for name, payload in shards.items():
+        shard_path = base / name
+        if not shard_path.exists():
+            shard_path.parent.mkdir(parents=True, exist_ok=True)
+            write_bytes_atomic(shard_path, payload)
+            written.append(shard_path)
+
+    previous = _load_json(manifest_path)
+    if previous != manifest:
+        write_json_atomic(manifest_path, manifest)
+        written.append(manifest_path)
+
+    referenced = set(shards)
+    if previous:
+        referenced.update(entry.get('shard') for entry in previous.get('main', []))
+
+    shard_dir = base / SHARD_DIR
+    if shard_dir.exists():
+        for shard_path in shard_dir.glob('*.json'):
+            if f"{SHARD_DIR}/{shard_path.name}" not in referenced:
+                shard_path.unlink()
+
+    if written:
+        print(f"🧩 Категорий в частях: {len(shards)}, записано файлов: {len(written)} ({SHARD_DIR}/)")
+
+    return written
+
+
+def validate_shards(output_file, data=None):
+    """
+    Проверяет, что манифест и части в точности собираются обратно в form.json
+
+    Возвращает список ошибок (пустой - все в порядке)
+    """
+    if data is None:
+        data = _load_json(output_file)
+        if data is None:
+            return [f"Не удалось прочитать {output_file}"]
+
+    base = Path(output_file).parent
+    manifest = _load_json(manifest_path_for(output_file))
+    if manifest is None:
+        return [f"Не найден манифест {manifest_path_for(output_file).name}"]
+
+    errors = []
+    rebuilt = []
+
+    for entry in manifest.get('main', []):
+        shard_name = entry.get('shard', '')
+        shard_path = base / shard_name
+
+        try:
+            payload = shard_path.read_bytes()
+        except OSError:
+            errors.append(f"Нет файла категории {shard_name}")
+            continue
+
+        digest = hashlib.sha256(payload).hexdigest()[:12]
+        if not shard_path.name.endswith(f".{digest}.json"):
+            errors.append(f"Хеш не совпадает с содержимым: {shard_name}")
+
+        item = json.loads(payload)
+        summary = {key: value for key, value in item.items() if key != 'children'}
+        if any(entry.get(key) != value for key, value in summary.items()):
+            errors.append(f"Манифест расходится с категорией {item.get('value')}")
+
+        rebuilt.append(item)
+
+    if not errors and rebuilt != data.get('main', []):
+        errors.append("Части не совпадают с form.json")
+
+    return errors
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else 'form.json'
+
+    form_data = _load_json(source)
+    if form_data is None:
+        print(f"❌ Не удалось прочитать {source}")
+        sys.exit(1)
+
+    publish_shards(source, form_data)
+    problems = validate_shards(source, form_data)
+
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
+        sys.exit(1)
+
+    print(f"✓ {manifest_path_for(source).name} и {SHARD_DIR}/ соответствуют {source}")
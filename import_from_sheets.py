@@ -6,9 +6,23 @@
 
 import json
 import csv
+import io
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+
+from backup_store import BACKUP_DIR, snapshot
+from form_shards import publish_shards, validate_shards
+from sheet_tree import TreeBuilder, link_tree, make_item
+from static_variants import publish_json
+
+
+# Колонки, без которых файл не является вкладкой дерева form.json
+TREE_COLUMNS = {'ID', 'Родитель', 'Название', 'Значение'}
+
+# Размер части CSV-файла, которую читает один процесс
+CHUNK_BYTES = 1024 * 1024
 
 
 def unescape_csv(text):
@@ -18,6 +32,16 @@ def unescape_csv(text):
     return text.replace('\\n', '\n').replace('\\r', '\r')
 
 
+def report_problems(result):
+    """Выводит предупреждения сборки дерева и возвращает элементы верхнего уровня"""
+    for orphan in result['orphans']:
+        print(f"[WARNING] Предупреждение: не найден родитель '{orphan['parent']}' для элемента '{orphan['id']}'")
+    for entry in result['ambiguous']:
+        print(f"[WARNING] Предупреждение: неоднозначный родитель '{entry['parent']}' для элемента '{entry['id']}'")
+
+    return result['tree']
+
+
 def build_tree(rows):
     """
     Построение древовидной структуры из плоских данных
@@ -25,79 +49,134 @@ def build_tree(rows):
     rows: список словарей с данными из CSV
     возвращает: список элементов верхнего уровня
     """
-    # Индекс всех элементов по ID
-    items_by_id = {}
-
-    # Сначала создаем все элементы
-    for row in rows:
-        item_id = row['ID']
-        parent_path = row['Родитель']
-        level = int(row['Уровень'])
-
-        # Создаем элемент
-        item = {
-            'label': unescape_csv(row['Название']),
-            'value': unescape_csv(row['Значение']),
-        }
-
-        # Добавляем опциональные поля только если они не пустые
-        if row['Подпись']:
-            item['sub'] = unescape_csv(row['Подпись'])
-        if row['Иконка']:
-            item['image'] = unescape_csv(row['Иконка'])
-        if row['Обложка']:
-            item['fimage'] = unescape_csv(row['Обложка'])
-        if row['Краткое описание']:
-            item['desc'] = unescape_csv(row['Краткое описание'])
-        if row['Полное описание']:
-            item['fulldesc'] = unescape_csv(row['Полное описание'])
-        if row['Расписание']:
-            item['timetable'] = unescape_csv(row['Расписание'])
-        if row['Цена']:
-            item['price'] = unescape_csv(row['Цена'])
-
-        # Сохраняем в индекс
-        items_by_id[item_id] = {
-            'item': item,
-            'parent': parent_path,
-            'level': level,
-            'children': []
-        }
-
-    # Теперь строим дерево
-    root_items = []
-
-    for item_id, data in items_by_id.items():
-        parent_path = data['parent']
-
-        if not parent_path:
-            # Это элемент верхнего уровня
-            root_items.append(data)
-        else:
-            # Ищем родителя
-            parent_found = False
-            for pid, pdata in items_by_id.items():
-                # Проверяем, является ли этот элемент родителем
-                if parent_path == f"{pdata['parent']}/{pdata['item']['value']}" if pdata['parent'] else parent_path == pdata['item']['value']:
-                    pdata['children'].append(data)
-                    parent_found = True
-                    break
-
-            if not parent_found:
-                print(f"[WARNING] Предупреждение: не найден родитель '{parent_path}' для элемента '{item_id}'")
-
-    # Рекурсивно добавляем children к элементам
-    def finalize_item(data):
-        item = data['item']
-        if data['children']:
-            item['children'] = [finalize_item(child) for child in data['children']]
-        return item
-
-    return [finalize_item(root) for root in root_items]
-
-
-def import_from_csv(input_dir='google_sheets_export', output_file='form.json'):
-    """Импорт данных из CSV файлов обратно в JSON"""
+    return report_problems(link_tree(rows, convert=unescape_csv))
+
+
+def read_header(f):
+    """Первая запись CSV-файла (заголовки колонок); f открыт в двоичном режиме"""
+    data = b''
+    for line in f:
+        data += line
+        # Перевод строки внутри кавычек - часть значения, а не конец записи
+        if data.count(b'"') % 2 == 0:
+            break
+    return next(csv.reader(io.StringIO(data.decode('utf-8-sig'), newline=''), delimiter='\t'), None)
+
+
+def split_csv(f, chunk_bytes=CHUNK_BYTES):
+    """
+    Границы частей файла после заголовков: (начало, конец) в байтах
+
+    Файл просматривается построчно без разбора CSV; часть заканчивается
+    только на границе записи (четное число кавычек с начала части)
+    """
+    start = end = f.tell()
+    quotes = 0
+    for line in f:
+        end += len(line)
+        quotes += line.count(b'"')
+        if quotes % 2 == 0 and end - start >= chunk_bytes:
+            yield start, end
+            start, quotes = end, 0
+    if end > start:
+        yield start, end
+
+
+def csv_tasks(csv_files, chunk_bytes=CHUNK_BYTES):
+    """
+    Задания на чтение всех файлов по порядку: (имя файла, задание, готовый результат)
+
+    Задание - аргументы read_csv_chunk; для пропущенных файлов и ошибок
+    заголовков задания нет, сразу отдается результат
+    """
+    for csv_file in csv_files:
+        name = Path(csv_file).name
+        try:
+            with open(csv_file, 'rb') as f:
+                fieldnames = read_header(f)
+
+                # Слайды, акции, новости и т.п. - не категории form.json
+                if not TREE_COLUMNS.issubset(fieldnames or []):
+                    yield name, None, {'items': [], 'error': None, 'skipped': True}
+                    continue
+
+                # Файл только с заголовками - пустой результат, чтобы файл попал в отчет
+                empty = True
+                for start, end in split_csv(f, chunk_bytes):
+                    empty = False
+                    yield name, (csv_file, fieldnames, start, end), None
+                if empty:
+                    yield name, None, {'items': [], 'error': None, 'skipped': False}
+        except Exception as e:
+            yield name, None, {'items': [], 'error': str(e), 'skipped': False}
+
+
+def read_csv_chunk(csv_file, fieldnames, start, end):
+    """
+    Элементы form.json из части CSV-файла (выполняется в отдельном процессе)
+
+    Возвращает словарь: items [(ID, Родитель, элемент)] - не больше
+    одной части файла, error, skipped
+    """
+    result = {'items': [], 'error': None, 'skipped': False}
+
+    try:
+        with open(csv_file, 'rb') as f:
+            f.seek(start)
+            text = f.read(end - start).decode('utf-8')
+
+        reader = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames, delimiter='\t')
+        for row in reader:
+            item_id = row.get('ID')
+            if item_id:
+                result['items'].append((item_id, row.get('Родитель') or '', make_item(row, unescape_csv)))
+    except Exception as e:
+        result['error'] = str(e)
+
+    return result
+
+
+def read_csv_files(csv_files, workers=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Читает файлы частями в пуле процессов и отдает (имя файла, результат части)
+    в исходном порядке файлов и частей
+
+    Один большой файл (ВСЕ_ДАННЫЕ.csv) тоже читается параллельно. В работе
+    одновременно не больше 2 * workers частей, так что память ограничена
+    размером частей, а не размером файлов
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = csv_tasks(csv_files, chunk_bytes)
+
+    if workers == 1:
+        for name, task, ready in tasks:
+            yield name, ready or read_csv_chunk(*task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+
+        for name, task, ready in tasks:
+            window.append((name, ready or pool.submit(read_csv_chunk, *task)))
+            if len(window) >= 2 * workers:
+                yield _result(window.popleft())
+
+        while window:
+            yield _result(window.popleft())
+
+
+def _result(entry):
+    name, result = entry
+    return name, result if isinstance(result, dict) else result.result()
+
+
+def import_from_csv(input_dir='google_sheets_export', output_file='form.json', workers=None):
+    """
+    Импорт данных из CSV файлов обратно в JSON
+
+    Файлы читаются параллельно частями по CHUNK_BYTES, элементы каждой части
+    сразу попадают в индекс TreeBuilder; form.json пишется потоковым JSON-кодировщиком
+    """
 
     input_path = Path(input_dir)
 
@@ -107,10 +186,9 @@ def import_from_csv(input_dir='google_sheets_export', output_file='form.json'):
         return
 
     # Создаем бэкап существующего файла
-    if Path(output_file).exists():
-        backup_file = f"{output_file}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        Path(output_file).rename(backup_file)
-        print(f"[OK] Создан бэкап: {backup_file}")
+    entry = snapshot(output_file)
+    if entry:
+        print(f"[OK] Создан бэкап: {entry['file']} @ {entry['hash'][:12]} ({BACKUP_DIR}/)")
 
     # Ищем общий файл или собираем из отдельных
     all_data_file = input_path / "ВСЕ_ДАННЫЕ.csv"
@@ -120,48 +198,63 @@ def import_from_csv(input_dir='google_sheets_export', output_file='form.json'):
         csv_files = [all_data_file]
     else:
         # Ищем все CSV файлы
-        csv_files = list(input_path.glob("*.csv"))
+        csv_files = sorted(input_path.glob("*.csv"))
         if not csv_files:
             print(f"[ERROR] Ошибка: в {input_path} не найдено CSV файлов")
             return
         print(f"Найдено CSV файлов: {len(csv_files)}")
 
-    # Читаем все строки
-    all_rows = []
+    builder = TreeBuilder()
+    total_rows = 0
+    duplicates = 0
+    counts = {}
+    failed = set()
 
-    for csv_file in csv_files:
-        print(f"Чтение: {csv_file.name}")
+    def report_file(name):
+        if name in counts and name not in failed:
+            print(f"  [OK] Прочитано строк: {counts[name]}")
 
-        try:
-            with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
-                reader = csv.DictReader(f, delimiter='\t')
-                rows = list(reader)
-                all_rows.extend(rows)
-                print(f"  [OK] Прочитано строк: {len(rows)}")
-        except Exception as e:
-            print(f"  [ERROR] Ошибка чтения {csv_file.name}: {e}")
+    current = None
+    for name, result in read_csv_files(csv_files, workers):
+        if name != current:
+            report_file(current)
+            current = name
+            print(f"Чтение: {name}")
+
+        if name in failed:
             continue
+        if result['error']:
+            # Уже прочитанные части файла остаются в дереве
+            print(f"  [ERROR] Ошибка чтения {name}: {result['error']}")
+            failed.add(name)
+            continue
+        if result['skipped']:
+            print(f"  [SKIP] Нет колонок ID/Родитель - файл пропущен")
+            continue
+
+        for item_id, parent_path, item in result['items']:
+            # Из нескольких файлов берется первая строка с таким ID
+            if len(csv_files) > 1 and item_id in builder:
+                duplicates += 1
+                continue
+            builder.add_item(item_id, parent_path, item)
+
+        counts[name] = counts.get(name, 0) + len(result['items'])
+        total_rows += len(result['items'])
 
-    if not all_rows:
+    report_file(current)
+
+    if not total_rows:
         print("[ERROR] Ошибка: нет данных для импорта")
         return
 
-    print(f"\nВсего строк для импорта: {len(all_rows)}")
-
-    # Если читали из нескольких файлов, нужно удалить дубликаты
-    if len(csv_files) > 1:
-        seen_ids = set()
-        unique_rows = []
-        for row in all_rows:
-            if row['ID'] not in seen_ids:
-                seen_ids.add(row['ID'])
-                unique_rows.append(row)
-        all_rows = unique_rows
-        print(f"После удаления дубликатов: {len(all_rows)} строк")
+    print(f"\nВсего строк для импорта: {total_rows}")
+    if duplicates:
+        print(f"После удаления дубликатов: {total_rows - duplicates} строк")
 
     # Строим дерево
     print("\nПостроение древовидной структуры...")
-    tree = build_tree(all_rows)
+    tree = report_problems(builder.finish())
 
     # Создаем финальную структуру
     result = {
@@ -169,14 +262,14 @@ def import_from_csv(input_dir='google_sheets_export', output_file='form.json'):
     }
 
     # Сохраняем в JSON
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    publish_json(output_file, result)
+    publish_shards(output_file, result)
 
     print(f"\n{'='*60}")
     print(f"[OK] Импорт завершен!")
     print(f"Файл сохранен: {output_file}")
     print(f"Элементов верхнего уровня: {len(tree)}")
-    print(f"Всего элементов: {len(all_rows)}")
+    print(f"Всего элементов: {len(builder.nodes_by_id)}")
     print(f"{'='*60}")
 
     # Проверка валидности
@@ -187,6 +280,9 @@ def import_from_csv(input_dir='google_sheets_export', output_file='form.json'):
         print("[OK] JSON валиден")
         print(f"[OK] Главных категорий: {len(check_data['main'])}")
 
+        for error in validate_shards(output_file, check_data):
+            print(f"[ERROR] {error}")
+
         # Выводим названия категорий
         print("\nГлавные категории:")
         for i, item in enumerate(check_data['main'], 1):
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Встраивание HTML-фрагментов модальных окон в index.html
+
+main.js загружает содержимое модальных окон (sportModal.html, restModal.html...)
+отдельным запросом при первом открытии. Этот скрипт вставляет небольшие
+фрагменты в конец index.html как <template id="partial-<имя>">, и loadPartial()
+в main.js берет их оттуда без запроса к серверу.
+
+Крупные фрагменты (больше INLINE_LIMIT или сверх общего INLINE_BUDGET)
+и расписания, которые пересоздаются во время работы сайта (RUNTIME_PARTIALS),
+не встраиваются и по-прежнему загружаются по запросу.
+
+Повторный запуск заменяет ранее вставленный блок, index.html вручную
+править не нужно. После изменения фрагментов запустите скрипт снова.
+
+Запуск: python inline_partials.py
+"""
+
+import re
+import sys
+from pathlib import Path
+
+from asset_manifest import RUNTIME_PARTIALS
+from safe_output import write_text_atomic
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+INDEX_FILE = 'index.html'
+SCRIPT_FILE = 'main.js'
+
+# Лимиты в байтах (UTF-8)
+INLINE_LIMIT = 8 * 1024
+INLINE_BUDGET = 32 * 1024
+
+BLOCK_START = '<!-- inline-partials:start (сгенерировано inline_partials.py, не редактировать) -->'
+BLOCK_END = '<!-- inline-partials:end -->'
+BLOCK_PATTERN = re.compile(re.escape(BLOCK_START) + r'.*?' + re.escape(BLOCK_END) + r'\n?', re.DOTALL)
+
+# loadPartial('sportModal.html?v=...')
+PARTIAL_CALL = re.compile(r"""loadPartial\(\s*['"`]([\w.-]+\.html)(?:\?[^'"`]*)?['"`]""")
+
+
+def find_partials(script):
+    """Имена фрагментов, которые main.js загружает через loadPartial, в порядке появления"""
+    return list(dict.fromkeys(PARTIAL_CALL.findall(script)))
+
+
+def template_id(name):
+    """sportModal.html -> partial-sportModal (так же считает loadPartial в main.js)"""
+    return f"partial-{name[:-len('.html')]}"
+
+
+def select_partials(names, root='.', limit=INLINE_LIMIT, budget=INLINE_BUDGET):
+    """
+    Разделяет фрагменты на встраиваемые и загружаемые по запросу
+
+    Сначала берутся самые маленькие, пока не исчерпан общий бюджет.
+    Возвращает (встраиваемые [(имя, html)], отложенные [(имя, причина)])
+    """
+    inline = []
+    lazy = []
+    used = 0
+
+    sized = []
+    for name in names:
+        path = Path(root) / name
+        if RUNTIME_PARTIALS.match(name):
+            lazy.append((name, 'пересоздается update-schedule.py'))
+            continue
+        if not path.exists():
+            lazy.append((name, 'файл не найден'))
+            continue
+        html = path.read_text(encoding='utf-8')
+        sized.append((len(html.encode('utf-8')), name, html))
+
+    for size, name, html in sorted(sized):
+        if '</template' in html.lower():
+            lazy.append((name, 'содержит </template>'))
+        elif size > limit:
+            lazy.append((name, f'{size / 1024:.1f} KB > {limit / 1024:.0f} KB'))
+        elif used + size > budget:
+            lazy.append((name, f'сверх общего лимита {budget / 1024:.0f} KB'))
+        else:
+            inline.append((name, html))
+            used += size
+
+    # В index.html - в том же порядке, что и в main.js
+    order = {name: i for i, name in enumerate(names)}
+    inline.sort(key=lambda item: order[item[0]])
+
+    return inline, lazy
+
+
+def render_block(partials):
+    parts = [BLOCK_START]
+    for name, html in partials:
+        parts.append(f'<template id="{template_id(name)}">\n{html.strip()}\n</template>')
+    parts.append(BLOCK_END)
+    return '\n'.join(parts) + '\n'
+
+
+def inline_partials(index_file=INDEX_FILE, script_file=SCRIPT_FILE):
+    """
+    Обновляет блок встроенных фрагментов в index.html
+
+    Возвращает словарь: inline - встроенные имена, lazy - [(имя, причина)],
+    changed - был ли изменен index.html
+    """
+    index_path = Path(index_file)
+    root = index_path.parent
+    content = index_path.read_text(encoding='utf-8')
+    script = (root / script_file).read_text(encoding='utf-8')
+
+    inline, lazy = select_partials(find_partials(script), root)
+    block = render_block(inline) if inline else ''
+
+    if BLOCK_PATTERN.search(content):
+        updated = BLOCK_PATTERN.sub(lambda _: block, content, count=1)
+    else:
+        position = content.rfind('</body>')
+        if position == -1:
+            raise ValueError(f"В {index_file} не найден </body>")
+        updated = content[:position] + block + content[position:]
+
+    if updated != content:
+        write_text_atomic(index_path, updated)
+
+    return {'inline': [name for name, _ in inline], 'lazy': lazy, 'changed': updated != content}
+
+
+def main():
+    result = inline_partials()
+
+    for name in result['inline']:
+        print(f"  ✓ встроен: {name}")
+    for name, reason in result['lazy']:
+        print(f"  ⏳ по запросу: {name} ({reason})")
+
+    if result['changed']:
+        print(f"✓ {INDEX_FILE} обновлен, запустите python asset_manifest.py для новых версий файлов")
+    else:
+        print(f"✓ {INDEX_FILE} уже актуален")
+
+
+if __name__ == '__main__':
+    main()
@@ -7339,8 +7339,13 @@ async function loadFormConfig() {
         console.log("Загрузка form.json...");
         console.log("Текущий URL:", window.location.href);
 
-        // Добавляем timestamp для обхода кеша
-        const response = await fetch(`form.json?t=${Date.now()}`);
+        // Добавляем timestamp для обхода кеша.
+        // form.min.json (с готовыми .gz/.br) создается при синхронизации,
+        // если его еще нет - загружаем обычный form.json
+        let response = await fetch(`form.min.json?t=${Date.now()}`);
+        if (!response.ok) {
+            response = await fetch(`form.json?t=${Date.now()}`);
+        }
         console.log("Response status:", response.status);
 
         if (!response.ok) {
@@ -7823,19 +7828,69 @@ document.addEventListener("DOMContentLoaded", () => {
   });
 });
 
-document.addEventListener("DOMContentLoaded", () => {
+// ===== Адаптивные картинки слайдов =====
+// slides_generator.py добавляет в .slide__img копии из responsive_images.py:
+// data-srcset-avif / data-srcset-webp ("путь ширинаw, ..."). В style остается
+// один url() исходника, здесь он заменяется копией поддерживаемого формата
+// и ширины под экран. Форматы в порядке предпочтения, картинки 1x1 для проверки
+const SLIDE_IMAGE_PROBES = {
+  avif: 'data:image/avif;base64,AAAAIGZ0eXBhdmlmAAAAAGF2aWZtaWYxbWlhZk1BMUIAAADrbWV0YQAAAAAAAAAhaGRscgAAAAAAAAAAcGljdAAAAAAAAAAAAAAAAAAAAAAOcGl0bQAAAAAAAQAAAB5pbG9jAAAAAEQAAAEAAQAAAAEAAAETAAAAIAAAAChpaW5mAAAAAAABAAAAGmluZmUCAAAAAAEAAGF2MDFDb2xvcgAAAABqaXBycAAAAEtpcGNvAAAAFGlzcGUAAAAAAAAAAQAAAAEAAAAQcGl4aQAAAAADCAgIAAAADGF2MUOBAAwAAAAAE2NvbHJuY2x4AAEADQAGgAAAABdpcG1hAAAAAAAAAAEAAQQBAoMEAAAAKG1kYXQSAAoIGAAGiAhoNCAyEh7Hh4VZ3///4sAAAJA1jjx+rQ==',
+  webp: 'data:image/webp;base64,UklGRiQAAABXRUJQVlA4IBgAAAAwAQCdASoBAAEAB0CWJaQAA3AA/u+5AAA='
+};
+
+function supportsImageFormat(format) {
+  return new Promise(resolve => {
+    const probe = new Image();
+    probe.onload = () => resolve(probe.width > 0);
+    probe.onerror = () => resolve(false);
+    probe.src = SLIDE_IMAGE_PROBES[format];
+  });
+}
+
+async function supportedSlideFormats() {
+  const formats = Object.keys(SLIDE_IMAGE_PROBES);
+  const supported = await Promise.all(formats.map(supportsImageFormat));
+  return formats.filter((format, i) => supported[i]);
+}
+
+// Самая узкая копия не уже targetWidth, если таких нет - самая широкая
+function pickFromSrcset(srcset, targetWidth) {
+  const candidates = srcset.split(',')
+    .map(candidate => {
+      const [url, width] = candidate.trim().split(/\s+/);
+      return { url, width: parseInt(width, 10) };
+    })
+    .sort((a, b) => a.width - b.width);
+
+  const fitting = candidates.find(candidate => candidate.width >= targetWidth);
+  return (fitting || candidates[candidates.length - 1]).url;
+}
+
+document.addEventListener("DOMContentLoaded", async () => {
   const isMobile = window.innerWidth <= 768; // условие мобилки
 
+  // Проверка форматов нужна, только если в разметке есть адаптивные копии
+  const hasResponsive = document.querySelector('.slide__img[data-srcset-avif], .slide__img[data-srcset-webp]');
+  const formats = hasResponsive ? await supportedSlideFormats() : [];
+  // Ширина экрана в физических пикселях (плотнее 2x разницы на фоне не видно)
+  const targetWidth = window.innerWidth * Math.min(window.devicePixelRatio || 1, 2);
+
   document.querySelectorAll(".slide__img-wrap").forEach(wrap => {
     let img = wrap.dataset.img; // берём data-img из wrap
     if (!img) return; // если нет картинки - пропускаем
 
-    if (isMobile) {
+    const imgEl = wrap.querySelector('.slide__img');
+    const format = imgEl && formats.find(name => imgEl.hasAttribute(`data-srcset-${name}`));
+
+    if (format) {
+      img = pickFromSrcset(imgEl.getAttribute(`data-srcset-${format}`), targetWidth);
+      // Прелоадер и ленивая загрузка в index.html тоже берут картинку из data-img
+      wrap.dataset.img = img;
+    } else if (isMobile) {
       // заменяем на версию с m перед расширением
       img = img.replace(/(\.\w+)$/, "m$1");
     }
 
-    const imgEl = wrap.querySelector('.slide__img');
     if (imgEl) {
       imgEl.style.backgroundImage = `url("${img}")`;
     }
@@ -7844,6 +7899,20 @@ document.addEventListener("DOMContentLoaded", () => {
 
 
 
+// ===== Фрагменты модальных окон =====
+// Небольшие фрагменты встроены в index.html как <template id="partial-<имя>">
+// (см. inline_partials.py), остальные загружаются с сервера.
+// Фрагменты без ?v= (расписания, их пересоздает update-schedule.py)
+// каждый раз сверяются с сервером, чтобы не показывать устаревшую версию
+async function loadPartial(url) {
+  const name = url.split('?')[0].replace(/\.html$/, '');
+  const template = document.getElementById(`partial-${name}`);
+  if (template) return template.innerHTML;
+
+  const response = await fetch(url, url.includes('?v=') ? {} : { cache: 'no-cache' });
+  return response.text();
+}
+
 // ===== СПОРТ: плавное открытие модалки с видео и горизонтальный слайдер =====
 document.addEventListener('DOMContentLoaded', () => {
   const btnOpen  = document.getElementById('sportBtn');
@@ -7857,8 +7926,7 @@ document.addEventListener('DOMContentLoaded', () => {
     if (modal.children.length > 1) return; // уже загружено
 
     try {
-      const response = await fetch('sportModal.html');
-      const html = await response.text();
+      const html = await loadPartial('sportModal.html?v=abb069eaa3');
       modal.innerHTML = html;
 
       // Сразу скрываем левую стрелку (мы в начале слайдера)
@@ -8319,8 +8387,7 @@ document.addEventListener('DOMContentLoaded', () => {
     if (scheduleModal.children.length > 0) return;
 
     try {
-      const response = await fetch('schedule-fight.html');
-      const html = await response.text();
+      const html = await loadPartial('schedule-fight.html');
       scheduleModal.innerHTML = html;
 
       // Обработчик закрытия
@@ -8588,8 +8655,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
   // Загрузка контента из restModal.html
   try {
-    const response = await fetch('restModal.html');
-    const html = await response.text();
+    const html = await loadPartial('restModal.html?v=deb9f91a7c');
     modal.innerHTML = html;
 
     // Сразу скрываем левую стрелку (мы в начале слайдера)
@@ -8924,8 +8990,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
   // Загрузка контента из kidsModal.html
   try {
-    const response = await fetch('kidsModal.html');
-    const html = await response.text();
+    const html = await loadPartial('kidsModal.html?v=c3e4146d59');
     modal.innerHTML = html;
 
     // Сразу скрываем левую стрелку (мы в начале слайдера)
@@ -9078,8 +9143,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
   // Загрузка контента из contactsModal.html
   try {
-    const response = await fetch('contactsModal.html');
-    const html = await response.text();
+    const html = await loadPartial('contactsModal.html?v=6c59e03926');
     modal.innerHTML = html;
   } catch (err) {
     console.error('Ошибка загрузки contactsModal.html:', err);
@@ -9180,8 +9244,7 @@ document.addEventListener('DOMContentLoaded', async () => {
 
   // Загрузка контента из planEventModal.html
   try {
-    const response = await fetch('planEventModal.html');
-    const html = await response.text();
+    const html = await loadPartial('planEventModal.html?v=bb17799a09');
     modal.innerHTML = html;
   } catch (err) {
     console.error('Ошибка загрузки planEventModal.html:', err);
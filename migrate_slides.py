@@ -4,19 +4,19 @@
 Скрипт миграции слайдов из старой структуры (с HTML) в новую (с простой разметкой)
 """
 
+import argparse
 import json
 import re
 import sys
-from bs4 import BeautifulSoup
-import gspread
-from google.oauth2.service_account import Credentials
+
+from sheet_source import (add_source_arguments, connect_spreadsheet, open_sheet_source,
+                          resolve_mode, update_snapshot_sheet)
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 # Конфигурация
-SPREADSHEET_ID = '1a4ZhAM2GNCxZzKbVgIMkTV4BT2mpmcheA9ejB8t5Sgk'
-CREDENTIALS_FILE = 'pride34-d166327454d1.json'
+SLIDES_SHEET = '01_СЛАЙДЫ.csv'
 
 
 def html_to_simple_markup(html_text):
@@ -233,22 +233,28 @@ def migrate_all_slides(slides_data):
     return new_data
 
 
-def update_google_sheet(new_data):
-    """Обновляет Google Таблицу новыми данными"""
+def update_google_sheet(new_data, source=None):
+    """
+    Обновляет Google Таблицу новыми данными
 
-    print("🔌 Подключение к Google Sheets...")
+    source='offline': пробный запуск без сети - ни таблица, ни снимок
+    sheet_data.json не меняются, результат остается только в slides_migrated.json
+    """
 
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets',
-        'https://www.googleapis.com/auth/drive'
-    ]
+    if resolve_mode(source) == 'offline':
+        # Снимок - зеркало живой таблицы: cached-запуски других скриптов
+        # опубликовали бы из него слайды, которых в таблице нет
+        print("📦 Офлайн-режим: Google Таблица и снимок sheet_data.json не изменены")
+        print(f"✓ Мигрировано строк: {len(new_data)}, результат в slides_migrated.json")
+        print()
+        return
 
-    credentials = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=scopes)
-    client = gspread.authorize(credentials)
-    spreadsheet = client.open_by_key(SPREADSHEET_ID)
+    print("🔌 Подключение к Google Sheets...")
+
+    spreadsheet = connect_spreadsheet(write=True)
 
     # Находим лист слайдов
-    worksheet = spreadsheet.worksheet('01_СЛАЙДЫ.csv')
+    worksheet = spreadsheet.worksheet(SLIDES_SHEET)
 
     print("✓ Подключение установлено")
     print(f"📊 Лист: {worksheet.title}")
@@ -262,12 +268,20 @@ def update_google_sheet(new_data):
     print("📝 Запись новых данных...")
     worksheet.update('A1', new_data)
 
+    # Запись в таблицу прошла: снимок должен совпадать с ней,
+    # иначе cached/offline-запуски увидят старые слайды
+    update_snapshot_sheet(SLIDES_SHEET, new_data)
+
     print(f"✓ Обновлено строк: {len(new_data)}")
     print()
 
 
-def main(auto_confirm=False):
-    """Главная функция миграции"""
+def main(auto_confirm=False, source=None, ttl=None):
+    """
+    Главная функция миграции
+
+    source, ttl: режим источника таблицы (live, cached, offline, см. sheet_source)
+    """
 
     print("="*70)
     print("🔄 МИГРАЦИЯ СЛАЙДОВ В НОВУЮ СТРУКТУРУ")
@@ -276,10 +290,9 @@ def main(auto_confirm=False):
 
     # Читаем текущие данные
     print("📖 Чтение текущих данных...")
-    with open('sheet_data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    transport = open_sheet_source(source, ttl)
 
-    old_slides = data.get('01_СЛАЙДЫ.csv', [])
+    old_slides = transport.data.get(SLIDES_SHEET, [])
 
     if not old_slides:
         print("❌ Данные слайдов не найдены!")
@@ -320,7 +333,7 @@ def main(auto_confirm=False):
 
     # Обновляем Google Таблицу
     print()
-    update_google_sheet(new_slides)
+    update_google_sheet(new_slides, source)
 
     print("="*70)
     print("✅ МИГРАЦИЯ ЗАВЕРШЕНА УСПЕШНО!")
@@ -331,7 +344,10 @@ def main(auto_confirm=False):
     print("✓ Извлечены заголовки (до 3 строк)")
     print("✓ Извлечены кнопки (первая кнопка)")
     print("✓ Определены темы слайдов (light/dark)")
-    print("✓ Обновлена Google Таблица")
+    if resolve_mode(source) == 'offline':
+        print("✓ Результат сохранен в slides_migrated.json (Google Таблица не изменена)")
+    else:
+        print("✓ Обновлена Google Таблица")
     print()
     print("Следующие шаги:")
     print("1. Откройте Google Таблицу и проверьте данные")
@@ -344,10 +360,12 @@ def main(auto_confirm=False):
 
 if __name__ == '__main__':
     try:
-        # Проверяем параметры командной строки
-        auto_confirm = '--yes' in sys.argv or '-y' in sys.argv
+        parser = argparse.ArgumentParser(description='Миграция слайдов в новую структуру')
+        parser.add_argument('-y', '--yes', action='store_true', help='не спрашивать подтверждение')
+        add_source_arguments(parser)
+        args = parser.parse_args()
 
-        success = main(auto_confirm=auto_confirm)
+        success = main(auto_confirm=args.yes, source=args.source, ttl=args.ttl)
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ Критическая ошибка: {e}")
@@ -0,0 +1,387 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Адаптивные версии картинок слайдов и обложек
+
+Собирает ссылки на локальные картинки из slides.json (Картинка Desktop / Mobile)
+и form.json (image, fimage) и делает для каждой уменьшенные копии в форматах
+AVIF и WebP нескольких ширин:
+
+    responsive/<имя>.<хеш>.<ширина>w.<формат>
+
+Хеш берется от содержимого исходника, поэтому неизмененные картинки
+не перекодируются. Итог записывается в images.json - по нему
+slides_generator добавляет data-srcset-*/srcset в HTML слайдов.
+
+Нужен пакет Pillow (pip install Pillow). AVIF создается, если Pillow
+собран с поддержкой AVIF или установлен pillow-avif-plugin.
+
+Копии создаются параллельно в пуле процессов (по числу ядер).
+
+Запуск: python responsive_images.py [число процессов]
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from safe_output import write_json_atomic
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+try:
+    import pillow_avif  # noqa: F401 - регистрирует формат AVIF в Pillow
+except ImportError:
+    pass
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+MANIFEST_FILE = 'images.json'
+OUTPUT_DIR = 'responsive'
+MANIFEST_VERSION = 2
+
+WIDTHS = (320, 640, 960, 1280, 1920)
+
+# Формат -> (MIME-тип, параметры сохранения). Порядок - по предпочтению браузера
+FORMATS = {
+    'avif': ('image/avif', {'quality': 55, 'speed': 6}),
+    'webp': ('image/webp', {'quality': 78}),
+}
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+SLIDE_IMAGE_FIELDS = ('Картинка Desktop', 'Картинка Mobile')
+FORM_IMAGE_FIELDS = ('image', 'fimage')
+
+
+def normalize_ref(ref):
+    """'./img/1.jpg' -> 'img/1.jpg'; внешние ссылки и не-картинки -> None"""
+    ref = (ref or '').strip()
+    if not ref or '://' in ref or ref.startswith(('//', '/', 'data:')):
+        return None
+
+    ref = ref.split('?', 1)[0]
+    if ref.startswith('./'):
+        ref = ref[2:]
+
+    return ref if ref.lower().endswith(SOURCE_EXTENSIONS) else None
+
+
+def collect_image_refs(slides, form_data):
+    """Локальные картинки из слайдов и form.json без повторов, в порядке появления"""
+    refs = {}
+
+    for slide in slides:
+        for field in SLIDE_IMAGE_FIELDS:
+            ref = normalize_ref(slide.get(field))
+            if ref:
+                refs[ref] = True
+
+    def walk(item):
+        for field in FORM_IMAGE_FIELDS:
+            ref = normalize_ref(item.get(field))
+            if ref:
+                refs[ref] = True
+        for child in item.get('children', []):
+            walk(child)
+
+    for item in form_data.get('main', []):
+        walk(item)
+
+    return list(refs)
+
+
+def available_formats():
+    """Форматы из FORMATS, которые умеет сохранять установленный Pillow"""
+    if Image is None:
+        return []
+
+    Image.init()
+    return [fmt for fmt in FORMATS if fmt.upper() in Image.SAVE]
+
+
+def target_widths(source_width):
+    """Ширины копий: без увеличения, исходная ширина - если она меньше максимальной"""
+    widths = [width for width in WIDTHS if width < source_width]
+    # Исходник шире WIDTHS[-1]: максимальная ширина уже в списке
+    if source_width <= WIDTHS[-1]:
+        widths.append(source_width)
+    return widths
+
+
+def variant_path(ref, key, width, fmt):
+    return f"{OUTPUT_DIR}/{Path(ref).stem}.{key}.{width}w.{fmt}"
+
+
+# Отпечаток настроек: при смене ширин или качества копии создаются заново
+SETTINGS_FINGERPRINT = hashlib.sha256(
+    json.dumps([WIDTHS, FORMATS], sort_keys=True).encode('utf-8')
+).hexdigest()[:8]
+
+# EXIF-ориентации, при которых картинка поворачивается на 90°
+ROTATED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def image_key(data):
+    """Ключ копий: хеш содержимого исходника вместе с настройками"""
+    return hashlib.sha256(data + SETTINGS_FINGERPRINT.encode('utf-8')).hexdigest()[:12]
+
+
+def _oriented_size(image):
+    """Размер с учетом EXIF-поворота без декодирования картинки"""
+    width, height = image.size
+    if image.getexif().get(0x0112) in ROTATED_ORIENTATIONS:
+        return height, width
+    return width, height
+
+
+def transcode(job):
+    """
+    Создает одну копию картинки (выполняется в процессе пула)
+
+    job: {'ref', 'source', 'target', 'width', 'format'}
+    Возвращает (ref, секунды)
+    """
+    started = time.perf_counter()
+
+    with Image.open(job['source']) as original:
+        image = ImageOps.exif_transpose(original)
+        if image.mode not in ('RGB', 'RGBA'):
+            has_alpha = image.mode in ('LA', 'PA') or 'transparency' in image.info
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        if job['width'] != image.width:
+            height = max(1, round(image.height * job['width'] / image.width))
+            image = image.resize((job['width'], height), Image.LANCZOS)
+
+        target = Path(job['target'])
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_target = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        image.save(tmp_target, job['format'].upper(), **FORMATS[job['format']][1])
+        tmp_target.replace(target)
+
+    return job['ref'], time.perf_counter() - started
+
+
+def plan_image(ref, root, formats, previous=None):
+    """
+    Запись манифеста и задания на недостающие копии одной картинки
+
+    previous: запись из прошлого манифеста - если ключ совпадает и все копии
+    на месте, она используется без заданий.
+    Возвращает (запись, задания)
+    """
+    source = root / ref
+    key = image_key(source.read_bytes())
+
+    if previous and previous.get('hash') == key and set(previous['variants']) == set(formats):
+        if all((root / v['path']).exists() for variants in previous['variants'].values() for v in variants):
+            return previous, []
+
+    with Image.open(source) as image:
+        width, height = _oriented_size(image)
+
+    entry = {'hash': key, 'width': width, 'height': height, 'variants': {}}
+    jobs = []
+
+    for fmt in formats:
+        entry['variants'][fmt] = []
+
+        for target_width in target_widths(width):
+            path = variant_path(ref, key, target_width, fmt)
+            entry['variants'][fmt].append({'width': target_width, 'path': path})
+
+            if not (root / path).exists():
+                jobs.append({
+                    'ref': ref,
+                    'source': str(source),
+                    'target': str(root / path),
+                    'width': target_width,
+                    'format': fmt
+                })
+
+    return entry, jobs
+
+
+def run_jobs(jobs, workers=None):
+    """
+    Выполняет задания в пуле процессов (по умолчанию - по числу ядер)
+
+    Возвращает (секунды по картинкам {ref: сумма}, ошибки {ref: текст})
+    """
+    timings = {}
+    errors = {}
+
+    def record(ref, seconds):
+        timings[ref] = timings.get(ref, 0.0) + seconds
+
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            try:
+                record(*transcode(job))
+            except Exception as e:
+                errors[job['ref']] = str(e)
+        return timings, errors
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(transcode, job): job for job in jobs}
+
+        for future in as_completed(futures):
+            try:
+                record(*future.result())
+            except Exception as e:
+                errors[futures[future]['ref']] = str(e)
+
+    return timings, errors
+
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """Манифест адаптивных картинок; пустой, если он не создан"""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest['images']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    return {}
+
+
+def build_manifest(refs, root='.', manifest_file=MANIFEST_FILE, workers=None):
+    """
+    Обновляет копии для всех картинок refs и записывает манифест
+
+    Картинки, ключ которых (хеш исходника + настройки) уже есть в манифесте
+    и все копии на месте, пропускаются. Остальные копии создаются параллельно.
+    Возвращает словарь со статистикой: built, reused, missing, errors,
+    timings ({ref: секунды}), jobs, removed
+    """
+    root = Path(root)
+    formats = available_formats()
+    previous = load_manifest(root / manifest_file)
+    images = {}
+    jobs = []
+    stats = {'built': [], 'reused': [], 'missing': [], 'errors': {}, 'timings': {}, 'jobs': 0, 'removed': 0}
+
+    for ref in refs:
+        if not (root / ref).is_file():
+            stats['missing'].append(ref)
+            continue
+
+        entry, image_jobs = plan_image(ref, root, formats, previous.get(ref))
+        images[ref] = entry
+        jobs.extend(image_jobs)
+        stats['built' if image_jobs else 'reused'].append(ref)
+
+    stats['jobs'] = len(jobs)
+    stats['timings'], stats['errors'] = run_jobs(jobs, workers)
+
+    # Картинки с ошибками не попадают в манифест: у них нет всех копий
+    for ref in stats['errors']:
+        images.pop(ref, None)
+
+    if images != previous:
+        write_json_atomic(root / manifest_file, {'version': MANIFEST_VERSION, 'images': images})
+
+    # Копии, на которые больше нет ссылок (картинка изменилась или удалена)
+    referenced = {
+        variant['path']
+        for entry in images.values()
+        for variants in entry['variants'].values()
+        for variant in variants
+    }
+    output_dir = root / OUTPUT_DIR
+    if output_dir.exists():
+        for path in output_dir.iterdir():
+            if path.is_file() and not path.name.endswith('.tmp') and f"{OUTPUT_DIR}/{path.name}" not in referenced:
+                path.unlink()
+                stats['removed'] += 1
+
+    return stats
+
+
+# ---------------------------------------------------------------------------
+# Разметка для HTML
+# ---------------------------------------------------------------------------
+
+def lookup(images, ref):
+    """Запись манифеста для ссылки из слайда или form.json (или None)"""
+    ref = normalize_ref(ref)
+    return images.get(ref) if ref else None
+
+
+def srcset(entry, fmt):
+    """'responsive/a.320w.webp 320w, responsive/a.640w.webp 640w'"""
+    return ', '.join(f"{variant['path']} {variant['width']}w" for variant in entry['variants'].get(fmt, []))
+
+
+def background_attributes(entry):
+    """
+    Атрибуты data-srcset-avif / data-srcset-webp для фоновой картинки
+
+    В style остается один url() исходника, формат и ширину под экран
+    выбирает main.js (pickSlideImages)
+    """
+    attributes = []
+
+    for fmt in FORMATS:
+        candidates = srcset(entry, fmt)
+        if candidates:
+            attributes.append(f' data-srcset-{fmt}="{candidates}"')
+
+    return ''.join(attributes)
+
+
+def main(workers=None):
+    if Image is None:
+        print("❌ Не установлен Pillow: pip install Pillow")
+        return False
+
+    formats = available_formats()
+    if not formats:
+        print("❌ Pillow не умеет сохранять WebP/AVIF")
+        return False
+    if 'avif' not in formats:
+        print("ℹ️  AVIF недоступен (pip install pillow-avif-plugin), создаются только WebP")
+
+    with open('slides.json', 'r', encoding='utf-8') as f:
+        slides = json.load(f)
+    with open('form.json', 'r', encoding='utf-8') as f:
+        form_data = json.load(f)
+
+    refs = collect_image_refs(slides, form_data)
+    print(f"🖼️  Картинок в slides.json и form.json: {len(refs)}")
+
+    started = time.perf_counter()
+    stats = build_manifest(refs, workers=workers)
+
+    for ref, seconds in sorted(stats['timings'].items(), key=lambda item: -item[1]):
+        print(f"  {seconds:7.2f} s  {ref}")
+    print(f"✓ Создано копий: {stats['jobs']} для {len(stats['built'])} картинок "
+          f"за {time.perf_counter() - started:.1f} s, без изменений: {len(stats['reused'])}")
+    for ref, error in stats['errors'].items():
+        print(f"  ❌ {ref}: {error}")
+    if stats['removed']:
+        print(f"🗑️  Удалено устаревших копий: {stats['removed']}")
+    for ref in stats['missing']:
+        print(f"  ⚠️  Файл не найден: {ref}")
+    print(f"✓ Манифест: {MANIFEST_FILE}")
+
+    return not stats['errors']
+
+
+if __name__ == '__main__':
+    # python responsive_images.py [число процессов]
+    sys.exit(0 if main(int(sys.argv[1]) if len(sys.argv) > 1 else None) else 1)
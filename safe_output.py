@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Атомарная запись выходных файлов сайта (form.json, slides_html.json, settings.json...)
+
+Данные пишутся во временный файл в той же папке, сбрасываются на диск (fsync)
+и только потом подменяют целевой файл через os.replace. Веб-сервер всегда видит
+либо старую, либо новую версию файла целиком, но не обрезанную.
+"""
+
+import io
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+# Права для новых файлов: веб-сервер должен иметь доступ на чтение
+DEFAULT_MODE = 0o644
+
+
+@contextmanager
+def atomic_writer(path):
+    """
+    Файл для атомарной записи по частям (двоичный режим)
+
+    Целевой файл подменяется только после успешного выхода из блока with,
+    при исключении временный файл удаляется и старая версия остается на месте
+    """
+    path = Path(path)
+    directory = path.parent if str(path.parent) else Path('.')
+
+    # mkstemp создает файл с правами 0600 - сохраняем права старого файла
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = DEFAULT_MODE
+
+    fd, tmp_name = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=directory)
+
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    _fsync_directory(directory)
+
+
+def write_bytes_atomic(path, data):
+    """Атомарная запись байтов в файл"""
+    with atomic_writer(path) as f:
+        f.write(data)
+
+
+def write_text_atomic(path, text, encoding='utf-8'):
+    """Атомарная запись текста в файл"""
+    write_bytes_atomic(path, text.encode(encoding))
+
+
+def write_json_atomic(path, data, encoding='utf-8', **dump_options):
+    """
+    Атомарная запись JSON
+
+    По умолчанию формат как у остальных скриптов: ensure_ascii=False, indent=2.
+    Документ кодируется потоком (JSONEncoder.iterencode) и пишется в файл
+    частями, целиком строка в памяти не собирается
+    """
+    options = {'ensure_ascii': False, 'indent': 2}
+    options.update(dump_options)
+    encoder = json.JSONEncoder(**options)
+
+    with atomic_writer(path) as f:
+        writer = io.TextIOWrapper(f, encoding=encoding, newline='', write_through=False)
+        try:
+            for chunk in encoder.iterencode(data):
+                writer.write(chunk)
+            writer.flush()
+        finally:
+            writer.detach()
+
+
+def _fsync_directory(directory):
+    """Сброс записи каталога, чтобы переименование пережило сбой питания (только POSIX)"""
+    if os.name != 'posix':
+        return
+
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Инкрементальная сборка дерева категорий по отпечаткам вкладок
+
+Для каждой вкладки хранится хеш исходных значений и уже построенное поддерево.
+Неизмененные вкладки берутся из кеша, заново разбираются только измененные.
+Кеш лежит рядом с form.json (form.cache.json) и перезаписывается, только
+если какая-то вкладка изменилась, добавилась или пропала.
+
+Склеить поддеревья можно, только если вкладки независимы: все родители
+найдены по полному пути внутри своей вкладки, а ID и полные пути не
+повторяются между вкладками. Иначе дерево собирается заново целиком -
+результат всегда совпадает с полной сборкой.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from safe_output import write_json_atomic
+from sheet_tree import link_tree, print_problems, rows_to_dicts
+
+
+# Увеличить при изменении сборки элементов (sheet_tree), иначе из кеша
+# будут браться поддеревья в старом формате
+CACHE_VERSION = 2
+
+
+def cache_path_for(output_file):
+    """form.json -> form.cache.json"""
+    return Path(output_file).with_suffix('.cache.json')
+
+
+def fingerprint(rows):
+    """Хеш исходных значений вкладки"""
+    raw = json.dumps(rows, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def load_cache(cache_file):
+    """Загрузка кеша, при любой ошибке - пустой кеш"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION:
+            return cache
+    except (OSError, ValueError):
+        pass
+
+    return {'version': CACHE_VERSION, 'sheets': {}}
+
+
+def save_cache(cache_file, cache):
+    write_json_atomic(cache_file, cache, indent=None, separators=(',', ':'))
+
+
+def same_as_file(output_file, data):
+    """True, если файл уже содержит ровно эти данные (перезапись не нужна)"""
+    try:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            return json.load(f) == data
+    except (OSError, ValueError):
+        return False
+
+
+def sheet_entry(rows, sheet_hash):
+    """Поддерево одной вкладки и сведения для проверки независимости"""
+    all_rows = rows_to_dicts(rows)
+    dict_rows = [row for row in all_rows if row.get('ID')]
+    built = link_tree(dict_rows)
+
+    ids = [row['ID'] for row in dict_rows]
+    paths = []
+    parents = set()
+    for row in dict_rows:
+        parent = row.get('Родитель') or ''
+        value = row.get('Значение', '')
+        paths.append(f"{parent}/{value}" if parent else value)
+        if parent:
+            parents.add(parent)
+
+    # Родители найдены точно по пути, без поиска по значению
+    # и без неоднозначностей - внутри вкладки связи не зависят от других вкладок
+    linked = (
+        not built['orphans'] and not built['ambiguous']
+        and len(set(ids)) == len(ids) and parents <= set(paths)
+    )
+
+    return {
+        'hash': sheet_hash,
+        'rows': len(all_rows),
+        'ids': ids,
+        'paths': paths,
+        'linked': linked,
+        'tree': built['tree']
+    }
+
+
+def full_build(sheets):
+    """Сборка всех вкладок за один проход, без кеша"""
+    all_rows = []
+    for title, rows in sheets:
+        all_rows.extend(rows_to_dicts(rows))
+
+    built = link_tree(all_rows)
+    print_problems(built)
+
+    return {'tree': built['tree'], 'rows': len(all_rows), 'changed': [title for title, _ in sheets], 'reused': []}
+
+
+def build_category_tree(sheets, output_file=None):
+    """
+    Сборка дерева категорий из нескольких вкладок с использованием кеша
+
+    sheets: список пар (название вкладки, строки с заголовком) в нужном порядке;
+    у каждой вкладки свои заголовки, поэтому строки разбираются по вкладкам
+    output_file: итоговый файл (form.json), рядом с ним хранится кеш;
+    None - без кеша
+
+    Возвращает словарь:
+    - tree: список элементов верхнего уровня
+    - rows: всего строк данных
+    - changed: вкладки, которые пришлось разобрать заново
+    - reused: вкладки, взятые из кеша
+    """
+    if output_file is None:
+        return full_build(sheets)
+
+    cache_file = cache_path_for(output_file)
+    old_sheets = load_cache(cache_file)['sheets']
+    new_sheets = {}
+    result = {'tree': [], 'rows': 0, 'changed': [], 'reused': []}
+
+    for title, rows in sheets:
+        sheet_hash = fingerprint(rows)
+        entry = old_sheets.get(title)
+
+        if entry and entry['hash'] == sheet_hash:
+            result['reused'].append(title)
+        else:
+            entry = sheet_entry(rows, sheet_hash)
+            result['changed'].append(title)
+
+        result['rows'] += entry['rows']
+        new_sheets[title] = entry
+
+    all_ids = [item_id for entry in new_sheets.values() for item_id in entry['ids']]
+    all_paths = [path for entry in new_sheets.values() for path in entry['paths']]
+    independent = (
+        all(entry['linked'] for entry in new_sheets.values())
+        and len(all_ids) == len(set(all_ids))
+        and len(all_paths) == len(set(all_paths))
+    )
+
+    if independent:
+        for entry in new_sheets.values():
+            result['tree'].extend(entry['tree'])
+    else:
+        print("  ℹ️  Вкладки ссылаются друг на друга - полная пересборка дерева")
+        result['tree'] = full_build(sheets)['tree']
+
+    if result['changed'] or list(old_sheets) != list(new_sheets):
+        save_cache(cache_file, {'version': CACHE_VERSION, 'sheets': new_sheets})
+
+    return result
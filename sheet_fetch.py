@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Загрузка данных вкладок Google Таблицы одним запросом (values.batchGet)
+Если пакетный запрос не удался - данные читаются по одной вкладке
+
+Источник данных подключается через "транспорт":
+- GspreadTransport - живая таблица через gspread
+- FakeTransport - локальные данные (например, sheet_data.json) для проверок без сети
+"""
+
+
+def quote_sheet_title(title):
+    """Экранирование названия вкладки для A1-нотации: 'Лист ''1'''"""
+    return "'" + title.replace("'", "''") + "'"
+
+
+def fill_gaps(rows):
+    """
+    Выравнивает строки до одинаковой ширины
+
+    batchGet обрезает пустые ячейки в конце строк, а get_all_values - нет
+    """
+    if not rows:
+        return []
+
+    width = max(len(row) for row in rows)
+    return [list(row) + [''] * (width - len(row)) for row in rows]
+
+
+class GspreadTransport:
+    """Транспорт поверх gspread.Spreadsheet"""
+
+    def __init__(self, spreadsheet, worksheets=None):
+        self.spreadsheet = spreadsheet
+        # Уже полученный список вкладок, чтобы не запрашивать его повторно
+        self._worksheets = worksheets
+
+    def worksheets(self):
+        if self._worksheets is None:
+            self._worksheets = self.spreadsheet.worksheets()
+        return self._worksheets
+
+    def refresh(self):
+        """Забыть список вкладок: следующее чтение запросит его заново"""
+        self._worksheets = None
+
+    def sheet_titles(self):
+        return [ws.title for ws in self.worksheets()]
+
+    def batch_get(self, titles):
+        """Один HTTP-запрос на все вкладки, результат в порядке titles"""
+        ranges = [quote_sheet_title(title) for title in titles]
+        response = self.spreadsheet.values_batch_get(ranges)
+        value_ranges = response.get('valueRanges', [])
+
+        if len(value_ranges) != len(titles):
+            raise ValueError(f"batchGet вернул {len(value_ranges)} диапазонов вместо {len(titles)}")
+
+        return [fill_gaps(vr.get('values', [])) for vr in value_ranges]
+
+    def get_values(self, title):
+        for ws in self.worksheets():
+            if ws.title == title:
+                return ws.get_all_values()
+        raise KeyError(title)
+
+
+class FakeTransport:
+    """
+    Локальная "таблица" для тестов и офлайн-запусков
+
+    data: словарь {название вкладки: список строк}, как в sheet_data.json
+    fail_batch: имитировать ошибку пакетного запроса
+    """
+
+    def __init__(self, data, fail_batch=False):
+        self.data = data
+        self.fail_batch = fail_batch
+        self.calls = []
+
+    def sheet_titles(self):
+        self.calls.append(('sheet_titles',))
+        return list(self.data.keys())
+
+    def batch_get(self, titles):
+        self.calls.append(('batch_get', tuple(titles)))
+        if self.fail_batch:
+            raise RuntimeError("batchGet недоступен")
+        return [fill_gaps(self.data[title]) for title in titles]
+
+    def get_values(self, title):
+        self.calls.append(('get_values', title))
+        return fill_gaps(self.data[title])
+
+
+def fetch_sheets(transport, titles):
+    """
+    Загружает несколько вкладок
+
+    Сначала пробует один пакетный запрос, при ошибке читает вкладки по одной.
+    Возвращает словарь:
+    - values: {название: строки} для успешно прочитанных вкладок
+    - errors: {название: текст ошибки}
+    - batched: True, если сработал пакетный запрос
+    """
+    titles = list(titles)
+    result = {'values': {}, 'errors': {}, 'batched': False}
+
+    if not titles:
+        return result
+
+    try:
+        for title, rows in zip(titles, transport.batch_get(titles)):
+            result['values'][title] = rows
+        result['batched'] = True
+        return result
+    except Exception as e:
+        print(f"  ⚠️  Пакетная загрузка не удалась ({e}), читаем вкладки по одной")
+
+    for title in titles:
+        try:
+            result['values'][title] = transport.get_values(title)
+        except Exception as e:
+            result['errors'][title] = str(e)
+
+    return result
@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Общий источник данных Google Таблицы для всех скриптов
+
+Режимы:
+- live - таблица читается из API (все вкладки одним пакетным запросом),
+  снимок sheet_data.json обновляется;
+- cached - если снимку меньше TTL секунд, API не вызывается, иначе как live;
+- offline - только снимок sheet_data.json, без сети и ключей доступа.
+
+Режим выбирается аргументом --source у скриптов или переменной окружения
+SHEET_SOURCE (TTL - SHEET_SOURCE_TTL). Повторные и пробные запуски, CI и замеры
+в режимах cached/offline не тратят запросов к API и дают одинаковый результат.
+
+Использование:
+    transport = open_sheet_source()            # режим из SHEET_SOURCE, по умолчанию live
+    transport = open_sheet_source('offline')
+    for worksheet in transport.worksheets(): ...
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from safe_output import write_json_atomic
+from sheet_fetch import FakeTransport, GspreadTransport, fetch_sheets
+
+
+SPREADSHEET_ID = '1a4ZhAM2GNCxZzKbVgIMkTV4BT2mpmcheA9ejB8t5Sgk'
+CREDENTIALS_FILE = 'pride34-d166327454d1.json'
+SHEET_DATA_FILE = 'sheet_data.json'
+
+MODES = ('live', 'cached', 'offline')
+DEFAULT_MODE = 'live'
+DEFAULT_TTL = 600
+
+MODE_ENV = 'SHEET_SOURCE'
+TTL_ENV = 'SHEET_SOURCE_TTL'
+
+READ_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets.readonly',
+    'https://www.googleapis.com/auth/drive.readonly'
+]
+WRITE_SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets',
+    'https://www.googleapis.com/auth/drive'
+]
+
+
+def connect_spreadsheet(write=False):
+    """Подключение к таблице через gspread (только чтение, если write=False)"""
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    scopes = WRITE_SCOPES if write else READ_SCOPES
+    credentials = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=scopes)
+    client = gspread.authorize(credentials)
+    return client.open_by_key(SPREADSHEET_ID)
+
+
+class SnapshotWorksheet:
+    """Уже прочитанная вкладка с интерфейсом gspread.Worksheet (title, get_all_values)"""
+
+    def __init__(self, title, rows):
+        self.title = title
+        self.rows = rows
+
+    def get_all_values(self):
+        return self.rows
+
+
+class SnapshotTransport(FakeTransport):
+    """
+    Транспорт поверх полного снимка таблицы
+
+    origin: откуда взят снимок - 'live' (только что из API), 'cache', 'offline'
+    """
+
+    def __init__(self, data, origin):
+        super().__init__(data)
+        self.origin = origin
+
+    def worksheets(self):
+        return [SnapshotWorksheet(title, rows) for title, rows in self.data.items()]
+
+    def worksheet(self, title):
+        return SnapshotWorksheet(title, self.data[title])
+
+
+def resolve_mode(mode=None):
+    mode = mode or os.environ.get(MODE_ENV) or DEFAULT_MODE
+    if mode not in MODES:
+        raise ValueError(f"Неизвестный режим источника таблицы: {mode} (допустимо: {', '.join(MODES)})")
+    return mode
+
+
+def resolve_ttl(ttl=None):
+    if ttl is not None:
+        return ttl
+    return float(os.environ.get(TTL_ENV, DEFAULT_TTL))
+
+
+def load_snapshot(snapshot_file=SHEET_DATA_FILE):
+    """(данные, возраст в секундах) или (None, None), если снимка нет"""
+    path = Path(snapshot_file)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None, None
+    return data, time.time() - path.stat().st_mtime
+
+
+def save_snapshot(data, snapshot_file=SHEET_DATA_FILE):
+    write_json_atomic(snapshot_file, data)
+
+
+def fetch_snapshot(transport):
+    """
+    Все вкладки таблицы одним пакетным запросом
+
+    Пустые вкладки тоже сохраняются, чтобы номера вкладок в меню sync_selective.py
+    совпадали во всех режимах
+    """
+    titles = transport.sheet_titles()
+    fetched = fetch_sheets(transport, titles)
+    if fetched['errors']:
+        raise RuntimeError(f"Не прочитаны вкладки: {', '.join(fetched['errors'])}")
+    return {title: fetched['values'][title] for title in titles}
+
+
+def open_sheet_source(mode=None, ttl=None, snapshot_file=SHEET_DATA_FILE, connect=connect_spreadsheet):
+    """
+    Транспорт таблицы в выбранном режиме (см. описание модуля)
+
+    connect: функция подключения к живой таблице (для проверок - подставная)
+    """
+    mode = resolve_mode(mode)
+
+    if mode != 'live':
+        data, age = load_snapshot(snapshot_file)
+
+        if mode == 'offline':
+            if data is None:
+                raise FileNotFoundError(f"Нет снимка таблицы {snapshot_file} для офлайн-режима")
+            print(f"📦 Таблица из снимка {snapshot_file} (офлайн)")
+            return SnapshotTransport(data, 'offline')
+
+        if data is not None and age < resolve_ttl(ttl):
+            print(f"📦 Таблица из снимка {snapshot_file} ({age:.0f} с назад)")
+            return SnapshotTransport(data, 'cache')
+
+    print("🔌 Подключение к Google Sheets...")
+    data = fetch_snapshot(GspreadTransport(connect()))
+    save_snapshot(data, snapshot_file)
+    print(f"✓ Загружено вкладок: {len(data)}, снимок сохранен в {snapshot_file}")
+    return SnapshotTransport(data, 'live')
+
+
+def update_snapshot_sheet(title, rows, snapshot_file=SHEET_DATA_FILE):
+    """Замена одной вкладки в снимке - только после успешной записи в таблицу"""
+    data, _ = load_snapshot(snapshot_file)
+    data = data or {}
+    data[title] = rows
+    save_snapshot(data, snapshot_file)
+
+
+def add_source_arguments(parser):
+    """Общие аргументы --source и --ttl для argparse"""
+    parser.add_argument('--source', choices=MODES,
+                        help=f'источник таблицы (по умолчанию ${MODE_ENV} или {DEFAULT_MODE})')
+    parser.add_argument('--ttl', type=float,
+                        help=f'срок годности снимка в режиме cached, секунд (по умолчанию {DEFAULT_TTL})')
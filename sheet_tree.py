@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Построение древовидной структуры form.json из плоских строк Google Таблиц / CSV
+Общий модуль для sync_from_google_sheets.py, sync_selective.py и import_from_sheets.py
+
+Узлы индексируются по полному пути (Родитель/Значение) и по значению,
+дети привязываются за один линейный проход без перебора всех элементов.
+"""
+
+
+# Соответствие колонок таблицы необязательным полям элемента form.json
+OPTIONAL_FIELDS = [
+    ('Подпись', 'sub'),
+    ('Иконка', 'image'),
+    ('Обложка', 'fimage'),
+    ('Краткое описание', 'desc'),
+    ('Полное описание', 'fulldesc'),
+    ('Расписание', 'timetable'),
+    ('Цена', 'price'),
+]
+
+
+def rows_to_dicts(rows):
+    """
+    Преобразует данные листа (первая строка - заголовки) в список словарей
+
+    Короткие строки дополняются пустыми значениями
+    """
+    if not rows:
+        return []
+
+    headers = rows[0]
+    width = len(headers)
+    result = []
+
+    for row_data in rows[1:]:
+        if len(row_data) < width:
+            row_data = list(row_data) + [''] * (width - len(row_data))
+        result.append(dict(zip(headers, row_data)))
+
+    return result
+
+
+def make_item(row, convert=None):
+    """
+    Создает элемент form.json из строки таблицы
+
+    convert: необязательная функция преобразования значений (например, unescape_csv)
+    """
+    convert = convert or (lambda text: text)
+
+    item = {
+        'label': convert(row.get('Название', '')),
+        'value': convert(row.get('Значение', '')),
+    }
+
+    # Добавляем опциональные поля только если они не пустые
+    for column, key in OPTIONAL_FIELDS:
+        if row.get(column):
+            item[key] = convert(row[column])
+
+    return item
+
+
+class TreeBuilder:
+    """
+    Пошаговая сборка дерева: строки добавляются по одной (add), связи
+    строятся в конце (finish)
+
+    Сами строки не хранятся - только готовые узлы, поэтому источник строк
+    может быть потоковым (CSV-файлы, читаемые построчно)
+    """
+
+    def __init__(self, convert=None):
+        self.convert = convert
+        self.nodes_by_id = {}
+
+    def __contains__(self, item_id):
+        return item_id in self.nodes_by_id
+
+    def add(self, row):
+        """Добавляет строку-словарь; строки без ID пропускаются"""
+        item_id = row.get('ID')
+        if not item_id:
+            return
+
+        self.add_item(item_id, row.get('Родитель') or '', make_item(row, self.convert))
+
+    def add_item(self, item_id, parent_path, item):
+        """Добавляет готовый элемент (например, созданный make_item в другом процессе)"""
+        # Повторный ID заменяет данные, но сохраняет исходную позицию
+        self.nodes_by_id[item_id] = {
+            'id': item_id,
+            'item': item,
+            'parent': parent_path,
+            'path': f"{parent_path}/{item['value']}" if parent_path else item['value'],
+            'children': []
+        }
+
+    def finish(self):
+        """
+        Привязывает детей к родителям и возвращает результат как link_tree
+        """
+        nodes_by_id = self.nodes_by_id
+
+        # Индексы по полному пути и по значению
+        by_path = {}
+        by_value = {}
+        # Пути, под которыми несколько узлов: дети привязываются к первому
+        duplicates = {}
+        for node in nodes_by_id.values():
+            path = node['path']
+            if path in by_path:
+                duplicates.setdefault(path, [by_path[path]]).append(node)
+            else:
+                by_path[path] = node
+            by_value.setdefault(node['item']['value'], []).append(node)
+
+        # Привязываем детей к родителям
+        root_nodes = []
+        orphans = []
+        ambiguous = []
+
+        for node in nodes_by_id.values():
+            parent_path = node['parent']
+
+            if not parent_path:
+                root_nodes.append(node)
+                continue
+
+            parent = by_path.get(parent_path)
+
+            if parent_path in duplicates:
+                ambiguous.append({
+                    'id': node['id'],
+                    'parent': parent_path,
+                    'candidates': [f"{c['path']} (ID {c['id']})" for c in duplicates[parent_path]]
+                })
+
+            if parent is None:
+                # Старый формат: в колонке "Родитель" указан не полный путь,
+                # а только значение родителя или хвост пути
+                leaf = parent_path.rsplit('/', 1)[-1]
+                candidates = [c for c in by_value.get(leaf, []) if c is not node]
+
+                if len(candidates) > 1:
+                    narrowed = [c for c in candidates if c['path'].endswith(f"/{parent_path}")]
+                    if narrowed:
+                        candidates = narrowed
+
+                if len(candidates) > 1:
+                    ambiguous.append({
+                        'id': node['id'],
+                        'parent': parent_path,
+                        'candidates': [c['path'] for c in candidates]
+                    })
+
+                parent = candidates[0] if candidates else None
+
+            if parent is None:
+                orphans.append({'id': node['id'], 'parent': parent_path})
+                continue
+
+            parent['children'].append(node)
+
+        # Собираем итоговые элементы
+        def finalize_item(node):
+            item = node['item']
+            if node['children']:
+                item['children'] = [finalize_item(child) for child in node['children']]
+            return item
+
+        return {
+            'tree': [finalize_item(node) for node in root_nodes],
+            'count': len(nodes_by_id),
+            'orphans': orphans,
+            'ambiguous': ambiguous
+        }
+
+
+def link_tree(rows, convert=None):
+    """
+    Строит дерево из списка словарей-строк
+
+    Возвращает словарь:
+    - tree: список элементов верхнего уровня
+    - count: количество обработанных элементов
+    - orphans: элементы, для которых не найден родитель
+    - ambiguous: элементы, для которых подходит несколько родителей, в том числе
+      несколько узлов с одинаковым полным путем (привязываются к первому подходящему)
+    """
+    builder = TreeBuilder(convert)
+    for row in rows:
+        builder.add(row)
+    return builder.finish()
+
+
+def print_problems(result):
+    """Выводит предупреждения о потерянных и неоднозначных родителях"""
+    for orphan in result['orphans']:
+        print(f"⚠️  Предупреждение: не найден родитель '{orphan['parent']}' для элемента '{orphan['id']}'")
+
+    for entry in result['ambiguous']:
+        print(f"⚠️  Предупреждение: неоднозначный родитель '{entry['parent']}' для элемента "
+              f"'{entry['id']}' (варианты: {', '.join(entry['candidates'])})")
+
+
+def build_tree(rows):
+    """
+    Построение древовидной структуры из плоских данных
+
+    rows: список списков с данными из Google Sheets (первая строка - заголовки)
+    возвращает: список элементов верхнего уровня
+    """
+    if not rows or len(rows) < 2:
+        return []
+
+    result = link_tree(rows_to_dicts(rows))
+    print_problems(result)
+
+    return result['tree']
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Запись нескольких таблиц в одну книгу .xlsx или .ods без сторонних библиотек
+
+Оба формата - zip-архив с XML-частями, поэтому хватает zipfile из стандартной
+библиотеки. Книгу с вкладками можно загрузить в Google Таблицы одним файлом
+вместо отдельных CSV.
+
+tabs: список (имя вкладки, заголовки, строки); строки - списки значений,
+числа записываются как числа, остальное - как текст.
+"""
+
+import re
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+
+from safe_output import atomic_writer
+
+
+# Символы, недопустимые в XML 1.0 (управляющие, кроме табуляции и переводов строки)
+INVALID_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+
+# Ограничения имени листа в Excel
+SHEET_NAME_LIMIT = 31
+SHEET_NAME_FORBIDDEN = re.compile(r'[\[\]:*?/\\]')
+
+
+def _text(value):
+    return escape(INVALID_XML.sub('', str(value)))
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def sheet_names(tabs):
+    """Допустимые и уникальные имена листов"""
+    names = []
+    for name, _, _ in tabs:
+        name = SHEET_NAME_FORBIDDEN.sub('_', name)[:SHEET_NAME_LIMIT] or 'Sheet'
+        base, n = name, 2
+        while name in names:
+            suffix = f"_{n}"
+            name = base[:SHEET_NAME_LIMIT - len(suffix)] + suffix
+            n += 1
+        names.append(name)
+    return names
+
+
+# ---------------------------------------------------------------------------
+# XLSX (Office Open XML)
+# ---------------------------------------------------------------------------
+
+def _column_letter(index):
+    letters = ''
+    index += 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        letters = chr(65 + rest) + letters
+    return letters
+
+
+def _xlsx_sheet(headers, rows):
+    parts = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+             '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             '<sheetData>']
+    letters = [_column_letter(i) for i in range(len(headers))]
+
+    for row_number, row in enumerate([headers, *rows], 1):
+        parts.append(f'<row r="{row_number}">')
+        for column, value in enumerate(row):
+            if column >= len(letters):
+                letters.append(_column_letter(column))
+            ref = f"{letters[column]}{row_number}"
+            if _is_number(value):
+                parts.append(f'<c r="{ref}"><v>{value}</v></c>')
+            elif value not in (None, ''):
+                parts.append(f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{_text(value)}</t></is></c>')
+        parts.append('</row>')
+
+    parts.append('</sheetData></worksheet>')
+    return ''.join(parts)
+
+
+def write_xlsx(path, tabs):
+    """Книга Excel: по листу на вкладку"""
+    names = sheet_names(tabs)
+    count = len(tabs)
+
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        + ''.join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            for i in range(1, count + 1))
+        + '</Types>'
+    )
+    root_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    )
+    workbook = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>'
+        + ''.join(f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+                  for i, name in enumerate(names, 1))
+        + '</sheets></workbook>'
+    )
+    workbook_rels = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        + ''.join(
+            f'<Relationship Id="rId{i}" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+            f'Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, count + 1))
+        + f'<Relationship Id="rId{count + 1}" '
+          'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+          'Target="styles.xml"/>'
+        '</Relationships>'
+    )
+    styles = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+        '<borders count="1"><border/></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        '</styleSheet>'
+    )
+
+    with atomic_writer(path) as f:
+        with zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as book:
+            book.writestr('[Content_Types].xml', content_types)
+            book.writestr('_rels/.rels', root_rels)
+            book.writestr('xl/workbook.xml', workbook)
+            book.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+            book.writestr('xl/styles.xml', styles)
+            for i, (_, headers, rows) in enumerate(tabs, 1):
+                book.writestr(f'xl/worksheets/sheet{i}.xml', _xlsx_sheet(headers, rows))
+
+
+# ---------------------------------------------------------------------------
+# ODS (OpenDocument)
+# ---------------------------------------------------------------------------
+
+ODS_MIMETYPE = 'application/vnd.oasis.opendocument.spreadsheet'
+
+
+def _ods_table(name, headers, rows):
+    parts = [f'<table:table table:name={quoteattr(name)}>']
+
+    for row in [headers, *rows]:
+        parts.append('<table:table-row>')
+        for value in row:
+            if _is_number(value):
+                parts.append(f'<table:table-cell office:value-type="float" office:value="{value}">'
+                             f'<text:p>{value}</text:p></table:table-cell>')
+            elif value not in (None, ''):
+                parts.append('<table:table-cell office:value-type="string">'
+                             f'<text:p>{_text(value)}</text:p></table:table-cell>')
+            else:
+                parts.append('<table:table-cell/>')
+        parts.append('</table:table-row>')
+
+    parts.append('</table:table>')
+    return ''.join(parts)
+
+
+def write_ods(path, tabs):
+    """Книга OpenDocument (LibreOffice): по листу на вкладку"""
+    names = sheet_names(tabs)
+
+    content = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<office:document-content '
+        'xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0" '
+        'xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0" '
+        'xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" '
+        'office:version="1.2"><office:body><office:spreadsheet>'
+        + ''.join(_ods_table(name, headers, rows) for name, (_, headers, rows) in zip(names, tabs))
+        + '</office:spreadsheet></office:body></office:document-content>'
+    )
+    manifest = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<manifest:manifest xmlns:manifest="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0" '
+        'manifest:version="1.2">'
+        f'<manifest:file-entry manifest:full-path="/" manifest:media-type="{ODS_MIMETYPE}"/>'
+        '<manifest:file-entry manifest:full-path="content.xml" manifest:media-type="text/xml"/>'
+        '</manifest:manifest>'
+    )
+
+    with atomic_writer(path) as f:
+        with zipfile.ZipFile(f, 'w', zipfile.ZIP_DEFLATED) as book:
+            # mimetype должен идти первым и без сжатия
+            book.writestr(zipfile.ZipInfo('mimetype'), ODS_MIMETYPE, compress_type=zipfile.ZIP_STORED)
+            book.writestr('META-INF/manifest.xml', manifest)
+            book.writestr('content.xml', content)
+
+
+WRITERS = {
+    'xlsx': write_xlsx,
+    'ods': write_ods,
+}
@@ -5,15 +5,191 @@
 Преобразует разметку (**жирный**, *курсив*, [плашка], {акцент}) в HTML
 """
 
-import re
+import hashlib
 import json
 import sys
+from functools import lru_cache
+from html import escape as escape_html
+from pathlib import Path
+from string import Template
+
+import responsive_images
+from safe_output import write_json_atomic, write_text_atomic
 
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
-def parse_markup(text):
+# Теги разметки -> (открывающий HTML, закрывающий HTML)
+MARKUP_TAGS = {
+    'strong': ('<strong>', '</strong>'),
+    'em': ('<em>', '</em>'),
+    'accent': ('<span class="slideTextAccent">', '</span>'),
+    'beige': ('<span class="slideTextAccentBeige">', '</span>'),
+}
+
+LINE_BREAK = '<br class="mobile-br"/>'
+
+# Открывающий маркер -> тег
+MARKERS = {'**': 'strong', '*': 'em', '_': 'em', '[': 'accent', '{': 'beige'}
+
+# Закрывающая скобка -> открывающая
+CLOSING_BRACKETS = {']': '[', '}': '{'}
+
+
+class MarkupError(ValueError):
+    """Ошибка разметки заголовка: position - позиция маркера в строке (с нуля)"""
+
+    def __init__(self, message, position):
+        super().__init__(f"{message} (позиция {position + 1})")
+        self.message = message
+        self.position = position
+
+
+def _append_text(children, text):
+    if children and isinstance(children[-1], str):
+        children[-1] += text
+    else:
+        children.append(text)
+
+
+@lru_cache(maxsize=4096)
+def parse_markup_ast(text):
+    """
+    Разбор разметки за один проход по строке
+
+    Возвращает (узлы, ошибки). Узел - это строка текста, ('br',) или
+    (тег, дочерние узлы), тег - ключ MARKUP_TAGS. Незакрытые и лишние маркеры
+    остаются в тексте как есть и попадают в список ошибок MarkupError.
+    Результат кешируется по входной строке.
+    """
+    root = []
+    stack = []  # открытые маркеры: {'marker', 'pos', 'children'}
+    errors = []
+
+    def children():
+        return stack[-1]['children'] if stack else root
+
+    def dissolve_top():
+        """Незакрытый маркер превращается обратно в текст"""
+        frame = stack.pop()
+        errors.append(MarkupError(f"Не закрыт маркер '{frame['marker']}'", frame['pos']))
+        _append_text(children(), frame['marker'])
+        for child in frame['children']:
+            if isinstance(child, str):
+                _append_text(children(), child)
+            else:
+                children().append(child)
+
+    def is_open(marker):
+        return any(frame['marker'] == marker for frame in stack)
+
+    def close(marker):
+        while stack[-1]['marker'] != marker:
+            dissolve_top()
+        frame = stack.pop()
+        children().append((MARKERS[marker], tuple(frame['children'])))
+
+    def toggle(marker, pos):
+        if is_open(marker):
+            close(marker)
+        else:
+            stack.append({'marker': marker, 'pos': pos, 'children': []})
+
+    i = 0
+    length = len(text)
+
+    while i < length:
+        char = text[i]
+
+        if char == '*':
+            run = 1
+            while i + run < length and text[i + run] == '*':
+                run += 1
+
+            pos = i
+            i += run
+
+            # ***текст*** -> <strong><em>текст</em></strong>
+            if run == 3 and stack and stack[-1]['marker'] == '*' and is_open('**'):
+                toggle('*', pos)
+                toggle('**', pos + 1)
+                continue
+
+            while run >= 2:
+                toggle('**', pos)
+                pos += 2
+                run -= 2
+            if run:
+                toggle('*', pos)
+
+        elif char == '_' and (
+            # **_текст_** -> <strong><em>текст</em></strong>
+            (stack and stack[-1]['marker'] == '**' and stack[-1]['pos'] == i - 2)
+            or (is_open('_') and text.startswith('**', i + 1))
+        ):
+            toggle('_', i)
+            i += 1
+
+        elif char in '[{':
+            stack.append({'marker': char, 'pos': i, 'children': []})
+            i += 1
+
+        elif char in CLOSING_BRACKETS:
+            if is_open(CLOSING_BRACKETS[char]):
+                close(CLOSING_BRACKETS[char])
+            else:
+                errors.append(MarkupError(f"Лишний маркер '{char}'", i))
+                _append_text(children(), char)
+            i += 1
+
+        elif char == '|':
+            children().append(('br',))
+            i += 1
+
+        else:
+            start = i
+            i += 1
+            while i < length and text[i] not in '*_[]{}|':
+                i += 1
+            _append_text(children(), text[start:i])
+
+    while stack:
+        dissolve_top()
+
+    errors.sort(key=lambda error: error.position)
+    return tuple(root), tuple(errors)
+
+
+def render_markup(nodes):
+    """HTML из узлов parse_markup_ast, текст экранируется"""
+    parts = []
+
+    for node in nodes:
+        if isinstance(node, str):
+            parts.append(escape_html(node, quote=False))
+        elif node[0] == 'br':
+            parts.append(LINE_BREAK)
+        else:
+            open_tag, close_tag = MARKUP_TAGS[node[0]]
+            parts.append(f"{open_tag}{render_markup(node[1])}{close_tag}")
+
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=4096)
+def _markup_html(text):
+    return render_markup(parse_markup_ast(text)[0])
+
+
+def check_markup(text):
+    """Список ошибок разметки (MarkupError) - пустой, если разметка корректна"""
+    if not text:
+        return []
+    return list(parse_markup_ast(text)[1])
+
+
+def parse_markup(text, strict=False):
     """
     Преобразует простую разметку в HTML
 
@@ -23,99 +199,96 @@ def parse_markup(text):
     - [текст] -> <span class="slideTextAccent">текст</span> (белая плашка)
     - {текст} -> <span class="slideTextAccentBeige">текст</span> (бежевая плашка)
     - | -> <br class="mobile-br"/> (перенос строки)
+
+    Теги можно вкладывать: **[текст]**, *{текст}*, ***текст***, **_текст_**.
+    Символы <, > и & в тексте экранируются.
+    strict: при ошибке разметки выбросить MarkupError вместо вывода маркера как текста
     """
 
     if not text or text.strip() == '':
         return ''
 
-    # Сначала обрабатываем комбинации
-    # **_текст_** -> <strong><em>текст</em></strong>
-    text = re.sub(r'\*\*_(.+?)_\*\*', r'<strong><em>\1</em></strong>', text)
+    if strict:
+        errors = check_markup(text)
+        if errors:
+            raise errors[0]
+
+    return _markup_html(text)
 
-    # **[текст]** -> <strong><span class="slideTextAccent">текст</span></strong>
-    text = re.sub(r'\*\*\[(.+?)\]\*\*', r'<strong><span class="slideTextAccent">\1</span></strong>', text)
 
-    # **{текст}** -> <strong><span class="slideTextAccentBeige">текст</span></strong>
-    text = re.sub(r'\*\*\{(.+?)\}\*\*', r'<strong><span class="slideTextAccentBeige">\1</span></strong>', text)
+def wrap_in_text_row(text):
+    """Оборачивает текст в структуру text-row для слайдера"""
+    if not text:
+        return ''
 
-    # *[текст]* -> <em><span class="slideTextAccent">текст</span></em>
-    text = re.sub(r'\*\[(.+?)\]\*', r'<em><span class="slideTextAccent">\1</span></em>', text)
+    return f'<span class="text-row"><span>{text}</span></span>'
 
-    # *{текст}* -> <em><span class="slideTextAccentBeige">текст</span></em>
-    text = re.sub(r'\*\{(.+?)\}\*', r'<em><span class="slideTextAccentBeige">\1</span></em>', text)
 
-    # Затем простые теги
-    # **текст** -> <strong>текст</strong>
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+HEADLINE_FIELDS = ['Заголовок строка 1', 'Заголовок строка 2', 'Заголовок строка 3']
 
-    # *текст* -> <em>текст</em> (но не затрагиваем уже обработанное)
-    text = re.sub(r'(?<!</)(?<!</em>)\*([^*]+?)\*', r'<em>\1</em>', text)
 
-    # [текст] -> <span class="slideTextAccent">текст</span>
-    text = re.sub(r'\[(.+?)\]', r'<span class="slideTextAccent">\1</span>', text)
+# Шаблоны слайда компилируются один раз при загрузке модуля.
+# Варианты отличаются только блоком картинки и порядком выбора картинок.
+SLIDE_TEMPLATE = '''<figure class="$slide_class"$id_attr>
+<div class="slide__img-wrap $theme_class" data-img="$image">
+$image_html
+</div>
+<figcaption class="slide__caption">
+<h2 class="slides__caption-headline">
+$headline_html
+</h2>
+$button_html
+</figcaption>
+</figure>'''
 
-    # {текст} -> <span class="slideTextAccentBeige">текст</span>
-    text = re.sub(r'\{(.+?)\}', r'<span class="slideTextAccentBeige">\1</span>', text)
+# $responsive - адаптивные копии из images.json (см. responsive_images.py), если они есть.
+# В style только один url(): его читают BackgroundCheck и imagesLoaded,
+# копию под формат и ширину экрана подставляет main.js из data-srcset-*
+BACKGROUND_IMAGE = '<div class="slide__img" style="background-image: url($image)"$responsive></div>'
+AMP_IMAGE = '<amp-img class="slide__img" src="$image"$responsive layout="fill" alt=""></amp-img>'
 
-    # | -> <br class="mobile-br"/>
-    text = text.replace('|', '<br class="mobile-br"/>')
+SLIDE_VARIANTS = {
+    # Основная картинка - desktop, mobile - если desktop не указана
+    'desktop': {'images': ('Картинка Desktop', 'Картинка Mobile'), 'image_html': BACKGROUND_IMAGE},
+    'mobile': {'images': ('Картинка Mobile', 'Картинка Desktop'), 'image_html': BACKGROUND_IMAGE},
+    'amp': {'images': ('Картинка Desktop', 'Картинка Mobile'), 'image_html': AMP_IMAGE},
+}
 
-    return text
+COMPILED_TEMPLATES = {
+    name: Template(SLIDE_TEMPLATE.replace('$image_html', variant['image_html']))
+    for name, variant in SLIDE_VARIANTS.items()
+}
 
+# Отпечаток шаблонов: при их изменении кеш готового HTML сбрасывается
+TEMPLATES_FINGERPRINT = hashlib.sha256(
+    json.dumps([SLIDE_TEMPLATE, SLIDE_VARIANTS], sort_keys=True).encode('utf-8')
+).hexdigest()[:16]
 
-def wrap_in_text_row(text):
-    """Оборачивает текст в структуру text-row для слайдера"""
-    if not text:
-        return ''
+CACHE_VERSION = 1
 
-    return f'<span class="text-row"><span>{text}</span></span>'
+# Кеш готового HTML в памяти, если файл кеша не указан
+_memory_cache = {}
+MEMORY_CACHE_LIMIT = 1000
 
 
-def generate_slide_html(slide_data, is_first=False):
+def slide_context(slide_data, is_first=False):
     """
-    Генерирует HTML код для одного слайда
+    Общие для всех вариантов части слайда
 
-    slide_data: словарь с данными слайда
-    is_first: флаг первого слайда (добавляет класс slide--current)
+    Заголовки и кнопка считаются один раз, варианты подставляют только картинку.
     """
-
-    # Извлекаем данные
-    slide_num = slide_data.get('Номер', '')
     idname = slide_data.get('idname', '')
-    line1 = slide_data.get('Заголовок строка 1', '')
-    line2 = slide_data.get('Заголовок строка 2', '')
-    line3 = slide_data.get('Заголовок строка 3', '')
-    img_desktop = slide_data.get('Картинка Desktop', '')
-    img_mobile = slide_data.get('Картинка Mobile', '')
     btn_text = slide_data.get('Текст кнопки', '')
     btn_link = slide_data.get('Ссылка кнопки', '#')
     btn_id = slide_data.get('ID кнопки', '')
     theme = slide_data.get('Тема слайда', 'light')
 
-    # Определяем класс темы
-    theme_class = 'light-slide' if theme == 'light' else 'dark-slide'
-
-    # Определяем класс слайда
-    slide_class = 'slide slide--current' if is_first else 'slide'
-
-    # Выбираем картинку (используем desktop как основную, mobile для адаптива)
-    main_img = img_desktop if img_desktop else img_mobile
-
     # Парсим заголовки
-    parsed_line1 = parse_markup(line1)
-    parsed_line2 = parse_markup(line2)
-    parsed_line3 = parse_markup(line3)
-
-    # Формируем заголовок
     headline_parts = []
-    if parsed_line1:
-        headline_parts.append(wrap_in_text_row(parsed_line1))
-    if parsed_line2:
-        headline_parts.append(wrap_in_text_row(parsed_line2))
-    if parsed_line3:
-        headline_parts.append(wrap_in_text_row(parsed_line3))
-
-    headline_html = '\n'.join(headline_parts)
+    for field in HEADLINE_FIELDS:
+        parsed = parse_markup(slide_data.get(field, ''))
+        if parsed:
+            headline_parts.append(wrap_in_text_row(parsed))
 
     # Формируем кнопку
     button_html = ''
@@ -124,45 +297,162 @@ def generate_slide_html(slide_data, is_first=False):
         btn_class = 'sport-btn' if 'записаться' in btn_text.lower() or 'запись' in btn_text.lower() else ''
         button_html = f'<a class="slides__caption-link {btn_class}" href="{btn_link}"{btn_id_attr}><span>{btn_text}</span></a>'
 
-    # Генерируем атрибут id для якорной ссылки (формат: slide_idname)
-    id_attr = f' id="slide_{idname}" data-slide-id="{idname}"' if idname else ''
+    return {
+        'slide_class': 'slide slide--current' if is_first else 'slide',
+        # Атрибут id для якорной ссылки (формат: slide_idname)
+        'id_attr': f' id="slide_{idname}" data-slide-id="{idname}"' if idname else '',
+        'theme_class': 'light-slide' if theme == 'light' else 'dark-slide',
+        'headline_html': '\n'.join(headline_parts),
+        'button_html': button_html,
+    }
+
 
-    # Генерируем финальный HTML
-    html = f'''<figure class="{slide_class}"{id_attr}>
-<div class="slide__img-wrap {theme_class}" data-img="{main_img}">
-<div class="slide__img" style="background-image: url({main_img})"></div>
-</div>
-<figcaption class="slide__caption">
-<h2 class="slides__caption-headline">
-{headline_html}
-</h2>
-{button_html}
-</figcaption>
-</figure>'''
+def responsive_markup(image, variant, images):
+    """Добавка к разметке картинки: data-srcset-* для фона или srcset для AMP"""
+    entry = responsive_images.lookup(images or {}, image)
+    if not entry:
+        return ''
+
+    if variant == 'amp':
+        candidates = responsive_images.srcset(entry, 'webp')
+        return f' srcset="{candidates}"' if candidates else ''
+
+    return responsive_images.background_attributes(entry)
+
+
+def render_variant(slide_data, context, variant='desktop', images=None):
+    """
+    HTML одного варианта слайда из общего контекста slide_context
+
+    images: манифест адаптивных картинок (responsive_images.load_manifest)
+    """
+    first, fallback = SLIDE_VARIANTS[variant]['images']
+    image = slide_data.get(first, '') or slide_data.get(fallback, '')
+    responsive = responsive_markup(image, variant, images)
+    return COMPILED_TEMPLATES[variant].substitute(context, image=image, responsive=responsive)
+
+
+def generate_slide_html(slide_data, is_first=False, variant='desktop', images=None):
+    """
+    Генерирует HTML код для одного слайда
+
+    slide_data: словарь с данными слайда
+    is_first: флаг первого слайда (добавляет класс slide--current)
+    variant: desktop, mobile или amp (см. SLIDE_VARIANTS)
+    images: манифест адаптивных картинок, если нужны data-srcset-*/srcset
+    """
+    return render_variant(slide_data, slide_context(slide_data, is_first), variant, images)
 
-    return html
 
+def slide_key(slide_data, is_first, images=None):
+    """Ключ кеша: хеш строки таблицы, позиции слайда и версий его картинок"""
+    image_hashes = []
+    for field in responsive_images.SLIDE_IMAGE_FIELDS:
+        entry = responsive_images.lookup(images or {}, slide_data.get(field))
+        image_hashes.append(entry['hash'] if entry else None)
 
-def generate_slides_from_data(slides_data):
+    raw = json.dumps([slide_data, is_first, image_hashes], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def cache_path_for(output_file):
+    """slides_html.json -> slides_html.cache.json"""
+    return Path(output_file).with_suffix('.cache.json')
+
+
+def load_render_cache(cache_file):
+    """Загрузка кеша готового HTML, при любой ошибке или смене шаблонов - пустой кеш"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') == CACHE_VERSION and cache.get('templates') == TEMPLATES_FINGERPRINT:
+            return cache['slides']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    return {}
+
+
+def save_render_cache(cache_file, entries):
+    cache = {'version': CACHE_VERSION, 'templates': TEMPLATES_FINGERPRINT, 'slides': entries}
+    write_json_atomic(cache_file, cache, indent=None, separators=(',', ':'))
+
+
+def render_slides(slides_data, variants=('desktop',), cache_file=None, images=None):
+    """
+    HTML всех слайдов в нужных вариантах
+
+    Слайды, строка которых не изменилась, берутся из кеша (файл cache_file
+    или память процесса). images - манифест адаптивных картинок.
+    Возвращает словарь:
+    - variants: {вариант: [HTML слайдов]}
+    - rendered: сколько слайдов отрисовано заново
+    - reused: сколько взято из кеша
+    """
+    cached = load_render_cache(cache_file) if cache_file else _memory_cache
+    entries = {}
+    result = {'variants': {variant: [] for variant in variants}, 'rendered': 0, 'reused': 0}
+
+    for i, slide in enumerate(slides_data):
+        key = slide_key(slide, i == 0, images)
+        entry = dict(cached.get(key, {}))
+        missing = [variant for variant in variants if variant not in entry]
+
+        if missing:
+            context = slide_context(slide, i == 0)
+            for variant in missing:
+                entry[variant] = render_variant(slide, context, variant, images)
+            result['rendered'] += 1
+        else:
+            result['reused'] += 1
+
+        entries[key] = entry
+        for variant in variants:
+            result['variants'][variant].append(entry[variant])
+
+    if cache_file:
+        # В кеше остаются только текущие слайды
+        if entries != cached:
+            save_render_cache(cache_file, entries)
+    else:
+        if len(_memory_cache) + len(entries) > MEMORY_CACHE_LIMIT:
+            _memory_cache.clear()
+        _memory_cache.update(entries)
+
+    return result
+
+
+def generate_slides_from_data(slides_data, variant='desktop', cache_file=None, images=None):
     """
     Генерирует HTML код для всех слайдов
 
     slides_data: список словарей с данными слайдов
+    variant: вариант разметки (desktop, mobile, amp)
+    cache_file: файл кеша готового HTML между запусками (по умолчанию - только в памяти)
+    images: манифест адаптивных картинок (responsive_images.load_manifest)
     """
+    return render_slides(slides_data, (variant,), cache_file, images)['variants'][variant]
 
-    html_slides = []
 
-    for i, slide in enumerate(slides_data):
-        is_first = (i == 0)
-        slide_html = generate_slide_html(slide, is_first)
-        html_slides.append(slide_html)
+def print_markup_errors(slides_data):
+    """Выводит ошибки разметки заголовков; возвращает их количество"""
+    count = 0
+
+    for i, slide in enumerate(slides_data, 1):
+        for field in HEADLINE_FIELDS:
+            for error in check_markup(slide.get(field, '')):
+                print(f"  ⚠️  Слайд {slide.get('Номер', i)}, {field}: {error}")
+                count += 1
 
-    return html_slides
+    return count
 
 
-def generate_slides_json(input_file='slides.json', output_file='slides_html.json'):
+def generate_slides_json(input_file='slides.json', output_file='slides_html.json', variants=()):
     """
     Читает слайды из JSON и генерирует HTML версию
+
+    variants: дополнительные варианты разметки (mobile, amp), каждый сохраняется
+              в slides_output.<вариант>.html
     """
 
     print("="*70)
@@ -186,7 +476,15 @@ def generate_slides_json(input_file='slides.json', output_file='slides_html.json
     # Генерируем HTML
     print("\n🔨 Генерация HTML...")
 
-    html_slides = generate_slides_from_data(slides_data)
+    print_markup_errors(slides_data)
+    rendered = render_slides(
+        slides_data, ('desktop',) + tuple(variants), cache_path_for(output_file),
+        images=responsive_images.load_manifest()
+    )
+    html_slides = rendered['variants']['desktop']
+
+    if rendered['reused']:
+        print(f"♻️  Без изменений (из кеша): {rendered['reused']}, отрисовано заново: {rendered['rendered']}")
 
     # Создаем структуру для сохранения
     result = {
@@ -206,8 +504,7 @@ def generate_slides_json(input_file='slides.json', output_file='slides_html.json
         })
 
     # Сохраняем
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
+    write_json_atomic(output_file, result)
 
     print(f"✓ HTML сгенерирован для {len(html_slides)} слайдов")
     print(f"✓ Сохранено в: {output_file}")
@@ -215,11 +512,15 @@ def generate_slides_json(input_file='slides.json', output_file='slides_html.json
     # Также сохраняем чистый HTML для вставки
     html_output = '\n\n'.join(html_slides)
     html_file = 'slides_output.html'
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html_output)
+    write_text_atomic(html_file, html_output)
 
     print(f"✓ Чистый HTML сохранен в: {html_file}")
 
+    for variant in variants:
+        variant_file = f'slides_output.{variant}.html'
+        write_text_atomic(variant_file, '\n\n'.join(rendered['variants'][variant]))
+        print(f"✓ Вариант {variant} сохранен в: {variant_file}")
+
     print("\n" + "="*70)
     print("✓ ГЕНЕРАЦИЯ ЗАВЕРШЕНА!")
     print("="*70)
@@ -240,6 +541,10 @@ if __name__ == '__main__':
             ("**_семьи_**", "<strong><em>семьи</em></strong>"),
             ("Сила|и движение", 'Сила<br class="mobile-br"/>и движение'),
             ("**Сила** и *движение*", '<strong>Сила</strong> и <em>движение</em>'),
+            ("***семьи***", "<strong><em>семьи</em></strong>"),
+            ("**[на ковре]**", '<strong><span class="slideTextAccent">на ковре</span></strong>'),
+            ("4 < 5 & 6", "4 &lt; 5 &amp; 6"),
+            ("**не закрыто", "**не закрыто"),
         ]
 
         for input_text, expected in tests:
@@ -249,7 +554,10 @@ if __name__ == '__main__':
             print(f"   → {result}")
             if result != expected:
                 print(f"   Ожидалось: {expected}")
+            for error in check_markup(input_text):
+                print(f"   ⚠️  {error}")
             print()
     else:
-        # Генерация HTML из файла
-        generate_slides_json()
+        # Генерация HTML из файла; дополнительные варианты: python slides_generator.py mobile amp
+        extra_variants = [arg for arg in sys.argv[1:] if arg in SLIDE_VARIANTS and arg != 'desktop']
+        generate_slides_json(variants=extra_variants)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Минифицированные и предварительно сжатые версии JSON-файлов сайта
+
+Рядом с form.json создаются:
+- form.min.json     - без отступов и пробелов
+- form.min.json.gz  - для nginx gzip_static
+- form.min.json.br  - для brotli_static (если установлен пакет brotli)
+
+Файлы пересоздаются только при изменении содержимого, поэтому веб-серверу
+не нужно сжимать их заново на каждый запрос.
+
+После ручной правки form.json версии и части по категориям обновляются так:
+    python static_variants.py [form.json]
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from pathlib import Path
+
+from form_shards import manifest_path_for, publish_shards
+from safe_output import write_bytes_atomic, write_json_atomic
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+def min_path_for(path):
+    """form.json -> form.min.json"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.min{path.suffix}")
+
+
+def minify_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def write_variants(path, data):
+    """
+    Пишет минифицированную и сжатые версии, если они устарели
+
+    Возвращает список записанных файлов (пустой, если все актуально)
+    """
+    min_path = min_path_for(path)
+    payload = minify_json(data)
+
+    variants = {
+        min_path: lambda: payload,
+        # mtime=0 - одинаковое содержимое дает одинаковый .gz (стабильный ETag)
+        Path(f"{min_path}.gz"): lambda: gzip.compress(payload, compresslevel=9, mtime=0),
+    }
+    if brotli is not None:
+        variants[Path(f"{min_path}.br")] = lambda: brotli.compress(payload, quality=11)
+
+    up_to_date = (
+        min_path.exists() and min_path.read_bytes() == payload
+        and all(variant.exists() for variant in variants)
+    )
+    if up_to_date:
+        return []
+
+    written = []
+    # Сначала сжатые версии, минифицированный файл - последним:
+    # он служит признаком того, что все версии актуальны
+    for variant, build in reversed(list(variants.items())):
+        write_bytes_atomic(variant, build())
+        written.append(variant)
+
+    return written
+
+
+def publish_json(path, data):
+    """Запись JSON-файла сайта вместе с минифицированной и сжатыми версиями"""
+    write_json_atomic(path, data)
+    written = write_variants(path, data)
+
+    if written:
+        sizes = ', '.join(f"{variant.name} {variant.stat().st_size / 1024:.1f} KB" for variant in written)
+        print(f"🗜️  Сжатые версии: {sizes}")
+        if brotli is None:
+            print("   (для .br версии установите пакет: pip install brotli)")
+
+    return written
+
+
+def republish(path):
+    """
+    Обновляет версии файла, записанного в обход publish_json
+    (восстановление из бэкапа, ручная правка)
+
+    Пересоздается только то, что у файла уже есть: .min/.gz/.br и части
+    по категориям. Возвращает список записанных файлов.
+    """
+    path = Path(path)
+    has_variants = min_path_for(path).exists()
+    has_shards = manifest_path_for(path).exists()
+    if not (has_variants or has_shards):
+        return []
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    written = []
+    if has_variants:
+        written += write_variants(path, data)
+    if has_shards:
+        written += publish_shards(path, data)
+    return written
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Обновление сжатых версий и частей JSON-файла сайта')
+    parser.add_argument('file', nargs='?', default='form.json', help='JSON-файл (по умолчанию form.json)')
+    args = parser.parse_args()
+
+    written = republish(args.file)
+    if written:
+        print(f"✓ Обновлено файлов: {len(written)}")
+    else:
+        print(f"✓ Версии {args.file} актуальны")
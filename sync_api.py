@@ -5,8 +5,9 @@ API сервер для автоматического обновления да
 Запуск: python sync_api.py
 """
 
-from flask import Flask, jsonify, send_file
+from flask import Flask, Response, jsonify, request, send_file, stream_with_context
 from flask_cors import CORS
+import json
 import sys
 import os
 
@@ -15,6 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Импортируем функцию синхронизации
 from sync_from_google_sheets import sync_data
+from sync_jobs import SyncJobManager
 
 app = Flask(__name__)
 CORS(app)  # Разрешаем CORS для локальной разработки
@@ -26,46 +28,106 @@ def index():
     return send_file('admin-update.html')
 
 
+def count_items(items):
+    """Подсчет всех элементов дерева"""
+    count = len(items)
+    for item in items:
+        if 'children' in item:
+            count += count_items(item['children'])
+    return count
+
+
+def run_sync(progress):
+    """Синхронизация в фоновом потоке, возвращает статистику для панели управления"""
+    success = sync_data(progress=progress)
+
+    if not success:
+        raise RuntimeError('Ошибка синхронизации данных')
+
+    # Читаем обновленный form.json для получения статистики
+    with open('form.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    return {
+        'message': 'Данные успешно обновлены',
+        'count': count_items(data.get('main', [])),
+        'categories': len(data.get('main', []))
+    }
+
+
+# Одна синхронизация за раз, повторные запросы присоединяются к текущей
+sync_jobs = SyncJobManager(run_sync)
+
+
 @app.route('/api/sync-data', methods=['POST'])
 def api_sync_data():
-    """API endpoint для синхронизации данных"""
-    try:
-        # Запускаем синхронизацию
-        success = sync_data()
-
-        if success:
-            # Читаем обновленный form.json для получения статистики
-            import json
-            with open('form.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            # Подсчитываем количество элементов
-            def count_items(items):
-                count = len(items)
-                for item in items:
-                    if 'children' in item:
-                        count += count_items(item['children'])
-                return count
-
-            total_items = count_items(data.get('main', []))
-
-            return jsonify({
-                'success': True,
-                'message': 'Данные успешно обновлены',
-                'count': total_items,
-                'categories': len(data.get('main', []))
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Ошибка синхронизации данных'
-            }), 500
-
-    except Exception as e:
+    """API endpoint для запуска синхронизации в фоне"""
+    job = sync_jobs.submit()
+
+    return jsonify({
+        'success': True,
+        'job_id': job['id'],
+        'status': job['status'],
+        'merged': job['merged'],
+        'status_url': f"/api/sync-jobs/{job['id']}",
+        'events_url': f"/api/sync-jobs/{job['id']}/events"
+    }), 202
+
+
+@app.route('/api/sync-jobs/<job_id>', methods=['GET'])
+def api_sync_job(job_id):
+    """Состояние задачи синхронизации"""
+    job = sync_jobs.get(job_id)
+
+    if job is None:
         return jsonify({
             'success': False,
-            'error': str(e)
-        }), 500
+            'error': 'Задача не найдена'
+        }), 404
+
+    return jsonify(dict(job, success=job['status'] != 'failed'))
+
+
+@app.route('/api/sync-jobs/<job_id>/events', methods=['GET'])
+def api_sync_job_events(job_id):
+    """Прогресс задачи синхронизации (Server-Sent Events)"""
+    if sync_jobs.get(job_id) is None:
+        return jsonify({
+            'success': False,
+            'error': 'Задача не найдена'
+        }), 404
+
+    # При переподключении браузер присылает номер последнего полученного события
+    try:
+        start = int(request.headers.get('Last-Event-ID', -1)) + 1
+    except ValueError:
+        start = 0
+
+    def stream():
+        since = start
+
+        while True:
+            waited = sync_jobs.wait_events(job_id, since)
+            if waited is None:
+                break
+
+            events, finished = waited
+
+            if not events and not finished:
+                # Комментарий, чтобы прокси не закрывали соединение
+                yield ': keepalive\n\n'
+
+            for event in events:
+                yield f"id: {event['seq']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+                since = event['seq'] + 1
+
+            if finished:
+                break
+
+    return Response(stream_with_context(stream()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
 
 
 @app.route('/api/status', methods=['GET'])
@@ -73,7 +135,7 @@ def api_status():
     """Проверка статуса API"""
     return jsonify({
         'status': 'online',
-        'version': '1.0'
+        'version': '1.1'
     })
 
 
@@ -88,9 +150,10 @@ if __name__ == '__main__':
     print()
     print("📍 Панель управления: http://localhost:5000")
     print("📍 API endpoint: http://localhost:5000/api/sync-data")
+    print("📍 Прогресс: http://localhost:5000/api/sync-jobs/<id>/events")
     print()
     print("Нажмите Ctrl+C для остановки сервера")
     print("="*60)
     print()
 
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=True, host='0.0.0.0', port=5000, threaded=True)
@@ -5,17 +5,20 @@
 Используется для обновления контента сайта через Google Sheets
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
+import argparse
 import json
 import sys
 from datetime import datetime
-from pathlib import Path
+
+from backup_store import backup_file
+from form_shards import publish_shards, validate_shards
+from sheet_cache import build_category_tree, same_as_file
+from sheet_fetch import fetch_sheets
+from sheet_source import add_source_arguments, open_sheet_source
+from static_variants import publish_json, write_variants
 
 
 # Конфигурация
-SPREADSHEET_ID = '1a4ZhAM2GNCxZzKbVgIMkTV4BT2mpmcheA9ejB8t5Sgk'
-CREDENTIALS_FILE = 'pride34-d166327454d1.json'
 OUTPUT_FILE = 'form.json'
 
 # Настройка кодировки для консоли Windows
@@ -23,189 +26,99 @@ if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8')
 
 
-def connect_to_sheets():
-    """Подключение к Google Sheets API"""
-    print("🔌 Подключение к Google Sheets...")
-
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets.readonly',
-        'https://www.googleapis.com/auth/drive.readonly'
-    ]
-
-    credentials = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=scopes)
-    client = gspread.authorize(credentials)
-    spreadsheet = client.open_by_key(SPREADSHEET_ID)
-
-    print("✓ Подключение установлено")
-    return spreadsheet
-
-
-def build_tree(rows):
+def sync_data(transport=None, progress=None):
     """
-    Построение древовидной структуры из плоских данных
+    Основная функция синхронизации
 
-    rows: список списков с данными из Google Sheets
-    возвращает: список элементов верхнего уровня
+    transport: источник данных таблицы (см. sheet_fetch), по умолчанию - open_sheet_source()
+               в режиме из SHEET_SOURCE (live, cached или offline, см. sheet_source)
+    progress: необязательный обратный вызов progress(event) для событий прогресса
+              (используется фоновыми задачами sync_api.py)
     """
-    if not rows or len(rows) < 2:
-        return []
-
-    # Первая строка - заголовки
-    headers = rows[0]
-
-    # Индекс всех элементов по ID
-    items_by_id = {}
-
-    # Обрабатываем все строки (пропускаем заголовок)
-    for row_data in rows[1:]:
-        # Создаем словарь из строки
-        row = {}
-        for i, header in enumerate(headers):
-            row[header] = row_data[i] if i < len(row_data) else ""
+    def report(stage, **details):
+        if progress:
+            progress(dict(details, stage=stage))
 
-        if not row.get('ID'):
-            continue
-
-        item_id = row['ID']
-        parent_path = row.get('Родитель', '')
-        level = int(row.get('Уровень', 0))
-
-        # Создаем элемент
-        item = {
-            'label': row.get('Название', ''),
-            'value': row.get('Значение', ''),
-        }
-
-        # Добавляем опциональные поля только если они не пустые
-        if row.get('Подпись'):
-            item['sub'] = row['Подпись']
-        if row.get('Иконка'):
-            item['image'] = row['Иконка']
-        if row.get('Обложка'):
-            item['fimage'] = row['Обложка']
-        if row.get('Краткое описание'):
-            item['desc'] = row['Краткое описание']
-        if row.get('Полное описание'):
-            item['fulldesc'] = row['Полное описание']
-        if row.get('Расписание'):
-            item['timetable'] = row['Расписание']
-        if row.get('Цена'):
-            item['price'] = row['Цена']
-
-        # Сохраняем в индекс
-        items_by_id[item_id] = {
-            'item': item,
-            'parent': parent_path,
-            'level': level,
-            'children': []
-        }
-
-    # Теперь строим дерево
-    root_items = []
-
-    for item_id, data in items_by_id.items():
-        parent_path = data['parent']
-
-        if not parent_path:
-            # Это элемент верхнего уровня
-            root_items.append(data)
-        else:
-            # Ищем родителя
-            parent_found = False
-            for pid, pdata in items_by_id.items():
-                # Проверяем, является ли этот элемент родителем
-                parent_value = pdata['item']['value']
-                if parent_path == parent_value or parent_path.endswith(f"/{parent_value}"):
-                    pdata['children'].append(data)
-                    parent_found = True
-                    break
-
-            if not parent_found:
-                print(f"⚠️  Предупреждение: не найден родитель '{parent_path}' для элемента '{item_id}'")
-
-    # Рекурсивно добавляем children к элементам
-    def finalize_item(data):
-        item = data['item']
-        if data['children']:
-            item['children'] = [finalize_item(child) for child in data['children']]
-        return item
-
-    return [finalize_item(root) for root in root_items]
-
-
-def sync_data():
-    """Основная функция синхронизации"""
     try:
-        # Подключаемся к Google Sheets
-        spreadsheet = connect_to_sheets()
+        # Подключаемся к Google Sheets (или к локальному снимку таблицы)
+        if transport is None:
+            transport = open_sheet_source()
 
         # Получаем все листы
-        worksheets = spreadsheet.worksheets()
-        print(f"\n📊 Найдено листов: {len(worksheets)}")
+        sheet_titles = transport.sheet_titles()
+        print(f"\n📊 Найдено листов: {len(sheet_titles)}")
+        report('connected', sheets=len(sheet_titles))
 
-        # Создаем бэкап существующего файла
-        if Path(OUTPUT_FILE).exists():
-            backup_file = f"{OUTPUT_FILE}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            Path(OUTPUT_FILE).rename(backup_file)
-            print(f"💾 Создан бэкап: {backup_file}")
+        # Пропускаем слайды, события, акции и новости
+        category_titles = [
+            title for title in sheet_titles
+            if not any(skip in title for skip in ['СЛАЙДЫ', 'СОБЫТИЯ', 'АКЦИИ', 'НОВОСТИ'])
+        ]
 
-        # Собираем данные из листов с категориями (02-13)
-        all_rows = []
-        category_sheets = []
+        # Загружаем все листы с категориями (02-13) одним запросом
+        fetched = fetch_sheets(transport, category_titles)
 
-        for worksheet in worksheets:
-            sheet_name = worksheet.title
-
-            # Пропускаем слайды, события, акции и новости
-            if any(skip in sheet_name for skip in ['СЛАЙДЫ', 'СОБЫТИЯ', 'АКЦИИ', 'НОВОСТИ']):
-                continue
+        sheets = []
 
+        for sheet_name in category_titles:
             print(f"📄 Обработка листа: {sheet_name}")
 
-            try:
-                data = worksheet.get_all_values()
-
-                if data and len(data) > 1:
-                    # Добавляем строки (пропуская заголовок у всех кроме первого)
-                    if not all_rows:
-                        all_rows.extend(data)  # Первый лист - с заголовком
-                    else:
-                        all_rows.extend(data[1:])  # Остальные - без заголовка
+            if sheet_name in fetched['errors']:
+                print(f"  ✗ Ошибка чтения листа: {fetched['errors'][sheet_name]}")
+                report('sheet', sheet=sheet_name, error=fetched['errors'][sheet_name])
+                continue
 
-                    category_sheets.append(sheet_name)
-                    print(f"  ✓ Добавлено строк: {len(data) - 1}")
-                else:
-                    print(f"  ⊘ Лист пуст")
+            data = fetched['values'][sheet_name]
 
-            except Exception as e:
-                print(f"  ✗ Ошибка чтения листа: {e}")
-                continue
+            if data and len(data) > 1:
+                sheets.append((sheet_name, data))
+                print(f"  ✓ Добавлено строк: {len(data) - 1}")
+                report('sheet', sheet=sheet_name, rows=len(data) - 1)
+            else:
+                print(f"  ⊘ Лист пуст")
+                report('sheet', sheet=sheet_name, rows=0)
 
-        if not all_rows:
+        if not sheets:
             print("\n✗ Ошибка: нет данных для импорта")
             return False
 
-        print(f"\n🔨 Всего строк для обработки: {len(all_rows) - 1}")
-        print(f"📁 Обработано листов: {len(category_sheets)}")
-
-        # Строим дерево
+        # Строим дерево (неизмененные листы берутся из кеша)
         print("\n🌳 Построение древовидной структуры...")
-        tree = build_tree(all_rows)
+        report('build')
+        built = build_category_tree(sheets, OUTPUT_FILE)
+        tree = built['tree']
+
+        print(f"\n🔨 Всего строк для обработки: {built['rows']}")
+        print(f"📁 Обработано листов: {len(sheets)}")
+        if built['reused']:
+            print(f"♻️  Без изменений (из кеша): {len(built['reused'])}, разобрано заново: {len(built['changed'])}")
 
         # Создаем финальную структуру
         result = {
             'main': tree
         }
 
-        # Сохраняем в JSON
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        # Ничего не изменилось - не трогаем файл, чтобы не сбрасывать кеш браузеров
+        if same_as_file(OUTPUT_FILE, result):
+            print(f"\n✓ Данные не изменились, {OUTPUT_FILE} не перезаписан")
+            write_variants(OUTPUT_FILE, result)
+            publish_shards(OUTPUT_FILE, result)
+            report('unchanged')
+            return True
+
+        # Создаем бэкап существующего файла
+        backup_file(OUTPUT_FILE)
+
+        # Сохраняем в JSON (атомарно: сайт не увидит недописанный файл)
+        publish_json(OUTPUT_FILE, result)
+        publish_shards(OUTPUT_FILE, result)
 
         print(f"\n{'='*60}")
         print(f"✓ Синхронизация завершена успешно!")
         print(f"📁 Файл сохранен: {OUTPUT_FILE}")
+        report('saved', file=OUTPUT_FILE)
         print(f"📊 Элементов верхнего уровня: {len(tree)}")
-        print(f"📝 Всего элементов: {len(all_rows) - 1}")
+        print(f"📝 Всего элементов: {built['rows']}")
         print(f"⏰ Время: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*60}")
 
@@ -217,6 +130,13 @@ def sync_data():
             print("✓ JSON валиден")
             print(f"✓ Главных категорий: {len(check_data['main'])}")
 
+            shard_errors = validate_shards(OUTPUT_FILE, check_data)
+            if shard_errors:
+                for error in shard_errors:
+                    print(f"✗ {error}")
+                return False
+            print("✓ Части по категориям совпадают с form.json")
+
             # Выводим названия категорий
             print("\n📋 Главные категории:")
             for i, item in enumerate(check_data['main'], 1):
@@ -237,12 +157,22 @@ def sync_data():
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Синхронизация form.json из Google Таблицы')
+    add_source_arguments(parser)
+    args = parser.parse_args()
+
     print("="*60)
     print("🔄 СИНХРОНИЗАЦИЯ ДАННЫХ ИЗ GOOGLE SHEETS")
     print("="*60)
     print()
 
-    success = sync_data()
+    try:
+        transport = open_sheet_source(args.source, args.ttl)
+    except Exception as e:
+        print(f"✗ Не удалось получить данные таблицы: {e}")
+        sys.exit(1)
+
+    success = sync_data(transport)
 
     if success:
         print("\n✓ Данные успешно обновлены!")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Фоновые задачи синхронизации для sync_api.py
+
+Синхронизация выполняется в отдельном потоке, HTTP-запрос сразу получает ID задачи.
+Одновременно выполняется только одна задача: повторные нажатия "Обновить"
+присоединяются к уже идущей синхронизации, а не запускают параллельную запись form.json.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+
+class SyncJobManager:
+    """
+    Очередь из одной задачи с журналом событий прогресса
+
+    target: функция target(progress) -> dict со статистикой,
+            progress(event) - обратный вызов для событий прогресса (словарей),
+            при ошибке функция должна выбросить исключение
+    """
+
+    # Сколько завершенных задач хранить для запросов статуса
+    MAX_JOBS = 20
+
+    def __init__(self, target):
+        self.target = target
+        self._changed = threading.Condition()
+        self._jobs = OrderedDict()
+        self._active_id = None
+
+    def submit(self):
+        """Запуск синхронизации или присоединение к уже идущей"""
+        with self._changed:
+            if self._active_id is not None:
+                return dict(self._snapshot(self._jobs[self._active_id]), merged=True)
+
+            job = {
+                'id': uuid.uuid4().hex[:12],
+                'status': 'queued',
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'finished': None,
+                'result': None,
+                'error': None,
+                'events': []
+            }
+            self._jobs[job['id']] = job
+            self._active_id = job['id']
+
+            while len(self._jobs) > self.MAX_JOBS:
+                self._jobs.popitem(last=False)
+
+            threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+            return dict(self._snapshot(job), merged=False)
+
+    def get(self, job_id):
+        """Текущее состояние задачи или None"""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            return self._snapshot(job) if job else None
+
+    def wait_events(self, job_id, since=0, timeout=15):
+        """
+        Ожидание новых событий задачи (для Server-Sent Events)
+
+        Возвращает (события начиная с номера since, задача завершена) или None,
+        если задача не найдена.
+        """
+        with self._changed:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+
+            if len(job['events']) <= since and not self._is_finished(job):
+                self._changed.wait(timeout)
+
+            return job['events'][since:], self._is_finished(job)
+
+    def _run(self, job):
+        with self._changed:
+            job['status'] = 'running'
+        self._emit(job, {'stage': 'started'})
+
+        try:
+            result = self.target(lambda event: self._emit(job, event))
+            self._finish(job, 'done', result=result)
+        except Exception as e:
+            self._finish(job, 'failed', error=str(e))
+
+    def _finish(self, job, status, result=None, error=None):
+        # Статус и финальное событие меняются под одной блокировкой,
+        # чтобы поток событий не завершился раньше, чем получит итог
+        with self._changed:
+            job.update(status=status, result=result, error=error,
+                       finished=datetime.now().isoformat(timespec='seconds'))
+            self._active_id = None
+            self._append(job, {'stage': 'finished', 'status': status, 'result': result, 'error': error})
+            self._changed.notify_all()
+
+    def _emit(self, job, event):
+        with self._changed:
+            self._append(job, event)
+            self._changed.notify_all()
+
+    @staticmethod
+    def _append(job, event):
+        event = dict(event, seq=len(job['events']), time=datetime.now().isoformat(timespec='seconds'))
+        job['events'].append(event)
+
+    @staticmethod
+    def _is_finished(job):
+        return job['status'] in ('done', 'failed')
+
+    @staticmethod
+    def _snapshot(job):
+        snapshot = {key: value for key, value in job.items() if key != 'events'}
+        snapshot['progress'] = job['events'][-1] if job['events'] else None
+        return snapshot
@@ -5,17 +5,23 @@
 Позволяет обновлять отдельные вкладки
 """
 
-import gspread
-from google.oauth2.service_account import Credentials
+import argparse
 import json
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from backup_store import backup_file
+from form_shards import publish_shards, validate_shards
+from safe_output import write_json_atomic, write_text_atomic
+from sheet_cache import build_category_tree
+from sheet_fetch import fetch_sheets
+from sheet_source import add_source_arguments, open_sheet_source
+from sheet_tree import build_tree
+from static_variants import publish_json, write_variants
+
 
 # Конфигурация
-SPREADSHEET_ID = '1a4ZhAM2GNCxZzKbVgIMkTV4BT2mpmcheA9ejB8t5Sgk'
-CREDENTIALS_FILE = 'pride34-d166327454d1.json'
 OUTPUT_FILE = 'form.json'
 
 # Настройка кодировки для консоли Windows
@@ -47,23 +53,8 @@ SHEET_TYPES = {
 }
 
 
-def connect_to_sheets():
-    """Подключение к Google Sheets API"""
-    scopes = [
-        'https://www.googleapis.com/auth/spreadsheets.readonly',
-        'https://www.googleapis.com/auth/drive.readonly'
-    ]
-
-    credentials = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=scopes)
-    client = gspread.authorize(credentials)
-    spreadsheet = client.open_by_key(SPREADSHEET_ID)
-    return spreadsheet
-
-
-def list_sheets(spreadsheet):
+def list_sheets(worksheets):
     """Показать список всех вкладок"""
-    worksheets = spreadsheet.worksheets()
-
     print("\n" + "="*70)
     print("ДОСТУПНЫЕ ВКЛАДКИ ДЛЯ ОБНОВЛЕНИЯ")
     print("="*70)
@@ -93,81 +84,6 @@ def list_sheets(spreadsheet):
     return worksheets
 
 
-def build_tree(rows):
-    """Построение древовидной структуры из плоских данных"""
-    if not rows or len(rows) < 2:
-        return []
-
-    headers = rows[0]
-    items_by_id = {}
-
-    for row_data in rows[1:]:
-        row = {}
-        for i, header in enumerate(headers):
-            row[header] = row_data[i] if i < len(row_data) else ""
-
-        if not row.get('ID'):
-            continue
-
-        item_id = row['ID']
-        parent_path = row.get('Родитель', '')
-        level = int(row.get('Уровень', 0))
-
-        item = {
-            'label': row.get('Название', ''),
-            'value': row.get('Значение', ''),
-        }
-
-        if row.get('Подпись'):
-            item['sub'] = row['Подпись']
-        if row.get('Иконка'):
-            item['image'] = row['Иконка']
-        if row.get('Обложка'):
-            item['fimage'] = row['Обложка']
-        if row.get('Краткое описание'):
-            item['desc'] = row['Краткое описание']
-        if row.get('Полное описание'):
-            item['fulldesc'] = row['Полное описание']
-        if row.get('Расписание'):
-            item['timetable'] = row['Расписание']
-        if row.get('Цена'):
-            item['price'] = row['Цена']
-
-        items_by_id[item_id] = {
-            'item': item,
-            'parent': parent_path,
-            'level': level,
-            'children': []
-        }
-
-    root_items = []
-
-    for item_id, data in items_by_id.items():
-        parent_path = data['parent']
-
-        if not parent_path:
-            root_items.append(data)
-        else:
-            parent_found = False
-            for pid, pdata in items_by_id.items():
-                parent_value = pdata['item']['value']
-                if parent_path == parent_value or parent_path.endswith(f"/{parent_value}"):
-                    pdata['children'].append(data)
-                    parent_found = True
-                    break
-
-            if not parent_found:
-                print(f"⚠️  Предупреждение: не найден родитель '{parent_path}' для '{item_id}'")
-
-    def finalize_item(data):
-        item = data['item']
-        if data['children']:
-            item['children'] = [finalize_item(child) for child in data['children']]
-        return item
-
-    return [finalize_item(root) for root in root_items]
-
-
 def update_slides(worksheet):
     """Обновление слайдов (01_СЛАЙДЫ.csv)"""
     print("\n🎬 Обновление слайдов...")
@@ -197,8 +113,7 @@ def update_slides(worksheet):
 
     # Сохраняем исходные данные
     slides_file = 'slides.json'
-    with open(slides_file, 'w', encoding='utf-8') as f:
-        json.dump(slides_data, f, ensure_ascii=False, indent=2)
+    write_json_atomic(slides_file, slides_data)
 
     print(f"✓ Слайдов обновлено: {len(slides_data)}")
     print(f"✓ Исходные данные сохранены в: {slides_file}")
@@ -234,9 +149,16 @@ def update_slides(worksheet):
         # Генерируем HTML через slides_generator
         print("\n🔨 Генерация HTML кода...")
         try:
-            from slides_generator import generate_slides_from_data
-            html_slides = generate_slides_from_data(slides_data)
-            print(f"✓ HTML сгенерирован для {len(html_slides)} слайдов")
+            from slides_generator import cache_path_for, print_markup_errors, render_slides
+            print_markup_errors(slides_data)
+            # Перерисовываются только слайды, строки которых изменились
+            from responsive_images import load_manifest
+            rendered = render_slides(
+                slides_data, cache_file=cache_path_for('slides_html.json'), images=load_manifest()
+            )
+            html_slides = rendered['variants']['desktop']
+            print(f"✓ HTML сгенерирован для {len(html_slides)} слайдов "
+                  f"(заново: {rendered['rendered']}, из кеша: {rendered['reused']})")
         except Exception as e:
             print(f"⚠️  Ошибка генерации HTML: {e}")
             print("   Исходные данные сохранены в slides.json")
@@ -259,14 +181,12 @@ def update_slides(worksheet):
 
     # Сохраняем JSON с HTML
     html_json_file = 'slides_html.json'
-    with open(html_json_file, 'w', encoding='utf-8') as f:
-        json.dump(html_output, f, ensure_ascii=False, indent=2)
+    write_json_atomic(html_json_file, html_output)
 
     # Сохраняем чистый HTML для вставки
     html_text = '\n\n'.join(html_slides)
     html_file = 'slides_output.html'
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write(html_text)
+    write_text_atomic(html_file, html_text)
 
     print(f"✓ HTML+JSON сохранен в: {html_json_file}")
     print(f"✓ Чистый HTML сохранен в: {html_file}")
@@ -300,8 +220,7 @@ def update_settings(worksheet):
 
     # Сохраняем настройки
     settings_file = 'settings.json'
-    with open(settings_file, 'w', encoding='utf-8') as f:
-        json.dump(settings, f, ensure_ascii=False, indent=2)
+    write_json_atomic(settings_file, settings)
 
     print(f"✓ Настроек сохранено: {len(settings)}")
     print(f"✓ Файл: {settings_file}")
@@ -451,64 +370,105 @@ def update_single_category(worksheet, current_data):
     return {'main': new_main}
 
 
-def update_all_categories(spreadsheet, current_data):
-    """Обновление всех категорий (02-13)"""
+def update_all_categories(transport, current_data):
+    """
+    Обновление всех категорий (02-13)
+
+    transport: источник данных таблицы (см. sheet_fetch)
+    """
     print("\n🔄 Обновление ВСЕХ категорий...")
 
-    worksheets = spreadsheet.worksheets()
-    all_rows = []
-    updated_count = 0
+    category_titles = [
+        title for title in transport.sheet_titles()
+        if SHEET_TYPES.get(title, 'unknown') == 'category'
+    ]
 
-    for worksheet in worksheets:
-        sheet_type = SHEET_TYPES.get(worksheet.title, 'unknown')
+    # Все вкладки категорий одним запросом
+    fetched = fetch_sheets(transport, category_titles)
 
-        if sheet_type != 'category':
-            continue
+    sheets = []
 
-        print(f"📄 Обработка: {worksheet.title}")
+    for title in category_titles:
+        print(f"📄 Обработка: {title}")
 
-        try:
-            data = worksheet.get_all_values()
+        if title in fetched['errors']:
+            print(f"  ❌ Ошибка: {fetched['errors'][title]}")
+            continue
 
-            if data and len(data) > 1:
-                if not all_rows:
-                    all_rows.extend(data)
-                else:
-                    all_rows.extend(data[1:])
+        data = fetched['values'][title]
 
-                updated_count += 1
-                print(f"  ✓ Добавлено строк: {len(data) - 1}")
-        except Exception as e:
-            print(f"  ❌ Ошибка: {e}")
-            continue
+        if data and len(data) > 1:
+            sheets.append((title, data))
+            print(f"  ✓ Добавлено строк: {len(data) - 1}")
 
-    if not all_rows:
+    if not sheets:
         print("❌ Нет данных для обновления")
         return current_data
 
-    # Строим дерево
-    tree = build_tree(all_rows)
+    # Строим дерево (неизмененные вкладки берутся из кеша)
+    built = build_category_tree(sheets, OUTPUT_FILE)
+
+    print(f"\n✓ Обновлено категорий: {len(sheets)}")
+    if built['reused']:
+        print(f"♻️  Без изменений (из кеша): {len(built['reused'])}")
+    print(f"✓ Всего элементов: {built['rows']}")
+
+    return {'main': built['tree']}
+
+
+def load_form_data():
+    """Текущий form.json или пустые данные"""
+    if Path(OUTPUT_FILE).exists():
+        with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return {}
 
-    print(f"\n✓ Обновлено категорий: {updated_count}")
-    print(f"✓ Всего элементов: {len(all_rows) - 1}")
 
-    return {'main': tree}
+def save_form_data(result, current_data):
+    """
+    Публикация обновленного form.json вместе с вариантами и частями
 
+    Возвращает False, если части по категориям не совпали с form.json
+    """
+    # Ничего не изменилось - не трогаем файл, чтобы не сбрасывать кеш браузеров
+    if result == current_data:
+        print(f"\n✓ Данные не изменились, {OUTPUT_FILE} не перезаписан")
+        write_variants(OUTPUT_FILE, result)
+        publish_shards(OUTPUT_FILE, result)
+        return True
+
+    # Создаем бэкап
+    backup_file(OUTPUT_FILE)
+
+    # Сохраняем результат
+    publish_json(OUTPUT_FILE, result)
+    publish_shards(OUTPUT_FILE, result)
+
+    shard_errors = validate_shards(OUTPUT_FILE, result)
+    if shard_errors:
+        for error in shard_errors:
+            print(f"❌ {error}")
+        return False
+
+    return True
 
-def sync_selective(choice=None):
-    """Выборочная синхронизация"""
+
+def sync_selective(choice=None, source=None, ttl=None):
+    """
+    Выборочная синхронизация
+
+    source, ttl: режим источника таблицы (live, cached, offline, см. sheet_source)
+    """
     try:
-        # Подключаемся к Google Sheets
-        print("🔌 Подключение к Google Sheets...")
-        spreadsheet = connect_to_sheets()
-        print("✓ Подключение установлено")
+        # Все вкладки таблицы одним запросом (или из локального снимка)
+        transport = open_sheet_source(source, ttl)
 
         # Получаем список вкладок
-        worksheets = spreadsheet.worksheets()
+        worksheets = transport.worksheets()
 
         # Если выбор не указан, показываем меню
         if choice is None:
-            list_sheets(spreadsheet)
+            list_sheets(worksheets)
             choice = input("\nВведите номер вкладки для обновления: ").strip()
 
         # Обработка выбора
@@ -516,24 +476,15 @@ def sync_selective(choice=None):
             print("\n❌ Отменено")
             return False
 
-        # Загружаем текущие данные ПЕРЕД созданием бэкапа
-        current_data = {}
-        if Path(OUTPUT_FILE).exists():
-            with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
-                current_data = json.load(f)
+        # Загружаем текущие данные
+        current_data = load_form_data()
+        if current_data:
             print(f"📄 Загружены текущие данные: {len(current_data.get('main', []))} категорий")
 
-        # Создаем бэкап
-        if Path(OUTPUT_FILE).exists():
-            backup_file = f"{OUTPUT_FILE}.backup.{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            import shutil
-            shutil.copy2(OUTPUT_FILE, backup_file)
-            print(f"💾 Создан бэкап: {backup_file}")
-
         # Выполняем обновление
         if choice == '0':
             # Обновить все категории
-            result = update_all_categories(spreadsheet, current_data)
+            result = update_all_categories(transport, current_data)
         else:
             # Обновить конкретную вкладку
             try:
@@ -566,9 +517,8 @@ def sync_selective(choice=None):
                 print("\n❌ Введите число")
                 return False
 
-        # Сохраняем результат
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        if not save_form_data(result, current_data):
+            return False
 
         print("\n" + "="*70)
         print("✓ ОБНОВЛЕНИЕ ЗАВЕРШЕНО УСПЕШНО!")
@@ -586,14 +536,16 @@ def sync_selective(choice=None):
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Выборочное обновление form.json из Google Таблицы')
+    parser.add_argument('choice', nargs='?', help='номер вкладки (0 - все категории); без него - меню')
+    add_source_arguments(parser)
+    args = parser.parse_args()
+
     print("="*70)
     print("🎯 ВЫБОРОЧНОЕ ОБНОВЛЕНИЕ ДАННЫХ ИЗ GOOGLE SHEETS")
     print("="*70)
 
-    # Проверяем аргументы командной строки
-    choice = sys.argv[1] if len(sys.argv) > 1 else None
-
-    success = sync_selective(choice)
+    success = sync_selective(args.choice, args.source, args.ttl)
 
     if success:
         print("\n✓ Готово!")
@@ -0,0 +1,601 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Фоновое наблюдение за Google Таблицей и расписанием pride34.ru
+
+Вместо ручного запуска (admin-update.html, ОБНОВИТЬ_ДАННЫЕ.bat,
+update-schedule.py) процесс сам опрашивает источники и запускает только
+нужные этапы обновления:
+
+- таблица: раз в POLL_SHEETS секунд запрашивается только время изменения
+  файла (Drive modifiedTime, один легкий запрос). Когда оно меняется,
+  наблюдатель ждет, пока правки утихнут (DEBOUNCE секунд без новых изменений,
+  но не дольше MAX_DELAY), затем одним пакетным запросом читает вкладки
+  и по хешам определяет, какие из них изменились:
+  категории -> дерево form.json (неизмененные вкладки берутся из form.cache.json),
+  01_СЛАЙДЫ -> слайды, 00_НАСТРОЙКИ -> settings.json, 14_СОБЫТИЯ -> события
+- расписание: раз в POLL_SCHEDULE секунд условный HEAD-запрос (ETag /
+  Last-Modified), при изменении - update-schedule.py
+
+Состояние (последние ETag/время изменения и хеши вкладок) хранится
+в sync_watcher.state.json, поэтому после перезапуска лишней пересборки нет.
+Стоимость опросов и задержка от обнаружения изменения до готовых файлов
+пишутся в sync_watcher.metrics.json.
+
+Для проверок без сети есть FakeSheetSource и FakeTimetableSource, а режим
+--demo прогоняет сценарий с правками на подставных источниках и часах.
+
+Запуск:
+    python sync_watcher.py          (наблюдение, Ctrl+C - остановка)
+    python sync_watcher.py --once   (один опрос и выход)
+    python sync_watcher.py --demo
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from safe_output import write_json_atomic
+from sheet_cache import fingerprint
+from sheet_fetch import FakeTransport, fetch_sheets
+from sheet_source import SnapshotWorksheet
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+STATE_FILE = 'sync_watcher.state.json'
+METRICS_FILE = 'sync_watcher.metrics.json'
+
+# Интервалы в секундах
+POLL_SHEETS = 30
+POLL_SCHEDULE = 15 * 60
+DEBOUNCE = 45
+MAX_DELAY = 5 * 60
+# После ошибки этапа - повтор не раньше, чем через
+RETRY_DELAY = 5 * 60
+
+
+def stage_for_title(title):
+    """Этап обновления для вкладки таблицы (None - вкладка не публикуется)"""
+    if 'НАСТРОЙКИ' in title:
+        return 'settings'
+    if 'СЛАЙДЫ' in title:
+        return 'slides'
+    if 'СОБЫТИЯ' in title:
+        return 'events'
+    if 'АКЦИИ' in title or 'НОВОСТИ' in title:
+        return None
+    return 'categories'
+
+
+# ---------------------------------------------------------------------------
+# Источники изменений
+# ---------------------------------------------------------------------------
+
+class SheetSource:
+    """
+    Google Таблица
+
+    transport: источник данных вкладок (см. sheet_fetch)
+    modified_time: функция без аргументов, возвращающая метку изменения файла
+    """
+
+    name = 'sheets'
+    interval = POLL_SHEETS
+
+    def __init__(self, transport, modified_time):
+        self.transport = transport
+        self.modified_time = modified_time
+        self.hashes = {}
+
+    def poll(self):
+        return self.modified_time()
+
+    def changes(self):
+        """
+        Читает все вкладки и сравнивает их с прошлым запуском
+
+        Возвращает ({этап: {'titles': вкладки для обработки, 'values': все вкладки}},
+        commit(done) - запоминает новые хеши вкладок успешно выполненных этапов)
+        """
+        # Список вкладок перечитывается при каждом опросе, иначе добавленные,
+        # переименованные и удаленные вкладки не попадут в сравнение
+        refresh = getattr(self.transport, 'refresh', None)
+        if refresh:
+            refresh()
+
+        titles = self.transport.sheet_titles()
+        fetched = fetch_sheets(self.transport, titles)
+        if fetched['errors']:
+            raise RuntimeError(f"Не прочитаны вкладки: {', '.join(fetched['errors'])}")
+
+        values = fetched['values']
+        hashes = {title: fingerprint(rows) for title, rows in values.items()}
+
+        stages = {}
+        for title in titles:
+            stage = stage_for_title(title)
+            if stage and hashes[title] != self.hashes.get(title):
+                stages.setdefault(stage, {'titles': [], 'values': values})['titles'].append(title)
+
+        # Удаленная вкладка категории тоже меняет дерево
+        removed = [title for title in self.hashes if title not in hashes]
+        if any(stage_for_title(title) == 'categories' for title in removed):
+            stages.setdefault('categories', {'titles': [], 'values': values})
+
+        # Пересборка категорий записывает form.json без событий,
+        # поэтому события дописываются заново, даже если их вкладка не менялась
+        forced = []
+        if 'categories' in stages:
+            events = stages.setdefault('events', {'titles': [], 'values': values})
+            forced = [title for title in titles
+                      if stage_for_title(title) == 'events' and title not in events['titles']]
+            events['titles'].extend(forced)
+
+        def commit(done):
+            # Вкладки упавшего этапа сохраняют старый хеш и попадут в повтор
+            for title in set(hashes) | set(self.hashes):
+                if stage_for_title(title) in stages and stage_for_title(title) not in done:
+                    # У неизмененной вкладки старый хеш совпал бы с новым - сбрасываем его
+                    if title in forced:
+                        self.hashes.pop(title, None)
+                    continue
+                if title in hashes:
+                    self.hashes[title] = hashes[title]
+                else:
+                    self.hashes.pop(title, None)
+
+        return stages, commit
+
+    def state(self):
+        return {'hashes': self.hashes}
+
+    def restore(self, state):
+        self.hashes = state.get('hashes', {})
+
+
+class TimetableSource:
+    """Страница расписания: метка изменения - ETag или Last-Modified из HEAD-запроса"""
+
+    name = 'schedule'
+    interval = POLL_SCHEDULE
+
+    def __init__(self, url=None, session=None):
+        self.schedule = load_schedule_module()
+        self.url = url or self.schedule.URL
+        self.session = session
+
+    def poll(self):
+        session = self.session or self.schedule.get_session()
+        response = session.head(self.url, timeout=self.schedule.TIMEOUT, allow_redirects=True)
+        response.raise_for_status()
+        # Без валидаторов сравнивать нечего - каждый опрос считается изменением,
+        # а update-schedule.py сам не перезапишет файлы без изменений
+        return response.headers.get('ETag') or response.headers.get('Last-Modified') or time.time()
+
+    def changes(self):
+        return {'schedule': {'url': self.url}}, lambda done: None
+
+    def state(self):
+        return {}
+
+    def restore(self, state):
+        pass
+
+
+class FakeSheetSource(SheetSource):
+    """
+    Подставная таблица для проверок без сети
+
+    data: {вкладка: строки}, как в sheet_data.json; edit() имитирует правку
+    """
+
+    def __init__(self, data):
+        self.data = {title: [list(row) for row in rows] for title, rows in data.items()}
+        self.version = 1
+        super().__init__(FakeTransport(self.data), lambda: f"v{self.version}")
+
+    def edit(self, title, row_index, column, value):
+        self.data[title][row_index][column] = value
+        self.version += 1
+
+
+class FakeTimetableSource:
+    """Подставная страница расписания: publish() меняет ETag"""
+
+    name = 'schedule'
+    interval = POLL_SCHEDULE
+
+    def __init__(self):
+        self.version = 1
+
+    def poll(self):
+        return f'"{self.version}"'
+
+    def publish(self):
+        self.version += 1
+
+    def changes(self):
+        return {'schedule': {'url': 'fake://timetable'}}, lambda done: None
+
+    def state(self):
+        return {}
+
+    def restore(self, state):
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Этапы обновления
+# ---------------------------------------------------------------------------
+
+def load_schedule_module():
+    """update-schedule.py (в имени дефис, обычный import не подходит)"""
+    path = Path(__file__).parent / 'update-schedule.py'
+    spec = importlib.util.spec_from_file_location('update_schedule', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_categories(payload):
+    from sync_from_google_sheets import sync_data
+
+    if not sync_data(transport=FakeTransport(payload['values'])):
+        raise RuntimeError('Ошибка сборки form.json')
+
+
+def run_events(payload):
+    from sync_selective import load_form_data, save_form_data, update_events
+
+    current_data = load_form_data()
+    for title in payload['titles']:
+        result = update_events(SnapshotWorksheet(title, payload['values'][title]), current_data)
+        if not save_form_data(result, current_data):
+            raise RuntimeError('Части form.json не совпали с основным файлом')
+        current_data = result
+
+
+def run_slides(payload):
+    from sync_selective import update_slides
+
+    for title in payload['titles']:
+        if not update_slides(SnapshotWorksheet(title, payload['values'][title])):
+            raise RuntimeError(f'Ошибка обновления слайдов: {title}')
+
+
+def run_settings(payload):
+    from sync_selective import update_settings
+
+    for title in payload['titles']:
+        if not update_settings(SnapshotWorksheet(title, payload['values'][title])):
+            raise RuntimeError(f'Ошибка обновления настроек: {title}')
+
+
+def run_schedule(payload):
+    load_schedule_module().update_schedule(payload['url'])
+
+
+# Порядок важен: события дописываются в form.json после пересборки категорий
+STAGES = {
+    'categories': run_categories,
+    'events': run_events,
+    'slides': run_slides,
+    'settings': run_settings,
+    'schedule': run_schedule,
+}
+
+
+# ---------------------------------------------------------------------------
+# Наблюдатель
+# ---------------------------------------------------------------------------
+
+def _new_source_metrics():
+    return {'polls': 0, 'poll_seconds': 0.0, 'poll_errors': 0, 'changes': 0,
+            'fetches': 0, 'fetch_seconds': 0.0, 'last_poll': None}
+
+
+def _new_stage_metrics():
+    return {'runs': 0, 'failures': 0, 'seconds': 0.0,
+            'last_latency': None, 'max_latency': 0.0, 'total_latency': 0.0}
+
+
+class Watcher:
+    """
+    Опрос источников, сглаживание серий правок и запуск этапов
+
+    sources: список источников (poll/changes/state/restore, name, interval)
+    stages: {этап: функция(payload)}, по умолчанию STAGES
+    clock: функция текущего времени в секундах (для проверок - подставные часы)
+    """
+
+    def __init__(self, sources, stages=None, state_file=STATE_FILE, metrics_file=METRICS_FILE,
+                 debounce=DEBOUNCE, max_delay=MAX_DELAY, clock=time.monotonic):
+        self.sources = sources
+        self.stages = STAGES if stages is None else stages
+        self.state_file = state_file
+        self.metrics_file = metrics_file
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.clock = clock
+
+        self.tokens = {}
+        self.next_poll = {source.name: 0.0 for source in sources}
+        self.pending = {}  # {источник: {'first', 'last', 'not_before'}}
+        self.metrics = {
+            'started': datetime.now().isoformat(timespec='seconds'),
+            'sources': {source.name: _new_source_metrics() for source in sources},
+            'stages': {}
+        }
+        self._load_state()
+
+    def _load_state(self):
+        if not self.state_file:
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        for source in self.sources:
+            saved = state.get(source.name, {})
+            if 'token' in saved:
+                self.tokens[source.name] = saved['token']
+            source.restore(saved)
+
+    def _save_state(self):
+        if not self.state_file:
+            return
+        state = {}
+        for source in self.sources:
+            state[source.name] = dict(source.state())
+            # Пока пересборка не завершена, метка не сохраняется: после перезапуска
+            # источник будет перечитан
+            if source.name in self.tokens and source.name not in self.pending:
+                state[source.name]['token'] = self.tokens[source.name]
+        write_json_atomic(self.state_file, state)
+
+    def save_metrics(self):
+        if self.metrics_file:
+            write_json_atomic(self.metrics_file, self.metrics)
+
+    def poll(self, source, now):
+        """Легкий опрос источника; изменение метки откладывает пересборку на debounce"""
+        metrics = self.metrics['sources'][source.name]
+        started = time.perf_counter()
+        try:
+            token = source.poll()
+        except Exception as e:
+            metrics['poll_errors'] += 1
+            print(f"⚠️  {source.name}: ошибка опроса: {e}")
+            return
+        finally:
+            metrics['polls'] += 1
+            metrics['poll_seconds'] += time.perf_counter() - started
+            metrics['last_poll'] = datetime.now().isoformat(timespec='seconds')
+
+        # Без сохраненной метки (первый запуск) изменение считается произошедшим
+        if self.tokens.get(source.name) == token:
+            return
+
+        self.tokens[source.name] = token
+        metrics['changes'] += 1
+        pending = self.pending.setdefault(source.name, {'first': now, 'last': now, 'not_before': now})
+        pending['last'] = now
+
+    def due(self, name, now):
+        pending = self.pending[name]
+        if now < pending['not_before']:
+            return False
+        return now - pending['last'] >= self.debounce or now - pending['first'] >= self.max_delay
+
+    def rebuild(self, source, now):
+        """
+        Чтение изменений источника и запуск затронутых этапов
+
+        Возвращает список выполненных этапов
+        """
+        pending = self.pending[source.name]
+        source_metrics = self.metrics['sources'][source.name]
+
+        started = time.perf_counter()
+        try:
+            stages, commit = source.changes()
+        except Exception as e:
+            print(f"❌ {source.name}: не удалось прочитать изменения: {e}")
+            pending['not_before'] = now + RETRY_DELAY
+            return []
+        finally:
+            source_metrics['fetches'] += 1
+            source_metrics['fetch_seconds'] += time.perf_counter() - started
+
+        done = []
+        failed = False
+        for name, handler in self.stages.items():
+            if name not in stages:
+                continue
+            metrics = self.metrics['stages'].setdefault(name, _new_stage_metrics())
+            titles = stages[name].get('titles')
+            print(f"🔄 {name}" + (f": {', '.join(titles)}" if titles else ''))
+
+            stage_started = time.perf_counter()
+            try:
+                handler(stages[name])
+            except Exception as e:
+                failed = True
+                metrics['failures'] += 1
+                print(f"❌ {name}: {e}")
+                continue
+            finally:
+                metrics['runs'] += 1
+                metrics['seconds'] += time.perf_counter() - stage_started
+
+            # Задержка: от первого обнаруженного изменения до готовых файлов
+            latency = self.clock() - pending['first']
+            metrics['last_latency'] = round(latency, 3)
+            metrics['max_latency'] = round(max(metrics['max_latency'], latency), 3)
+            metrics['total_latency'] += latency
+            done.append(name)
+
+        commit(done)
+        if failed:
+            # Повторяются только упавшие этапы: их вкладки остались с прежними хешами
+            pending['not_before'] = now + RETRY_DELAY
+        else:
+            del self.pending[source.name]
+
+        self._save_state()
+        return done
+
+    def tick(self):
+        """
+        Один проход: опрос источников, у которых подошло время, и пересборка
+        тех, где правки утихли
+
+        Возвращает {источник: выполненные этапы}
+        """
+        now = self.clock()
+        for source in self.sources:
+            if now >= self.next_poll[source.name]:
+                self.poll(source, now)
+                self.next_poll[source.name] = now + source.interval
+
+        done = {}
+        for source in self.sources:
+            if source.name in self.pending and self.due(source.name, now):
+                done[source.name] = self.rebuild(source, now)
+
+        self._save_state()
+        self.save_metrics()
+        return done
+
+    def next_wakeup(self):
+        """Через сколько секунд следующий опрос или пересборка"""
+        now = self.clock()
+        moments = list(self.next_poll.values())
+        for pending in self.pending.values():
+            moments.append(max(pending['not_before'],
+                               min(pending['last'] + self.debounce, pending['first'] + self.max_delay)))
+        return max(0.0, min(moments) - now)
+
+    def run_forever(self, sleep=time.sleep):
+        print(f"👀 Наблюдение: {', '.join(source.name for source in self.sources)} (Ctrl+C - остановка)")
+        try:
+            while True:
+                self.tick()
+                sleep(max(1.0, self.next_wakeup()))
+        except KeyboardInterrupt:
+            print("\n⏹  Остановлено")
+        finally:
+            self.save_metrics()
+            print_metrics(self.metrics)
+
+
+def print_metrics(metrics):
+    print("\n📊 Опросы:")
+    for name, source in metrics['sources'].items():
+        average = source['poll_seconds'] / source['polls'] * 1000 if source['polls'] else 0
+        print(f"  {name}: {source['polls']} опросов, в среднем {average:.1f} мс, "
+              f"ошибок {source['poll_errors']}, изменений {source['changes']}, "
+              f"чтений данных {source['fetches']} ({source['fetch_seconds']:.2f} с)")
+
+    if metrics['stages']:
+        print("📊 Этапы:")
+    for name, stage in metrics['stages'].items():
+        successes = stage['runs'] - stage['failures']
+        average = stage['total_latency'] / successes if successes else 0
+        print(f"  {name}: {stage['runs']} запусков, ошибок {stage['failures']}, "
+              f"работа {stage['seconds']:.2f} с, задержка средняя {average:.0f} с / макс. {stage['max_latency']:.0f} с")
+
+
+# ---------------------------------------------------------------------------
+# Запуск
+# ---------------------------------------------------------------------------
+
+def live_sources():
+    """Настоящие источники: Google Таблица и страница расписания"""
+    from sheet_fetch import GspreadTransport
+    from sheet_source import connect_spreadsheet
+
+    spreadsheet = connect_spreadsheet()
+
+    def modified_time():
+        # gspread 6: get_lastUpdateTime(), gspread 5: свойство lastUpdateTime
+        getter = getattr(spreadsheet, 'get_lastUpdateTime', None)
+        return getter() if getter else spreadsheet.lastUpdateTime
+
+    # Список вкладок GspreadTransport сбрасывается в SheetSource.changes() перед каждым чтением
+    return [SheetSource(GspreadTransport(spreadsheet), modified_time), TimetableSource()]
+
+
+def run_demo():
+    """Сценарий на подставных источниках: серия правок, одна пересборка"""
+    with open('sheet_data.json', 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    sheets = FakeSheetSource(data)
+    timetable = FakeTimetableSource()
+    clock = {'now': 0.0}
+    runs = []
+
+    def recorder(name):
+        def handler(payload):
+            runs.append((clock['now'], name, payload.get('titles')))
+        return handler
+
+    watcher = Watcher(
+        [sheets, timetable],
+        stages={name: recorder(name) for name in STAGES},
+        state_file=None, metrics_file=None,
+        clock=lambda: clock['now']
+    )
+
+    category = next(title for title in data if stage_for_title(title) == 'categories')
+    slides = next(title for title in data if stage_for_title(title) == 'slides')
+
+    # Правки: три подряд в категории (серия), потом слайды, потом расписание
+    edits = {60: (category, 'A'), 75: (category, 'B'), 100: (category, 'C'), 400: (slides, 'D')}
+    for second in range(0, 1200, 5):
+        clock['now'] = float(second)
+        if second in edits:
+            title, value = edits[second]
+            sheets.edit(title, 1, 0, sheets.data[title][1][0] + value)
+        if second == 700:
+            timetable.publish()
+        watcher.tick()
+
+    print("\nЗапуски этапов (секунда, этап, вкладки):")
+    for moment, name, titles in runs:
+        print(f"  {moment:6.0f}  {name:<11} {', '.join(titles or [])}")
+    print_metrics(watcher.metrics)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Наблюдение за Google Таблицей и расписанием')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--once', action='store_true',
+                      help='один опрос источников и выход')
+    mode.add_argument('--demo', action='store_true',
+                      help='сценарий с правками на подставных источниках, без сети')
+    args = parser.parse_args(argv)
+
+    if args.demo:
+        run_demo()
+        return
+
+    if args.once:
+        # Один проход: ждать затихания правок некому
+        watcher = Watcher(live_sources(), debounce=0)
+        watcher.tick()
+        print_metrics(watcher.metrics)
+    else:
+        Watcher(live_sources()).run_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Проверки выбора снимка в backup_store.restore
+
+Запуск: python -m pytest test_backup_store.py
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backup_store import _record, restore
+
+
+def make_history(tmp_path, versions):
+    """Файл form.json и снимки его версий (старые первыми)"""
+    store = tmp_path / '.backups'
+    for day, text in enumerate(versions, 1):
+        _record(store, 'form.json', text.encode('utf-8'), created=datetime(2026, 1, day))
+    path = tmp_path / 'form.json'
+    path.write_text('current', encoding='utf-8')
+    return path, store
+
+
+@pytest.mark.parametrize('ref, expected', [('1', 'newest'), ('3', 'oldest'), (None, 'newest')])
+def test_restore_by_number(tmp_path, ref, expected):
+    path, store = make_history(tmp_path, ['oldest', 'middle', 'newest'])
+
+    restore(path, ref, store)
+    assert path.read_text(encoding='utf-8') == expected
+
+
+def test_restore_rejects_zero(tmp_path):
+    path, store = make_history(tmp_path, ['oldest', 'newest'])
+
+    with pytest.raises(LookupError):
+        restore(path, '0', store)
+    with pytest.raises(LookupError):
+        restore(path, '00', store)
+
+    # Файл не тронут
+    assert path.read_text(encoding='utf-8') == 'current'
+
+
+def test_restore_republishes_variants(tmp_path, monkeypatch):
+    from form_shards import publish_shards
+    from static_variants import min_path_for, minify_json, publish_json
+
+    monkeypatch.chdir(tmp_path)
+    store = tmp_path / '.backups'
+    path = tmp_path / 'form.json'
+    old = {'main': [{'label': 'Старое', 'value': 'old'}]}
+    new = {'main': [{'label': 'Новое', 'value': 'new'}]}
+
+    publish_json(path, old)
+    _record(store, 'form.json', path.read_bytes())
+    publish_json(path, new)
+    publish_shards(path, new)
+
+    restore(path, '1', store)
+
+    assert min_path_for(path).read_bytes() == minify_json(old)
+    manifest = (tmp_path / 'form.manifest.json').read_text(encoding='utf-8')
+    assert '"old"' in manifest and '"new"' not in manifest
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Проверки поиска HTML-фрагментов в critical_css
+
+Запуск: python -m pytest test_critical_css.py
+"""
+
+from pathlib import Path
+
+from critical_css import UsageCollector, build_critical, collect_usage, page_sources
+
+ROOT = Path(__file__).parent
+
+
+def test_inline_script_partials_keep_styles(tmp_path):
+    (tmp_path / 'index.html').write_text(
+        '<html><head><link rel="stylesheet" href="style.css"></head><body>\n'
+        '<script>\n'
+        "fetch('./aboutModal.html').then(r => r.text());\n"
+        "const modals = [{ id: 'eventsModal', file: 'eventsModal.html' }];\n"
+        'modals.forEach(m => fetch(`./${m.file}`));\n'
+        '</script>\n'
+        '</body></html>\n', encoding='utf-8')
+    (tmp_path / 'aboutModal.html').write_text('<div class="about-card"></div>', encoding='utf-8')
+    (tmp_path / 'eventsModal.html').write_text('<div class="events-list"></div>', encoding='utf-8')
+    (tmp_path / 'style.css').write_text(
+        '.about-card { color: red; }\n.events-list { color: blue; }\n.never-used { color: green; }\n',
+        encoding='utf-8')
+
+    build_critical(tmp_path / 'index.html')
+
+    pruned = (tmp_path / 'pruned' / 'style.css').read_text(encoding='utf-8')
+    assert '.about-card' in pruned
+    assert '.events-list' in pruned
+    assert '.never-used' not in pruned
+
+
+def test_site_partials_are_not_pruned():
+    index_path = ROOT / 'index.html'
+    _, scripts, partials = page_sources(index_path)
+
+    # Фрагменты, которые загружают <script> внутри index.html
+    for name in ['aboutModal.html', 'relaxModal.html', 'iceModal.html', 'pricingModal.html',
+                 'eventsModal.html', 'reviewModal.html']:
+        assert name in partials
+
+    # Все классы загружаемых фрагментов считаются используемыми
+    usage, _ = collect_usage(index_path, scripts, partials)
+    for name in partials:
+        collector = UsageCollector()
+        collector.feed((ROOT / name).read_text(encoding='utf-8'))
+        collector.close()
+        assert collector.usage['classes'] <= usage['classes'], name
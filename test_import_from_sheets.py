@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Проверки чтения CSV частями в import_from_sheets
+
+Запуск: python -m pytest test_import_from_sheets.py
+"""
+
+import csv
+
+import pytest
+
+from import_from_sheets import read_csv_files
+
+HEADER = ['ID', 'Родитель', 'Название', 'Значение', 'Полное описание']
+
+
+def write_csv(path, rows):
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        csv.writer(f, delimiter='\t').writerows([HEADER, *rows])
+
+
+@pytest.mark.parametrize('workers, chunk_bytes', [(1, 1), (1, 40), (1, 1024 * 1024), (2, 40)])
+def test_chunks_keep_rows_whole(tmp_path, workers, chunk_bytes):
+    # Переводы строк и табуляции внутри кавычек не должны резать запись
+    rows = [[f'id{i}', '', f'Название {i}', f'value{i}', f'строка 1\nстрока "{i}"\tконец'] for i in range(20)]
+    path = tmp_path / 'gym.csv'
+    write_csv(path, rows)
+
+    results = list(read_csv_files([path], workers, chunk_bytes))
+    items = [item for _, result in results for item in result['items']]
+
+    assert [item_id for item_id, _, _ in items] == [row[0] for row in rows]
+    assert items[3][2]['label'] == 'Название 3'
+    assert items[3][2]['fulldesc'] == 'строка 1\nстрока "3"\tконец'
+    if chunk_bytes == 1:
+        assert len(results) == len(rows)
+
+
+def test_files_without_tree_columns_are_skipped(tmp_path):
+    path = tmp_path / 'slides.csv'
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        csv.writer(f, delimiter='\t').writerows([['Номер', 'Заголовок'], ['1', 'Слайд']])
+
+    assert list(read_csv_files([path], workers=1)) == [
+        ('slides.csv', {'items': [], 'error': None, 'skipped': True})
+    ]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Проверки кеша поддеревьев в sheet_cache.build_category_tree
+
+Запуск: python -m pytest test_sheet_cache.py
+"""
+
+import json
+import os
+
+from sheet_cache import CACHE_VERSION, build_category_tree, cache_path_for
+
+HEADER = ['ID', 'Родитель', 'Название', 'Значение']
+
+
+def sheet(*rows):
+    return [HEADER, *[list(row) for row in rows]]
+
+
+def make_sheets():
+    return [
+        ('02_ЗАЛ', sheet(['1', '', 'Зал', 'gym'], ['2', 'gym', 'Тренажеры', 'machines'])),
+        ('03_ДЕТИ', sheet(['3', '', 'Детям', 'kids'], ['4', 'kids', 'Плавание', 'swim'])),
+    ]
+
+
+def full_tree(sheets):
+    return build_category_tree(sheets)['tree']
+
+
+def test_unchanged_sheets_come_from_cache(tmp_path):
+    output = tmp_path / 'form.json'
+    sheets = make_sheets()
+
+    first = build_category_tree(sheets, output)
+    second = build_category_tree(sheets, output)
+
+    assert first['changed'] == ['02_ЗАЛ', '03_ДЕТИ']
+    assert second['changed'] == [] and second['reused'] == ['02_ЗАЛ', '03_ДЕТИ']
+    assert second['tree'] == full_tree(sheets)
+
+
+def test_edited_sheet_is_rebuilt(tmp_path):
+    output = tmp_path / 'form.json'
+    sheets = make_sheets()
+    build_category_tree(sheets, output)
+
+    sheets[1][1][2][2] = 'Бассейн'
+    built = build_category_tree(sheets, output)
+
+    assert built['changed'] == ['03_ДЕТИ'] and built['reused'] == ['02_ЗАЛ']
+    assert built['tree'] == full_tree(sheets)
+    assert built['tree'][1]['children'][0]['label'] == 'Бассейн'
+
+
+def test_removed_and_reordered_sheets(tmp_path):
+    output = tmp_path / 'form.json'
+    sheets = make_sheets()
+    build_category_tree(sheets, output)
+
+    built = build_category_tree(sheets[1:], output)
+    assert built['tree'] == full_tree(sheets[1:])
+
+    built = build_category_tree(list(reversed(sheets)), output)
+    assert [item['value'] for item in built['tree']] == ['kids', 'gym']
+
+
+def test_parent_in_another_sheet_forces_full_build(tmp_path):
+    output = tmp_path / 'form.json'
+    sheets = make_sheets()
+    sheets.append(('04_ЕЩЕ', sheet(['5', 'gym', 'Кардио', 'cardio'])))
+    build_category_tree(sheets, output)
+
+    # Родитель cardio - во вкладке 02_ЗАЛ: правка 02_ЗАЛ меняет и поддерево 04_ЕЩЕ
+    sheets[0][1][1][3] = 'fitness'
+    sheets[0][1][2][1] = 'fitness'
+    sheets[2][1][1][1] = 'fitness'
+    built = build_category_tree(sheets, output)
+
+    assert built['tree'] == full_tree(sheets)
+    assert [child['value'] for child in built['tree'][0]['children']] == ['machines', 'cardio']
+
+
+def test_duplicate_path_across_sheets_forces_full_build(tmp_path):
+    output = tmp_path / 'form.json'
+    sheets = make_sheets()
+    sheets.append(('04_ЕЩЕ', sheet(['5', '', 'Зал 2', 'gym'], ['6', 'gym', 'Йога', 'yoga'])))
+
+    build_category_tree(sheets, output)
+    built = build_category_tree(sheets, output)
+
+    assert built['tree'] == full_tree(sheets)
+
+
+def test_stale_or_broken_cache_is_ignored(tmp_path):
+    output = tmp_path / 'form.json'
+    sheets = make_sheets()
+    cache_file = cache_path_for(output)
+
+    cache_file.write_text('{не json', encoding='utf-8')
+    assert build_category_tree(sheets, output)['tree'] == full_tree(sheets)
+
+    cache = json.loads(cache_file.read_text(encoding='utf-8'))
+    cache['version'] = CACHE_VERSION - 1
+    cache_file.write_text(json.dumps(cache), encoding='utf-8')
+    built = build_category_tree(sheets, output)
+    assert built['reused'] == []
+    assert built['tree'] == full_tree(sheets)
+
+
+def test_cache_is_not_rewritten_without_changes(tmp_path):
+    output = tmp_path / 'form.json'
+    sheets = make_sheets()
+    build_category_tree(sheets, output)
+
+    cache_file = cache_path_for(output)
+    os.utime(cache_file, ns=(0, 0))
+
+    build_category_tree(sheets, output)
+    assert cache_file.stat().st_mtime_ns == 0
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Проверки разметки адаптивных картинок в slides_generator
+
+Запуск: python -m pytest test_slides_generator.py
+"""
+
+import re
+
+from responsive_images import target_widths
+from slides_generator import render_slides
+
+IMAGES = {
+    'img/1.jpg': {
+        'hash': 'abc', 'width': 2400, 'height': 1200,
+        'variants': {
+            fmt: [{'width': width, 'path': f'responsive/1.abc.{width}w.{fmt}'} for width in target_widths(2400)]
+            for fmt in ('avif', 'webp')
+        }
+    }
+}
+
+SLIDE = {'Картинка Desktop': './img/1.jpg', 'Заголовок строка 1': '**Зал**'}
+
+
+def test_background_keeps_single_url():
+    rendered = render_slides([SLIDE], variants=('desktop', 'mobile'), images=IMAGES)
+
+    for variant in ('desktop', 'mobile'):
+        html = rendered['variants'][variant][0]
+        # BackgroundCheck и imagesLoaded читают style: там должен быть один url()
+        assert re.findall(r'style="([^"]*)"', html) == ['background-image: url(./img/1.jpg)']
+        # Все ширины: копию под экран выбирает main.js
+        assert 'data-srcset-avif="responsive/1.abc.320w.avif 320w, ' in html
+        assert 'responsive/1.abc.1920w.webp 1920w"' in html
+
+
+def test_slide_without_copies_has_no_srcset():
+    html = render_slides([SLIDE], images={})['variants']['desktop'][0]
+
+    assert 'data-srcset' not in html
+    assert 'style="background-image: url(./img/1.jpg)"' in html
+
+
+def test_widths_are_unique():
+    assert target_widths(2400) == [320, 640, 960, 1280, 1920]
+    assert target_widths(1000) == [320, 640, 960, 1000]
@@ -1,16 +1,58 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Скрипт для обновления расписания единоборств из pride34.ru
+Скрипт для обновления расписаний из pride34.ru
+
+Страница разбирается за один проход HTML-парсером: все таблицы расписания
+(единоборства, детские секции, танцы - каждая на своей вкладке страницы)
+превращаются в модель "день, время, секция, тренер, возраст". Из модели
+собираются schedule-<вкладка>.html (для единоборств - schedule-fight.html)
+и schedule.json со всеми расписаниями для других скриптов.
+
+Страница запрашивается условно: ETag и Last-Modified прошлого ответа и хеш
+модели хранятся в schedule.state.json. Если сервер ответил 304 или
+расписания не изменились, файлы не перезаписываются и кеш посетителей
+не сбрасывается.
+
+Запуск:
+    python update-schedule.py
+    python update-schedule.py http://127.0.0.1:8000/timetable.html   (локальная копия страницы)
 """
 
+import hashlib
+import json
 import re
 import sys
 import requests
+from html import escape
+from html.parser import HTMLParser
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from safe_output import write_json_atomic, write_text_atomic
+
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
 
 URL = "https://pride34.ru/timetable/#fights"
-OUTPUT_FILE = "schedule-fight.html"
+JSON_FILE = "schedule.json"
+STATE_FILE = "schedule.state.json"
+
+# Вкладки страницы расписания: id блока -> заголовок и файл для модального окна
+TIMETABLES = {
+    'fights': {'title': 'Расписание единоборств', 'output': 'schedule-fight.html'},
+    'kids': {'title': 'Расписание детских секций', 'output': 'schedule-kids.html'},
+    'dance': {'title': 'Расписание танцев', 'output': 'schedule-dance.html'},
+}
+# Если на странице нет вкладок, первая таблица считается расписанием единоборств
+DEFAULT_TIMETABLE = 'fights'
+
+TIMEOUT = 10
+# Повторы при обрыве соединения и ответах 429/5xx: паузы 0.5, 1, 2 секунды
+RETRIES = 3
+BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
 
 # Маппинг названий секций на data-class атрибуты
 CLASS_MAPPING = {
@@ -27,108 +69,426 @@ CLASS_MAPPING = {
     'Панкратион': 'pankration',
 }
 
-def main():
-    print(f"🔄 Загрузка расписания с {URL}...")
+# Поля занятия по классу <div>: разметка pride34.ru и уже преобразованная
+FIELD_CLASSES = {
+    'hours': 'hours',
+    'class-trainers': 'trainer',
+    'trainer': 'trainer',
+    'before-hour-text': 'age',
+    'after-hour-text': 'age',
+    'age': 'age',
+}
+RENDER_CLASSES = {'hours': 'hours', 'trainer': 'trainer', 'age': 'age'}
 
-    try:
-        # Загружаем HTML страницу
-        response = requests.get(URL, timeout=10)
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-        html = response.text
-
-        # Извлекаем таблицу расписания
-        match = re.search(r'<table class="timetable">(.*?)</table>', html, re.DOTALL)
-
-        if not match:
-            print("❌ Не удалось найти таблицу расписания на странице")
-            sys.exit(1)
-
-        table_content = match.group(1)
-        print("✅ Таблица найдена, обрабатываем...")
-
-        # Заменяем ссылки на data-class атрибуты
-        for class_name, data_class in CLASS_MAPPING.items():
-            # Обрабатываем различные варианты ссылок
-            patterns = [
-                rf'<a\s+(?:style="[^"]*"\s+)?href="[^"]*"\s+title="{class_name}">',
-                rf'<a\s+href="[^"]*"\s+(?:style="[^"]*"\s+)?title="{class_name}">',
-            ]
-
-            for pattern in patterns:
-                table_content = re.sub(
-                    pattern,
-                    f'<a href="#" data-class="{data_class}" class="class-link">',
-                    table_content
-                )
-
-        # Заменяем классы для стилей
-        replacements = {
-            'class="class-trainers"': 'class="trainer"',
-            'class="before-hour-text"': 'class="age"',
-            'class="after-hour-text"': 'class="age"',
-        }
+DAY_NAMES = {
+    'Понедельник': 'Пн',
+    'Вторник': 'Вт',
+    'Среда': 'Ср',
+    'Четверг': 'Чт',
+    'Пятница': 'Пт',
+    'Суббота': 'Сб',
+    'Воскресенье': 'Вс',
+}
+TIME_HEADER = 'Время'
+TIME_RANGE = re.compile(r'^[\d:]+\s*-\s*[\d:]+$')
 
-        for old, new in replacements.items():
-            table_content = table_content.replace(old, new)
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr'
+}
 
-        # Заменяем row_N классы
-        table_content = re.sub(r'class="row_\d+\s+row-gray"', 'class="row-gray"', table_content)
-        table_content = re.sub(r'class="row_\d+"', '', table_content)
+_session = None
 
-        # Добавляем класс time-cell для первой колонки с временем
-        table_content = re.sub(
-            r'<td>\s*([\d:]+\s*-\s*[\d:]+)\s*</td>',
-            r'<td class="time-cell">\1</td>',
-            table_content
+
+def get_session():
+    """Общая сессия: соединения переиспользуются, сбои повторяются с паузой"""
+    global _session
+    if _session is None:
+        retry = Retry(
+            total=RETRIES,
+            backoff_factor=BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=('GET', 'HEAD'),
+            respect_retry_after_header=True,
+            raise_on_status=False
         )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=2, pool_maxsize=4)
+        _session = requests.Session()
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+
+def load_state(state_file):
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def fetch_page(url, state, session=None):
+    """
+    Условный GET страницы
+
+    Возвращает (html или None при 304, валидаторы {'etag', 'last_modified'})
+    """
+    headers = {}
+    if state.get('url') == url:
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+    response = (session or get_session()).get(url, headers=headers, timeout=TIMEOUT)
+
+    if response.status_code == 304:
+        return None, {'etag': state.get('etag'), 'last_modified': state.get('last_modified')}
+
+    response.raise_for_status()
+    response.encoding = 'utf-8'
+    validators = {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified')
+    }
+    return response.text, validators
+
+
+class TimetableParser(HTMLParser):
+    """
+    Разбор всех <table class="timetable"> страницы за один проход
+
+    Понимает и разметку pride34.ru (title="Самбо", class-trainers,
+    before-hour-text, <br>), и уже преобразованную (data-class, trainer, age, <hr>),
+    поэтому schedule-fight.html можно разобрать обратно в ту же модель.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tables = []
+        self.tab_labels = {}     # {'fights': 'Единоборства'} из ссылок href="#fights"
+        self.open_ids = []       # [(тег, id)] открытых элементов с id
+        self.table = None
+        self.row = None
+        self.cell = None
+        self.entry = None
+        self.field = None
+        self.in_head = False
+        self.header = None
+        self.link_target = None
+        self.link_text = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if tag == 'a' and (attrs.get('href') or '').startswith('#') and len(attrs['href']) > 1:
+            self.link_target = attrs['href'][1:]
+            self.link_text = []
+
+        if tag == 'table' and 'timetable' in classes:
+            ids = [element_id for _, element_id in self.open_ids]
+            self.table = {'ids': ids, 'days': [], 'rows': []}
+            self.tables.append(self.table)
+        elif self.table is None:
+            if attrs.get('id') and tag not in VOID_ELEMENTS:
+                self.open_ids.append((tag, attrs['id']))
+            return
+        elif tag == 'thead':
+            self.in_head = True
+        elif tag == 'tr':
+            self.row = None if self.in_head else {'gray': 'row-gray' in classes, 'cells': []}
+            if self.row is not None:
+                self.table['rows'].append(self.row)
+        elif tag == 'th':
+            self.header = []
+        elif tag == 'td' and self.row is not None:
+            self.cell = {'rowspan': int(attrs.get('rowspan') or 1), 'colspan': int(attrs.get('colspan') or 1),
+                         'text': [], 'entries': []}
+            self.row['cells'].append(self.cell)
+        elif self.cell is None:
+            return
+        elif tag == 'a':
+            slug = attrs.get('data-class') or CLASS_MAPPING.get(attrs.get('title') or '')
+            self.entry = {'class': '', 'slug': slug}
+            self.cell['entries'].append(self.entry)
+            self.field = 'class'
+        elif tag == 'div' and classes and classes[0] in FIELD_CLASSES:
+            if self.entry is None:
+                self.entry = {}
+                self.cell['entries'].append(self.entry)
+            self.field = FIELD_CLASSES[classes[0]]
+            # before-hour-text и after-hour-text - оба в age: второй текст дописывается
+            previous = self.entry.get(self.field)
+            self.entry[self.field] = f"{previous} " if previous else ''
+        elif tag in ('br', 'hr'):
+            self.entry = None
+            self.field = None
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self.link_target is not None:
+            label = ' '.join(''.join(self.link_text).split())
+            if label:
+                self.tab_labels.setdefault(self.link_target, label)
+            self.link_target = None
+
+        if self.table is None:
+            for depth in range(len(self.open_ids) - 1, -1, -1):
+                if self.open_ids[depth][0] == tag:
+                    del self.open_ids[depth:]
+                    break
+            return
+
+        if tag == 'table':
+            self.table = self.row = self.cell = self.entry = self.field = None
+        elif tag == 'th' and self.header is not None:
+            name = ' '.join(''.join(self.header).split())
+            self.table['days'].append(DAY_NAMES.get(name, name))
+            self.header = None
+        elif tag == 'thead':
+            self.in_head = False
+        elif tag == 'td' and self.cell is not None:
+            self.cell['text'] = ' '.join(''.join(self.cell['text']).split())
+            self.cell = self.entry = self.field = None
+        elif tag in ('a', 'div'):
+            if self.field and self.entry is not None:
+                self.entry[self.field] = self.entry[self.field].strip()
+            self.field = None
+
+    def handle_data(self, data):
+        if self.link_target is not None:
+            self.link_text.append(data)
+        if self.header is not None:
+            self.header.append(data)
+        elif self.cell is not None:
+            if self.field and self.entry is not None:
+                self.entry[self.field] = ' '.join((self.entry[self.field] + data).split())
+            elif not self.cell['entries']:
+                self.cell['text'].append(data)
+
 
-        # Заменяем длинные названия дней на короткие
-        day_replacements = {
-            '<th>Понедельник</th>': '<th>Пн</th>',
-            '<th>Вторник</th>': '<th>Вт</th>',
-            '<th>Среда</th>': '<th>Ср</th>',
-            '<th>Четверг</th>': '<th>Чт</th>',
-            '<th>Пятница</th>': '<th>Пт</th>',
-            '<th>Суббота</th>': '<th>Сб</th>',
-            '<th>Воскресенье</th>': '<th>Вс</th>',
-            '<th></th>': '<th>Время</th>',
+def timetable_key(table, used):
+    """Вкладка таблицы: id ближайшего известного блока-вкладки, иначе любой id"""
+    for element_id in reversed(table['ids']):
+        if element_id in TIMETABLES and element_id not in used:
+            return element_id
+    for element_id in reversed(table['ids']):
+        if element_id not in used:
+            return element_id
+    # Страница без вкладок: первая таблица - единоборства, как раньше
+    if DEFAULT_TIMETABLE not in used:
+        return DEFAULT_TIMETABLE
+    return f"timetable-{len(used) + 1}"
+
+
+def build_events(days, rows):
+    """
+    Плоский список занятий: день, строка сетки, время, секция, тренер, возраст
+
+    Ячейки с rowspan занимают столбец в следующих строках, поэтому
+    столбец (и день) считается по сетке занятых ячеек.
+    """
+    events = []
+    occupied = {}  # {столбец: сколько строк еще занято}
+
+    for row in rows:
+        column = 0
+        slot = ''
+        for cell in row['cells']:
+            while occupied.get(column):
+                column += 1
+            if column == 0:
+                slot = cell['text']
+            else:
+                day = days[column - 1] if column - 1 < len(days) else str(column)
+                for entry in cell['entries']:
+                    events.append({
+                        'day': day,
+                        'slot': slot,
+                        'class': entry.get('class', ''),
+                        'slug': entry.get('slug'),
+                        'hours': entry.get('hours', ''),
+                        'trainer': entry.get('trainer', ''),
+                        'age': entry.get('age', '')
+                    })
+            for offset in range(cell['colspan']):
+                if cell['rowspan'] > 1:
+                    occupied[column + offset] = cell['rowspan']
+            column += cell['colspan']
+
+        for key in list(occupied):
+            occupied[key] -= 1
+            if occupied[key] <= 0:
+                del occupied[key]
+
+    return events
+
+
+def parse_timetables(html):
+    """
+    Модель всех расписаний страницы
+
+    {вкладка: {'title', 'days', 'rows', 'events'}}, где rows - строки сетки
+    ({'gray', 'cells'}) для HTML, а events - плоский список занятий
+    """
+    parser = TimetableParser()
+    parser.feed(html)
+    parser.close()
+
+    timetables = {}
+    for table in parser.tables:
+        key = timetable_key(table, timetables)
+        days = table['days'][1:] if table['days'] and table['days'][0] in ('', TIME_HEADER) else table['days']
+        table['rows'] = [row for row in table['rows'] if row['cells']]
+        rows = [{'gray': row['gray'],
+                 'cells': [{name: value for name, value in cell.items() if value not in ('', [], 1)}
+                           for cell in row['cells']]}
+                for row in table['rows']]
+        title = TIMETABLES.get(key, {}).get('title') or parser.tab_labels.get(key) or key
+        timetables[key] = {
+            'title': title,
+            'days': days,
+            'rows': rows,
+            'events': build_events(days, table['rows'])
         }
 
-        for old, new in day_replacements.items():
-            table_content = table_content.replace(old, new)
+    return timetables
 
-        # Заменяем <br> на разделители
-        table_content = table_content.replace('<br>', '<hr>')
 
-        # Формируем финальный HTML
-        final_html = f'''<div class="schedule-header">
-\t<h2>Расписание единоборств</h2>
-\t<button class="schedule-close" id="closeSchedule">×</button>
-</div>
+def render_entry(entry):
+    lines = []
+    for name, value in entry.items():
+        if name == 'class':
+            slug = entry.get('slug')
+            data_class = f' data-class="{escape(slug)}"' if slug else ''
+            lines.append(f'<a href="#"{data_class} class="class-link">{escape(value, quote=False)}</a>')
+        elif name != 'slug':
+            css_class = next(css for css, field in RENDER_CLASSES.items() if field == name)
+            lines.append(f'<div class="{css_class}">{escape(value, quote=False)}</div>')
+    return lines
 
-<div class="schedule-content">
-\t<table class="timetable">
-{table_content}
-\t</table>
-</div>
-'''
 
-        # Сохраняем в файл
-        output_path = Path(__file__).parent / OUTPUT_FILE
-        output_path.write_text(final_html, encoding='utf-8')
+def render_schedule(timetable):
+    """HTML содержимого модального окна расписания"""
+    out = [
+        '<div class="schedule-header">',
+        f'\t<h2>{escape(timetable["title"], quote=False)}</h2>',
+        '\t<button class="schedule-close" id="closeSchedule">×</button>',
+        '</div>',
+        '',
+        '<div class="schedule-content">',
+        '\t<table class="timetable">',
+        '\t\t<thead>',
+        '\t\t\t<tr>',
+    ]
+    for day in [TIME_HEADER, *timetable['days']]:
+        out.append(f'\t\t\t\t<th>{escape(day, quote=False)}</th>')
+    out += ['\t\t\t</tr>', '\t\t</thead>', '\t\t<tbody>']
 
-        file_size = output_path.stat().st_size / 1024
-        print(f"✅ Расписание успешно обновлено: {output_path}")
-        print(f"📊 Размер файла: {file_size:.2f} KB")
-        print("\n✨ Готово! Обновите страницу в браузере для просмотра изменений.")
+    for row in timetable['rows']:
+        out.append('\t\t\t<tr class="row-gray">' if row['gray'] else '\t\t\t<tr>')
+        for index, cell in enumerate(row['cells']):
+            spans = ''.join(f' {name}="{cell[name]}"' for name in ('rowspan', 'colspan') if name in cell)
+            if cell.get('entries'):
+                out.append(f'\t\t\t\t<td class="event"{spans}>')
+                for number, entry in enumerate(cell['entries']):
+                    if number:
+                        out.append('\t\t\t\t\t<hr>')
+                    out += [f'\t\t\t\t\t{line}' for line in render_entry(entry)]
+                out.append('\t\t\t\t</td>')
+            elif index == 0 and TIME_RANGE.match(cell.get('text', '')):
+                out.append(f'\t\t\t\t<td class="time-cell"{spans}>{escape(cell["text"], quote=False)}</td>')
+            else:
+                out.append(f'\t\t\t\t<td{spans}>{escape(cell.get("text", ""), quote=False)}</td>')
+        out.append('\t\t\t</tr>')
+
+    out += ['\t\t</tbody>', '\t</table>', '</div>']
+    return '\n'.join(out) + '\n'
+
+
+def output_file_for(key):
+    return TIMETABLES.get(key, {}).get('output') or f"schedule-{key}.html"
+
+
+def write_if_changed(path, text):
+    if path.exists() and path.read_text(encoding='utf-8') == text:
+        return False
+    write_text_atomic(path, text)
+    return True
+
+
+def update_schedule(url=URL, output_dir=None, state_file=None, session=None):
+    """
+    Обновляет HTML всех расписаний и schedule.json, если расписание на сайте изменилось
 
+    Возвращает словарь: status - 'not_modified' (ответ 304), 'unchanged'
+    (расписания те же), 'updated' (хотя бы один файл перезаписан);
+    written - перезаписанные файлы, timetables - модель расписаний (кроме 304)
+    """
+    base = Path(output_dir) if output_dir else Path(__file__).parent
+    state_path = Path(state_file) if state_file else base / STATE_FILE
+
+    state = load_state(state_path)
+    if not (base / JSON_FILE).exists():
+        # Без файлов на диске нечего сравнивать - нужен полный ответ
+        state = {}
+
+    html, validators = fetch_page(url, state, session)
+
+    if html is None:
+        return {'status': 'not_modified', 'written': [], 'timetables': None}
+
+    timetables = parse_timetables(html)
+    if not timetables:
+        raise ValueError("Не удалось найти таблицу расписания на странице")
+
+    data = {'source': url, 'timetables': timetables}
+    serialized = json.dumps(data, ensure_ascii=False, indent=2)
+    timetables_hash = hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+    written = []
+    if state.get('timetables_hash') != timetables_hash:
+        for key, timetable in timetables.items():
+            path = base / output_file_for(key)
+            if write_if_changed(path, render_schedule(timetable)):
+                written.append(path)
+        if write_if_changed(base / JSON_FILE, serialized + '\n'):
+            written.append(base / JSON_FILE)
+
+    write_json_atomic(state_path, {'url': url, **validators, 'timetables_hash': timetables_hash})
+    return {'status': 'updated' if written else 'unchanged', 'written': written, 'timetables': timetables}
+
+
+def main():
+    url = sys.argv[1] if len(sys.argv) > 1 else URL
+    print(f"🔄 Загрузка расписания с {url}...")
+
+    try:
+        result = update_schedule(url)
     except requests.RequestException as e:
         print(f"❌ Ошибка при загрузке расписания: {e}")
         sys.exit(1)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Неожиданная ошибка: {e}")
         sys.exit(1)
 
+    if result['status'] == 'not_modified':
+        print("✅ Страница не изменилась (304), файлы не перезаписаны")
+        return
+
+    for key, timetable in result['timetables'].items():
+        print(f"📅 {timetable['title']} ({key}): {len(timetable['events'])} занятий -> {output_file_for(key)}")
+
+    if result['status'] == 'unchanged':
+        print("✅ Расписание не изменилось, файлы не перезаписаны")
+    else:
+        for path in result['written']:
+            print(f"✅ Обновлен: {path} ({path.stat().st_size / 1024:.2f} KB)")
+        print("\n✨ Готово! Обновите страницу в браузере для просмотра изменений.")
+
+
 if __name__ == "__main__":
     main()